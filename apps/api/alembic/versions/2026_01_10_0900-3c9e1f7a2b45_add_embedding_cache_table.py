@@ -0,0 +1,58 @@
+"""add embedding_cache table
+
+Revision ID: 3c9e1f7a2b45
+Revises: dfcc6df55b0d
+Create Date: 2026-01-10 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9e1f7a2b45"
+down_revision: str | None = "dfcc6df55b0d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create embedding_cache table for reusing RAG query embeddings."""
+    op.create_table(
+        "embedding_cache",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("cache_key", sa.String(64), nullable=False),
+        sa.Column(
+            "model",
+            sa.String(100),
+            nullable=False,
+            comment="Embedding model (e.g., 'text-embedding-ada-002')",
+        ),
+        sa.Column("text", sa.Text(), nullable=False, comment="Normalized text that was embedded"),
+        sa.Column(
+            "embedding",
+            postgresql.ARRAY(sa.Float()),
+            nullable=False,
+            comment="Embedding vector",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_embedding_cache_cache_key"), "embedding_cache", ["cache_key"], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Drop embedding_cache table."""
+    op.drop_index(op.f("ix_embedding_cache_cache_key"), table_name="embedding_cache")
+    op.drop_table("embedding_cache")
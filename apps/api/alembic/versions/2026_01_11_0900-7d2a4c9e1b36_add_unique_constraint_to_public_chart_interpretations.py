@@ -0,0 +1,47 @@
+"""add unique constraint to public_chart_interpretations
+
+Revision ID: 7d2a4c9e1b36
+Revises: 3c9e1f7a2b45
+Create Date: 2026-01-11 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d2a4c9e1b36"
+down_revision: str | None = "3c9e1f7a2b45"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add unique constraint so interpretations can be bulk upserted."""
+    # Keep only the most recently updated row of each duplicate group
+    op.execute(
+        """
+        DELETE FROM public_chart_interpretations a
+        USING public_chart_interpretations b
+        WHERE a.chart_id = b.chart_id
+          AND a.interpretation_type = b.interpretation_type
+          AND a.subject = b.subject
+          AND a.language = b.language
+          AND (a.updated_at, a.id) < (b.updated_at, b.id)
+        """
+    )
+
+    # Only ONE interpretation per element per language per public chart
+    op.create_unique_constraint(
+        "uq_public_chart_interpretation",
+        "public_chart_interpretations",
+        ["chart_id", "interpretation_type", "subject", "language"],
+    )
+
+
+def downgrade() -> None:
+    """Remove unique constraint."""
+    op.drop_constraint(
+        "uq_public_chart_interpretation", "public_chart_interpretations", type_="unique"
+    )
@@ -0,0 +1,75 @@
+"""add birth_chart_localizations table
+
+Revision ID: 5b8f2d6e4a19
+Revises: 7d2a4c9e1b36
+Create Date: 2026-01-12 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8f2d6e4a19"
+down_revision: str | None = "7d2a4c9e1b36"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """
+    Create birth_chart_localizations for per-language chart sections.
+
+    Existing language-keyed chart_data is split by
+    scripts/migrate_chart_data_to_localizations.py (readers handle both layouts).
+    """
+    op.create_table(
+        "birth_chart_localizations",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("chart_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "language",
+            sa.String(10),
+            nullable=False,
+            comment="Language code (e.g., 'pt-BR', 'en-US')",
+        ),
+        sa.Column(
+            "data",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            comment="Language-specific chart sections",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["chart_id"], ["birth_charts.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("chart_id", "language", name="uq_birth_chart_localization"),
+    )
+    op.create_index(
+        op.f("ix_birth_chart_localizations_chart_id"),
+        "birth_chart_localizations",
+        ["chart_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop birth_chart_localizations table."""
+    op.drop_index(
+        op.f("ix_birth_chart_localizations_chart_id"), table_name="birth_chart_localizations"
+    )
+    op.drop_table("birth_chart_localizations")
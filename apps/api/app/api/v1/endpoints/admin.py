@@ -33,6 +33,7 @@ from app.schemas.subscription import (
     SubscriptionRevoke,
 )
 from app.services import subscription_service
+from app.services.auth_principal_cache import AuthPrincipal, invalidate_principal
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -47,7 +48,7 @@ router = APIRouter(prefix="/admin", tags=["admin"])
 async def list_all_users(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Max records to return"),
-    admin_user: User = Depends(require_verified_admin),
+    admin_user: AuthPrincipal = Depends(require_verified_admin),
     db: AsyncSession = Depends(get_db),
 ) -> AdminUserList:
     """List all users in the system (admin only)."""
@@ -86,7 +87,7 @@ async def list_all_users(
 )
 async def get_user_detail(
     user_id: UUID,
-    admin_user: User = Depends(require_verified_admin),
+    admin_user: AuthPrincipal = Depends(require_verified_admin),
     db: AsyncSession = Depends(get_db),
 ) -> AdminUserDetail:
     """Get detailed user information (admin only)."""
@@ -138,7 +139,7 @@ async def get_user_detail(
 async def update_user_role(
     user_id: UUID,
     request: UpdateUserRoleRequest,
-    admin_user: User = Depends(require_verified_admin),
+    admin_user: AuthPrincipal = Depends(require_verified_admin),
     db: AsyncSession = Depends(get_db),
 ) -> UpdateUserRoleResponse:
     """Update user role (admin only)."""
@@ -197,6 +198,7 @@ async def update_user_role(
 
     await db.commit()
     await db.refresh(user)
+    await invalidate_principal(user_id)
 
     logger.info(
         "User role updated by admin",
@@ -222,7 +224,7 @@ async def update_user_role(
     responses={403: {"description": "Admin privileges required"}},
 )
 async def get_system_stats(
-    admin_user: User = Depends(require_verified_admin),
+    admin_user: AuthPrincipal = Depends(require_verified_admin),
     db: AsyncSession = Depends(get_db),
 ) -> SystemStats:
     """Get system statistics (admin only)."""
@@ -292,7 +294,7 @@ async def get_system_stats(
 @limiter.limit(RateLimits.ADMIN_ROLE_UPDATE)
 async def grant_subscription(
     request: SubscriptionCreate,
-    admin_user: User = Depends(require_verified_admin),
+    admin_user: AuthPrincipal = Depends(require_verified_admin),
     db: AsyncSession = Depends(get_db),
 ) -> SubscriptionRead:
     """Grant premium subscription to a user (admin only)."""
@@ -327,7 +329,7 @@ async def grant_subscription(
 @limiter.limit(RateLimits.ADMIN_ROLE_UPDATE)
 async def revoke_subscription(
     request: SubscriptionRevoke,
-    admin_user: User = Depends(require_verified_admin),
+    admin_user: AuthPrincipal = Depends(require_verified_admin),
     db: AsyncSession = Depends(get_db),
 ) -> None:
     """Revoke premium subscription from a user (admin only)."""
@@ -361,7 +363,7 @@ async def revoke_subscription(
 @limiter.limit(RateLimits.ADMIN_ROLE_UPDATE)
 async def extend_subscription(
     request: SubscriptionExtend,
-    admin_user: User = Depends(require_verified_admin),
+    admin_user: AuthPrincipal = Depends(require_verified_admin),
     db: AsyncSession = Depends(get_db),
 ) -> SubscriptionRead:
     """
@@ -406,7 +408,7 @@ async def extend_subscription(
 async def list_subscriptions(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Max records to return"),
-    admin_user: User = Depends(require_verified_admin),
+    admin_user: AuthPrincipal = Depends(require_verified_admin),
     db: AsyncSession = Depends(get_db),
 ) -> list[SubscriptionRead]:
     """List all active subscriptions (admin only)."""
@@ -432,7 +434,7 @@ async def get_subscription_history(
     user_id: UUID,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Max records to return"),
-    admin_user: User = Depends(require_verified_admin),
+    admin_user: AuthPrincipal = Depends(require_verified_admin),
     db: AsyncSession = Depends(get_db),
 ) -> list[SubscriptionHistoryRead]:
     """
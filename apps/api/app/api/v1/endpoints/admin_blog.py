@@ -9,13 +9,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.dependencies import require_admin
-from app.models.user import User
 from app.schemas.blog import (
     BlogPostCreate,
     BlogPostListResponse,
     BlogPostRead,
     BlogPostUpdate,
 )
+from app.services.auth_principal_cache import AuthPrincipal
 from app.services.blog_service import BlogService
 
 router = APIRouter(prefix="/admin/blog", tags=["admin-blog"])
@@ -26,7 +26,7 @@ async def list_posts_admin(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=50, description="Items per page"),
     include_drafts: bool = Query(True, description="Include unpublished posts"),
-    current_user: User = Depends(require_admin),
+    current_user: AuthPrincipal = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ) -> BlogPostListResponse:
     """
@@ -44,7 +44,7 @@ async def list_posts_admin(
 @router.get("/posts/{post_id}", response_model=BlogPostRead)
 async def get_post_admin(
     post_id: UUID,
-    current_user: User = Depends(require_admin),
+    current_user: AuthPrincipal = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ) -> BlogPostRead:
     """
@@ -66,7 +66,7 @@ async def get_post_admin(
 @router.post("/posts", response_model=BlogPostRead, status_code=status.HTTP_201_CREATED)
 async def create_post(
     data: BlogPostCreate,
-    current_user: User = Depends(require_admin),
+    current_user: AuthPrincipal = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ) -> BlogPostRead:
     """
@@ -84,7 +84,7 @@ async def create_post(
 async def update_post(
     post_id: UUID,
     data: BlogPostUpdate,
-    current_user: User = Depends(require_admin),
+    current_user: AuthPrincipal = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ) -> BlogPostRead:
     """
@@ -106,7 +106,7 @@ async def update_post(
 @router.delete("/posts/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_post(
     post_id: UUID,
-    current_user: User = Depends(require_admin),
+    current_user: AuthPrincipal = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ) -> None:
     """
@@ -127,7 +127,7 @@ async def delete_post(
 @router.post("/posts/{post_id}/publish", response_model=BlogPostRead)
 async def publish_post(
     post_id: UUID,
-    current_user: User = Depends(require_admin),
+    current_user: AuthPrincipal = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ) -> BlogPostRead:
     """
@@ -149,7 +149,7 @@ async def publish_post(
 @router.post("/posts/{post_id}/unpublish", response_model=BlogPostRead)
 async def unpublish_post(
     post_id: UUID,
-    current_user: User = Depends(require_admin),
+    current_user: AuthPrincipal = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ) -> BlogPostRead:
     """
@@ -16,6 +16,7 @@ from app.core.dependencies import get_current_user, require_admin
 from app.core.rate_limit import RateLimits, limiter
 from app.models.chart import AuditLog
 from app.models.user import User
+from app.services.auth_principal_cache import AuthPrincipal
 from app.services.interpretation_cache_service import InterpretationCacheService
 
 router = APIRouter()
@@ -54,7 +55,7 @@ def _get_client_ip(request: Request) -> str | None:
 
 async def _create_audit_log(
     db: AsyncSession,
-    user: User,
+    user: AuthPrincipal,
     action: str,
     extra_data: dict | None = None,
     ip_address: str | None = None,
@@ -95,7 +96,7 @@ async def get_cache_stats(
 async def clear_expired_cache(
     request: Request,
     ttl_days: int = 30,
-    current_user: Annotated[User, Depends(require_admin)] = None,  # type: ignore[assignment]
+    current_user: Annotated[AuthPrincipal, Depends(require_admin)] = None,  # type: ignore[assignment]
     db: Annotated[AsyncSession, Depends(get_db)] = None,  # type: ignore[assignment]
 ) -> CacheClearResponse:
     """
@@ -135,7 +136,7 @@ async def clear_expired_cache(
 async def clear_cache_by_prompt_version(
     request: Request,
     version: str,
-    current_user: Annotated[User, Depends(require_admin)] = None,  # type: ignore[assignment]
+    current_user: Annotated[AuthPrincipal, Depends(require_admin)] = None,  # type: ignore[assignment]
     db: Annotated[AsyncSession, Depends(get_db)] = None,  # type: ignore[assignment]
 ) -> CacheClearResponse:
     """
@@ -169,7 +170,7 @@ async def clear_cache_by_prompt_version(
 async def clear_all_cache(
     request: Request,
     confirm: bool = False,
-    current_user: Annotated[User, Depends(require_admin)] = None,  # type: ignore[assignment]
+    current_user: Annotated[AuthPrincipal, Depends(require_admin)] = None,  # type: ignore[assignment]
     db: Annotated[AsyncSession, Depends(get_db)] = None,  # type: ignore[assignment]
 ) -> CacheClearResponse:
     """
@@ -2,33 +2,48 @@
 Birth chart endpoints for creating and managing natal charts.
 """
 
+import json
 import re
+import time
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Annotated, Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from loguru import logger
 from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.context import get_locale
-from app.core.dependencies import get_current_user, get_db
+from app.core.dependencies import get_current_principal, get_db
+from app.core.http_cache import make_etag, not_modified, not_modified_response, set_etag
 from app.core.i18n import translate as _
 from app.core.i18n.messages import ChartMessages
 from app.core.rate_limit import RateLimits, limiter
 from app.models.chart import BirthChart
-from app.models.user import User
 from app.repositories.chart_repository import ChartRepository
 from app.schemas.chart import (
     BirthChartCreate,
     BirthChartList,
     BirthChartRead,
+    BirthChartSummary,
     BirthChartUpdate,
     ChartStatusResponse,
     PDFDownloadResponse,
     PDFDownloadURLResponse,
 )
+from app.services.auth_principal_cache import AuthPrincipal
+from app.services.chart_progress_service import (
+    clear_progress_states,
+    get_progress_states,
+    publish_chart_progress,
+    publish_pdf_progress,
+    stream_progress,
+    to_event,
+)
 from app.services.chart_service import (
     ChartNotFoundError,
     ChartService,
@@ -38,33 +53,13 @@ from app.services.chart_service import (
 from app.services.s3_service import s3_service
 from app.tasks.astro_tasks import generate_birth_chart_task
 from app.tasks.pdf_tasks import generate_chart_pdf_task
-from app.translations import DEFAULT_LANGUAGE, SUPPORTED_LANGUAGES, get_translation
-from app.utils.chart_data_accessor import extract_language_data
+from app.translations import DEFAULT_LANGUAGE, get_translation
 
 router = APIRouter()
 
-
-def _extract_chart_data_for_response(chart_data: dict[str, Any] | None) -> dict[str, Any] | None:
-    """
-    Extract language-specific chart data for API response.
-
-    Converts language-first format {"en-US": {...}, "pt-BR": {...}}
-    to flat format {...} based on request locale.
-
-    Args:
-        chart_data: Chart data in language-first or legacy flat format
-
-    Returns:
-        Language-specific chart data, or None if chart_data is None
-    """
-    if not chart_data:
-        return None
-
-    # Get current request locale (from LocaleMiddleware)
-    locale = get_locale() or DEFAULT_LANGUAGE
-
-    # Extract language-specific data using backward-compatible accessor
-    return extract_language_data(chart_data, locale)
+# Progress event streams: keepalive comment interval and maximum lifetime
+PROGRESS_STREAM_KEEPALIVE_SECONDS = 15.0
+PROGRESS_STREAM_MAX_SECONDS = 15 * 60
 
 
 def _translate_phases_for_language(data: dict[str, Any], lang: str) -> dict[str, Any]:
@@ -273,41 +268,24 @@ def _normalize_temperament_fields(data: dict[str, Any]) -> dict[str, Any]:
     return data
 
 
-def extract_chart_data_for_language(chart: BirthChart, lang: str) -> dict[str, Any] | None:
+def extract_chart_data_for_language(
+    chart_data: dict[str, Any] | None, lang: str
+) -> dict[str, Any] | None:
     """
-    Extract chart_data for the specified language.
+    Prepare a chart's data in the specified language for the API response.
 
-    Handles both new format (language-keyed: {"en-US": {...}, "pt-BR": {...}})
-    and legacy format (single language dict with direct keys like "planets", "houses").
+    Takes the data loaded by ChartService.get_chart_data (shared section merged
+    with the language's row, or extracted from unmigrated language-first and
+    legacy flat chart_data) and normalizes legacy field names and translations.
 
     Args:
-        chart: BirthChart model instance
+        chart_data: Flat chart data for the language
         lang: Language code (e.g., "en-US", "pt-BR")
 
     Returns:
         Chart data dict for the specified language, or None if not available
     """
-    if not chart.chart_data:
-        return None
-
-    chart_data: dict[str, Any] = chart.chart_data
-    result: dict[str, Any] | None = None
-
-    # Check if this is the new language-keyed format
-    if lang in chart_data:
-        result = chart_data[lang]
-    else:
-        # Check if any supported language key exists (indicates new format)
-        has_language_keys = any(
-            supported_lang in chart_data for supported_lang in SUPPORTED_LANGUAGES
-        )
-
-        if has_language_keys:
-            # New format but requested language not found - fallback to default
-            result = chart_data.get(DEFAULT_LANGUAGE, None)
-        else:
-            # Legacy format - return as-is (no language separation)
-            result = chart_data
+    result = chart_data or None
 
     # Normalize field names for backward compatibility
     if result:
@@ -335,7 +313,7 @@ async def create_chart(
     request: Request,
     response: Response,
     chart_data: BirthChartCreate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthPrincipal, Depends(get_current_principal)],
     db: Annotated[AsyncSession, Depends(get_db)],
     chart_service: Annotated[ChartService, Depends(get_chart_service)],
 ) -> BirthChartRead:
@@ -396,6 +374,7 @@ async def create_chart(
                 chart_obj.status = "failed"
                 chart_obj.error_message = "Task queue unavailable. Please try again."
                 await db.commit()
+                await publish_chart_progress(chart_obj)
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail=_(ChartMessages.PROCESSING_UNAVAILABLE),
@@ -430,7 +409,7 @@ async def create_chart(
 async def list_charts(
     request: Request,
     response: Response,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthPrincipal, Depends(get_current_principal)],
     chart_service: Annotated[ChartService, Depends(get_chart_service)],
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
@@ -451,8 +430,10 @@ async def list_charts(
     """
     skip = (page - 1) * page_size
 
-    charts = await chart_service.get_user_charts(
+    # Summaries only: the full chart_data is not loaded for list views
+    charts = await chart_service.get_user_chart_summaries(
         user_id=UUID(str(current_user.id)),
+        language=get_locale() or DEFAULT_LANGUAGE,
         skip=skip,
         limit=page_size,
     )
@@ -461,12 +442,8 @@ async def list_charts(
         user_id=UUID(str(current_user.id)),
     )
 
-    # Extract language-specific chart data for each chart
-    for chart in charts:
-        chart.chart_data = _extract_chart_data_for_response(chart.chart_data)
-
     return BirthChartList(
-        charts=charts,
+        charts=[BirthChartSummary.model_validate(chart) for chart in charts],
         total=total,
         page=page,
         page_size=page_size,
@@ -484,17 +461,20 @@ async def get_chart_status(
     request: Request,
     response: Response,
     chart_id: UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthPrincipal, Depends(get_current_principal)],
     chart_service: Annotated[ChartService, Depends(get_chart_service)],
 ) -> ChartStatusResponse:
     """
     Get birth chart processing status.
 
-    **Use for polling:**
+    **Use for polling** (or follow GET /charts/{id}/events instead):
     - After creating a chart (HTTP 202), poll this endpoint every 2-3 seconds
     - Check status: 'processing' → 'completed' or 'failed'
     - When completed, fetch full chart via GET /charts/{id}
 
+    The status is read from the progress state the tasks publish to Redis;
+    the database is only read when no state is stored.
+
     Args:
         chart_id: Birth chart UUID
         current_user: Current authenticated user
@@ -503,11 +483,25 @@ async def get_chart_status(
     Returns:
         Chart status information (status, progress, error_message)
     """
-    try:
-        chart = await chart_service.get_chart_by_id(
-            chart_id=chart_id,
-            user_id=UUID(str(current_user.id)),
-        )
+    state = await _get_progress_state(chart_id, "chart", current_user)
+    if state is None:
+        try:
+            chart = await chart_service.get_chart_by_id(
+                chart_id=chart_id,
+                user_id=UUID(str(current_user.id)),
+            )
+        except ChartNotFoundError:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=_(ChartMessages.CHART_NOT_FOUND),
+            ) from None
+        except UnauthorizedAccessError:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=_(ChartMessages.ACCESS_DENIED),
+            ) from None
+        # Seed the state so the next checks skip the database
+        await publish_chart_progress(chart)
         return ChartStatusResponse(
             id=chart.id,
             status=chart.status,
@@ -515,16 +509,111 @@ async def get_chart_status(
             error_message=chart.error_message,
             task_id=chart.task_id,
         )
-    except ChartNotFoundError:
+
+    return ChartStatusResponse(
+        id=chart_id,
+        status=state["status"],
+        progress=state["progress"],
+        error_message=state["error_message"],
+        task_id=state["task_id"],
+    )
+
+
+@router.get(
+    "/{chart_id}/events",
+    summary="Stream chart processing progress",
+    description="Server-sent events with the chart's processing and PDF generation progress.",
+    response_class=StreamingResponse,
+)
+@limiter.limit(RateLimits.CHART_READ)
+async def stream_chart_events(
+    request: Request,
+    response: Response,
+    chart_id: UUID,
+    current_user: Annotated[AuthPrincipal, Depends(get_current_principal)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    chart_service: Annotated[ChartService, Depends(get_chart_service)],
+) -> StreamingResponse:
+    """
+    Stream a chart's progress as server-sent events.
+
+    Each event's data is a JSON object with a `kind` ('chart' or 'pdf') and
+    the same fields as GET /charts/{id}/status (for 'chart') or a PDF
+    `status` ('generating', 'ready', 'failed'). The current state is sent
+    first; the stream then follows the Celery tasks and closes after
+    PROGRESS_STREAM_MAX_SECONDS. Clients authenticate with the usual Bearer
+    header, so read the stream with fetch() rather than EventSource. When a
+    PDF is ready, get its download URL from GET /charts/{id}/pdf-status.
+
+    Args:
+        chart_id: Birth chart UUID
+        current_user: Current authenticated user
+        db: Database session
+        chart_service: Injected chart service
+
+    Returns:
+        text/event-stream response
+    """
+    if await _get_progress_state(chart_id, "chart", current_user) is None:
+        try:
+            chart = await chart_service.get_chart_by_id(
+                chart_id=chart_id,
+                user_id=UUID(str(current_user.id)),
+            )
+        except ChartNotFoundError:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=_(ChartMessages.CHART_NOT_FOUND),
+            ) from None
+        except UnauthorizedAccessError:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=_(ChartMessages.ACCESS_DENIED),
+            ) from None
+        # The stream starts from the stored state
+        await publish_chart_progress(chart)
+
+    # Release the database connection for the lifetime of the stream
+    await db.close()
+
+    return StreamingResponse(
+        _progress_event_stream(request, chart_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _progress_event_stream(request: Request, chart_id: UUID) -> AsyncIterator[str]:
+    """Format a chart's progress as server-sent events until the client leaves."""
+    deadline = time.monotonic() + PROGRESS_STREAM_MAX_SECONDS
+    async for state in stream_progress(chart_id, PROGRESS_STREAM_KEEPALIVE_SECONDS):
+        if await request.is_disconnected() or time.monotonic() >= deadline:
+            break
+        if state is None:
+            yield ": keepalive\n\n"
+        else:
+            yield f"data: {json.dumps(to_event(state), default=str)}\n\n"
+
+
+async def _get_progress_state(
+    chart_id: UUID, kind: str, current_user: AuthPrincipal
+) -> dict[str, Any] | None:
+    """
+    Get a chart's stored progress state of one kind, checking ownership.
+
+    Returns:
+        The state, or None if none is stored
+
+    Raises:
+        HTTPException: 404 if the state belongs to another user
+    """
+    state = (await get_progress_states(chart_id)).get(kind)
+    if state is not None and state["user_id"] != str(current_user.id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=_(ChartMessages.CHART_NOT_FOUND),
-        ) from None
-    except UnauthorizedAccessError:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=_(ChartMessages.ACCESS_DENIED),
-        ) from None
+        )
+    return state
 
 
 @router.get(
@@ -538,14 +627,14 @@ async def get_chart(
     request: Request,
     response: Response,
     chart_id: UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthPrincipal, Depends(get_current_principal)],
     chart_service: Annotated[ChartService, Depends(get_chart_service)],
     lang: str = Query(
         DEFAULT_LANGUAGE,
         description="Language for chart data (en-US or pt-BR)",
         regex="^(en-US|pt-BR)$",
     ),
-) -> BirthChartRead:
+) -> BirthChartRead | Response:
     """
     Get a birth chart by ID.
 
@@ -562,14 +651,34 @@ async def get_chart(
         Birth chart data in the specified language
     """
     try:
+        # Answer revalidations from id/updated_at alone, before loading chart_data
+        if request.headers.get("if-none-match"):
+            updated_at = await chart_service.get_chart_version(
+                chart_id=chart_id,
+                user_id=UUID(str(current_user.id)),
+                is_admin=current_user.is_admin,
+            )
+            if updated_at is not None:
+                etag = make_etag(chart_id, updated_at, lang)
+                if not_modified(request, etag):
+                    return not_modified_response(etag)
+
         chart = await chart_service.get_chart_by_id(
             chart_id=chart_id,
             user_id=UUID(str(current_user.id)),
             is_admin=current_user.is_admin,
         )
 
+        # Progress updates, recalculations and cached analyses all move updated_at
+        etag = make_etag(chart.id, chart.updated_at, lang)
+        if not_modified(request, etag):
+            return not_modified_response(etag)
+        set_etag(response, etag)
+
         # Extract chart_data for the requested language
-        chart_data = extract_chart_data_for_language(chart, lang)
+        chart_data = extract_chart_data_for_language(
+            await chart_service.get_chart_data(chart, lang), lang
+        )
 
         # Build response with language-specific chart_data
         return BirthChartRead(
@@ -626,7 +735,7 @@ async def update_chart(
     response: Response,
     chart_id: UUID,
     update_data: BirthChartUpdate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthPrincipal, Depends(get_current_principal)],
     chart_service: Annotated[ChartService, Depends(get_chart_service)],
 ) -> BirthChartRead:
     """
@@ -671,7 +780,7 @@ async def delete_chart(
     request: Request,
     response: Response,
     chart_id: UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthPrincipal, Depends(get_current_principal)],
     chart_service: Annotated[ChartService, Depends(get_chart_service)],
     hard_delete: bool = Query(False, description="Permanently delete if true"),
 ) -> None:
@@ -718,7 +827,7 @@ async def generate_chart_pdf(
     request: Request,
     response: Response,
     chart_id: UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthPrincipal, Depends(get_current_principal)],
     db: Annotated[AsyncSession, Depends(get_db)],
     chart_service: Annotated[ChartService, Depends(get_chart_service)],
 ) -> dict[str, str]:
@@ -784,6 +893,9 @@ async def generate_chart_pdf(
                 detail=_(ChartMessages.PDF_ALREADY_GENERATING),
             )
 
+        # Published before dispatch so it cannot overwrite the task's own updates
+        await publish_pdf_progress(chart_id, chart.user_id, "generating")
+
         # Dispatch Celery task now that we have the lock
         try:
             task = generate_chart_pdf_task.delay(str(chart_id))
@@ -797,6 +909,7 @@ async def generate_chart_pdf(
             )
             await db.execute(rollback_stmt)
             await db.commit()
+            await clear_progress_states(chart_id, kinds=("pdf",))
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail=_(ChartMessages.PDF_FAILED),
@@ -837,7 +950,7 @@ async def get_pdf_status(
     request: Request,
     response: Response,
     chart_id: UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthPrincipal, Depends(get_current_principal)],
     chart_service: Annotated[ChartService, Depends(get_chart_service)],
 ) -> PDFDownloadResponse:
     """
@@ -853,6 +966,9 @@ async def get_pdf_status(
     - If PDF is stored locally, returns local file path
     - Presigned URLs are regenerated on each request
 
+    The status is read from the progress state the PDF task publishes to
+    Redis; the database is only read when no state is stored.
+
     Args:
         chart_id: Birth chart UUID
         current_user: Current authenticated user
@@ -861,7 +977,22 @@ async def get_pdf_status(
     Returns:
         PDF status with download URL and metadata
     """
-    from app.core.config import settings
+    state = await _get_progress_state(chart_id, "pdf", current_user)
+    if state is not None:
+        if state["status"] == "failed":
+            return PDFDownloadResponse(
+                status="failed",
+                message=state["error_message"] or _(ChartMessages.PDF_FAILED),
+            )
+        if state["status"] != "ready" or not state["pdf_url"]:
+            return PDFDownloadResponse(
+                status="generating",
+                message=_(ChartMessages.PDF_GENERATING),
+            )
+        generated_at = state["generated_at"]
+        return _pdf_ready_response(
+            state["pdf_url"], datetime.fromisoformat(generated_at) if generated_at else None
+        )
 
     try:
         chart = await chart_service.get_chart_by_id(
@@ -883,37 +1014,15 @@ async def get_pdf_status(
                     message=_(ChartMessages.PDF_GENERATING),
                 )
 
-        # PDF exists - determine download URL
-        download_url = None
-        expires_in = None
-
-        if chart.pdf_url.startswith("s3://"):
-            # S3 URL - generate presigned URL
-            download_url = s3_service.generate_presigned_url(
-                s3_url=chart.pdf_url,
-                expires_in=settings.S3_PRESIGNED_URL_EXPIRATION,
-            )
-
-            if download_url:
-                expires_in = settings.S3_PRESIGNED_URL_EXPIRATION
-            else:
-                # Failed to generate presigned URL
-                return PDFDownloadResponse(
-                    status="failed",
-                    message=_(ChartMessages.S3_DOWNLOAD_FAILED),
-                    generated_at=chart.pdf_generated_at,
-                )
-        else:
-            # Local file path - return as-is
-            download_url = chart.pdf_url
-
-        return PDFDownloadResponse(
-            status="ready",
-            download_url=download_url,
-            expires_in=expires_in,
+        # Seed the state so the next checks skip the database
+        await publish_pdf_progress(
+            chart_id,
+            chart.user_id,
+            "ready",
+            pdf_url=chart.pdf_url,
             generated_at=chart.pdf_generated_at,
-            message=_(ChartMessages.PDF_READY),
         )
+        return _pdf_ready_response(chart.pdf_url, chart.pdf_generated_at)
 
     except ChartNotFoundError:
         raise HTTPException(
@@ -927,6 +1036,49 @@ async def get_pdf_status(
         ) from None
 
 
+def _pdf_ready_response(pdf_url: str, generated_at: datetime | None) -> PDFDownloadResponse:
+    """
+    Build the 'ready' PDF status with a download URL.
+
+    Args:
+        pdf_url: Stored PDF location (s3:// URL or local path)
+        generated_at: When the PDF was generated
+
+    Returns:
+        PDF status with download URL and metadata
+    """
+    download_url = None
+    expires_in = None
+
+    if pdf_url.startswith("s3://"):
+        # S3 URL - generate presigned URL
+        download_url = s3_service.generate_presigned_url(
+            s3_url=pdf_url,
+            expires_in=settings.S3_PRESIGNED_URL_EXPIRATION,
+        )
+
+        if download_url:
+            expires_in = settings.S3_PRESIGNED_URL_EXPIRATION
+        else:
+            # Failed to generate presigned URL
+            return PDFDownloadResponse(
+                status="failed",
+                message=_(ChartMessages.S3_DOWNLOAD_FAILED),
+                generated_at=generated_at,
+            )
+    else:
+        # Local file path - return as-is
+        download_url = pdf_url
+
+    return PDFDownloadResponse(
+        status="ready",
+        download_url=download_url,
+        expires_in=expires_in,
+        generated_at=generated_at,
+        message=_(ChartMessages.PDF_READY),
+    )
+
+
 @router.get(
     "/{chart_id}/download-pdf",
     response_model=PDFDownloadURLResponse,
@@ -937,7 +1089,7 @@ async def get_pdf_status(
 async def download_chart_pdf(
     request: Request,
     chart_id: UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthPrincipal, Depends(get_current_principal)],
     chart_service: Annotated[ChartService, Depends(get_chart_service)],
     response: Response,
 ) -> PDFDownloadURLResponse:
@@ -1041,7 +1193,7 @@ async def recalculate_chart(
     request: Request,
     response: Response,
     chart_id: UUID,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[AuthPrincipal, Depends(get_current_principal)],
     db: Annotated[AsyncSession, Depends(get_db)],
     chart_service: Annotated[ChartService, Depends(get_chart_service)],
 ) -> BirthChartRead:
@@ -1077,6 +1229,7 @@ async def recalculate_chart(
         chart.progress = 0
         await db.commit()
         await db.refresh(chart)
+        await publish_chart_progress(chart)
 
         # Dispatch Celery task to recalculate in background
         task = generate_birth_chart_task.delay(str(chart_id))
@@ -1087,6 +1240,7 @@ async def recalculate_chart(
             chart.status = "failed"
             chart.error_message = "Task queue unavailable"
             await db.commit()
+            await publish_chart_progress(chart)
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail=_(ChartMessages.PROCESSING_UNAVAILABLE),
@@ -20,6 +20,7 @@ from app.schemas.credit import (
     UserCreditResponse,
 )
 from app.services import credit_service
+from app.services.auth_principal_cache import AuthPrincipal
 from app.services.chart_service import ChartNotFoundError, ChartService, get_chart_service
 
 router = APIRouter(prefix="/credits")
@@ -193,7 +194,7 @@ admin_router = APIRouter(prefix="/admin/credits")
 async def add_bonus_credits(
     user_id: UUID,
     request: AddBonusCreditsRequest,
-    admin_user: User = Depends(require_admin),
+    admin_user: AuthPrincipal = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ) -> CreditTransactionRead:
     """Add bonus credits to a user."""
@@ -217,7 +218,7 @@ async def add_bonus_credits(
 async def change_user_plan(
     user_id: UUID,
     request: UpgradePlanRequest,
-    admin_user: User = Depends(require_admin),
+    admin_user: AuthPrincipal = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ) -> UserCreditResponse:
     """Change a user's plan type."""
@@ -250,7 +251,7 @@ async def change_user_plan(
 )
 async def get_user_credits(
     user_id: UUID,
-    _admin_user: User = Depends(require_admin),
+    _admin_user: AuthPrincipal = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ) -> UserCreditResponse:
     """Get a specific user's credit information."""
@@ -283,7 +284,7 @@ async def get_user_credit_history(
     user_id: UUID,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Maximum records to return"),
-    _admin_user: User = Depends(require_admin),
+    _admin_user: AuthPrincipal = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ) -> CreditHistoryResponse:
     """Get credit transaction history for a specific user."""
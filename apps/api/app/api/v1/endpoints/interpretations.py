@@ -18,6 +18,7 @@ from app.core.i18n import SUPPORTED_LOCALES, normalize_locale
 from app.models.chart import BirthChart
 from app.models.interpretation import ChartInterpretation
 from app.models.user import User
+from app.repositories.chart_repository import ChartRepository
 from app.repositories.interpretation_repository import InterpretationRepository
 from app.schemas.interpretation import (
     InterpretationItem,
@@ -598,15 +599,8 @@ async def _generate_rag_interpretations(
     # Initialize repository for saving interpretations
     repo = InterpretationRepository(db) if save_to_db else None
 
-    # chart_data is guaranteed to be non-None by the calling endpoints
-    chart_data = chart.chart_data
-    assert chart_data is not None, "chart_data must not be None"
-
-    # Extract language-specific chart data (chart_data has language-first format)
-    lang_chart_data = chart_data.get(language, {})
-    if not lang_chart_data:
-        # Fallback to pt-BR if requested language doesn't exist
-        lang_chart_data = chart_data.get("pt-BR", {})
+    # Shared section merged with the language's translations (or another language's)
+    lang_chart_data = await ChartRepository(db).get_chart_data(chart, language)
 
     planets = lang_chart_data.get("planets", [])
     houses = lang_chart_data.get("houses", [])
@@ -741,7 +735,7 @@ async def _generate_rag_interpretations(
             )
 
     # Process aspects (limited by RAG_MAX_ASPECTS setting)
-    aspects = chart_data.get("aspects", [])
+    aspects = lang_chart_data.get("aspects", [])
     max_aspects = settings.RAG_MAX_ASPECTS
 
     for aspect in aspects[:max_aspects]:
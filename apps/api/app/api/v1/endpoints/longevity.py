@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.astro.alcochoden import calculate_alcochoden
 from app.astro.hyleg import calculate_hyleg
 from app.astro.longevity import calculate_longevity_analysis
+from app.core.calculation_executor import get_calculation_executor
 from app.core.context import get_locale
 from app.core.credit_config import get_feature_cost
 from app.core.dependencies import get_current_user, get_db
@@ -26,6 +27,7 @@ from app.models.enums import FeatureType
 from app.models.user import User
 from app.schemas.longevity import AlcochodenResponse, HylegResponse, LongevityResponse
 from app.services import credit_service
+from app.services.astro_service import convert_to_julian_day
 from app.services.chart_service import (
     ChartNotFoundError,
     ChartService,
@@ -125,8 +127,6 @@ async def get_hyleg(
     sect = chart_data.get("sect", "diurnal")
 
     # We need the birth Julian Day - calculate from chart birth data
-    from app.services.astro_service import convert_to_julian_day
-
     birth_jd = convert_to_julian_day(
         chart.birth_datetime,
         chart.birth_timezone,
@@ -134,7 +134,11 @@ async def get_hyleg(
         chart.longitude,
     )
 
-    hyleg = calculate_hyleg(
+    # Run the calculation off the event loop
+    executor = get_calculation_executor()
+
+    hyleg = await executor.run(
+        calculate_hyleg,
         planets=planets,
         houses=houses,
         aspects=aspects,
@@ -237,8 +241,6 @@ async def get_alcochoden(
             break
 
     # Calculate birth Julian Day
-    from app.services.astro_service import convert_to_julian_day
-
     birth_jd = convert_to_julian_day(
         chart.birth_datetime,
         chart.birth_timezone,
@@ -246,8 +248,12 @@ async def get_alcochoden(
         chart.longitude,
     )
 
+    # Run the calculations off the event loop
+    executor = get_calculation_executor()
+
     # Calculate Hyleg first
-    hyleg = calculate_hyleg(
+    hyleg = await executor.run(
+        calculate_hyleg,
         planets=planets,
         houses=houses,
         aspects=aspects,
@@ -260,7 +266,8 @@ async def get_alcochoden(
     )
 
     # Calculate Alcochoden
-    alcochoden = calculate_alcochoden(
+    alcochoden = await executor.run(
+        calculate_alcochoden,
         hyleg_data=hyleg,
         planets=planets,
         houses=houses,
@@ -399,8 +406,6 @@ async def get_longevity(
             break
 
     # Calculate birth Julian Day
-    from app.services.astro_service import convert_to_julian_day
-
     birth_jd = convert_to_julian_day(
         chart.birth_datetime,
         chart.birth_timezone,
@@ -408,7 +413,11 @@ async def get_longevity(
         chart.longitude,
     )
 
-    longevity = calculate_longevity_analysis(
+    # Run the calculations off the event loop
+    executor = get_calculation_executor()
+
+    longevity = await executor.run(
+        calculate_longevity_analysis,
         planets=planets,
         houses=houses,
         aspects=aspects,
@@ -14,7 +14,9 @@ from app.core.dependencies import get_current_user
 from app.models.chart import AuditLog, BirthChart
 from app.models.user import OAuthAccount, User
 from app.models.user_consent import UserConsent
+from app.repositories.chart_repository import ChartRepository
 from app.services.amplitude_service import amplitude_service
+from app.services.auth_principal_cache import invalidate_principal
 
 router = APIRouter(prefix="/users/me", tags=["Privacy & LGPD"])
 
@@ -80,6 +82,7 @@ async def export_user_data(
         )
     )
     charts = charts_result.scalars().all()
+    chart_repo = ChartRepository(db)
     charts_data = [
         {
             "id": str(chart.id),
@@ -90,7 +93,8 @@ async def export_user_data(
             "longitude": float(chart.longitude),
             "city": chart.city,
             "country": chart.country,
-            "chart_data": chart.chart_data,  # Full calculation data
+            # Full calculation data, in every stored language
+            "chart_data": await chart_repo.get_chart_data_all_languages(chart),
             "created_at": chart.created_at.isoformat() if chart.created_at else None,
             "updated_at": chart.updated_at.isoformat() if chart.updated_at else None,
         }
@@ -220,6 +224,7 @@ async def delete_user_account(
     db.add(audit_log)
 
     await db.commit()
+    await invalidate_principal(current_user.id)
 
     # Track account deletion request
     amplitude_service.track(
@@ -288,6 +293,7 @@ async def cancel_account_deletion(
     db.add(audit_log)
 
     await db.commit()
+    await invalidate_principal(current_user.id)
 
     # Track account deletion cancellation
     amplitude_service.track(
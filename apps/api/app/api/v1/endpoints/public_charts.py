@@ -4,22 +4,29 @@ Public Charts API endpoints.
 Provides public access to famous people's natal charts for evaluating RAG interpretations.
 """
 
+from collections.abc import Awaitable, Callable
 from typing import Annotated, Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from loguru import logger
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings
 from app.core.database import get_db
 from app.core.dependencies import require_admin
+from app.core.http_cache import (
+    PUBLIC_REVALIDATE,
+    make_etag,
+    not_modified,
+    not_modified_response,
+    set_etag,
+)
 from app.core.i18n import SUPPORTED_LOCALES, normalize_locale
 from app.core.rate_limit import RateLimits, get_real_client_ip, limiter
 from app.models.public_chart import PublicChart
 from app.models.public_chart_interpretation import PublicChartInterpretation
-from app.models.user import User
 from app.schemas.interpretation import ChartInterpretationsResponse
 from app.schemas.public_chart import (
     PUBLIC_CHART_CATEGORIES,
@@ -29,13 +36,55 @@ from app.schemas.public_chart import (
     PublicChartPreview,
     PublicChartUpdate,
 )
-from app.services.interpretation_service_rag import ARABIC_PARTS, InterpretationServiceRAG
+from app.services.auth_principal_cache import AuthPrincipal
+from app.services.public_chart_cache import (
+    cache_response,
+    generate_cache_key,
+    get_cached_response,
+)
 from app.services.public_chart_service import PublicChartService
 from app.services.view_dedup_service import should_increment_view
 from app.translations import DEFAULT_LANGUAGE, SUPPORTED_LANGUAGES, get_translation
 
 router = APIRouter(prefix="/public-charts", tags=["public-charts"])
 
+_PREVIEW_LIST_ADAPTER = TypeAdapter(list[PublicChartPreview])
+_CATEGORY_LIST_ADAPTER = TypeAdapter(list[dict])
+
+
+async def _cached_listing(
+    request: Request,
+    endpoint: str,
+    params: dict[str, Any],
+    build: Callable[[], Awaitable[str]],
+) -> Response:
+    """
+    Serve a listing from the Redis response cache, building and caching it on a miss.
+
+    The ETag is derived from the body, so revalidation is answered with 304.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        endpoint: Listing name used in the cache key
+        params: Query parameters the listing depends on
+        build: Coroutine function returning the serialized JSON body
+
+    Returns:
+        JSON or 304 response
+    """
+    key = generate_cache_key(endpoint, params)
+    body = await get_cached_response(key)
+    if body is None:
+        body = await build()
+        await cache_response(key, body)
+
+    etag = make_etag(body)
+    if not_modified(request, etag):
+        return not_modified_response(etag, PUBLIC_REVALIDATE)
+    response = Response(content=body, media_type="application/json")
+    set_etag(response, etag, PUBLIC_REVALIDATE)
+    return response
+
 
 def extract_i18n_field(
     i18n_data: dict[str, Any] | None,
@@ -236,7 +285,7 @@ async def list_public_charts(
     ] = "name",
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     page_size: Annotated[int, Query(ge=1, le=50, description="Items per page")] = 20,
-) -> PublicChartList:
+) -> PublicChartList | Response:
     """
     List all published public charts.
 
@@ -245,15 +294,30 @@ async def list_public_charts(
     - **sort**: Sort order (name, date, views)
     - **page**: Page number (1-based)
     - **page_size**: Number of items per page (max 50)
+
+    Listings without a search term are served from the response cache.
     """
     service = PublicChartService(db)
-    return await service.list_charts(
-        category=category,
-        search=search,
-        sort=sort,
-        page=page,
-        page_size=page_size,
-    )
+    if search:
+        return await service.list_charts(
+            category=category,
+            search=search,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+        )
+
+    async def build() -> str:
+        charts = await service.list_charts(
+            category=category,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+        )
+        return charts.model_dump_json()
+
+    params = {"category": category, "sort": sort, "page": page, "page_size": page_size}
+    return await _cached_listing(request, "list", params, build)
 
 
 @router.get(
@@ -268,10 +332,14 @@ async def get_featured_charts(
     response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
     limit: Annotated[int, Query(ge=1, le=20, description="Maximum number of charts")] = 10,
-) -> list[PublicChartPreview]:
+) -> list[PublicChartPreview] | Response:
     """Get featured public charts for homepage display."""
-    service = PublicChartService(db)
-    return await service.get_featured_charts(limit=limit)
+
+    async def build() -> str:
+        charts = await PublicChartService(db).get_featured_charts(limit=limit)
+        return _PREVIEW_LIST_ADAPTER.dump_json(charts).decode()
+
+    return await _cached_listing(request, "featured", {"limit": limit}, build)
 
 
 @router.get(
@@ -285,18 +353,22 @@ async def get_categories(
     request: Request,
     response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> list[dict]:
+) -> list[dict] | Response:
     """Get all available categories with chart counts."""
-    service = PublicChartService(db)
-    categories = await service.get_categories_with_counts()
 
-    # Add all possible categories even if empty
-    existing = {c["category"] for c in categories}
-    for cat in PUBLIC_CHART_CATEGORIES:
-        if cat not in existing:
-            categories.append({"category": cat, "count": 0})
+    async def build() -> str:
+        categories = await PublicChartService(db).get_categories_with_counts()
 
-    return sorted(categories, key=lambda x: x["count"], reverse=True)
+        # Add all possible categories even if empty
+        existing = {c["category"] for c in categories}
+        for cat in PUBLIC_CHART_CATEGORIES:
+            if cat not in existing:
+                categories.append({"category": cat, "count": 0})
+
+        ordered = sorted(categories, key=lambda x: x["count"], reverse=True)
+        return _CATEGORY_LIST_ADAPTER.dump_json(ordered).decode()
+
+    return await _cached_listing(request, "categories", {}, build)
 
 
 @router.get(
@@ -318,7 +390,7 @@ async def get_public_chart(
             regex="^(en-US|pt-BR)$",
         ),
     ] = DEFAULT_LANGUAGE,
-) -> PublicChartDetail:
+) -> PublicChartDetail | Response:
     """
     Get a public chart by its slug.
 
@@ -343,6 +415,12 @@ async def get_public_chart(
             detail=f"Public chart '{slug}' not found",
         )
 
+    # updated_at also moves when the view count does
+    etag = make_etag(chart.id, chart.updated_at, lang)
+    if not_modified(request, etag):
+        return not_modified_response(etag, PUBLIC_REVALIDATE)
+    set_etag(response, etag, PUBLIC_REVALIDATE)
+
     # Extract language-specific data for both chart_data and text fields
     lang_chart_data = (
         extract_chart_data_for_language_dict(chart.chart_data, lang) if chart.chart_data else None
@@ -402,7 +480,7 @@ async def get_public_chart_interpretations(
     slug: str,
     db: Annotated[AsyncSession, Depends(get_db)],
     lang: Annotated[str | None, Query(description="Language: 'pt-BR' or 'en-US'")] = None,
-) -> ChartInterpretationsResponse:
+) -> ChartInterpretationsResponse | Response:
     """
     Get all interpretations for a public chart by its slug.
 
@@ -431,6 +509,20 @@ async def get_public_chart_interpretations(
             detail="Chart data is not available yet.",
         )
 
+    # Version of the stored interpretations (answers revalidation without loading them)
+    version_stmt = select(
+        func.count(PublicChartInterpretation.id), func.max(PublicChartInterpretation.updated_at)
+    ).where(
+        PublicChartInterpretation.chart_id == chart.id,
+        PublicChartInterpretation.language == language,
+    )
+    count, last_updated = (await db.execute(version_stmt)).one()
+    if count:
+        etag = make_etag(chart.id, language, count, last_updated)
+        if not_modified(request, etag):
+            return not_modified_response(etag, PUBLIC_REVALIDATE)
+        set_etag(response, etag, PUBLIC_REVALIDATE)
+
     # Check for existing interpretations in the requested language
     stmt = select(PublicChartInterpretation).where(
         PublicChartInterpretation.chart_id == chart.id,
@@ -505,192 +597,16 @@ async def _generate_public_chart_interpretations(
         language: Primary language for the returned response
         generate_all_languages: If True, also generates in other supported languages
     """
-    planets: dict[str, str] = {}
-    houses: dict[str, str] = {}
-    aspects: dict[str, str] = {}
-    arabic_parts: dict[str, str] = {}
-
-    # Initialize RAG service with language
-    rag_service = InterpretationServiceRAG(db, use_cache=True, use_rag=True, language=language)
-
-    chart_data = chart.chart_data
-    assert chart_data is not None, "chart_data must not be None"
-
-    planets_data = chart_data.get("planets", [])
-    houses_data = chart_data.get("houses", [])
-    arabic_parts_data = chart_data.get("arabic_parts", {})
-    sect = chart_data.get("sect", "diurnal")
-
-    # Process planets
-    for planet in planets_data:
-        planet_name = planet.get("name", "")
-        if not planet_name:
-            continue
-
-        sign = planet.get("sign", "")
-        house = planet.get("house", 1)
-        retrograde = planet.get("retrograde", False)
-        dignities = planet.get("dignities", {})
-
-        interpretation = await rag_service.generate_planet_interpretation(
-            planet=planet_name,
-            sign=sign,
-            house=house,
-            dignities=dignities,
-            sect=sect,
-            retrograde=retrograde,
-        )
-
-        planets[planet_name] = interpretation
-
-        # Save to database
-        interp_record = PublicChartInterpretation(
-            chart_id=chart.id,
-            interpretation_type="planet",
-            subject=planet_name,
-            content=interpretation,
-            openai_model="gpt-4o-mini-rag",
-            prompt_version="rag-v1",
-            language=language,
-        )
-        db.add(interp_record)
-
-    # Process houses
-    for house in houses_data:
-        house_number = house.get("house", 0) or house.get("number", 0)
-        house_sign = house.get("sign", "")
-
-        if not house_number or not house_sign:
-            continue
-
-        house_key = str(house_number)
-
-        from app.astro.dignities import get_sign_ruler
-
-        ruler = get_sign_ruler(house_sign) or "Unknown"
-
-        ruler_dignities: dict[str, Any] = {}
-        for planet_data in planets_data:
-            if planet_data.get("name") == ruler:
-                ruler_dignities = planet_data.get("dignities", {})
-                break
-
-        interpretation = await rag_service.generate_house_interpretation(
-            house=house_number,
-            sign=house_sign,
-            ruler=ruler,
-            ruler_dignities=ruler_dignities,
-            sect=sect,
-        )
-
-        houses[house_key] = interpretation
-
-        # Save to database
-        interp_record = PublicChartInterpretation(
-            chart_id=chart.id,
-            interpretation_type="house",
-            subject=house_key,
-            content=interpretation,
-            openai_model="gpt-4o-mini-rag",
-            prompt_version="rag-v1",
-            language=language,
-        )
-        db.add(interp_record)
-
-    # Process aspects (limited by settings)
-    aspects_list = chart_data.get("aspects", [])
-    max_aspects = settings.RAG_MAX_ASPECTS
+    assert chart.chart_data is not None, "chart_data must not be None"
 
-    for aspect in aspects_list[:max_aspects]:
-        planet1 = aspect.get("planet1", "")
-        planet2 = aspect.get("planet2", "")
-        aspect_name = aspect.get("aspect", "")
-        orb = aspect.get("orb", 0.0)
+    # Cached subjects are resolved in one batch, misses are generated
+    # concurrently and everything is saved with one bulk upsert
+    results = await PublicChartService(db).generate_interpretations(chart, language)
 
-        if not all([planet1, planet2, aspect_name]):
-            continue
-
-        aspect_key = f"{planet1}-{aspect_name}-{planet2}"
-
-        planet1_data: dict[str, Any] = next(
-            (p for p in planets_data if p.get("name") == planet1), {}
-        )
-        planet2_data: dict[str, Any] = next(
-            (p for p in planets_data if p.get("name") == planet2), {}
-        )
-
-        sign1 = planet1_data.get("sign", "")
-        sign2 = planet2_data.get("sign", "")
-        dignities1 = planet1_data.get("dignities", {})
-        dignities2 = planet2_data.get("dignities", {})
-        applying = aspect.get("applying", False)
-
-        interpretation = await rag_service.generate_aspect_interpretation(
-            planet1=planet1,
-            planet2=planet2,
-            aspect=aspect_name,
-            sign1=sign1,
-            sign2=sign2,
-            orb=orb,
-            applying=applying,
-            sect=sect,
-            dignities1=dignities1,
-            dignities2=dignities2,
-        )
-
-        aspects[aspect_key] = interpretation
-
-        # Save to database
-        interp_record = PublicChartInterpretation(
-            chart_id=chart.id,
-            interpretation_type="aspect",
-            subject=aspect_key,
-            content=interpretation,
-            openai_model="gpt-4o-mini-rag",
-            prompt_version="rag-v1",
-            language=language,
-        )
-        db.add(interp_record)
-
-    # Process Arabic Parts
-    for part_key, part_data in arabic_parts_data.items():
-        if part_key not in ARABIC_PARTS:
-            continue
-
-        part_sign = part_data.get("sign", "")
-        part_house = part_data.get("house", 1)
-        part_degree = part_data.get("degree", 0.0)
-
-        interpretation = await rag_service.generate_arabic_part_interpretation(
-            part_key=part_key,
-            sign=part_sign,
-            house=part_house,
-            degree=part_degree,
-            sect=sect,
-        )
-
-        arabic_parts[part_key] = interpretation
-
-        # Save to database
-        interp_record = PublicChartInterpretation(
-            chart_id=chart.id,
-            interpretation_type="arabic_part",
-            subject=part_key,
-            content=interpretation,
-            openai_model="gpt-4o-mini-rag",
-            prompt_version="rag-v1",
-            language=language,
-        )
-        db.add(interp_record)
-
-    # Commit all interpretations
-    await db.commit()
-
-    logger.info(
-        f"Saved {len(planets)} planet, {len(houses)} house, "
-        f"{len(aspects)} aspect, and {len(arabic_parts)} Arabic Part "
-        f"interpretations for public chart {chart.id} ({language})"
-    )
+    planets = results["planets"]
+    houses = results["houses"]
+    aspects = results["aspects"]
+    arabic_parts = results["arabic_parts"]
 
     # Generate interpretations in other languages if requested.
     # This runs after primary language is saved, so failures don't affect the main response.
@@ -755,7 +671,7 @@ admin_router = APIRouter(prefix="/admin/public-charts", tags=["admin-public-char
 )
 async def list_public_charts_admin(
     db: Annotated[AsyncSession, Depends(get_db)],
-    admin_user: Annotated[User, Depends(require_admin)],
+    admin_user: Annotated[AuthPrincipal, Depends(require_admin)],
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     page_size: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 50,
     include_unpublished: Annotated[bool, Query(description="Include unpublished")] = True,
@@ -779,7 +695,7 @@ async def list_public_charts_admin(
 async def create_public_chart(
     data: PublicChartCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    admin_user: Annotated[User, Depends(require_admin)],
+    admin_user: Annotated[AuthPrincipal, Depends(require_admin)],
 ) -> PublicChartDetail:
     """
     Create a new public chart.
@@ -807,7 +723,7 @@ async def create_public_chart(
 async def get_public_chart_admin(
     chart_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    admin_user: Annotated[User, Depends(require_admin)],
+    admin_user: Annotated[AuthPrincipal, Depends(require_admin)],
 ) -> PublicChartDetail:
     """Admin endpoint to get any chart by ID."""
     service = PublicChartService(db)
@@ -832,7 +748,7 @@ async def update_public_chart(
     chart_id: UUID,
     data: PublicChartUpdate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    admin_user: Annotated[User, Depends(require_admin)],
+    admin_user: Annotated[AuthPrincipal, Depends(require_admin)],
 ) -> PublicChartDetail:
     """
     Update a public chart.
@@ -867,7 +783,7 @@ async def update_public_chart(
 async def delete_public_chart(
     chart_id: UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
-    admin_user: Annotated[User, Depends(require_admin)],
+    admin_user: Annotated[AuthPrincipal, Depends(require_admin)],
 ) -> None:
     """Delete a public chart permanently."""
     service = PublicChartService(db)
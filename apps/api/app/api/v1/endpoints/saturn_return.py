@@ -21,6 +21,7 @@ from app.astro.saturn_return import (
     get_saturn_return_interpretation,
     get_sign_from_longitude,
 )
+from app.core.calculation_executor import get_calculation_executor
 from app.core.context import get_locale
 from app.core.credit_config import get_feature_cost
 from app.core.dependencies import get_current_user, get_db
@@ -185,8 +186,12 @@ async def get_saturn_return(
         chart.longitude,
     )
 
+    # Run the calculations off the event loop
+    executor = get_calculation_executor()
+
     # Calculate Saturn Return analysis
-    analysis = calculate_saturn_return_analysis(
+    analysis = await executor.run(
+        calculate_saturn_return_analysis,
         birth_jd=birth_jd,
         natal_saturn_longitude=natal_saturn_longitude,
         natal_saturn_house=natal_saturn_house,
@@ -286,8 +291,12 @@ async def get_saturn_return_interp(
         chart.longitude,
     )
 
+    # Run the calculations off the event loop
+    executor = get_calculation_executor()
+
     # Get Saturn Return analysis to determine current phase
-    analysis = calculate_saturn_return_analysis(
+    analysis = await executor.run(
+        calculate_saturn_return_analysis,
         birth_jd=birth_jd,
         natal_saturn_longitude=natal_saturn_longitude,
         natal_saturn_house=natal_saturn_house,
@@ -16,10 +16,11 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response,
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.astro.solar_return import (
-    calculate_multiple_solar_returns,
+    calculate_multiple_solar_returns_async,
     calculate_solar_return,
     get_solar_return_interpretation,
 )
+from app.core.calculation_executor import get_calculation_executor, get_solar_return_executor
 from app.core.context import get_locale
 from app.core.credit_config import get_feature_cost
 from app.core.dependencies import get_current_user, get_db
@@ -202,8 +203,9 @@ async def get_solar_return(
             detail="Sun data not found in chart",
         )
 
-    # Calculate Solar Return
-    sr_data = calculate_solar_return(
+    # Calculate Solar Return (off the event loop)
+    sr_data = await get_calculation_executor().run(
+        calculate_solar_return,
         natal_sun_longitude=natal_sun_longitude,
         birth_datetime=chart.birth_datetime,
         target_year=year,
@@ -327,8 +329,8 @@ async def get_solar_returns(
     sr_latitude = lat if lat is not None else chart.latitude
     sr_longitude = lon if lon is not None else chart.longitude
 
-    # Calculate multiple Solar Returns
-    returns = calculate_multiple_solar_returns(
+    # Calculate multiple Solar Returns (years run in parallel on the Solar Return executor)
+    returns = await calculate_multiple_solar_returns_async(
         natal_sun_longitude=natal_sun_longitude,
         birth_datetime=chart.birth_datetime,
         start_year=start_year,
@@ -339,6 +341,7 @@ async def get_solar_returns(
         city=chart.city or "",
         country=chart.country or "",
         house_system=chart.house_system or "placidus",
+        executor=get_solar_return_executor(),
     )
 
     # Consume credits for each year in the batch (unless admin)
@@ -450,8 +453,9 @@ async def get_solar_return_interp(
     sr_latitude = lat if lat is not None else chart.latitude
     sr_longitude = lon if lon is not None else chart.longitude
 
-    # Calculate Solar Return to get ascendant and sun house
-    sr_data = calculate_solar_return(
+    # Calculate Solar Return to get ascendant and sun house (off the event loop)
+    sr_data = await get_calculation_executor().run(
+        calculate_solar_return,
         natal_sun_longitude=natal_sun_longitude,
         birth_datetime=chart.birth_datetime,
         target_year=year,
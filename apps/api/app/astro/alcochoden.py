@@ -50,14 +50,12 @@ Alternative Method (NOT Implemented):
 
 from typing import Any
 
+from app.astro.aspects import find_aspects
 from app.astro.dignities import (
-    EGYPTIAN_TERMS,
     EXALTATIONS,
-    FACES,
     RULERSHIPS,
-    SIGN_ELEMENTS,
     SIGNS,
-    TRIPLICITIES,
+    get_rulers_at_position,
 )
 from app.translations import get_translation
 
@@ -139,47 +137,7 @@ def get_dignities_at_position(
             "face": "Saturn" or None,
         }
     """
-    dignities: dict[str, str | None] = {
-        "domicile": None,
-        "exaltation": None,
-        "triplicity": None,
-        "term": None,
-        "face": None,
-    }
-
-    # Domicile ruler
-    dignities["domicile"] = RULERSHIPS.get(sign)
-
-    # Exaltation ruler (check if any planet is exalted in this sign)
-    for planet, exalt_data in EXALTATIONS.items():
-        if exalt_data["sign"] == sign:
-            dignities["exaltation"] = planet
-            break
-
-    # Triplicity ruler (based on element and sect)
-    element = SIGN_ELEMENTS.get(sign)
-    if element and element in TRIPLICITIES:
-        trip_data = TRIPLICITIES[element]
-        if sect == "diurnal":
-            dignities["triplicity"] = trip_data["day_ruler"]
-        else:
-            dignities["triplicity"] = trip_data["night_ruler"]
-
-    # Term ruler
-    if sign in EGYPTIAN_TERMS:
-        for start, end, planet in EGYPTIAN_TERMS[sign]:
-            if start <= degree < end:
-                dignities["term"] = planet
-                break
-
-    # Face ruler
-    if sign in FACES:
-        for start, end, planet in FACES[sign]:
-            if start <= degree < end:
-                dignities["face"] = planet
-                break
-
-    return dignities
+    return get_rulers_at_position(sign, degree, sect)
 
 
 def planet_aspects_position(
@@ -198,23 +156,19 @@ def planet_aspects_position(
     Returns:
         Aspect data if aspect found, None otherwise
     """
-    angle_diff = abs(planet_longitude - target_longitude)
-    if angle_diff > 180:
-        angle_diff = 360 - angle_diff
-
-    for aspect_name, aspect_data in ALCOCHODEN_ASPECTS.items():
-        aspect_angle = aspect_data["angle"]
-        aspect_orb = min(orb, aspect_data["orb"])
-
-        orb_diff = abs(angle_diff - aspect_angle)
-        if orb_diff <= aspect_orb:
-            return {
-                "aspect": aspect_name,
-                "angle": round(angle_diff, 2),
-                "orb": round(orb_diff, 2),
-            }
+    aspect_orbs = {
+        name: {"angle": data["angle"], "orb": min(orb, data["orb"])}
+        for name, data in ALCOCHODEN_ASPECTS.items()
+    }
+    matches = find_aspects([planet_longitude], aspect_orbs, longitudes_b=[target_longitude])
+    if not matches:
+        return None
 
-    return None
+    return {
+        "aspect": matches[0].aspect,
+        "angle": round(matches[0].angle, 2),
+        "orb": round(matches[0].orb, 2),
+    }
 
 
 def find_alcochoden_candidates(
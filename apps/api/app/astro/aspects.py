@@ -0,0 +1,235 @@
+"""
+Aspect engine shared by chart, Solar Return, Hyleg and Alcochoden code.
+
+Aspects are given in the same shape used throughout the package:
+
+    {"Conjunction": {"angle": 0, "orb": 8}, "Sextile": {"angle": 60, "orb": 6}, ...}
+
+``find_aspects`` finds every aspect between two point sets (or within one).
+The second set is sorted by longitude once; for each point of the first set
+and each aspect, the two windows ``lon ± angle ± orb`` are located with a
+binary search, so only pairs that can be in orb are examined. Candidates are
+then checked with the exact separation and orb, and the applying/separating
+state is derived from daily speeds when they are given.
+
+``find_aspects_many`` evaluates a whole stack of charts at once (one row of
+longitudes per chart) for bulk analysis, e.g. aspect statistics across every
+public chart.
+"""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+# Window padding so floating-point noise never drops a pair at the exact orb
+# limit; every candidate is re-checked against the exact orb afterwards.
+WINDOW_EPSILON = 1e-9
+
+
+@dataclass(frozen=True)
+class AspectMatch:
+    """A single aspect between point ``index_a`` of set A and ``index_b`` of set B."""
+
+    index_a: int
+    index_b: int
+    aspect: str
+    aspect_angle: float
+    angle: float  # Actual separation (0-180)
+    orb: float  # Distance from the exact aspect angle
+    applying: bool | None  # None when speeds are not given
+
+
+@dataclass(frozen=True)
+class AspectArrays:
+    """Aspects found across many charts, one entry per match."""
+
+    chart: np.ndarray  # Row of the chart in the input stack
+    index_a: np.ndarray  # Column of the first point (index_a < index_b)
+    index_b: np.ndarray  # Column of the second point
+    aspect: np.ndarray  # Index into the aspect names
+    angle: np.ndarray
+    orb: np.ndarray
+    applying: np.ndarray | None
+    aspect_names: tuple[str, ...]
+
+
+def _aspect_arrays(
+    aspects: Mapping[str, Mapping[str, float]],
+) -> tuple[tuple[str, ...], np.ndarray, np.ndarray]:
+    """Split an aspect definition mapping into names, angles and orbs."""
+    names = tuple(aspects)
+    angles = np.array([aspects[name]["angle"] for name in names], dtype=float)
+    orbs = np.array([aspects[name]["orb"] for name in names], dtype=float)
+    return names, angles, orbs
+
+
+def _separation(lon_a: np.ndarray, lon_b: np.ndarray) -> np.ndarray:
+    """Shortest angular distance (0-180) between longitudes."""
+    separation = np.abs(lon_a - lon_b) % 360
+    return np.where(separation > 180, 360 - separation, separation)
+
+
+def _is_applying(
+    separation: np.ndarray,
+    speed_a: np.ndarray,
+    speed_b: np.ndarray,
+    aspect_angle: np.ndarray,
+) -> np.ndarray:
+    """Applying when the faster point is closing on the exact aspect angle."""
+    relative_speed = speed_a - speed_b
+    return ((relative_speed > 0) & (separation < aspect_angle)) | (
+        (relative_speed < 0) & (separation > aspect_angle)
+    )
+
+
+def is_applying(
+    lon_a: float, lon_b: float, speed_a: float, speed_b: float, aspect_angle: float
+) -> bool:
+    """Applying/separating state of a single pair, using the engine's rule."""
+    separation = _separation(np.array(lon_a, dtype=float), np.array(lon_b, dtype=float))
+    return bool(
+        _is_applying(
+            separation,
+            np.array(speed_a, dtype=float),
+            np.array(speed_b, dtype=float),
+            np.array(aspect_angle, dtype=float),
+        )
+    )
+
+
+def find_aspects(
+    longitudes_a: Sequence[float] | np.ndarray,
+    aspects: Mapping[str, Mapping[str, float]],
+    longitudes_b: Sequence[float] | np.ndarray | None = None,
+    speeds_a: Sequence[float] | np.ndarray | None = None,
+    speeds_b: Sequence[float] | np.ndarray | None = None,
+) -> list[AspectMatch]:
+    """
+    Find all aspects between two sets of points.
+
+    Args:
+        longitudes_a: Longitudes of the first set
+        aspects: Aspect definitions ({name: {"angle": ..., "orb": ...}})
+        longitudes_b: Longitudes of the second set. When omitted, aspects are
+            found within the first set (each pair once, index_a < index_b).
+        speeds_a: Daily speeds of the first set (enables applying/separating)
+        speeds_b: Daily speeds of the second set (defaults to speeds_a when
+            finding aspects within one set)
+
+    Returns:
+        Matches ordered by (index_a, index_b, aspect definition order)
+    """
+    within_set = longitudes_b is None
+    lon_a = np.asarray(longitudes_a, dtype=float)
+    lon_b = lon_a if within_set else np.asarray(longitudes_b, dtype=float)
+    names, angles, orbs = _aspect_arrays(aspects)
+    if not len(lon_a) or not len(lon_b) or not names:
+        return []
+
+    # Sort set B once and repeat it one turn below and above, so no search
+    # window has to wrap around 0°/360°
+    normalized_b = lon_b % 360
+    order = np.argsort(normalized_b, kind="stable")
+    sorted_b = normalized_b[order]
+    extended = np.concatenate([sorted_b - 360, sorted_b, sorted_b + 360])
+    extended_index = np.tile(order, 3)
+
+    # Window centres lon ± angle for every (point, aspect): shape (n_a, n_aspects, 2)
+    centres = (lon_a % 360)[:, None, None] + angles[None, :, None] * np.array([1.0, -1.0])
+    half_widths = orbs[None, :, None] + WINDOW_EPSILON
+    starts = np.searchsorted(extended, centres - half_widths, side="left").ravel()
+    counts = np.searchsorted(extended, centres + half_widths, side="right").ravel() - starts
+
+    # Expand every window into its candidate positions
+    window = np.repeat(np.arange(starts.size), counts)
+    offsets = np.arange(window.size) - np.repeat(np.cumsum(counts) - counts, counts)
+    candidate_b = extended_index[starts[window] + offsets]
+    candidate_a, candidate_aspect, _ = np.unravel_index(window, centres.shape)
+
+    # Deduplicate (0° and 180° windows coincide) and order by (a, b, aspect)
+    n_b, n_aspects = len(lon_b), len(names)
+    keys = np.unique((candidate_a * n_b + candidate_b) * n_aspects + candidate_aspect)
+    index_a, rest = np.divmod(keys, n_b * n_aspects)
+    index_b, aspect_index = np.divmod(rest, n_aspects)
+    if within_set:
+        keep = index_a < index_b
+        index_a, index_b, aspect_index = index_a[keep], index_b[keep], aspect_index[keep]
+
+    # Exact check
+    separation = _separation(lon_a[index_a], lon_b[index_b])
+    orb = np.abs(separation - angles[aspect_index])
+    keep = orb <= orbs[aspect_index]
+    index_a, index_b, aspect_index = index_a[keep], index_b[keep], aspect_index[keep]
+    separation, orb = separation[keep], orb[keep]
+
+    applying: list[bool | None] = [None] * len(index_a)
+    if speeds_a is not None:
+        speed_a = np.asarray(speeds_a, dtype=float)
+        speed_b = speed_a if speeds_b is None else np.asarray(speeds_b, dtype=float)
+        applying = _is_applying(
+            separation, speed_a[index_a], speed_b[index_b], angles[aspect_index]
+        ).tolist()
+
+    return [
+        AspectMatch(
+            index_a=int(a),
+            index_b=int(b),
+            aspect=names[k],
+            aspect_angle=float(angles[k]),
+            angle=float(sep),
+            orb=float(o),
+            applying=is_applying,
+        )
+        for a, b, k, sep, o, is_applying in zip(
+            index_a, index_b, aspect_index, separation, orb, applying, strict=True
+        )
+    ]
+
+
+def find_aspects_many(
+    longitudes: np.ndarray,
+    aspects: Mapping[str, Mapping[str, float]],
+    speeds: np.ndarray | None = None,
+) -> AspectArrays:
+    """
+    Find aspects within each chart of a stack of charts.
+
+    Args:
+        longitudes: Array of shape (n_charts, n_points); NaN marks a point
+            that is missing from a chart
+        aspects: Aspect definitions ({name: {"angle": ..., "orb": ...}})
+        speeds: Optional daily speeds with the same shape as longitudes
+
+    Returns:
+        AspectArrays ordered by (chart, index_a, index_b, aspect definition order)
+    """
+    lon = np.asarray(longitudes, dtype=float)
+    names, angles, orbs = _aspect_arrays(aspects)
+    pair_a, pair_b = np.triu_indices(lon.shape[1], k=1)
+
+    # (n_charts, n_pairs, n_aspects); NaN separations never match
+    separation = _separation(lon[:, pair_a], lon[:, pair_b])
+    orb = np.abs(separation[:, :, None] - angles)
+    chart, pair, aspect_index = np.nonzero(orb <= orbs)
+
+    applying = None
+    if speeds is not None:
+        speed = np.asarray(speeds, dtype=float)
+        applying = _is_applying(
+            separation[chart, pair],
+            speed[chart, pair_a[pair]],
+            speed[chart, pair_b[pair]],
+            angles[aspect_index],
+        )
+
+    return AspectArrays(
+        chart=chart,
+        index_a=pair_a[pair],
+        index_b=pair_b[pair],
+        aspect=aspect_index,
+        angle=separation[chart, pair],
+        orb=orb[chart, pair, aspect_index],
+        applying=applying,
+        aspect_names=names,
+    )
@@ -0,0 +1,205 @@
+"""
+Longitude crossing solver shared by return calculations.
+
+Finds every moment a body crosses a target ecliptic longitude inside a time
+window, including the extra passes caused by retrograde motion (e.g. the
+three passes of a Saturn Return).
+
+Algorithm:
+1. Sample longitude and speed (``FLG_SPEED``) across the window in one batch.
+2. Wherever the speed changes sign, locate the station with a secant search on
+   speed and insert it as an extra sample. Between consecutive samples the
+   body is then monotonic, so each interval holds at most one crossing.
+3. For every interval whose longitude difference to the target changes sign,
+   run Newton iteration ``jd -= diff / speed``, safeguarded by bisection so
+   the estimate never leaves the bracket.
+
+Sun returns typically converge in 2-3 Newton steps; a full Saturn Return
+window needs a few dozen ephemeris calls instead of hundreds.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import swisseph as swe
+
+from app.astro.ephemeris import DEFAULT_FLAGS, calc_position, calc_positions
+
+# Sampling step per body (days). Must be shorter than the body's shortest
+# retrograde/direct period so no two stations fall within one step.
+SCAN_STEP_DAYS = {
+    swe.SUN: 10.0,
+    swe.MOON: 2.0,
+    swe.MERCURY: 4.0,
+    swe.VENUS: 8.0,
+    swe.MARS: 10.0,
+    swe.JUPITER: 15.0,
+    swe.SATURN: 15.0,
+    swe.URANUS: 20.0,
+    swe.NEPTUNE: 20.0,
+    swe.PLUTO: 20.0,
+}
+DEFAULT_SCAN_STEP_DAYS = 4.0
+
+# Convergence criteria
+TOLERANCE_DAYS = 1e-6  # ~0.1 second
+TOLERANCE_DEGREES = 1e-7
+MAX_ITERATIONS = 50
+STATION_TOLERANCE_DAYS = 1e-3
+
+
+@dataclass
+class LongitudeCrossing:
+    """A single pass of a body over a target longitude."""
+
+    jd: float
+    longitude: float
+    speed: float
+    is_retrograde: bool
+
+
+def _wrap_180(angle: float | np.ndarray) -> float | np.ndarray:
+    """Normalize an angle (or array of angles) to the range [-180, 180)."""
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+def _find_station(body: int, jd_a: float, jd_b: float, speed_a: float, speed_b: float) -> float:
+    """
+    Locate the moment a body's speed changes sign between two Julian Days.
+
+    Uses the Illinois variant of regula falsi (a bracketed secant method).
+    """
+    side = 0
+    for _ in range(MAX_ITERATIONS):
+        jd_c = jd_b - speed_b * (jd_b - jd_a) / (speed_b - speed_a)
+        speed_c = calc_position(jd_c, body, DEFAULT_FLAGS)[3]
+
+        if abs(jd_b - jd_a) < STATION_TOLERANCE_DAYS or speed_c == 0:
+            return jd_c
+
+        if speed_c * speed_b > 0:
+            jd_b, speed_b = jd_c, speed_c
+            if side == -1:
+                speed_a /= 2
+            side = -1
+        else:
+            jd_a, speed_a = jd_c, speed_c
+            if side == 1:
+                speed_b /= 2
+            side = 1
+
+    return (jd_a + jd_b) / 2
+
+
+def _refine_crossing(
+    body: int, target: float, jd_a: float, jd_b: float, diff_a: float, diff_b: float
+) -> float:
+    """
+    Newton iteration on longitude, safeguarded by bisection within [jd_a, jd_b].
+
+    The bracket must contain exactly one crossing with the body monotonic.
+    diff_a and diff_b are the signed longitude differences to the target at
+    the bracket ends; they seed the first (secant) estimate.
+    """
+    jd = jd_a + (jd_b - jd_a) * diff_a / (diff_a - diff_b)
+
+    for _ in range(MAX_ITERATIONS):
+        position = calc_position(jd, body, DEFAULT_FLAGS)
+        diff = _wrap_180(position[0] - target)
+        speed = position[3]
+
+        if abs(diff) < TOLERANCE_DEGREES:
+            return jd
+
+        # Shrink the bracket around the root
+        if diff * diff_a > 0:
+            jd_a, diff_a = jd, diff
+        else:
+            jd_b = jd
+
+        # Newton step, falling back to bisection if it leaves the bracket
+        next_jd = jd - diff / speed if speed != 0 else jd_a
+        if not jd_a < next_jd < jd_b:
+            next_jd = (jd_a + jd_b) / 2
+
+        if abs(next_jd - jd) < TOLERANCE_DAYS:
+            return next_jd
+        jd = next_jd
+
+    return jd
+
+
+def find_longitude_crossings(
+    body: int,
+    target_lon: float,
+    jd_start: float,
+    jd_end: float,
+    scan_step_days: float | None = None,
+) -> list[LongitudeCrossing]:
+    """
+    Find all passes of a body over a target longitude within a window.
+
+    Args:
+        body: Swiss Ephemeris body ID (e.g., swe.SATURN)
+        target_lon: Target ecliptic longitude (0-360)
+        jd_start: Start of the search window (Julian Day)
+        jd_end: End of the search window (Julian Day)
+        scan_step_days: Override the sampling step for this body
+
+    Returns:
+        Chronologically ordered list of LongitudeCrossing (direct and retrograde)
+    """
+    target = target_lon % 360
+    step = scan_step_days or SCAN_STEP_DAYS.get(body, DEFAULT_SCAN_STEP_DAYS)
+
+    n_steps = max(1, int(np.ceil((jd_end - jd_start) / step)))
+    sample_jds = np.linspace(jd_start, jd_end, n_steps + 1)
+    batch = calc_positions(sample_jds, [body], DEFAULT_FLAGS)
+    speeds = batch.speeds[:, 0]
+
+    # Insert stations so that every interval is monotonic
+    jds = sample_jds.tolist()
+    stations = np.nonzero(speeds[:-1] * speeds[1:] < 0)[0]
+    for index in stations.tolist():
+        jds.append(
+            _find_station(
+                body,
+                float(sample_jds[index]),
+                float(sample_jds[index + 1]),
+                float(speeds[index]),
+                float(speeds[index + 1]),
+            )
+        )
+    jds.sort()
+
+    if len(stations):
+        batch = calc_positions(jds, [body], DEFAULT_FLAGS)
+    diffs = _wrap_180(batch.longitudes[:, 0] - target)
+
+    crossings: list[LongitudeCrossing] = []
+    for i in range(len(jds) - 1):
+        diff_a, diff_b = diffs[i], diffs[i + 1]
+
+        # A sign change across a jump of ~360° is the opposite point, not a crossing
+        if abs(diff_b - diff_a) > 180:
+            continue
+        if i == 0 and diff_a == 0:
+            crossing_jd = jds[0]
+        elif diff_a * diff_b < 0 or diff_b == 0:
+            crossing_jd = _refine_crossing(
+                body, target, jds[i], jds[i + 1], float(diff_a), float(diff_b)
+            )
+        else:
+            continue
+
+        position = calc_position(crossing_jd, body, DEFAULT_FLAGS)
+        crossings.append(
+            LongitudeCrossing(
+                jd=crossing_jd,
+                longitude=position[0],
+                speed=position[3],
+                is_retrograde=position[3] < 0,
+            )
+        )
+
+    return crossings
@@ -8,11 +8,18 @@ Hellenistic and Medieval astrology, including:
 - Triplicity (by sect)
 - Term (Bounds) - Egyptian system (default, other systems available in terms.py)
 - Face (Decan)
+
+Every ruler and score depends only on the planet, the sect and the whole
+degree of the position (all term and face boundaries are whole degrees), so
+the module precomputes 360-entry lookup tables at import time. Dignity lookups
+are then a single index into those tables.
 """
 
 from typing import Any
 
-from app.astro.terms import EGYPTIAN_TERMS
+import numpy as np
+
+from app.astro.terms import SIGN_INDEX, TERM_TABLES, TermSystem
 from app.translations import DEFAULT_LANGUAGE, get_translation
 
 # Zodiac signs in order
@@ -148,6 +155,29 @@ DIGNITY_POINTS = {
 }
 
 
+def _position_index(sign: str, degree: float) -> int | None:
+    """
+    Convert a sign and degree to a 0-359 table index.
+
+    Returns:
+        Whole-degree ecliptic index, or None for an unknown sign or a degree
+        outside [0, 30)
+    """
+    sign_index = SIGN_INDEX.get(sign)
+    if sign_index is None or not 0 <= degree < 30:
+        return None
+    return sign_index * 30 + int(degree)
+
+
+# Egyptian term and face rulers by whole degree (0-359)
+EGYPTIAN_TERM_TABLE = tuple(ruler for ruler, _, _ in TERM_TABLES[TermSystem.EGYPTIAN])
+FACE_TABLE = tuple(
+    next(planet for start, end, planet in FACES[sign] if start <= degree < end)
+    for sign in SIGNS
+    for degree in range(30)
+)
+
+
 def get_planet_in_term(sign: str, degree: float) -> str | None:
     """
     Get the planet that rules the term (bound) for a given degree in a sign.
@@ -159,13 +189,8 @@ def get_planet_in_term(sign: str, degree: float) -> str | None:
     Returns:
         Planet name that rules the term, or None if not found
     """
-    if sign not in EGYPTIAN_TERMS:
-        return None
-
-    for start, end, planet in EGYPTIAN_TERMS[sign]:
-        if start <= degree < end:
-            return planet
-    return None
+    index = _position_index(sign, degree)
+    return None if index is None else EGYPTIAN_TERM_TABLE[index]
 
 
 def get_planet_in_face(sign: str, degree: float) -> str | None:
@@ -179,48 +204,80 @@ def get_planet_in_face(sign: str, degree: float) -> str | None:
     Returns:
         Planet name that rules the face, or None if not found
     """
-    if sign not in FACES:
-        return None
+    index = _position_index(sign, degree)
+    return None if index is None else FACE_TABLE[index]
+
 
-    for start, end, planet in FACES[sign]:
-        if start <= degree < end:
+def _exaltation_ruler(sign: str) -> str | None:
+    """Get the planet exalted in a sign, if any."""
+    for planet, exalt_data in EXALTATIONS.items():
+        if exalt_data["sign"] == sign:
             return planet
     return None
 
 
-def calculate_essential_dignities(
-    planet: str, sign: str, degree: float, sect: str
-) -> dict[str, Any]:
-    """
-    Calculate all essential dignities for a planet.
+def _build_ruler_table(is_diurnal: bool) -> tuple[dict[str, str | None], ...]:
+    """Build the 360-entry table of dignity rulers for one sect."""
+    table = []
+    for index in range(360):
+        sign = SIGNS[index // 30]
+        trip_data = TRIPLICITIES[SIGN_ELEMENTS[sign]]
+        table.append(
+            {
+                "domicile": RULERSHIPS[sign],
+                "exaltation": _exaltation_ruler(sign),
+                "triplicity": trip_data["day_ruler" if is_diurnal else "night_ruler"],
+                "term": EGYPTIAN_TERM_TABLE[index],
+                "face": FACE_TABLE[index],
+            }
+        )
+    return tuple(table)
 
-    This follows the traditional point system:
-    - Rulership (Domicile): +5
-    - Exaltation: +4
-    - Triplicity: +3 (for day/night ruler), +3 (for participant)
-    - Term: +2
-    - Face: +1
-    - Detriment (opposite of rulership): -5
-    - Fall (opposite of exaltation): -4
+
+# Dignity rulers by sect (True = diurnal) and whole degree
+RULER_TABLES = {is_diurnal: _build_ruler_table(is_diurnal) for is_diurnal in (True, False)}
+
+
+def get_rulers_at_position(sign: str, degree: float, sect: str) -> dict[str, str | None]:
+    """
+    Get the planets that hold each dignity at a zodiacal position.
 
     Args:
-        planet: Planet name (e.g., "Sun", "Moon", "Mars")
-        sign: Zodiac sign name (e.g., "Aries", "Taurus")
-        degree: Degree within the sign (0.0-30.0)
-        sect: Chart sect - "diurnal" (day chart) or "nocturnal" (night chart)
+        sign: Zodiac sign name
+        degree: Degree within the sign (0-30)
+        sect: Chart sect - "diurnal" or "nocturnal"
 
     Returns:
-        Dictionary containing:
-        - score: Total dignity score
-        - dignities: List of dignity names
-        - is_ruler: Boolean
-        - is_exalted: Boolean
-        - is_detriment: Boolean
-        - is_fall: Boolean
-        - triplicity_ruler: str or None
-        - term_ruler: str or None
-        - face_ruler: str or None
-        - classification: "dignified", "peregrine", or "debilitated"
+        New dictionary with "domicile", "exaltation", "triplicity", "term" and
+        "face" rulers (None where not applicable)
+    """
+    index = _position_index(sign, degree)
+    if index is not None:
+        return dict(RULER_TABLES[sect == "diurnal"][index])
+
+    # Unknown sign or degree outside the sign: only sign-level rulers apply
+    element = SIGN_ELEMENTS.get(sign)
+    trip_data = TRIPLICITIES.get(element) if element else None
+    triplicity = None
+    if trip_data:
+        triplicity = trip_data["day_ruler" if sect == "diurnal" else "night_ruler"]
+    return {
+        "domicile": RULERSHIPS.get(sign),
+        "exaltation": _exaltation_ruler(sign),
+        "triplicity": triplicity,
+        "term": None,
+        "face": None,
+    }
+
+
+def _compute_essential_dignities(
+    planet: str, sign: str, degree: float, sect: str
+) -> dict[str, Any]:
+    """
+    Calculate all essential dignities for a planet from the rule tables.
+
+    Used to build DIGNITY_TABLES, and directly for positions the tables do
+    not cover. See calculate_essential_dignities for arguments and result.
     """
     score = 0
     dignities: list[str] = []
@@ -322,6 +379,102 @@ def calculate_essential_dignities(
     }
 
 
+# Planets covered by the precomputed dignity tables (the classical seven)
+DIGNITY_TABLE_PLANETS = tuple(EXALTATIONS)
+
+# Full dignity results by (planet, sect is diurnal), indexed by whole degree
+DIGNITY_TABLES: dict[tuple[str, bool], tuple[dict[str, Any], ...]] = {
+    (planet, is_diurnal): tuple(
+        _compute_essential_dignities(
+            planet, SIGNS[index // 30], index % 30, "diurnal" if is_diurnal else "nocturnal"
+        )
+        for index in range(360)
+    )
+    for planet in DIGNITY_TABLE_PLANETS
+    for is_diurnal in (True, False)
+}
+
+# Dignity scores as an array [planet, sect (0 = nocturnal, 1 = diurnal), degree]
+DIGNITY_SCORES = np.array(
+    [
+        [
+            [entry["score"] for entry in DIGNITY_TABLES[(planet, is_diurnal)]]
+            for is_diurnal in (False, True)
+        ]
+        for planet in DIGNITY_TABLE_PLANETS
+    ],
+    dtype=np.int8,
+)
+
+
+def calculate_essential_dignities(
+    planet: str, sign: str, degree: float, sect: str
+) -> dict[str, Any]:
+    """
+    Calculate all essential dignities for a planet.
+
+    This follows the traditional point system:
+    - Rulership (Domicile): +5
+    - Exaltation: +4
+    - Triplicity: +3 (for day/night ruler), +3 (for participant)
+    - Term: +2
+    - Face: +1
+    - Detriment (opposite of rulership): -5
+    - Fall (opposite of exaltation): -4
+
+    Args:
+        planet: Planet name (e.g., "Sun", "Moon", "Mars")
+        sign: Zodiac sign name (e.g., "Aries", "Taurus")
+        degree: Degree within the sign (0.0-30.0)
+        sect: Chart sect - "diurnal" (day chart) or "nocturnal" (night chart)
+
+    Returns:
+        Dictionary containing:
+        - score: Total dignity score
+        - dignities: List of dignity names
+        - is_ruler: Boolean
+        - is_exalted: Boolean
+        - is_detriment: Boolean
+        - is_fall: Boolean
+        - triplicity_ruler: str or None
+        - term_ruler: str or None
+        - face_ruler: str or None
+        - classification: "dignified", "peregrine", or "debilitated"
+    """
+    index = _position_index(sign, degree)
+    table = DIGNITY_TABLES.get((planet, sect == "diurnal"))
+    if index is None or table is None:
+        return _compute_essential_dignities(planet, sign, degree, sect)
+
+    entry = table[index]
+    return {**entry, "dignities": list(entry["dignities"])}
+
+
+def get_dignity_scores(planet: str, longitudes: np.ndarray, sect: str) -> np.ndarray:
+    """
+    Get dignity scores of one planet at many ecliptic longitudes.
+
+    Vectorized lookup for backfills and batch analysis.
+
+    Args:
+        planet: Classical planet name (one of DIGNITY_TABLE_PLANETS)
+        longitudes: Array of ecliptic longitudes (0-360)
+        sect: Chart sect - "diurnal" or "nocturnal"
+
+    Returns:
+        Integer array of dignity scores, same shape as longitudes
+
+    Raises:
+        ValueError: If the planet has no dignity table
+    """
+    if planet not in DIGNITY_TABLE_PLANETS:
+        raise ValueError(f"No dignity table for planet: {planet}")
+
+    # % 360 can round tiny negative longitudes up to 360.0
+    indices = np.minimum(np.asarray(longitudes, dtype=float) % 360, 359).astype(np.intp)
+    return DIGNITY_SCORES[DIGNITY_TABLE_PLANETS.index(planet), int(sect == "diurnal"), indices]
+
+
 def get_sign_ruler(sign: str) -> str | None:
     """
     Get the traditional ruler of a zodiac sign.
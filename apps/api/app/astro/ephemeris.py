@@ -0,0 +1,137 @@
+"""
+Batch ephemeris engine built on Swiss Ephemeris.
+
+pyswisseph only exposes a scalar ``calc_ut(jd, body, flags)`` call. Every
+scanner in this package (solar/saturn returns, prenatal syzygy) and every
+bulk script used to call it one date and one body at a time. This module
+centralises those calls:
+
+- ``calc_positions`` takes a NumPy array of Julian Days and a sequence of
+  bodies and returns ``(n_jd, n_body)`` arrays of longitude, latitude and
+  speed in longitude.
+- Each ``(jd, body, flags)`` lookup is memoized in a bounded LRU cache, so
+  repeated samples (bisection endpoints, charts sharing a birth moment,
+  overlapping scan windows) are served without touching the ephemeris.
+- Duplicate Julian Days inside one batch are resolved once.
+
+Example:
+    >>> batch = calc_positions(np.arange(2451545.0, 2451555.0), [swe.SUN, swe.MOON])
+    >>> batch.longitudes.shape
+    (10, 2)
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import swisseph as swe
+
+# Moshier ephemeris (built-in, no data files) with speed calculation
+DEFAULT_FLAGS = swe.FLG_MOSEPH | swe.FLG_SPEED
+
+# Maximum number of (jd, body, flags) results kept in memory (~100 bytes each)
+EPHEMERIS_CACHE_SIZE = 100_000
+
+
+@dataclass(frozen=True)
+class EphemerisBatch:
+    """Positions of several bodies at several Julian Days."""
+
+    jds: np.ndarray  # shape (n_jd,)
+    bodies: tuple[int, ...]
+    longitudes: np.ndarray  # shape (n_jd, n_body), degrees 0-360
+    latitudes: np.ndarray  # shape (n_jd, n_body), degrees
+    speeds: np.ndarray  # shape (n_jd, n_body), degrees/day in longitude
+
+    def column(self, body: int) -> int:
+        """Return the column index of a body in the result arrays."""
+        return self.bodies.index(body)
+
+    def longitude_of(self, body: int) -> np.ndarray:
+        """Longitudes of a single body across all Julian Days."""
+        return self.longitudes[:, self.column(body)]
+
+    def speed_of(self, body: int) -> np.ndarray:
+        """Speeds of a single body across all Julian Days."""
+        return self.speeds[:, self.column(body)]
+
+
+@lru_cache(maxsize=EPHEMERIS_CACHE_SIZE)
+def _calc_ut_cached(jd: float, body: int, flags: int) -> tuple[float, ...]:
+    """Memoized wrapper around swe.calc_ut returning the 6-value position tuple."""
+    result, _flags_ret = swe.calc_ut(jd, body, flags)
+    return tuple(result)
+
+
+def calc_position(jd: float, body: int, flags: int = DEFAULT_FLAGS) -> tuple[float, ...]:
+    """
+    Get the position of one body at one Julian Day (memoized).
+
+    Args:
+        jd: Julian Day (UT)
+        body: Swiss Ephemeris body ID (e.g., swe.SUN)
+        flags: Swiss Ephemeris calculation flags
+
+    Returns:
+        Tuple of (longitude, latitude, distance, speed_lon, speed_lat, speed_dist)
+    """
+    return _calc_ut_cached(float(jd), int(body), int(flags))
+
+
+def calc_positions(
+    jds: Iterable[float] | np.ndarray,
+    bodies: Sequence[int],
+    flags: int = DEFAULT_FLAGS,
+) -> EphemerisBatch:
+    """
+    Get positions of several bodies at several Julian Days.
+
+    Args:
+        jds: Julian Days (UT), any iterable or NumPy array
+        bodies: Swiss Ephemeris body IDs
+        flags: Swiss Ephemeris calculation flags
+
+    Returns:
+        EphemerisBatch with (n_jd, n_body) arrays
+    """
+    jd_array = np.atleast_1d(np.asarray(jds, dtype=np.float64))
+    body_tuple = tuple(int(b) for b in bodies)
+    flags = int(flags)
+
+    # Resolve each distinct JD once, then scatter back to the requested order
+    unique_jds, inverse = np.unique(jd_array, return_inverse=True)
+    values = np.empty((len(unique_jds), len(body_tuple), 3), dtype=np.float64)
+
+    for i, jd in enumerate(unique_jds.tolist()):
+        for j, body in enumerate(body_tuple):
+            result = _calc_ut_cached(jd, body, flags)
+            values[i, j, 0] = result[0]
+            values[i, j, 1] = result[1]
+            values[i, j, 2] = result[3]
+
+    values = values[inverse.reshape(-1)]
+
+    return EphemerisBatch(
+        jds=jd_array,
+        bodies=body_tuple,
+        longitudes=values[:, :, 0],
+        latitudes=values[:, :, 1],
+        speeds=values[:, :, 2],
+    )
+
+
+def cache_info() -> dict[str, int]:
+    """Return hit/miss statistics of the ephemeris memo cache."""
+    info = _calc_ut_cached.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize or 0,
+    }
+
+
+def clear_cache() -> None:
+    """Drop all memoized ephemeris results."""
+    _calc_ut_cached.cache_clear()
@@ -37,7 +37,10 @@ from typing import Any
 
 import swisseph as swe
 
+from app.astro.aspects import find_aspects
 from app.astro.dignities import RULERSHIPS
+from app.astro.ephemeris import calc_position
+from app.astro.lunations import find_previous_syzygy
 from app.translations import get_translation
 
 # Hylegical places - houses where Hyleg can exist
@@ -70,7 +73,7 @@ def calculate_prenatal_syzygy(
     """
     Calculate the prenatal syzygy (last New Moon or Full Moon before birth).
 
-    Uses Swiss Ephemeris to search backwards from birth date.
+    Uses the shared lunation index (see app.astro.lunations).
 
     Args:
         birth_jd: Julian Day of birth
@@ -87,94 +90,15 @@ def calculate_prenatal_syzygy(
     """
     from app.services.astro_service import SIGNS
 
-    # Search backwards for the last lunation
-    # New Moon: Sun-Moon conjunction (0°)
-    # Full Moon: Sun-Moon opposition (180°)
-
-    # Calculate current Sun-Moon elongation
+    # If elongation < 180, last syzygy was a New Moon (conjunction)
+    # If elongation >= 180, last syzygy was a Full Moon (opposition)
     elongation = (moon_longitude - sun_longitude) % 360
+    syzygy_type = "new_moon" if elongation < 180 else "full_moon"
 
-    # If elongation < 180, last syzygy was a New Moon
-    # If elongation >= 180, last syzygy was a Full Moon
-    if elongation < 180:
-        # Find previous New Moon (conjunction)
-        syzygy_type = "new_moon"
-    else:
-        # Find previous Full Moon (opposition)
-        syzygy_type = "full_moon"
-
-    # Use Swiss Ephemeris to find the previous lunation
-    # We'll iterate backwards by small steps to find when the elongation crossed our target
-    jd = birth_jd
-    step = 0.5  # Half day steps
-    max_iterations = 60  # About 30 days back (enough for any lunar phase)
-
-    prev_elongation = elongation
-    for _ in range(max_iterations):
-        jd -= step
-
-        # Get Sun position
-        sun_result = swe.calc_ut(jd, swe.SUN)
-        sun_lon = sun_result[0][0]
-
-        # Get Moon position
-        moon_result = swe.calc_ut(jd, swe.MOON)
-        moon_lon = moon_result[0][0]
-
-        current_elongation = (moon_lon - sun_lon) % 360
-
-        # Check if we crossed the target elongation
-        if syzygy_type == "new_moon":
-            # Crossing from small positive to large (near 360)
-            if prev_elongation < 30 and current_elongation > 330:
-                # Found it, now refine
-                break
-        else:
-            # Crossing from below 180 to above 180
-            if prev_elongation >= 180 and current_elongation < 180:
-                # Went too far, go back a step
-                jd += step
-                break
-            if prev_elongation < 180 and current_elongation >= 180:
-                # Found it
-                break
-
-        prev_elongation = current_elongation
-
-    # Refine the search with smaller steps
-    step = 0.01  # About 15 minutes
-    for _ in range(100):
-        sun_result = swe.calc_ut(jd, swe.SUN)
-        sun_lon = sun_result[0][0]
-        moon_result = swe.calc_ut(jd, swe.MOON)
-        moon_lon = moon_result[0][0]
-
-        current_elongation = (moon_lon - sun_lon) % 360
-
-        # Check if close enough to target
-        if syzygy_type == "new_moon":
-            diff = min(current_elongation, 360 - current_elongation)
-        else:
-            diff = abs(current_elongation - 180)
-
-        if diff < 0.1:  # Within 0.1 degree
-            break
-
-        # Adjust direction
-        if syzygy_type == "new_moon":
-            if current_elongation < 180:
-                jd -= step
-            else:
-                jd += step
-        else:
-            if current_elongation < 180:
-                jd += step
-            else:
-                jd -= step
+    jd = find_previous_syzygy(birth_jd, syzygy_type)
 
     # Get final position
-    sun_result = swe.calc_ut(jd, swe.SUN)
-    syzygy_longitude = sun_result[0][0]
+    syzygy_longitude = calc_position(jd, swe.SUN)[0]
 
     # Calculate sign and degree
     sign_index = int(syzygy_longitude / 30)
@@ -269,36 +193,31 @@ def find_aspecting_planets(
     Returns:
         List of aspecting planets with aspect details
     """
-    aspecting = []
+    classical = [planet for planet in planets if planet["name"] in CLASSICAL_PLANETS]
+    aspect_orbs = {
+        name: {"angle": data["angle"], "orb": min(orb, data["orb"])}
+        for name, data in HYLEG_ASPECTS.items()
+    }
+    matches = find_aspects(
+        [target_longitude],
+        aspect_orbs,
+        longitudes_b=[planet["longitude"] for planet in classical],
+    )
 
-    for planet in planets:
-        if planet["name"] not in CLASSICAL_PLANETS:
-            continue
-
-        planet_lon = planet["longitude"]
-
-        # Calculate angle between planet and target
-        angle_diff = abs(planet_lon - target_longitude)
-        if angle_diff > 180:
-            angle_diff = 360 - angle_diff
-
-        # Check each aspect type
-        for aspect_name, aspect_data in HYLEG_ASPECTS.items():
-            aspect_angle = aspect_data["angle"]
-            aspect_orb = min(orb, aspect_data["orb"])
-
-            orb_diff = abs(angle_diff - aspect_angle)
-
-            if orb_diff <= aspect_orb:
-                aspecting.append(
-                    {
-                        "planet": planet["name"],
-                        "aspect": aspect_name,
-                        "orb": round(orb_diff, 2),
-                        "angle": round(angle_diff, 2),
-                    }
-                )
-                break  # Only one aspect per planet
+    aspecting = []
+    seen: set[int] = set()
+    for match in matches:
+        if match.index_b in seen:
+            continue  # Only one aspect per planet
+        seen.add(match.index_b)
+        aspecting.append(
+            {
+                "planet": classical[match.index_b]["name"],
+                "aspect": match.aspect,
+                "orb": round(match.orb, 2),
+                "angle": round(match.angle, 2),
+            }
+        )
 
     return aspecting
 
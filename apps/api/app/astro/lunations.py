@@ -0,0 +1,166 @@
+"""
+Lunation index - precomputed New Moons and Full Moons.
+
+The prenatal syzygy (last New Moon or Full Moon before birth) is needed for
+every chart and every Hyleg evaluation. Instead of stepping backwards through
+the ephemeris, this module ships a table of all syzygies between 1800 and 2200
+(``lunations.npz``, ~10k float64 Julian Days). A lookup is a binary search in
+the table followed by a Newton refinement on the Sun-Moon elongation, which
+costs one batched ephemeris call.
+
+Dates outside the table range fall back to a Newton search seeded from the
+mean synodic month, so results are available for any date the ephemeris
+supports.
+
+The table is generated by ``scripts/build_lunation_table.py``.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import swisseph as swe
+
+from app.astro.ephemeris import calc_positions
+
+# Mean length of the synodic month (days)
+SYNODIC_MONTH_DAYS = 29.530588861
+
+# Mean New Moon of 2000-01-06 (Meeus, Astronomical Algorithms, ch. 49)
+MEAN_NEW_MOON_EPOCH_JD = 2451550.09766
+
+# Elongation of each syzygy type (Moon - Sun)
+SYZYGY_ANGLES = {"new_moon": 0.0, "full_moon": 180.0}
+
+# Newton refinement parameters
+NEWTON_TOLERANCE_DAYS = 1e-6  # ~0.1 second
+NEWTON_MAX_ITERATIONS = 10
+
+# Range covered by the shipped table
+TABLE_START_JD = 2378496.5  # 1800-01-01 00:00 UT
+TABLE_END_JD = 2524593.5  # 2200-01-01 00:00 UT
+
+LUNATION_TABLE_PATH = Path(__file__).parent / "lunations.npz"
+
+
+def _wrap_180(angle: float) -> float:
+    """Normalize an angle to the range [-180, 180)."""
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+def refine_syzygy(jd_guess: float, syzygy_type: str) -> float:
+    """
+    Refine a syzygy moment with Newton iteration on the Sun-Moon elongation.
+
+    Args:
+        jd_guess: Initial estimate (Julian Day), within a few days of the syzygy
+        syzygy_type: "new_moon" or "full_moon"
+
+    Returns:
+        Julian Day of the exact syzygy
+    """
+    target = SYZYGY_ANGLES[syzygy_type]
+    jd = jd_guess
+
+    for _ in range(NEWTON_MAX_ITERATIONS):
+        batch = calc_positions([jd], [swe.SUN, swe.MOON])
+        sun_lon, moon_lon = batch.longitudes[0]
+        sun_speed, moon_speed = batch.speeds[0]
+
+        error = _wrap_180(moon_lon - sun_lon - target)
+        step = error / (moon_speed - sun_speed)
+        jd -= step
+
+        if abs(step) < NEWTON_TOLERANCE_DAYS:
+            break
+
+    return float(jd)
+
+
+def compute_syzygies(jd_start: float, jd_end: float, syzygy_type: str) -> np.ndarray:
+    """
+    Compute all syzygies of one type between two Julian Days.
+
+    Args:
+        jd_start: Start of range (Julian Day)
+        jd_end: End of range (Julian Day)
+        syzygy_type: "new_moon" or "full_moon"
+
+    Returns:
+        Sorted array of syzygy Julian Days within [jd_start, jd_end)
+    """
+    offset = 0.5 if syzygy_type == "full_moon" else 0.0
+    k_start = int(np.floor((jd_start - MEAN_NEW_MOON_EPOCH_JD) / SYNODIC_MONTH_DAYS)) - 1
+    k_end = int(np.ceil((jd_end - MEAN_NEW_MOON_EPOCH_JD) / SYNODIC_MONTH_DAYS)) + 1
+
+    jds = [
+        refine_syzygy(MEAN_NEW_MOON_EPOCH_JD + (k + offset) * SYNODIC_MONTH_DAYS, syzygy_type)
+        for k in range(k_start, k_end + 1)
+    ]
+    result = np.unique(np.round(np.array(jds), 8))
+    return result[(result >= jd_start) & (result < jd_end)]
+
+
+def build_lunation_table(
+    jd_start: float = TABLE_START_JD, jd_end: float = TABLE_END_JD
+) -> dict[str, np.ndarray]:
+    """
+    Build the New Moon / Full Moon table.
+
+    Args:
+        jd_start: Start of range (Julian Day)
+        jd_end: End of range (Julian Day)
+
+    Returns:
+        Dictionary with sorted "new_moon" and "full_moon" Julian Day arrays
+    """
+    return {
+        syzygy_type: compute_syzygies(jd_start, jd_end, syzygy_type)
+        for syzygy_type in SYZYGY_ANGLES
+    }
+
+
+@lru_cache(maxsize=1)
+def load_lunation_table() -> dict[str, np.ndarray]:
+    """
+    Load the shipped lunation table (cached for the process lifetime).
+
+    Returns:
+        Dictionary with sorted "new_moon" and "full_moon" Julian Day arrays,
+        empty arrays if the table file is missing
+    """
+    if not LUNATION_TABLE_PATH.exists():
+        return {syzygy_type: np.empty(0) for syzygy_type in SYZYGY_ANGLES}
+
+    with np.load(LUNATION_TABLE_PATH) as data:
+        return {syzygy_type: np.array(data[syzygy_type]) for syzygy_type in SYZYGY_ANGLES}
+
+
+def find_previous_syzygy(jd: float, syzygy_type: str) -> float:
+    """
+    Find the last syzygy of the given type at or before a Julian Day.
+
+    Args:
+        jd: Reference Julian Day (e.g., birth)
+        syzygy_type: "new_moon" or "full_moon"
+
+    Returns:
+        Julian Day of the syzygy
+    """
+    table = load_lunation_table()[syzygy_type]
+
+    index = int(np.searchsorted(table, jd, side="right")) - 1
+    if 0 <= index < len(table) - 1:
+        return refine_syzygy(float(table[index]), syzygy_type)
+
+    # Outside the table: seed Newton from the mean synodic motion
+    batch = calc_positions([jd], [swe.SUN, swe.MOON])
+    sun_lon, moon_lon = batch.longitudes[0]
+    days_since = ((moon_lon - sun_lon - SYZYGY_ANGLES[syzygy_type]) % 360.0) / (
+        360.0 / SYNODIC_MONTH_DAYS
+    )
+
+    syzygy_jd = refine_syzygy(jd - days_since, syzygy_type)
+    if syzygy_jd > jd:
+        syzygy_jd = refine_syzygy(syzygy_jd - SYNODIC_MONTH_DAYS, syzygy_type)
+    return syzygy_jd
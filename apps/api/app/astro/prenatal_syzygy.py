@@ -21,6 +21,8 @@ from typing import Any
 
 import swisseph as swe
 
+from app.astro.ephemeris import calc_position
+from app.astro.lunations import find_previous_syzygy
 from app.translations import DEFAULT_LANGUAGE, get_translation
 
 ZODIAC_SIGNS = [
@@ -49,9 +51,8 @@ def calculate_prenatal_syzygy(
     """
     Calculate the prenatal syzygy (last New Moon or Full Moon before birth).
 
-    Uses Swiss Ephemeris to search backwards from birth date with a two-phase
-    search algorithm: coarse search (0.5 day steps) followed by fine search
-    (0.01 day steps, ~15 minute precision).
+    The syzygy moment is taken from the precomputed lunation index
+    (app.astro.lunations) and refined with Newton iteration (~0.1s precision).
 
     Args:
         birth_jd: Julian Day of birth
@@ -74,6 +75,31 @@ def calculate_prenatal_syzygy(
         - interpretation: Localized interpretation text
         - keywords: Localized keywords
     """
+    syzygy = find_prenatal_syzygy(birth_jd, sun_longitude, moon_longitude, houses)
+    return localize_prenatal_syzygy(syzygy, language)
+
+
+def find_prenatal_syzygy(
+    birth_jd: float,
+    sun_longitude: float,
+    moon_longitude: float,
+    houses: list[dict] | None = None,
+) -> dict[str, Any]:
+    """
+    Locate the prenatal syzygy without any localized text.
+
+    This is the ephemeris-bound half of calculate_prenatal_syzygy(). The result
+    can be passed to localize_prenatal_syzygy() once per language.
+
+    Args:
+        birth_jd: Julian Day of birth
+        sun_longitude: Sun's longitude at birth (0-360)
+        moon_longitude: Moon's longitude at birth (0-360)
+        houses: List of house data for house placement (optional)
+
+    Returns:
+        Dictionary with type, longitude, sign_key, degree, minute, house and emoji
+    """
     # Determine syzygy type from elongation
     # If Moon is ahead of Sun by < 180°, last syzygy was New Moon
     # If Moon is ahead of Sun by >= 180°, last syzygy was Full Moon
@@ -84,13 +110,9 @@ def calculate_prenatal_syzygy(
     syzygy_jd = _search_syzygy_backward(birth_jd, syzygy_type)
 
     # Get Sun position at syzygy (the conjunction/opposition point)
-    sun_result = swe.calc_ut(syzygy_jd, swe.SUN)
-    syzygy_longitude = sun_result[0][0]
-
     # For Full Moon, use Moon position (opposition point)
-    if syzygy_type == "full_moon":
-        moon_result = swe.calc_ut(syzygy_jd, swe.MOON)
-        syzygy_longitude = moon_result[0][0]
+    body = swe.SUN if syzygy_type == "new_moon" else swe.MOON
+    syzygy_longitude = calc_position(syzygy_jd, body)[0]
 
     # Calculate sign and degree
     sign_index = int(syzygy_longitude // 30)
@@ -100,36 +122,57 @@ def calculate_prenatal_syzygy(
     # Get house placement
     house = _get_house_for_position(syzygy_longitude, houses) if houses else 1
 
-    # Get translations
-    type_name = get_translation(f"prenatal_syzygy.types.{syzygy_type}", language)
-    sign_name = get_translation(f"signs.{sign.lower()}", language)
-    interpretation = get_translation(
-        f"prenatal_syzygy.interpretations.{syzygy_type}.{sign.lower()}", language
-    )
-    keywords = get_translation(f"prenatal_syzygy.keywords.{syzygy_type}", language)
-
     return {
         "type": syzygy_type,
-        "type_name": type_name,
         "longitude": round(syzygy_longitude, 4),
-        "sign": sign_name,
         "sign_key": sign.lower(),
         "degree": int(degree_in_sign),
         "minute": int((degree_in_sign % 1) * 60),
         "house": house,
         "emoji": "🌑" if syzygy_type == "new_moon" else "🌕",
-        "interpretation": interpretation,
-        "keywords": keywords,
+    }
+
+
+def localize_prenatal_syzygy(
+    syzygy: dict[str, Any], language: str = DEFAULT_LANGUAGE
+) -> dict[str, Any]:
+    """
+    Add localized names and interpretation to a result of find_prenatal_syzygy().
+
+    Args:
+        syzygy: Language-neutral syzygy data
+        language: Language code for translations ('en-US' or 'pt-BR')
+
+    Returns:
+        Dictionary in the format returned by calculate_prenatal_syzygy()
+    """
+    syzygy_type = syzygy["type"]
+    sign_key = syzygy["sign_key"]
+
+    return {
+        "type": syzygy_type,
+        "type_name": get_translation(f"prenatal_syzygy.types.{syzygy_type}", language),
+        "longitude": syzygy["longitude"],
+        "sign": get_translation(f"signs.{sign_key}", language),
+        "sign_key": sign_key,
+        "degree": syzygy["degree"],
+        "minute": syzygy["minute"],
+        "house": syzygy["house"],
+        "emoji": syzygy["emoji"],
+        "interpretation": get_translation(
+            f"prenatal_syzygy.interpretations.{syzygy_type}.{sign_key}", language
+        ),
+        "keywords": get_translation(f"prenatal_syzygy.keywords.{syzygy_type}", language),
     }
 
 
 def _search_syzygy_backward(start_jd: float, syzygy_type: str) -> float:
     """
-    Search backward from birth for exact syzygy moment.
+    Find the exact syzygy moment at or before birth.
 
-    Uses a two-phase search algorithm:
-    1. Coarse search: 0.5 day steps to find approximate crossing
-    2. Fine search: 0.01 day steps (~15 min) for 0.1° precision
+    Looks up the shared lunation index (binary search over the precomputed
+    New Moon / Full Moon table) and refines the result with Newton iteration
+    on the Sun-Moon elongation.
 
     Args:
         start_jd: Julian Day to start searching from (birth)
@@ -138,70 +181,7 @@ def _search_syzygy_backward(start_jd: float, syzygy_type: str) -> float:
     Returns:
         Julian Day of the syzygy moment
     """
-    jd = start_jd
-    step = 0.5  # Half day steps for coarse search
-    max_iterations = 60  # About 30 days back (enough for any lunar phase)
-
-    # Get initial elongation
-    sun_result = swe.calc_ut(jd, swe.SUN)
-    moon_result = swe.calc_ut(jd, swe.MOON)
-    prev_elongation = (moon_result[0][0] - sun_result[0][0]) % 360
-
-    # Coarse search phase
-    for _ in range(max_iterations):
-        jd -= step
-
-        sun_result = swe.calc_ut(jd, swe.SUN)
-        moon_result = swe.calc_ut(jd, swe.MOON)
-        current_elongation = (moon_result[0][0] - sun_result[0][0]) % 360
-
-        # Check if we crossed the target elongation
-        if syzygy_type == "new_moon":
-            # New Moon: Looking for elongation crossing 0°
-            # When we go from small positive (< 30) to large (> 330), we crossed
-            if prev_elongation < 30 and current_elongation > 330:
-                break
-        else:
-            # Full Moon: Looking for elongation crossing 180°
-            if prev_elongation >= 180 and current_elongation < 180:
-                # Went too far, step back
-                jd += step
-                break
-            if prev_elongation < 180 and current_elongation >= 180:
-                break
-
-        prev_elongation = current_elongation
-
-    # Fine search phase
-    step = 0.01  # About 15 minutes
-
-    for _ in range(100):
-        sun_result = swe.calc_ut(jd, swe.SUN)
-        moon_result = swe.calc_ut(jd, swe.MOON)
-        current_elongation = (moon_result[0][0] - sun_result[0][0]) % 360
-
-        # Check if close enough to target
-        if syzygy_type == "new_moon":
-            diff = min(current_elongation, 360 - current_elongation)
-        else:
-            diff = abs(current_elongation - 180)
-
-        if diff < 0.1:  # Within 0.1 degree precision
-            break
-
-        # Adjust direction
-        if syzygy_type == "new_moon":
-            if current_elongation < 180:
-                jd -= step
-            else:
-                jd += step
-        else:
-            if current_elongation < 180:
-                jd += step
-            else:
-                jd -= step
-
-    return jd
+    return find_previous_syzygy(start_jd, syzygy_type)
 
 
 def _get_house_for_position(longitude: float, houses: list[dict] | None) -> int:
@@ -18,6 +18,8 @@ from typing import Any
 
 import swisseph as swe
 
+from app.astro.crossings import find_longitude_crossings
+from app.astro.ephemeris import calc_position
 from app.translations import DEFAULT_LANGUAGE, get_translation
 
 # Saturn's sidereal period
@@ -29,8 +31,6 @@ SATURN = swe.SATURN
 
 # Search parameters
 SEARCH_WINDOW_DAYS = 200  # ±200 days around estimated return
-PRECISION_DEGREES = 0.001  # Precision for binary search (0.001°)
-MAX_ITERATIONS = 100  # Maximum iterations for binary search
 MIN_PASS_SEPARATION_DAYS = 30  # Minimum days between passes to avoid duplicates
 
 # Signs in order
@@ -108,9 +108,9 @@ def get_saturn_position(jd: float) -> tuple[float, float, bool]:
     Returns:
         Tuple of (longitude, speed, is_retrograde)
     """
-    result = swe.calc_ut(jd, SATURN, swe.FLG_MOSEPH | swe.FLG_SPEED)
-    longitude = result[0][0]  # Ecliptic longitude
-    speed = result[0][3]  # Speed in longitude
+    result = calc_position(jd, SATURN, swe.FLG_MOSEPH | swe.FLG_SPEED)
+    longitude = result[0]  # Ecliptic longitude
+    speed = result[3]  # Speed in longitude
     is_retrograde = speed < 0
     return longitude, speed, is_retrograde
 
@@ -166,7 +166,7 @@ def find_exact_crossing(
     """
     Find the exact Julian Day when Saturn crosses the target longitude.
 
-    Uses binary search for precision.
+    Uses the shared Newton crossing solver (app.astro.crossings).
 
     Args:
         target_longitude: The target ecliptic longitude
@@ -176,49 +176,8 @@ def find_exact_crossing(
     Returns:
         Julian Day of crossing, or None if not found
     """
-    target = normalize_longitude(target_longitude)
-
-    # Get starting positions
-    start_lon, _, _ = get_saturn_position(start_jd)
-    end_lon, _, _ = get_saturn_position(end_jd)
-
-    start_diff = longitude_diff(start_lon, target)
-    end_diff = longitude_diff(end_lon, target)
-
-    # Check if there's a crossing in this interval
-    # A crossing occurs if the signs of the differences are different
-    # OR if one of them is very close to zero
-    if abs(start_diff) < PRECISION_DEGREES:
-        return start_jd
-    if abs(end_diff) < PRECISION_DEGREES:
-        return end_jd
-
-    # If both have the same sign and neither is close, no crossing
-    if start_diff * end_diff > 0:
-        return None
-
-    # Binary search
-    for _ in range(MAX_ITERATIONS):
-        mid_jd = (start_jd + end_jd) / 2
-        mid_lon, _, _ = get_saturn_position(mid_jd)
-        mid_diff = longitude_diff(mid_lon, target)
-
-        if abs(mid_diff) < PRECISION_DEGREES:
-            return mid_jd
-
-        # Determine which half contains the crossing
-        if start_diff * mid_diff <= 0:
-            end_jd = mid_jd
-            end_diff = mid_diff
-        else:
-            start_jd = mid_jd
-            start_diff = mid_diff
-
-        # Check if interval is small enough
-        if abs(end_jd - start_jd) < 0.0001:  # About 8 seconds precision
-            return mid_jd
-
-    return (start_jd + end_jd) / 2
+    crossings = find_longitude_crossings(SATURN, target_longitude, start_jd, end_jd)
+    return crossings[0].jd if crossings else None
 
 
 def find_saturn_return_passes(
@@ -247,45 +206,27 @@ def find_saturn_return_passes(
     start_jd = approximate_jd - search_window_days
     end_jd = approximate_jd + search_window_days
 
-    # Scan through the window in small steps to find all crossings
-    step_days = 1.0  # 1 day steps
-    current_jd = start_jd
-
-    prev_lon, _, _ = get_saturn_position(current_jd)
-    prev_diff = longitude_diff(prev_lon, target)
-
-    while current_jd < end_jd:
-        next_jd = current_jd + step_days
-        curr_lon, _, _ = get_saturn_position(next_jd)
-        curr_diff = longitude_diff(curr_lon, target)
-
-        # Check for crossing (sign change or very close)
-        if prev_diff * curr_diff < 0 or abs(curr_diff) < PRECISION_DEGREES:
-            # Found potential crossing, refine with binary search
-            exact_jd = find_exact_crossing(target, current_jd, next_jd)
-            if exact_jd:
-                exact_lon, _, is_retro = get_saturn_position(exact_jd)
-
-                # Avoid duplicate passes (within MIN_PASS_SEPARATION_DAYS of each other)
-                is_duplicate = False
-                for existing_pass in passes:
-                    existing_jd = datetime_to_jd(existing_pass.date)
-                    if abs(exact_jd - existing_jd) < MIN_PASS_SEPARATION_DAYS:
-                        is_duplicate = True
-                        break
-
-                if not is_duplicate:
-                    passes.append(
-                        SaturnReturnPass(
-                            date=jd_to_datetime(exact_jd),
-                            longitude=round(exact_lon, 4),
-                            is_retrograde=is_retro,
-                            pass_number=len(passes) + 1,
-                        )
-                    )
-
-        prev_diff = curr_diff
-        current_jd = next_jd
+    # Solve for every direct and retrograde crossing in the window
+    crossings = find_longitude_crossings(SATURN, target, start_jd, end_jd)
+
+    for crossing in crossings:
+        # Avoid duplicate passes (within MIN_PASS_SEPARATION_DAYS of each other)
+        is_duplicate = False
+        for existing_pass in passes:
+            existing_jd = datetime_to_jd(existing_pass.date)
+            if abs(crossing.jd - existing_jd) < MIN_PASS_SEPARATION_DAYS:
+                is_duplicate = True
+                break
+
+        if not is_duplicate:
+            passes.append(
+                SaturnReturnPass(
+                    date=jd_to_datetime(crossing.jd),
+                    longitude=round(crossing.longitude, 4),
+                    is_retrograde=crossing.is_retrograde,
+                    pass_number=len(passes) + 1,
+                )
+            )
 
     # Sort passes by date
     passes.sort(key=lambda p: p.date)
@@ -9,12 +9,18 @@ The chart is calculated for the exact moment the Sun reaches the natal
 Sun's degree, minute, and second, and can be relocated to any location.
 """
 
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import Executor, Future, as_completed
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
 import swisseph as swe
 
+from app.astro.aspects import find_aspects
+from app.astro.crossings import find_longitude_crossings
+from app.astro.ephemeris import calc_position
 from app.translations import DEFAULT_LANGUAGE, get_translation
 
 # Sun's tropical year period (time to return to same ecliptic longitude)
@@ -25,8 +31,6 @@ SUN = swe.SUN
 
 # Search parameters
 SEARCH_WINDOW_DAYS = 3  # ±3 days around birthday (Sun moves ~1°/day)
-PRECISION_DEGREES = 0.0001  # High precision for exact moment
-MAX_ITERATIONS = 100  # Maximum iterations for binary search
 
 # Signs in order
 SIGNS = [
@@ -97,9 +101,9 @@ def get_sun_position(jd: float) -> tuple[float, float]:
     Returns:
         Tuple of (longitude, speed)
     """
-    result = swe.calc_ut(jd, SUN, swe.FLG_MOSEPH | swe.FLG_SPEED)
-    longitude = result[0][0]  # Ecliptic longitude
-    speed = result[0][3]  # Speed in longitude
+    result = calc_position(jd, SUN, swe.FLG_MOSEPH | swe.FLG_SPEED)
+    longitude = result[0]  # Ecliptic longitude
+    speed = result[3]  # Speed in longitude
     return longitude, speed
 
 
@@ -155,7 +159,7 @@ def find_sun_return_moment(
     """
     Find the exact moment when the Sun returns to its natal position.
 
-    Uses binary search for precision.
+    Uses the shared Newton crossing solver (app.astro.crossings).
 
     Args:
         natal_sun_longitude: The natal Sun's ecliptic longitude
@@ -182,43 +186,13 @@ def find_sun_return_moment(
     start_jd = estimated_jd - SEARCH_WINDOW_DAYS
     end_jd = estimated_jd + SEARCH_WINDOW_DAYS
 
-    # Get starting positions
-    start_lon, _ = get_sun_position(start_jd)
-    end_lon, _ = get_sun_position(end_jd)
-
-    start_diff = longitude_diff(start_lon, target)
-    end_diff = longitude_diff(end_lon, target)
-
-    # If target is near 0° Aries, we need special handling
-    # because the longitude wraps around
-    if abs(start_diff) < PRECISION_DEGREES:
-        return jd_to_datetime(start_jd)
-    if abs(end_diff) < PRECISION_DEGREES:
-        return jd_to_datetime(end_jd)
-
-    # Binary search for exact moment
-    for _ in range(MAX_ITERATIONS):
-        mid_jd = (start_jd + end_jd) / 2
-        mid_lon, _ = get_sun_position(mid_jd)
-        mid_diff = longitude_diff(mid_lon, target)
-
-        if abs(mid_diff) < PRECISION_DEGREES:
-            return jd_to_datetime(mid_jd)
-
-        # Determine which half contains the crossing
-        # Sun always moves forward (never retrograde)
-        if start_diff * mid_diff <= 0:
-            end_jd = mid_jd
-            end_diff = mid_diff
-        else:
-            start_jd = mid_jd
-            start_diff = mid_diff
-
-        # Check if interval is small enough (~1 second precision)
-        if abs(end_jd - start_jd) < 0.00001:
-            return jd_to_datetime(mid_jd)
+    # The Sun is never retrograde, so there is exactly one crossing in the window
+    crossings = find_longitude_crossings(SUN, target, start_jd, end_jd)
+    if crossings:
+        return jd_to_datetime(crossings[0].jd)
 
-    return jd_to_datetime((start_jd + end_jd) / 2)
+    # No crossing found (should not happen with a ±3 day window)
+    return jd_to_datetime(estimated_jd)
 
 
 def get_planet_house(longitude: float, house_cusps: list[float]) -> int:
@@ -267,10 +241,7 @@ def calculate_sr_to_natal_aspects(
     Returns:
         List of aspect dictionaries
     """
-    aspects = []
-
     # Aspect definitions: (name, angle, is_major)
-    # Sorted by angle for efficient range checking
     aspect_defs = [
         ("Conjunction", 0, True),
         ("Sextile", 60, True),
@@ -279,59 +250,33 @@ def calculate_sr_to_natal_aspects(
         ("Quincunx", 150, False),
         ("Opposition", 180, True),
     ]
+    aspect_orbs = {
+        name: {"angle": angle, "orb": orb_major if is_major else orb_minor}
+        for name, angle, is_major in aspect_defs
+    }
+    major_aspects = {name for name, _, is_major in aspect_defs if is_major}
 
-    # Pre-filter planets to skip (more efficient than checking in inner loop)
+    # Lunar nodes are not aspected
     skip_points = {"North Node", "South Node"}
+    sr_points = [p for p in sr_planets if p.get("name", "") not in skip_points]
+    natal_points = [p for p in natal_planets if p.get("name", "") not in skip_points]
 
-    # Pre-calculate max orb for early exit optimization
-    max_orb = max(orb_major, orb_minor)
-
-    for sr_planet in sr_planets:
-        sr_name = sr_planet.get("name", "")
-        if sr_name in skip_points:
-            continue
-
-        sr_lon = sr_planet.get("longitude", 0)
-
-        for natal_planet in natal_planets:
-            natal_name = natal_planet.get("name", "")
-            if natal_name in skip_points:
-                continue
-
-            natal_lon = natal_planet.get("longitude", 0)
-
-            # Calculate angular difference once per planet pair
-            diff = abs(longitude_diff(sr_lon, natal_lon))
-
-            # Early exit: if diff is far from any aspect angle, skip all checks
-            # Valid aspect angles are 0, 60, 90, 120, 150, 180
-            # Check if diff is within max_orb of any of these
-            if not (
-                diff <= max_orb  # Near conjunction (0°)
-                or 60 - max_orb <= diff <= 60 + max_orb  # Near sextile
-                or 90 - max_orb <= diff <= 90 + max_orb  # Near square
-                or 120 - max_orb <= diff <= 120 + max_orb  # Near trine
-                or 150 - max_orb <= diff <= 150 + max_orb  # Near quincunx
-                or diff >= 180 - max_orb  # Near opposition
-            ):
-                continue
-
-            # Check each aspect (only reached if diff is potentially valid)
-            for aspect_name, aspect_angle, is_major in aspect_defs:
-                orb = orb_major if is_major else orb_minor
-                orb_diff = abs(diff - aspect_angle)
-
-                if orb_diff <= orb:
-                    aspects.append(
-                        {
-                            "sr_planet": sr_name,
-                            "natal_planet": natal_name,
-                            "aspect": aspect_name,
-                            "angle": aspect_angle,
-                            "orb": round(orb_diff, 2),
-                            "is_major": is_major,
-                        }
-                    )
+    matches = find_aspects(
+        [p.get("longitude", 0) for p in sr_points],
+        aspect_orbs,
+        longitudes_b=[p.get("longitude", 0) for p in natal_points],
+    )
+    aspects = [
+        {
+            "sr_planet": sr_points[match.index_a].get("name", ""),
+            "natal_planet": natal_points[match.index_b].get("name", ""),
+            "aspect": match.aspect,
+            "angle": aspect_orbs[match.aspect]["angle"],
+            "orb": round(match.orb, 2),
+            "is_major": match.aspect in major_aspects,
+        }
+        for match in matches
+    ]
 
     # Sort by orb (tightest aspects first)
     aspects.sort(key=lambda a: a["orb"])
@@ -549,6 +494,209 @@ def get_solar_return_interpretation(
     }
 
 
+def _solar_return_for_year(kwargs: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+    """Process pool entry point: calculate one year's Solar Return."""
+    return kwargs["target_year"], calculate_solar_return(**kwargs)
+
+
+def _default_executor() -> Executor:
+    """Return the process-wide Solar Return executor (managed by the app lifespan)."""
+    from app.core.calculation_executor import get_solar_return_executor
+
+    return get_solar_return_executor()
+
+
+def _submit_solar_returns(
+    executor: Executor,
+    natal_sun_longitude: float,
+    birth_datetime: datetime,
+    start_year: int,
+    end_year: int,
+    latitude: float,
+    longitude: float,
+    timezone: str,
+    city: str,
+    country: str,
+    house_system: str,
+) -> list[Future[tuple[int, dict[str, Any]]]]:
+    """Submit one Solar Return job per year to an executor."""
+    return [
+        executor.submit(
+            _solar_return_for_year,
+            {
+                "natal_sun_longitude": natal_sun_longitude,
+                "birth_datetime": birth_datetime,
+                "target_year": year,
+                "latitude": latitude,
+                "longitude": longitude,
+                "timezone": timezone,
+                "city": city,
+                "country": country,
+                "house_system": house_system,
+            },
+        )
+        for year in range(start_year, end_year + 1)
+    ]
+
+
+def iter_solar_returns(
+    natal_sun_longitude: float,
+    birth_datetime: datetime,
+    start_year: int,
+    end_year: int,
+    latitude: float,
+    longitude: float,
+    timezone: str,
+    city: str = "",
+    country: str = "",
+    house_system: str = "placidus",
+    executor: Executor | None = None,
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """
+    Calculate Solar Returns for multiple years in parallel, yielding as they finish.
+
+    Each year is an independent chart, so years are fanned out to a bounded
+    pool (the dedicated Solar Return executor by default).
+    A single year is calculated inline to avoid the pool round-trip.
+
+    Args:
+        natal_sun_longitude: Natal Sun's ecliptic longitude
+        birth_datetime: Original birth datetime
+        start_year: First year to calculate
+        end_year: Last year to calculate
+        latitude: Location latitude
+        longitude: Location longitude
+        timezone: Timezone
+        city: City name
+        country: Country name
+        house_system: House system
+        executor: Executor to run years on (defaults to the Solar Return executor)
+
+    Yields:
+        Tuples of (year, Solar Return data) in completion order
+    """
+    if start_year == end_year and executor is None:
+        yield _solar_return_for_year(
+            {
+                "natal_sun_longitude": natal_sun_longitude,
+                "birth_datetime": birth_datetime,
+                "target_year": start_year,
+                "latitude": latitude,
+                "longitude": longitude,
+                "timezone": timezone,
+                "city": city,
+                "country": country,
+                "house_system": house_system,
+            }
+        )
+        return
+
+    futures = _submit_solar_returns(
+        executor or _default_executor(),
+        natal_sun_longitude,
+        birth_datetime,
+        start_year,
+        end_year,
+        latitude,
+        longitude,
+        timezone,
+        city,
+        country,
+        house_system,
+    )
+    try:
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+async def aiter_solar_returns(
+    natal_sun_longitude: float,
+    birth_datetime: datetime,
+    start_year: int,
+    end_year: int,
+    latitude: float,
+    longitude: float,
+    timezone: str,
+    city: str = "",
+    country: str = "",
+    house_system: str = "placidus",
+    executor: Executor | None = None,
+) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+    """
+    Async counterpart of iter_solar_returns: yield years as they finish.
+
+    Same arguments as iter_solar_returns. The event loop is never blocked;
+    pending years are cancelled if the consumer stops early.
+
+    Yields:
+        Tuples of (year, Solar Return data) in completion order
+    """
+    futures = _submit_solar_returns(
+        executor or _default_executor(),
+        natal_sun_longitude,
+        birth_datetime,
+        start_year,
+        end_year,
+        latitude,
+        longitude,
+        timezone,
+        city,
+        country,
+        house_system,
+    )
+    try:
+        for next_done in asyncio.as_completed([asyncio.wrap_future(f) for f in futures]):
+            yield await next_done
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+async def calculate_multiple_solar_returns_async(
+    natal_sun_longitude: float,
+    birth_datetime: datetime,
+    start_year: int,
+    end_year: int,
+    latitude: float,
+    longitude: float,
+    timezone: str,
+    city: str = "",
+    country: str = "",
+    house_system: str = "placidus",
+    executor: Executor | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Calculate Solar Returns for multiple years without blocking the event loop.
+
+    Same arguments as calculate_multiple_solar_returns, plus an optional
+    executor (defaults to the Solar Return executor). Years are collected
+    from aiter_solar_returns as they complete.
+
+    Returns:
+        List of Solar Return data for each year, ordered by year
+    """
+    results = {
+        year: sr_data
+        async for year, sr_data in aiter_solar_returns(
+            natal_sun_longitude=natal_sun_longitude,
+            birth_datetime=birth_datetime,
+            start_year=start_year,
+            end_year=end_year,
+            latitude=latitude,
+            longitude=longitude,
+            timezone=timezone,
+            city=city,
+            country=country,
+            house_system=house_system,
+            executor=executor,
+        )
+    }
+    return [results[year] for year in sorted(results)]
+
+
 def calculate_multiple_solar_returns(
     natal_sun_longitude: float,
     birth_datetime: datetime,
@@ -560,10 +708,13 @@ def calculate_multiple_solar_returns(
     city: str = "",
     country: str = "",
     house_system: str = "placidus",
+    executor: Executor | None = None,
 ) -> list[dict[str, Any]]:
     """
     Calculate Solar Returns for multiple years.
 
+    Years are calculated in parallel (see iter_solar_returns).
+
     Args:
         natal_sun_longitude: Natal Sun's ecliptic longitude
         birth_datetime: Original birth datetime
@@ -575,24 +726,24 @@ def calculate_multiple_solar_returns(
         city: City name
         country: Country name
         house_system: House system
+        executor: Executor to run years on (defaults to the Solar Return executor)
 
     Returns:
-        List of Solar Return data for each year
+        List of Solar Return data for each year, ordered by year
     """
-    returns = []
-
-    for year in range(start_year, end_year + 1):
-        sr_data = calculate_solar_return(
+    results = dict(
+        iter_solar_returns(
             natal_sun_longitude=natal_sun_longitude,
             birth_datetime=birth_datetime,
-            target_year=year,
+            start_year=start_year,
+            end_year=end_year,
             latitude=latitude,
             longitude=longitude,
             timezone=timezone,
             city=city,
             country=country,
             house_system=house_system,
+            executor=executor,
         )
-        returns.append(sr_data)
-
-    return returns
+    )
+    return [results[year] for year in sorted(results)]
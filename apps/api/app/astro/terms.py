@@ -36,6 +36,9 @@ ZODIAC_SIGNS = [
     "Pisces",
 ]
 
+# Position of each sign in the zodiac (0 = Aries)
+SIGN_INDEX = {sign: index for index, sign in enumerate(ZODIAC_SIGNS)}
+
 
 class TermSystem(str, Enum):
     """Available term systems for planetary bounds."""
@@ -437,6 +440,36 @@ TERM_SYSTEMS: dict[TermSystem, dict[str, list[tuple[int, int, str]]]] = {
 }
 
 
+def _build_term_table(
+    terms: dict[str, list[tuple[int, int, str]]],
+) -> tuple[tuple[str, int, int], ...]:
+    """
+    Expand a term system into a 360-entry table indexed by whole degree.
+
+    All term boundaries fall on whole degrees, so the ruler of any longitude
+    is ``table[int(longitude)]``.
+
+    Returns:
+        Tuple of (term_ruler, term_start, term_end) for each degree 0-359
+    """
+    table = []
+    for sign in ZODIAC_SIGNS:
+        for degree in range(30):
+            for start, end, ruler in terms[sign]:
+                if start <= degree < end:
+                    table.append((ruler, start, end))
+                    break
+            else:
+                raise ValueError(f"Could not find term for {degree}° {sign}")
+    return tuple(table)
+
+
+# Precomputed degree -> (ruler, start, end) lookup per term system
+TERM_TABLES: dict[TermSystem, tuple[tuple[str, int, int], ...]] = {
+    system: _build_term_table(terms) for system, terms in TERM_SYSTEMS.items()
+}
+
+
 # =============================================================================
 # Functions
 # =============================================================================
@@ -485,22 +518,17 @@ def get_term_ruler(
         raise ValueError(f"Longitude must be in range [0, 360), got {longitude}")
 
     sign, degree_in_sign = _longitude_to_sign_and_degree(longitude)
-    terms = TERM_SYSTEMS[system][sign]
-
-    for start, end, ruler in terms:
-        if start <= degree_in_sign < end:
-            return {
-                "longitude": longitude,
-                "sign": sign,
-                "degree_in_sign": degree_in_sign,
-                "term_ruler": ruler,
-                "term_start": start,
-                "term_end": end,
-                "term_system": system,
-            }
+    ruler, start, end = TERM_TABLES[system][int(longitude / 30) * 30 + int(degree_in_sign)]
 
-    # Should never reach here if terms are properly defined
-    raise ValueError(f"Could not find term for {degree_in_sign}° {sign}")
+    return {
+        "longitude": longitude,
+        "sign": sign,
+        "degree_in_sign": degree_in_sign,
+        "term_ruler": ruler,
+        "term_start": start,
+        "term_end": end,
+        "term_system": system,
+    }
 
 
 def get_all_term_rulers(
@@ -624,12 +652,9 @@ def get_planet_in_term(
     Returns:
         Planet name ruling this term, or None if sign not found
     """
-    terms = TERM_SYSTEMS.get(system, {}).get(sign)
-    if not terms:
+    table = TERM_TABLES.get(system)
+    sign_index = SIGN_INDEX.get(sign)
+    if table is None or sign_index is None or not 0 <= degree < 30:
         return None
 
-    for start, end, ruler in terms:
-        if start <= degree < end:
-            return ruler
-
-    return None
+    return table[sign_index * 30 + int(degree)][0]
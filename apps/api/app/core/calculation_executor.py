@@ -0,0 +1,236 @@
+"""
+Calculation executor for CPU-bound astrology work.
+
+Swiss Ephemeris calls (Hyleg, Alcochoden, Saturn/Solar Returns, full chart
+calculations) are synchronous and hold the GIL. Running them directly in an
+``async def`` handler freezes every other request on the same uvicorn worker.
+
+Endpoints hand that work to a shared ``CalculationExecutor`` instead:
+
+    executor = get_calculation_executor()
+    hyleg = await executor.run(calculate_hyleg, planets=planets, ...)
+
+The executor wraps a bounded process pool (default) or thread pool sized from
+settings, and keeps metrics on queue depth, queue wait and run time that are
+exposed on ``GET /health/calculations``.
+"""
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal
+
+from loguru import logger
+
+from app.core.config import settings
+
+# Number of recent tasks used for latency percentiles
+LATENCY_SAMPLE_SIZE = 1000
+
+
+def _timed_call[T](
+    func: Callable[..., T], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[T, float, float]:
+    """
+    Worker entry point: run a calculation and time it.
+
+    Returns:
+        Tuple of (result, wall-clock start time, run duration in seconds)
+    """
+    started_at = time.time()
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, started_at, time.perf_counter() - start
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an unsorted sample list (0 if empty)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(fraction * len(ordered)))
+    return ordered[index]
+
+
+class CalculationExecutor(Executor):
+    """
+    Bounded pool for CPU-bound calculations with queue and latency metrics.
+
+    Implements ``concurrent.futures.Executor`` so it can be passed anywhere an
+    executor is accepted (e.g. ``calculate_multiple_solar_returns_async``).
+    """
+
+    def __init__(self, kind: Literal["process", "thread"] = "process", max_workers: int = 2):
+        """
+        Initialize the executor (the pool itself is created on first use).
+
+        Args:
+            kind: "process" for a process pool, "thread" for a thread pool
+            max_workers: Maximum number of concurrent calculations
+        """
+        self.kind = kind
+        self.max_workers = max_workers
+        self._pool: Executor | None = None
+        self._lock = threading.Lock()
+
+        self._pending = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._wait_times: deque[float] = deque(maxlen=LATENCY_SAMPLE_SIZE)
+        self._run_times: deque[float] = deque(maxlen=LATENCY_SAMPLE_SIZE)
+
+    def _get_pool(self) -> Executor:
+        """Return the underlying pool, creating it on first use."""
+        with self._lock:
+            if self._pool is None:
+                if self.kind == "process":
+                    # spawn: forking a process that runs an event loop and threads is unsafe
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                else:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="calculation",
+                    )
+                logger.info(
+                    f"Started calculation executor ({self.kind}, {self.max_workers} workers)"
+                )
+            return self._pool
+
+    def submit[T](self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        """Schedule a calculation and return a Future for its result."""
+        pool = self._get_pool()
+        with self._lock:
+            self._pending += 1
+            self._submitted += 1
+
+        submitted_at = time.time()
+        inner = pool.submit(_timed_call, fn, args, kwargs)
+        outer: Future[T] = Future()
+
+        def _on_done(done: Future[tuple[T, float, float]]) -> None:
+            with self._lock:
+                self._pending -= 1
+                if done.cancelled() or done.exception() is not None:
+                    self._failed += 1
+                else:
+                    _, started_at, run_time = done.result()
+                    self._completed += 1
+                    self._wait_times.append(max(0.0, started_at - submitted_at))
+                    self._run_times.append(run_time)
+
+            if done.cancelled():
+                outer.cancel()
+            elif not outer.set_running_or_notify_cancel():
+                return
+            elif (error := done.exception()) is not None:
+                outer.set_exception(error)
+            else:
+                outer.set_result(done.result()[0])
+
+        def _on_outer_done(future: Future[T]) -> None:
+            if future.cancelled():
+                inner.cancel()
+
+        inner.add_done_callback(_on_done)
+        outer.add_done_callback(_on_outer_done)
+        return outer
+
+    async def run[T](self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Run a calculation on the pool and await its result."""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Shut down the underlying pool (a new one is created on next submit)."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        Get executor metrics.
+
+        Returns:
+            Dictionary with pool configuration, queue depth, task counters and
+            queue wait / run time percentiles (milliseconds)
+        """
+        with self._lock:
+            wait_times = list(self._wait_times)
+            run_times = list(self._run_times)
+            pending = self._pending
+            submitted = self._submitted
+            completed = self._completed
+            failed = self._failed
+
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "in_flight": pending,
+            "queue_depth": max(0, pending - self.max_workers),
+            "submitted": submitted,
+            "completed": completed,
+            "failed": failed,
+            "wait_ms_p50": round(_percentile(wait_times, 0.50) * 1000, 2),
+            "wait_ms_p95": round(_percentile(wait_times, 0.95) * 1000, 2),
+            "run_ms_p50": round(_percentile(run_times, 0.50) * 1000, 2),
+            "run_ms_p95": round(_percentile(run_times, 0.95) * 1000, 2),
+            "run_ms_max": round(max(run_times, default=0.0) * 1000, 2),
+        }
+
+
+_calculation_executor: CalculationExecutor | None = None
+
+
+def get_calculation_executor() -> CalculationExecutor:
+    """Get the process-wide calculation executor (configured from settings)."""
+    global _calculation_executor
+    if _calculation_executor is None:
+        _calculation_executor = CalculationExecutor(
+            kind=settings.CALCULATION_EXECUTOR_TYPE,
+            max_workers=settings.CALCULATION_EXECUTOR_WORKERS,
+        )
+    return _calculation_executor
+
+
+def shutdown_calculation_executor() -> None:
+    """Shut down the process-wide calculation executor, if started."""
+    global _calculation_executor
+    if _calculation_executor is not None:
+        _calculation_executor.shutdown(wait=True, cancel_futures=True)
+        _calculation_executor = None
+
+
+_solar_return_executor: CalculationExecutor | None = None
+
+
+def get_solar_return_executor() -> CalculationExecutor:
+    """
+    Get the process-wide Solar Return executor.
+
+    Multi-year Solar Returns fan out one job per year; they run on this
+    dedicated pool so a 20-year request neither waits behind nor fills the
+    shared calculation queue used by longevity and Saturn Return requests.
+    """
+    global _solar_return_executor
+    if _solar_return_executor is None:
+        _solar_return_executor = CalculationExecutor(
+            kind=settings.CALCULATION_EXECUTOR_TYPE,
+            max_workers=settings.SOLAR_RETURN_EXECUTOR_WORKERS,
+        )
+    return _solar_return_executor
+
+
+def shutdown_solar_return_executor() -> None:
+    """Shut down the process-wide Solar Return executor, if started."""
+    global _solar_return_executor
+    if _solar_return_executor is not None:
+        _solar_return_executor.shutdown(wait=True, cancel_futures=True)
+        _solar_return_executor = None
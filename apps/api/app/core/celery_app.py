@@ -67,4 +67,9 @@ celery_app.conf.beat_schedule = {
         "schedule": crontab(hour=5, minute=0),  # 5h AM diariamente
         "kwargs": {"ttl_days": 30},
     },
+    # Write buffered interpretation cache hit counts to the database
+    "flush-interpretation-cache-hits-every-minute": {
+        "task": "cache.flush_interpretation_hit_counts",
+        "schedule": 60.0,
+    },
 }
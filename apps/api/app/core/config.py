@@ -129,6 +129,11 @@ class Settings(BaseSettings):
     # Swiss Ephemeris
     EPHEMERIS_PATH: str = "/usr/share/ephe"
 
+    # Calculation executor (CPU-bound astrology work offloaded from the event loop)
+    CALCULATION_EXECUTOR_TYPE: Literal["process", "thread"] = "process"
+    CALCULATION_EXECUTOR_WORKERS: int = 2  # Concurrent calculations per API worker
+    SOLAR_RETURN_EXECUTOR_WORKERS: int = 8  # Solar Return years calculated in parallel
+
     # Logging
     LOG_LEVEL: str = "INFO"
 
@@ -150,6 +155,9 @@ class Settings(BaseSettings):
 
     # RAG Settings
     RAG_MAX_ASPECTS: int = 10  # Maximum aspects to interpret in RAG mode
+    # Generate a chart's missing interpretations with multi-subject JSON requests
+    RAG_BATCH_GENERATION: bool = False
+    RAG_BATCH_SUBJECTS: int = 8  # Subjects per batched request
 
     # RAG Document Storage
     RAG_STORAGE_TYPE: Literal["local", "s3"] = "local"  # Storage backend
@@ -158,6 +166,11 @@ class Settings(BaseSettings):
     RAG_LOCAL_PATH: str = "rag_docs"  # Local path for RAG documents (relative to app root)
     RAG_CACHE_DIR: str | None = "/tmp/rag_cache"  # Cache directory for S3 documents
     RAG_CACHE_TTL: int = 3600  # Cache TTL in seconds (1 hour)
+    # Directory of the persisted BM25 index, shared by all workers on a host (None: memory only)
+    RAG_BM25_INDEX_DIR: str | None = "/tmp/rag_bm25_index"
+    # Bulk ingestion: chunks per embedding/Qdrant/DB batch, batches in flight
+    RAG_INGEST_BATCH_SIZE: int = 64
+    RAG_INGEST_CONCURRENCY: int = 4
 
     @property
     def rag_s3_enabled(self) -> bool:
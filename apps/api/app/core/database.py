@@ -3,6 +3,8 @@ Database configuration and session management.
 Uses SQLAlchemy 2.0 with async support.
 """
 
+import asyncio
+import weakref
 from collections.abc import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import (
@@ -33,6 +35,9 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Locks serializing concurrent use of one session (see get_session_lock)
+_session_locks: weakref.WeakKeyDictionary[AsyncSession, asyncio.Lock] = weakref.WeakKeyDictionary()
+
 
 class Base(DeclarativeBase):
     """Base class for all database models."""
@@ -60,6 +65,21 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:  # type: ignore[misc]
             await session.close()
 
 
+def get_session_lock(session: AsyncSession) -> asyncio.Lock:
+    """
+    Get the lock that serializes concurrent use of a session.
+
+    An AsyncSession runs one statement at a time. Services that share a
+    session between concurrent tasks (e.g. interpretations generated in
+    parallel) hold this lock around each use of it; every service gets the
+    same lock for the same session.
+    """
+    lock = _session_locks.get(session)
+    if lock is None:
+        lock = _session_locks[session] = asyncio.Lock()
+    return lock
+
+
 async def init_db() -> None:
     """Initialize database (create tables)."""
     async with engine.begin() as conn:
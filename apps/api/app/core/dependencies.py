@@ -15,24 +15,30 @@ from app.core.i18n.messages import AuthMessages
 from app.core.security import decode_token
 from app.models.enums import UserRole
 from app.models.user import User
+from app.services.auth_principal_cache import AuthPrincipal, cache_principal, get_cached_principal
 
 # HTTP Bearer security scheme
 security = HTTPBearer()
 
 
-async def get_current_user(
+async def get_current_principal(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
+) -> AuthPrincipal:
     """
-    Get current authenticated user from JWT token.
+    Get the authenticated principal from JWT token.
+
+    The principal holds the fields needed for authorization and is cached
+    (see auth_principal_cache), so most requests authenticate without a
+    database query. Endpoints that only need the user's ID or role should
+    depend on this instead of get_current_user.
 
     Args:
         credentials: HTTP Authorization header with Bearer token
-        db: Database session
+        db: Database session (used on a cache miss)
 
     Returns:
-        User object
+        AuthPrincipal of the token's user
 
     Raises:
         HTTPException: If token is invalid or user not found
@@ -57,25 +63,30 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Fetch user from database
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    # Use the cached principal, or fetch the user from database
+    principal = await get_cached_principal(user_id)
+    if principal is None:
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
 
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=_(AuthMessages.USER_NOT_FOUND),
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=_(AuthMessages.USER_NOT_FOUND),
+                headers={"WWW-Authenticate": "Bearer"},
+            )
 
-    if not user.is_active:
+        principal = AuthPrincipal.from_user(user)
+        await cache_principal(principal)
+
+    if not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=_(AuthMessages.USER_INACTIVE),
         )
 
     # Check if token was issued before password change (JWT invalidation)
-    if user.password_changed_at is not None:
+    if principal.password_changed_at is not None:
         token_issued_at = payload.get("iat")
         if token_issued_at is not None:
             # Convert timestamps to comparable format
@@ -84,13 +95,46 @@ async def get_current_user(
             token_issued_datetime = datetime.fromtimestamp(token_issued_at, tz=UTC)
 
             # If token was issued before password change, reject it
-            if token_issued_datetime < user.password_changed_at:
+            if token_issued_datetime < principal.password_changed_at:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail=_(AuthMessages.TOKEN_INVALIDATED),
                     headers={"WWW-Authenticate": "Bearer"},
                 )
 
+    return principal
+
+
+async def get_current_user(
+    principal: Annotated[AuthPrincipal, Depends(get_current_principal)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> User:
+    """
+    Get current authenticated user from JWT token.
+
+    Loads the full user row (for endpoints that read profile fields or
+    modify the user). On a principal cache miss the row is already in the
+    session, so no second query runs.
+
+    Args:
+        principal: Authenticated principal from get_current_principal
+        db: Database session
+
+    Returns:
+        User object
+
+    Raises:
+        HTTPException: If the user no longer exists
+    """
+    user = await db.get(User, principal.id)
+
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=_(AuthMessages.USER_NOT_FOUND),
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     return user
 
 
@@ -110,16 +154,16 @@ async def get_current_active_user(
 
 
 async def get_current_superuser(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+    current_user: Annotated[AuthPrincipal, Depends(get_current_principal)],
+) -> AuthPrincipal:
     """
     Get current superuser (admin).
 
     Args:
-        current_user: Current user from get_current_user dependency
+        current_user: Authenticated principal from get_current_principal
 
     Returns:
-        User object
+        AuthPrincipal
 
     Raises:
         HTTPException: If user is not a superuser
@@ -170,8 +214,8 @@ async def require_verified_email(
 
 
 async def require_premium(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+    current_user: Annotated[AuthPrincipal, Depends(get_current_principal)],
+) -> AuthPrincipal:
     """
     Require premium or admin role for endpoint access.
 
@@ -183,10 +227,10 @@ async def require_premium(
     - ADMIN users can access all features (including premium)
 
     Args:
-        current_user: Current user from get_current_user dependency
+        current_user: Authenticated principal from get_current_principal
 
     Returns:
-        User object
+        AuthPrincipal
 
     Raises:
         HTTPException 403: If user does not have premium or admin role
@@ -203,16 +247,16 @@ async def require_premium(
 
 
 async def require_admin(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+    current_user: Annotated[AuthPrincipal, Depends(get_current_principal)],
+) -> AuthPrincipal:
     """
     Require admin role for endpoint access.
 
     Args:
-        current_user: Current user from get_current_user dependency
+        current_user: Authenticated principal from get_current_principal
 
     Returns:
-        User object
+        AuthPrincipal
 
     Raises:
         HTTPException: If user does not have admin role
@@ -226,8 +270,8 @@ async def require_admin(
 
 
 async def require_verified_admin(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
+    current_user: Annotated[AuthPrincipal, Depends(get_current_principal)],
+) -> AuthPrincipal:
     """
     Require admin role AND verified email for endpoint access.
 
@@ -235,10 +279,10 @@ async def require_verified_admin(
     exploited before email verification is complete.
 
     Args:
-        current_user: Current user from get_current_user dependency
+        current_user: Authenticated principal from get_current_principal
 
     Returns:
-        User object
+        AuthPrincipal
 
     Raises:
         HTTPException: If user is not admin or email not verified
@@ -263,7 +307,7 @@ def require_role(required_role: UserRole) -> Any:
     Usage:
         @router.get("/admin-only")
         async def admin_endpoint(
-            user: User = Depends(require_role(UserRole.ADMIN))
+            user: AuthPrincipal = Depends(require_role(UserRole.ADMIN))
         ):
             ...
 
@@ -275,8 +319,8 @@ def require_role(required_role: UserRole) -> Any:
     """
 
     async def _check_role(
-        current_user: Annotated[User, Depends(get_current_user)],
-    ) -> User:
+        current_user: Annotated[AuthPrincipal, Depends(get_current_principal)],
+    ) -> AuthPrincipal:
         # Admins can access any role-restricted endpoint
         if current_user.is_admin:
             return current_user
@@ -306,7 +350,7 @@ def require_credits(feature_type: str) -> Any:
     Usage:
         @router.post("/interpret")
         async def create_interpretation(
-            user: User = Depends(require_credits("interpretation_full")),
+            user: AuthPrincipal = Depends(require_credits("interpretation_full")),
             db: AsyncSession = Depends(get_db),
         ):
             # Do the work...
@@ -324,9 +368,9 @@ def require_credits(feature_type: str) -> Any:
     from app.services import credit_service
 
     async def _check_credits(
-        current_user: Annotated[User, Depends(get_current_user)],
+        current_user: Annotated[AuthPrincipal, Depends(get_current_principal)],
         db: Annotated[AsyncSession, Depends(get_db)],
-    ) -> User:
+    ) -> AuthPrincipal:
         # Admins always have access
         if current_user.is_admin:
             return current_user
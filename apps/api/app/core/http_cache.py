@@ -0,0 +1,90 @@
+"""
+Helper functions for HTTP conditional requests (ETag / If-None-Match).
+
+Read endpoints derive a strong ETag from what their response depends on
+(typically a row's updated_at plus the response language) and answer
+304 Not Modified when the client already holds that version, without
+building or serializing the response body.
+
+Usage:
+    from app.core.http_cache import make_etag, not_modified, not_modified_response, set_etag
+
+    etag = make_etag(chart.id, chart.updated_at, lang)
+    if not_modified(request, etag):
+        return not_modified_response(etag)
+    set_etag(response, etag)
+"""
+
+import hashlib
+
+from fastapi import Request, Response, status
+
+# Clients may store responses but must revalidate them (a 304 is cheap)
+PRIVATE_REVALIDATE = "private, no-cache"
+PUBLIC_REVALIDATE = "public, no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    """
+    Build a strong ETag from the values a response depends on.
+
+    Args:
+        *parts: Values identifying the response version (ids, timestamps, language)
+
+    Returns:
+        Quoted ETag header value
+    """
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def not_modified(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's If-None-Match matches an ETag.
+
+    Uses the weak comparison required for If-None-Match (RFC 9110), so a
+    W/ prefix added by a proxy still matches.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's copy is current
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates
+
+
+def set_etag(response: Response, etag: str, cache_control: str = PRIVATE_REVALIDATE) -> None:
+    """
+    Set the ETag and Cache-Control headers of a response.
+
+    Args:
+        response: Response to update
+        etag: ETag from make_etag
+        cache_control: Cache-Control header value
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+
+
+def not_modified_response(etag: str, cache_control: str = PRIVATE_REVALIDATE) -> Response:
+    """
+    Build an empty 304 Not Modified response.
+
+    Args:
+        etag: ETag from make_etag
+        cache_control: Cache-Control header value
+
+    Returns:
+        304 response carrying the validator headers
+    """
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_etag(response, etag, cache_control)
+    return response
@@ -0,0 +1,65 @@
+"""
+Async Redis connection pools for caches on the request path.
+
+Caches read from async handlers talk to Redis through redis.asyncio, so a
+slow or unreachable Redis never blocks the event loop. Short socket timeouts
+make such a Redis fail fast; callers treat every Redis error as a cache miss
+(fail open).
+
+Async connections belong to the event loop that opened them, and Celery tasks
+run each task in a fresh loop (asyncio.run), so one pool is kept per running
+loop and dropped with it.
+
+Usage:
+    from app.core.redis_pool import get_async_redis_pool
+
+    pool = get_async_redis_pool()
+    if pool:
+        client = aioredis.Redis(connection_pool=pool)
+        value = await client.get(key)
+"""
+
+import asyncio
+import weakref
+
+import redis.asyncio as aioredis
+from loguru import logger
+
+from app.core.config import settings
+
+# Seconds to wait for a Redis connection or reply before failing open
+REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS = 0.5
+REDIS_SOCKET_TIMEOUT_SECONDS = 0.5
+
+# Maximum connections per event loop
+REDIS_MAX_CONNECTIONS = 50
+
+# One pool per running event loop
+_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aioredis.ConnectionPool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_redis_pool() -> aioredis.ConnectionPool | None:
+    """
+    Get or create the Redis connection pool of the running event loop.
+
+    Returns:
+        Connection pool, or None if it could not be created
+    """
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        try:
+            pool = aioredis.ConnectionPool.from_url(
+                str(settings.REDIS_URL),
+                decode_responses=True,
+                socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+                socket_connect_timeout=REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS,
+                max_connections=REDIS_MAX_CONNECTIONS,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to create Redis connection pool: {e}")
+            return None
+        _pools[loop] = pool
+    return pool
@@ -10,6 +10,11 @@ from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from app.api.v1.router import api_router
+from app.core.calculation_executor import (
+    get_calculation_executor,
+    shutdown_calculation_executor,
+    shutdown_solar_return_executor,
+)
 from app.core.config import settings
 from app.core.database import close_db, init_db
 from app.core.i18n.locale_middleware import LocaleMiddleware
@@ -17,6 +22,7 @@ from app.core.logging_config import configure_logging, intercept_uvicorn_logs
 from app.core.middleware import RequestLoggingMiddleware, TokenRefreshMiddleware
 from app.core.rate_limit import limiter
 from app.middleware.security import SecurityHeadersMiddleware
+from app.services.interpretation_cache_service import push_pending_hits
 
 # Configure logging early (before app creation)
 configure_logging()
@@ -82,6 +88,10 @@ async def shutdown_event() -> None:
     logger.info("Shutting down application")
     await close_db()
     logger.info("Database connections closed")
+    shutdown_calculation_executor()
+    shutdown_solar_return_executor()
+    logger.info("Calculation executors stopped")
+    await push_pending_hits()
 
 
 @app.get("/", tags=["Health"])
@@ -106,6 +116,12 @@ async def health_check() -> JSONResponse:
     )
 
 
+@app.get("/health/calculations", tags=["Health"])
+async def calculation_executor_health() -> JSONResponse:
+    """Calculation executor metrics (queue depth and latency)."""
+    return JSONResponse(status_code=200, content=get_calculation_executor().get_metrics())
+
+
 # Include API routers
 app.include_router(api_router, prefix="/api/v1")
 
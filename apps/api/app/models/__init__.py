@@ -4,7 +4,9 @@ Database models.
 
 from app.models.blog_post import BlogPost
 from app.models.chart import AuditLog, BirthChart
+from app.models.chart_localization import BirthChartLocalization
 from app.models.credit_transaction import CreditTransaction
+from app.models.embedding_cache import EmbeddingCache
 from app.models.interpretation import ChartInterpretation
 from app.models.interpretation_cache import InterpretationCache
 from app.models.password_reset import PasswordResetToken
@@ -24,11 +26,13 @@ __all__ = [
     "User",
     "OAuthAccount",
     "BirthChart",
+    "BirthChartLocalization",
     "ChartInterpretation",
     "AuditLog",
     "PasswordResetToken",
     "UserConsent",
     "InterpretationCache",
+    "EmbeddingCache",
     "VectorDocument",
     "SearchIndex",
     "PublicChart",
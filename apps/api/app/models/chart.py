@@ -8,11 +8,12 @@ from uuid import uuid4
 
 from sqlalchemy import ARRAY, DateTime, ForeignKey, Integer, Numeric, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from app.core.database import Base
 
 if TYPE_CHECKING:
+    from app.models.chart_localization import BirthChartLocalization
     from app.models.interpretation import ChartInterpretation
     from app.models.user import User
 
@@ -68,9 +69,16 @@ class BirthChart(Base):
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     task_id: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
 
-    # Calculated chart data (stored as JSONB for flexibility)
+    # Calculated chart data (stored as JSONB for flexibility).
+    # Holds the language-neutral section; translated sections live in
+    # birth_chart_localizations (see ChartRepository.get_chart_data).
+    # Charts not yet migrated still hold language-keyed data here.
     chart_data: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
+    # Small projection of chart_data for list views (Sun, Moon, Ascendant).
+    # Only populated by ChartRepository.get_summaries_by_user, which defers chart_data.
+    chart_summary: Mapped[dict | None] = query_expression()
+
     # PDF export
     pdf_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     pdf_generated_at: Mapped[datetime | None] = mapped_column(
@@ -123,6 +131,12 @@ class BirthChart(Base):
         back_populates="chart",
         cascade="all, delete-orphan",
     )
+    localizations: Mapped[list["BirthChartLocalization"]] = relationship(  # noqa: F821
+        "BirthChartLocalization",
+        back_populates="chart",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
     def __repr__(self) -> str:
         return f"<BirthChart {self.person_name} ({self.id})>"
@@ -0,0 +1,74 @@
+"""
+Birth Chart Localization model for the per-language sections of chart data.
+
+A chart's calculation is stored in two parts:
+
+- ``birth_charts.chart_data``: the language-neutral section (positions, houses,
+  aspects, dignities, lots, sect) shared by every language
+- ``birth_chart_localizations``: one row per language with the translated
+  sections (lunar/solar phase, prenatal syzygy, lord of nativity, temperament,
+  mentality)
+
+Readers load the shared section plus the one language they need, so adding a
+language does not grow the row every chart read has to fetch.
+"""
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.database import Base
+
+if TYPE_CHECKING:
+    from app.models.chart import BirthChart
+
+
+class BirthChartLocalization(Base):
+    """Translated sections of a birth chart in one language."""
+
+    __tablename__ = "birth_chart_localizations"
+    __table_args__ = (UniqueConstraint("chart_id", "language", name="uq_birth_chart_localization"),)
+
+    id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid4,
+    )
+    chart_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("birth_charts.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    language: Mapped[str] = mapped_column(
+        String(10),
+        nullable=False,
+        comment="Language code (e.g., 'pt-BR', 'en-US')",
+    )
+    data: Mapped[dict] = mapped_column(
+        JSONB,
+        nullable=False,
+        comment="Language-specific chart sections",
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    # Relationships
+    chart: Mapped["BirthChart"] = relationship("BirthChart", back_populates="localizations")
+
+    def __repr__(self) -> str:
+        return f"<BirthChartLocalization {self.chart_id} ({self.language})>"
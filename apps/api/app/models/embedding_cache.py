@@ -0,0 +1,64 @@
+"""
+Embedding Cache model for storing query embeddings used by RAG retrieval.
+
+Interpretation queries are highly repetitive ("Mars in Aries house 1", ...),
+so their embeddings are stored by a hash of (embedding model, normalized text)
+and reused instead of calling the embeddings API again.
+"""
+
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import ARRAY, DateTime, Float, String, Text, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class EmbeddingCache(Base):
+    """Cache for query embeddings."""
+
+    __tablename__ = "embedding_cache"
+
+    id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid4,
+    )
+
+    # Unique hash key for cache lookup
+    # Generated from: embedding model + normalized text
+    cache_key: Mapped[str] = mapped_column(
+        String(64),  # SHA-256 hash
+        unique=True,
+        nullable=False,
+        index=True,
+    )
+
+    model: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="Embedding model (e.g., 'text-embedding-ada-002')",
+    )
+
+    text: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        comment="Normalized text that was embedded",
+    )
+
+    embedding: Mapped[list[float]] = mapped_column(
+        ARRAY(Float),
+        nullable=False,
+        comment="Embedding vector",
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<EmbeddingCache {self.model}:{self.text[:50]}>"
@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, String, Text, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -85,6 +85,17 @@ class PublicChartInterpretation(Base):
         nullable=False,
     )
 
+    __table_args__ = (
+        # One interpretation per element per language (target of bulk upserts)
+        UniqueConstraint(
+            "chart_id",
+            "interpretation_type",
+            "subject",
+            "language",
+            name="uq_public_chart_interpretation",
+        ),
+    )
+
     # Relationship
     chart: Mapped["PublicChart"] = relationship(
         "PublicChart",
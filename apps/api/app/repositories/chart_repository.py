@@ -3,14 +3,69 @@ Birth Chart repository.
 """
 
 from datetime import UTC, datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import ColumnElement, and_, case, cast, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import JSONB, JSONPATH, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, with_expression
 
 from app.models.chart import BirthChart
+from app.models.chart_localization import BirthChartLocalization
 from app.models.interpretation import ChartInterpretation
 from app.repositories.base import BaseRepository
+from app.utils.chart_data_accessor import (
+    extract_language_data,
+    is_language_first_format,
+    merge_chart_data,
+    split_chart_data,
+)
+
+# Planets included in chart summaries (list views show their signs)
+SUMMARY_PLANETS = ("Sun", "Moon")
+
+# Languages of language-first chart_data, in fallback order
+CHART_DATA_LANGUAGES = ("pt-BR", "en-US")
+
+
+def chart_summary_expression(language: str) -> ColumnElement[dict[str, Any]]:
+    """
+    SQL expression projecting chart_data to a small summary.
+
+    The summary has the shape of chart_data with only what list views use:
+    ``{"planets": [{"name": "Sun", "sign": ...}, {"name": "Moon", ...}],
+    "ascendant": ...}``. Like extract_language_data, the requested language is
+    preferred, then any other language, then the legacy flat format.
+
+    Args:
+        language: Language code ('pt-BR', 'en-US')
+
+    Returns:
+        JSONB expression (NULL while the chart has no data)
+    """
+    languages = [language, *(lang for lang in CHART_DATA_LANGUAGES if lang != language)]
+    data = func.coalesce(
+        *(BirthChart.chart_data[lang] for lang in languages),
+        BirthChart.chart_data,
+    )
+    planets = func.jsonb_build_array(
+        *(
+            func.jsonb_build_object(
+                literal("name"),
+                literal(name),
+                literal("sign"),
+                func.jsonb_path_query_first(
+                    data, cast(literal(f'$.planets[*] ? (@.name == "{name}").sign'), JSONPATH)
+                ),
+            )
+            for name in SUMMARY_PLANETS
+        )
+    )
+    summary = func.jsonb_build_object(
+        literal("planets"), planets, literal("ascendant"), data["ascendant"]
+    )
+    return case((BirthChart.chart_data.is_(None), None), else_=summary).cast(JSONB)
 
 
 class ChartRepository(BaseRepository[BirthChart]):
@@ -49,6 +104,31 @@ class ChartRepository(BaseRepository[BirthChart]):
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_version(
+        self,
+        chart_id: UUID,
+        user_id: UUID | None = None,
+    ) -> datetime | None:
+        """
+        Get a chart's updated_at without loading the row (for ETag checks).
+
+        Args:
+            chart_id: Chart UUID
+            user_id: Owner UUID; when given, only a non-deleted chart owned by
+                this user matches (same rules as get_by_id_and_user)
+
+        Returns:
+            The chart's updated_at, or None if no chart matches
+        """
+        stmt = select(BirthChart.id, BirthChart.updated_at, BirthChart.user_id).where(
+            BirthChart.id == chart_id
+        )
+        if user_id is not None:
+            stmt = stmt.where(BirthChart.user_id == user_id, BirthChart.deleted_at.is_(None))
+
+        row = (await self.db.execute(stmt)).one_or_none()
+        return row.updated_at if row else None
+
     async def get_all_by_user(
         self,
         user_id: UUID,
@@ -84,6 +164,49 @@ class ChartRepository(BaseRepository[BirthChart]):
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_summaries_by_user(
+        self,
+        user_id: UUID,
+        language: str,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[BirthChart]:
+        """
+        Get a user's charts for list views, without the full chart_data.
+
+        chart_data is deferred (it is tens of kilobytes per chart) and
+        chart_summary is loaded in its place (see chart_summary_expression).
+        Accessing chart_data on the returned charts triggers a lazy load.
+
+        Args:
+            user_id: User UUID
+            language: Language of the summaries
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of charts with chart_summary populated
+        """
+        stmt = (
+            select(BirthChart)
+            .options(
+                defer(BirthChart.chart_data),
+                with_expression(BirthChart.chart_summary, chart_summary_expression(language)),
+            )
+            .where(
+                and_(
+                    BirthChart.user_id == user_id,
+                    BirthChart.deleted_at.is_(None),
+                )
+            )
+            .order_by(BirthChart.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
     async def count_by_user(
         self,
         user_id: UUID,
@@ -242,3 +365,102 @@ class ChartRepository(BaseRepository[BirthChart]):
 
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
+
+    async def save_chart_data(
+        self,
+        chart: BirthChart,
+        chart_data_by_lang: dict[str, Any],
+    ) -> None:
+        """
+        Store a calculated chart: shared section on the chart, translations per language.
+
+        Replaces the chart's previous data (languages not in chart_data_by_lang
+        are removed). Flushes, but does not commit.
+
+        Args:
+            chart: Chart to update
+            chart_data_by_lang: Language-first chart data ({"en-US": {...}, ...})
+        """
+        neutral, localized = split_chart_data(chart_data_by_lang)
+        chart.chart_data = neutral
+
+        if localized:
+            insert_stmt = insert(BirthChartLocalization).values(
+                [
+                    {"chart_id": chart.id, "language": language, "data": data}
+                    for language, data in localized.items()
+                ]
+            )
+            await self.db.execute(
+                insert_stmt.on_conflict_do_update(
+                    constraint="uq_birth_chart_localization",
+                    set_={"data": insert_stmt.excluded.data, "updated_at": func.now()},
+                )
+            )
+        await self.db.execute(
+            delete(BirthChartLocalization).where(
+                BirthChartLocalization.chart_id == chart.id,
+                BirthChartLocalization.language.not_in(list(localized)),
+            )
+        )
+        await self.db.flush()
+
+    async def get_chart_data(
+        self,
+        chart: BirthChart,
+        language: str,
+    ) -> dict[str, Any]:
+        """
+        Load a chart's data in one language.
+
+        Only the shared section and the requested language's row are read.
+        Charts that still hold language-first or legacy flat chart_data are
+        handled like extract_language_data.
+
+        Args:
+            chart: Chart (with chart_data loaded)
+            language: Language code ('pt-BR', 'en-US')
+
+        Returns:
+            Flat chart data for the language ({} while the chart has no data)
+        """
+        if not chart.chart_data:
+            return {}
+        if is_language_first_format(chart.chart_data):
+            return extract_language_data(chart.chart_data, language)
+
+        # Requested language first, then any other (like extract_language_data)
+        stmt = (
+            select(BirthChartLocalization.data)
+            .where(BirthChartLocalization.chart_id == chart.id)
+            .order_by(
+                (BirthChartLocalization.language != language), BirthChartLocalization.language
+            )
+            .limit(1)
+        )
+        localized = (await self.db.execute(stmt)).scalar_one_or_none()
+        return merge_chart_data(chart.chart_data, localized)
+
+    async def get_chart_data_all_languages(self, chart: BirthChart) -> dict[str, Any]:
+        """
+        Load a chart's data in every stored language.
+
+        Args:
+            chart: Chart (with chart_data loaded)
+
+        Returns:
+            Language-first chart data ({"en-US": {...}, "pt-BR": {...}}), the
+            legacy flat chart_data as-is, or {} while the chart has no data
+        """
+        if not chart.chart_data:
+            return {}
+        if is_language_first_format(chart.chart_data):
+            return chart.chart_data
+
+        stmt = select(BirthChartLocalization.language, BirthChartLocalization.data).where(
+            BirthChartLocalization.chart_id == chart.id
+        )
+        rows = (await self.db.execute(stmt)).all()
+        if not rows:
+            return chart.chart_data
+        return {row.language: merge_chart_data(chart.chart_data, row.data) for row in rows}
@@ -107,6 +107,36 @@ class InterpretationRepository(BaseRepository[ChartInterpretation]):
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_existing_subjects(
+        self,
+        chart_id: UUID,
+        language: str,
+    ) -> dict[tuple[str, str], str]:
+        """
+        Get the content of every interpretation a chart already has in a language.
+
+        One query replaces a get_by_chart_and_subject call per subject.
+
+        Args:
+            chart_id: Chart UUID
+            language: Language code (e.g., 'pt-BR', 'en-US')
+
+        Returns:
+            Dictionary of (interpretation_type, subject) -> content
+        """
+        stmt = select(
+            ChartInterpretation.interpretation_type,
+            ChartInterpretation.subject,
+            ChartInterpretation.content,
+        ).where(
+            and_(
+                ChartInterpretation.chart_id == chart_id,
+                ChartInterpretation.language == language,
+            )
+        )
+        result = await self.db.execute(stmt)
+        return {(row.interpretation_type, row.subject): row.content for row in result}
+
     async def upsert_interpretation(
         self,
         chart_id: UUID | Any,  # Accept both uuid.UUID and SQLAlchemy UUID
@@ -6,7 +6,8 @@ from typing import Any
 from uuid import UUID
 
 from loguru import logger
-from sqlalchemy import and_, select
+from sqlalchemy import and_, func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.public_chart_interpretation import PublicChartInterpretation
@@ -118,3 +119,32 @@ class PublicInterpretationRepository(BaseRepository[PublicChartInterpretation]):
                 f"Created public interpretation: {interpretation_type}/{subject} for chart {chart_id}"
             )
             return new_interpretation
+
+    async def bulk_upsert(self, rows: list[dict[str, Any]]) -> int:
+        """
+        Create or update many interpretations with one INSERT ... ON CONFLICT.
+
+        Args:
+            rows: Column values (chart_id, interpretation_type, subject, content,
+                language, openai_model, prompt_version)
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+
+        insert_stmt = insert(PublicChartInterpretation).values(rows)
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            constraint="uq_public_chart_interpretation",
+            set_={
+                "content": insert_stmt.excluded.content,
+                "openai_model": insert_stmt.excluded.openai_model,
+                "prompt_version": insert_stmt.excluded.prompt_version,
+                "updated_at": func.now(),
+            },
+        )
+        await self.db.execute(upsert_stmt)
+
+        logger.debug(f"Upserted {len(rows)} public interpretations")
+        return len(rows)
@@ -17,6 +17,7 @@ from app.schemas.chart import (
     BirthChartCreate,
     BirthChartList,
     BirthChartRead,
+    BirthChartSummary,
     BirthChartUpdate,
     ChartData,
     HousePosition,
@@ -44,6 +45,7 @@ __all__ = [
     "BirthChartCreate",
     "BirthChartUpdate",
     "BirthChartRead",
+    "BirthChartSummary",
     "BirthChartList",
     "PlanetPosition",
     "HousePosition",
@@ -176,10 +176,20 @@ class BirthChartRead(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class BirthChartSummary(BirthChartRead):
+    """Schema for birth charts in lists (chart_data reduced to Sun, Moon and Ascendant)."""
+
+    chart_data: dict[str, Any] | None = Field(
+        None,
+        validation_alias="chart_summary",
+        description="Chart data projection: Sun and Moon signs and the Ascendant",
+    )
+
+
 class BirthChartList(BaseModel):
     """Schema for list of birth charts."""
 
-    charts: list[BirthChartRead]
+    charts: list[BirthChartSummary]
     total: int
     page: int
     page_size: int
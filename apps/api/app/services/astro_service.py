@@ -2,24 +2,33 @@
 Astrological calculation service using Swiss Ephemeris (PySwisseph).
 """
 
+import copy
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
-from zoneinfo import ZoneInfo
 
 import swisseph as swe
 
+from app.astro.aspects import find_aspects, is_applying
 from app.astro.dignities import calculate_essential_dignities, find_lord_of_nativity, get_sign_ruler
+from app.astro.ephemeris import calc_positions
 from app.astro.lunar_phase import calculate_lunar_phase
 from app.astro.mentality import calculate_mentality
-from app.astro.prenatal_syzygy import calculate_prenatal_syzygy
+from app.astro.prenatal_syzygy import find_prenatal_syzygy, localize_prenatal_syzygy
 from app.astro.solar_phase import calculate_solar_phase
 from app.astro.temperament import calculate_temperament
 from app.schemas.chart import AspectData, HousePosition, PlanetPosition
+from app.services.timezone_service import local_datetime_to_julian_day
+from app.translations import SUPPORTED_LANGUAGES
 
 # Set ephemeris path to None to use built-in Moshier ephemeris (lower precision but no files needed)
 # For production, download Swiss Ephemeris files for higher precision
 swe.set_ephe_path(None)
 
+# Version of the chart calculation engine. Bump whenever calculate_chart_core or
+# localize_chart output changes: cached chart results are keyed by this value.
+CHART_ENGINE_VERSION = "2"
+
 # Planet constants from Swiss Ephemeris
 # Note: Using Moshier ephemeris (built-in) which supports main planets and nodes
 # Chiron and other asteroids require external ephemeris files
@@ -108,27 +117,10 @@ def convert_to_julian_day(dt: datetime, timezone: str, latitude: float, longitud
     Returns:
         Julian Day number
     """
-    # Handle timezone conversion properly
     # Case 1: datetime already has timezone info (e.g., from database with UTC)
     # Case 2: naive datetime that should be interpreted in the given timezone
-    if dt.tzinfo is not None:
-        # Already timezone-aware - convert directly to UTC
-        dt_utc = dt.astimezone(ZoneInfo("UTC"))
-    else:
-        # Naive datetime - interpret it in the given timezone, then convert to UTC
-        tz = ZoneInfo(timezone)
-        dt_aware = dt.replace(tzinfo=tz)
-        dt_utc = dt_aware.astimezone(ZoneInfo("UTC"))
-
-    # Calculate Julian Day
-    jd: float = swe.julday(  # type: ignore[no-any-return]
-        dt_utc.year,
-        dt_utc.month,
-        dt_utc.day,
-        dt_utc.hour + dt_utc.minute / 60.0 + dt_utc.second / 3600.0,
-    )
-
-    return jd
+    # Conversions are memoized (bulk jobs and repeated charts share birth moments)
+    return local_datetime_to_julian_day(dt, timezone)
 
 
 def get_sign_and_position(longitude: float) -> dict[str, Any]:
@@ -172,14 +164,14 @@ def calculate_planets(jd: float, house_cusps: list[float]) -> list[PlanetPositio
     """
     planets = []
 
-    for name, planet_id in PLANETS.items():
-        # Calculate planet position
-        # flags: SEFLG_MOSEPH (Moshier ephemeris, built-in) + SEFLG_SPEED (get speed)
-        result, flags_ret = swe.calc_ut(jd, planet_id, swe.FLG_MOSEPH | swe.FLG_SPEED)
+    # Calculate all planet positions in one batch
+    # flags: SEFLG_MOSEPH (Moshier ephemeris, built-in) + SEFLG_SPEED (get speed)
+    batch = calc_positions([jd], list(PLANETS.values()), swe.FLG_MOSEPH | swe.FLG_SPEED)
 
-        longitude = result[0]
-        latitude = result[1]
-        speed = result[3]
+    for column, name in enumerate(PLANETS):
+        longitude = float(batch.longitudes[0, column])
+        latitude = float(batch.latitudes[0, column])
+        speed = float(batch.speeds[0, column])
 
         # Get sign and position
         sign_data = get_sign_and_position(longitude)
@@ -288,49 +280,23 @@ def calculate_aspects(planets: list[PlanetPosition]) -> list[AspectData]:
     Returns:
         List of significant aspects
     """
-    aspects = []
-
-    # Compare each planet with every other planet
-    for i, planet1 in enumerate(planets):
-        for planet2 in planets[i + 1 :]:
-            # Calculate angle between planets
-            angle_diff = abs(planet1.longitude - planet2.longitude)
-
-            # Normalize to 0-180 degrees
-            if angle_diff > 180:
-                angle_diff = 360 - angle_diff
-
-            # Check each aspect type
-            for aspect_name, aspect_data in ASPECTS.items():
-                aspect_angle = aspect_data["angle"]
-                orb = aspect_data["orb"]
-
-                # Calculate orb (difference from exact aspect)
-                orb_diff = abs(angle_diff - aspect_angle)
-
-                # If within orb, it's a valid aspect
-                if orb_diff <= orb:
-                    # Determine if applying or separating
-                    applying = is_aspect_applying(
-                        planet1.longitude,
-                        planet2.longitude,
-                        planet1.speed,
-                        planet2.speed,
-                        aspect_angle,
-                    )
-
-                    aspects.append(
-                        AspectData(
-                            planet1=planet1.name,
-                            planet2=planet2.name,
-                            aspect=aspect_name,
-                            angle=angle_diff,
-                            orb=orb_diff,
-                            applying=applying,
-                        )
-                    )
-
-    return aspects
+    matches = find_aspects(
+        [planet.longitude for planet in planets],
+        ASPECTS,
+        speeds_a=[planet.speed for planet in planets],
+    )
+
+    return [
+        AspectData(
+            planet1=planets[match.index_a].name,
+            planet2=planets[match.index_b].name,
+            aspect=match.aspect,
+            angle=match.angle,
+            orb=match.orb,
+            applying=bool(match.applying),
+        )
+        for match in matches
+    ]
 
 
 def is_aspect_applying(
@@ -349,18 +315,7 @@ def is_aspect_applying(
     Returns:
         True if applying, False if separating
     """
-    # Calculate relative speed
-    relative_speed = speed1 - speed2
-
-    # Calculate current angle
-    current_angle = abs(lon1 - lon2)
-    if current_angle > 180:
-        current_angle = 360 - current_angle
-
-    # If faster planet is catching up, aspect is applying
-    return (relative_speed > 0 and current_angle < aspect_angle) or (
-        relative_speed < 0 and current_angle > aspect_angle
-    )
+    return is_applying(lon1, lon2, speed1, speed2, aspect_angle)
 
 
 def calculate_sect(ascendant: float, sun_longitude: float) -> str:
@@ -848,16 +803,43 @@ def calculate_arabic_parts(
     return parts
 
 
-def calculate_birth_chart(
+@dataclass
+class ChartCore:
+    """
+    Language-neutral result of a birth chart calculation.
+
+    Holds every numeric section of the chart (ephemeris positions, houses,
+    aspects, dignities, lots, sect and the prenatal syzygy). Localized text is
+    added afterwards by localize_chart(), so the ephemeris work is done once
+    per chart regardless of how many languages are generated.
+    """
+
+    jd: float
+    houses: list[HousePosition]
+    planets: list[PlanetPosition]
+    planets_with_dignities: list[dict[str, Any]]
+    aspects: list[AspectData]
+    ascendant: float
+    midheaven: float
+    sect: str
+    sect_analysis: dict[str, Any]
+    arabic_parts: dict[str, Any]
+    prenatal_syzygy: dict[str, Any]
+    sun_longitude: float
+    moon_longitude: float
+    sun_sign: str
+    calculation_timestamp: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+
+
+def calculate_chart_core(
     birth_datetime: datetime,
     timezone: str,
     latitude: float,
     longitude: float,
     house_system: str = "placidus",
-    language: str = "pt-BR",
-) -> dict[str, Any]:
+) -> ChartCore:
     """
-    Calculate complete birth chart.
+    Calculate the language-neutral part of a birth chart.
 
     Args:
         birth_datetime: Birth date and time
@@ -865,10 +847,9 @@ def calculate_birth_chart(
         latitude: Geographic latitude
         longitude: Geographic longitude
         house_system: House system to use
-        language: Language for interpretations ('pt-BR' or 'en-US')
 
     Returns:
-        Complete chart data dictionary
+        ChartCore with all numeric chart sections
     """
     # Convert to Julian Day
     jd = convert_to_julian_day(birth_datetime, timezone, latitude, longitude)
@@ -896,19 +877,12 @@ def calculate_birth_chart(
     # Calculate sect (day/night chart)
     sect = calculate_sect(ascendant, sun_longitude)
 
-    # Calculate lunar phase
-    lunar_phase = calculate_lunar_phase(sun_longitude, moon_longitude, language)
-
-    # Calculate solar phase
-    solar_phase = calculate_solar_phase(sun_sign, language)
-
-    # Calculate prenatal syzygy (last New Moon or Full Moon before birth)
-    prenatal_syzygy = calculate_prenatal_syzygy(
+    # Locate prenatal syzygy (last New Moon or Full Moon before birth)
+    prenatal_syzygy = find_prenatal_syzygy(
         birth_jd=jd,
         sun_longitude=sun_longitude,
         moon_longitude=moon_longitude,
         houses=[h.model_dump() for h in houses],
-        language=language,
     )
 
     # Add essential dignities to each planet
@@ -916,7 +890,7 @@ def calculate_birth_chart(
     for planet in planets:
         planet_dict = planet.model_dump()
         # Only calculate dignities for classical 7 planets
-        if planet.name in ["Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn"]:
+        if planet.name in CLASSICAL_PLANET_ORDER:
             dignities = calculate_essential_dignities(planet.name, planet.sign, planet.degree, sect)
             planet_dict["dignities"] = dignities
         planets_with_dignities.append(planet_dict)
@@ -924,12 +898,71 @@ def calculate_birth_chart(
     # Calculate aspects
     aspects = calculate_aspects(planets)
 
+    # Calculate Arabic Parts (Lots)
+    arabic_parts = calculate_arabic_parts(
+        ascendant=ascendant,
+        sun_longitude=sun_longitude,
+        moon_longitude=moon_longitude,
+        planets=planets,
+        house_cusps=house_cusps,
+        sect=sect,
+    )
+
+    # Calculate complete sect analysis with planet classifications
+    sect_analysis = calculate_sect_analysis(planets_with_dignities, sect)
+
+    return ChartCore(
+        jd=jd,
+        houses=houses,
+        planets=planets,
+        planets_with_dignities=planets_with_dignities,
+        aspects=aspects,
+        ascendant=ascendant,
+        midheaven=midheaven,
+        sect=sect,
+        sect_analysis=sect_analysis,
+        arabic_parts=arabic_parts,
+        prenatal_syzygy=prenatal_syzygy,
+        sun_longitude=sun_longitude,
+        moon_longitude=moon_longitude,
+        sun_sign=sun_sign,
+    )
+
+
+def localize_chart(core: ChartCore, language: str = "pt-BR") -> dict[str, Any]:
+    """
+    Build the chart data dictionary for one language from a ChartCore.
+
+    Only translation lookups and pure-Python analysis run here; no ephemeris
+    calls are made. Numeric sections are copied so that charts produced for
+    different languages never share mutable state.
+
+    Args:
+        core: Result of calculate_chart_core()
+        language: Language for interpretations ('pt-BR' or 'en-US')
+
+    Returns:
+        Complete chart data dictionary
+    """
+    planets_with_dignities = copy.deepcopy(core.planets_with_dignities)
+    houses = [h.model_dump() for h in core.houses]
+    aspects = [a.model_dump() for a in core.aspects]
+
+    # Calculate lunar phase
+    lunar_phase = calculate_lunar_phase(core.sun_longitude, core.moon_longitude, language)
+
+    # Calculate solar phase
+    solar_phase = calculate_solar_phase(core.sun_sign, language)
+
+    # Localize prenatal syzygy
+    prenatal_syzygy = localize_prenatal_syzygy(core.prenatal_syzygy, language)
+
     # Find Lord of Nativity (planet with highest essential dignity score)
     lord_of_nativity = find_lord_of_nativity(planets_with_dignities, language)
 
     # Calculate Temperament based on 5 traditional factors
     # Get ascendant sign
-    ascendant_sign_data = get_sign_and_position(ascendant)
+    ascendant_sign_data = get_sign_and_position(core.ascendant)
     ascendant_sign = ascendant_sign_data["sign"]
 
     # Get ascendant ruler, its sign, and dignities
@@ -964,9 +997,9 @@ def calculate_birth_chart(
         ascendant_sign=ascendant_sign,
         ascendant_ruler_name=ascendant_ruler_name,
         ascendant_ruler_sign=ascendant_ruler_sign,
-        sun_sign=sun_sign,
-        sun_longitude=sun_longitude,
-        moon_longitude=moon_longitude,
+        sun_sign=core.sun_sign,
+        sun_longitude=core.sun_longitude,
+        moon_longitude=core.moon_longitude,
         lord_of_nativity_name=lord_of_nativity_name,
         lord_of_nativity_sign=lord_of_nativity_sign,
         ascendant_ruler_dignities=ascendant_ruler_dignities,
@@ -977,42 +1010,84 @@ def calculate_birth_chart(
     # Calculate Mentality (Issue #57)
     mentality = calculate_mentality(
         planets=planets_with_dignities,
-        houses=[h.model_dump() for h in houses],
-        aspects=[a.model_dump() for a in aspects],
+        houses=houses,
+        aspects=aspects,
         language=language,
     )
 
-    # Calculate Arabic Parts (Lots)
-    arabic_parts = calculate_arabic_parts(
-        ascendant=ascendant,
-        sun_longitude=sun_longitude,
-        moon_longitude=moon_longitude,
-        planets=planets,
-        house_cusps=house_cusps,
-        sect=sect,
-    )
-
-    # Calculate complete sect analysis with planet classifications
-    sect_analysis = calculate_sect_analysis(planets_with_dignities, sect)
-
     # NOTE: Longevity and Saturn Return are now calculated on-demand via their
     # respective endpoints to allow credit consumption per feature.
     # See: /charts/{id}/longevity and /charts/{id}/saturn-return
 
     return {
         "planets": planets_with_dignities,
-        "houses": [h.model_dump() for h in houses],
-        "aspects": [a.model_dump() for a in aspects],
-        "ascendant": ascendant,
-        "midheaven": midheaven,
-        "sect": sect,
-        "sect_analysis": sect_analysis,
+        "houses": houses,
+        "aspects": aspects,
+        "ascendant": core.ascendant,
+        "midheaven": core.midheaven,
+        "sect": core.sect,
+        "sect_analysis": copy.deepcopy(core.sect_analysis),
         "lunar_phase": lunar_phase,
         "solar_phase": solar_phase,
         "prenatal_syzygy": prenatal_syzygy,
         "lord_of_nativity": lord_of_nativity,
         "temperament": temperament,
         "mentality": mentality,
-        "arabic_parts": arabic_parts,
-        "calculation_timestamp": datetime.now(UTC).isoformat(),
+        "arabic_parts": copy.deepcopy(core.arabic_parts),
+        "calculation_timestamp": core.calculation_timestamp,
     }
+
+
+def calculate_birth_chart(
+    birth_datetime: datetime,
+    timezone: str,
+    latitude: float,
+    longitude: float,
+    house_system: str = "placidus",
+    language: str = "pt-BR",
+) -> dict[str, Any]:
+    """
+    Calculate complete birth chart.
+
+    Args:
+        birth_datetime: Birth date and time
+        timezone: Timezone string
+        latitude: Geographic latitude
+        longitude: Geographic longitude
+        house_system: House system to use
+        language: Language for interpretations ('pt-BR' or 'en-US')
+
+    Returns:
+        Complete chart data dictionary
+    """
+    core = calculate_chart_core(birth_datetime, timezone, latitude, longitude, house_system)
+    return localize_chart(core, language)
+
+
+def calculate_birth_chart_all_languages(
+    birth_datetime: datetime,
+    timezone: str,
+    latitude: float,
+    longitude: float,
+    house_system: str = "placidus",
+    languages: list[str] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Calculate a birth chart once and localize it for several languages.
+
+    Args:
+        birth_datetime: Birth date and time
+        timezone: Timezone string
+        latitude: Geographic latitude
+        longitude: Geographic longitude
+        house_system: House system to use
+        languages: Languages to generate (default: all SUPPORTED_LANGUAGES)
+
+    Returns:
+        Language-keyed chart data ({"en-US": {...}, "pt-BR": {...}})
+    """
+    if languages is None:
+        languages = SUPPORTED_LANGUAGES
+
+    core = calculate_chart_core(birth_datetime, timezone, latitude, longitude, house_system)
+    return {language: localize_chart(core, language) for language in languages}
@@ -0,0 +1,212 @@
+"""
+Cache for authentication principals.
+
+Every authenticated request used to load the user row to check that the
+account is active, that the token was issued after the last password reset,
+and (for admin/premium endpoints) the user's role. The fields these checks
+need are small and rarely change, so they are cached as an AuthPrincipal in
+two tiers:
+
+1. An in-process dict (bounded, AUTH_PRINCIPAL_LOCAL_TTL_SECONDS)
+2. Redis (shared by API workers), AUTH_PRINCIPAL_CACHE_TTL_SECONDS
+
+Code that changes a user's role, subscription, email verification, password
+reset time, activation or deletion calls invalidate_principal() after
+committing. This drops the Redis entry and this process's copy; other
+processes may keep their in-process copy for up to the local TTL. Redis
+errors fail open (the principal is loaded from the database).
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import redis.asyncio as aioredis
+from loguru import logger
+
+from app.core.redis_pool import get_async_redis_pool
+from app.models.enums import UserRole
+from app.models.user import User
+
+# Redis keys and TTL for cached principals (1 minute)
+AUTH_PRINCIPAL_CACHE_KEY_PREFIX = "auth_principal:"
+AUTH_PRINCIPAL_CACHE_TTL_SECONDS = 60
+
+# How long a process trusts its own copy of a principal
+AUTH_PRINCIPAL_LOCAL_TTL_SECONDS = 5.0
+
+# Maximum number of principals kept in process memory
+AUTH_PRINCIPAL_LOCAL_MAX_ENTRIES = 4096
+
+# In-process tier: user ID -> (expiry on the monotonic clock, principal)
+_local_cache: OrderedDict[str, tuple[float, "AuthPrincipal"]] = OrderedDict()
+_local_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class AuthPrincipal:
+    """The authorization-relevant fields of an authenticated user."""
+
+    id: UUID
+    email: str
+    role: str
+    is_superuser: bool
+    is_active: bool
+    email_verified: bool
+    password_changed_at: datetime | None = None
+    deleted_at: datetime | None = None
+
+    @classmethod
+    def from_user(cls, user: User) -> "AuthPrincipal":
+        """Build a principal from a loaded user row."""
+        return cls(
+            id=user.id,
+            email=user.email,
+            role=user.role,
+            is_superuser=user.is_superuser,
+            is_active=user.is_active,
+            email_verified=user.email_verified,
+            password_changed_at=user.password_changed_at,
+            deleted_at=user.deleted_at,
+        )
+
+    @classmethod
+    def from_json(cls, value: str) -> "AuthPrincipal":
+        """Build a principal from its cached JSON."""
+        data: dict[str, Any] = json.loads(value)
+        for key in ("password_changed_at", "deleted_at"):
+            if data[key] is not None:
+                data[key] = datetime.fromisoformat(data[key])
+        return cls(**(data | {"id": UUID(data["id"])}))
+
+    def to_json(self) -> str:
+        """Serialize the principal for Redis."""
+        return json.dumps(asdict(self), default=str)
+
+    @property
+    def is_admin(self) -> bool:
+        """Check if user has admin role."""
+        return self.role == UserRole.ADMIN.value or self.is_superuser
+
+    @property
+    def is_premium(self) -> bool:
+        """Check if user has premium or higher role."""
+        return self.role in [UserRole.PREMIUM.value, UserRole.ADMIN.value] or self.is_superuser
+
+    @property
+    def user_role(self) -> UserRole:
+        """Get user role as enum."""
+        try:
+            return UserRole(self.role)
+        except ValueError:
+            return UserRole.FREE
+
+
+def _local_get(key: str) -> AuthPrincipal | None:
+    with _local_lock:
+        entry = _local_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _local_cache[key]
+            return None
+        return entry[1]
+
+
+def _local_set(key: str, principal: AuthPrincipal) -> None:
+    with _local_lock:
+        _local_cache[key] = (time.monotonic() + AUTH_PRINCIPAL_LOCAL_TTL_SECONDS, principal)
+        _local_cache.move_to_end(key)
+        while len(_local_cache) > AUTH_PRINCIPAL_LOCAL_MAX_ENTRIES:
+            _local_cache.popitem(last=False)
+
+
+async def get_cached_principal(user_id: UUID | str) -> AuthPrincipal | None:
+    """
+    Get a cached principal.
+
+    Args:
+        user_id: User ID (the token subject)
+
+    Returns:
+        Cached principal, or None on a miss
+    """
+    key = str(user_id)
+    principal = _local_get(key)
+    if principal is not None:
+        return principal
+
+    pool = get_async_redis_pool()
+    if not pool:
+        return None
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        value = await client.get(f"{AUTH_PRINCIPAL_CACHE_KEY_PREFIX}{key}")
+        if value is None:
+            return None
+        principal = AuthPrincipal.from_json(value)
+    except Exception as e:
+        logger.debug(f"Auth principal cache read failed: {e}")
+        return None
+
+    _local_set(key, principal)
+    return principal
+
+
+async def cache_principal(principal: AuthPrincipal) -> None:
+    """
+    Store a principal in both tiers.
+
+    Args:
+        principal: Principal loaded from the database
+    """
+    key = str(principal.id)
+    _local_set(key, principal)
+
+    pool = get_async_redis_pool()
+    if not pool:
+        return
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        await client.setex(
+            f"{AUTH_PRINCIPAL_CACHE_KEY_PREFIX}{key}",
+            AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+            principal.to_json(),
+        )
+    except Exception as e:
+        logger.debug(f"Auth principal cache write failed: {e}")
+
+
+async def invalidate_principal(*user_ids: UUID | str) -> None:
+    """
+    Drop cached principals (call after committing a change to what they hold).
+
+    Args:
+        *user_ids: IDs of the changed users
+    """
+    if not user_ids:
+        return
+    keys = [str(user_id) for user_id in user_ids]
+    with _local_lock:
+        for key in keys:
+            _local_cache.pop(key, None)
+
+    pool = get_async_redis_pool()
+    if not pool:
+        return
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        await client.delete(*(f"{AUTH_PRINCIPAL_CACHE_KEY_PREFIX}{key}" for key in keys))
+    except Exception as e:
+        logger.warning(f"Auth principal cache invalidation failed: {e}")
+
+
+def clear_local_cache() -> None:
+    """Drop the in-process tier (Redis entries are kept)."""
+    with _local_lock:
+        _local_cache.clear()
@@ -23,6 +23,7 @@ from app.models.user_consent import UserConsent
 from app.repositories.user_repository import OAuthAccountRepository, UserRepository
 from app.schemas.auth import Token
 from app.schemas.user import UserCreate
+from app.services.auth_principal_cache import invalidate_principal
 
 # Domain for admin auto-assignment
 ADMIN_EMAIL_DOMAIN = "@realastrology.ai"
@@ -338,6 +339,7 @@ async def create_or_update_oauth_user(
         existing_user.email_verified = True  # Verified by OAuth provider
         existing_user.avatar_url = avatar_url or existing_user.avatar_url
         await user_repo.update(existing_user)
+        await invalidate_principal(existing_user.id)
         return existing_user, False
 
     # Determine user role based on email
@@ -449,6 +451,7 @@ async def verify_email(db: AsyncSession, token: str) -> User:
     # Verify email
     user.email_verified = True
     await user_repo.update(user)
+    await invalidate_principal(user.id)
 
     # Send welcome email after successful verification
     from app.services.email import EmailService
@@ -0,0 +1,247 @@
+"""
+Content-addressed cache for calculated birth charts.
+
+Chart output depends only on the UTC moment, the location and the chart
+options, so identical birth data (the same celebrity seeded twice, a user
+re-creating a chart, /recalculate, secondary-language tasks) can reuse a
+previous result instead of running the ephemeris again.
+
+Entries are keyed by a SHA-256 of (UTC Julian Day, latitude, longitude, house
+system, CHART_ENGINE_VERSION, language) and stored in two tiers:
+
+1. An in-process LRU (bounded number of entries)
+2. Redis (shared by API workers, Celery workers and scripts), with a TTL
+
+Bumping CHART_ENGINE_VERSION in astro_service changes every key, so stale
+results are never served after a calculation change; old Redis entries simply
+expire. Redis is reached through redis.asyncio and its errors fail open (the
+chart is calculated as usual). Misses are calculated on an executor, so the
+event loop is never blocked by the ephemeris.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor
+from datetime import UTC, datetime
+from functools import partial
+from typing import Any
+
+import redis.asyncio as aioredis
+from loguru import logger
+
+from app.core.redis_pool import get_async_redis_pool
+from app.services.astro_service import (
+    CHART_ENGINE_VERSION,
+    calculate_chart_core,
+    convert_to_julian_day,
+    localize_chart,
+)
+from app.translations import SUPPORTED_LANGUAGES
+
+# Redis key prefix and TTL for cached chart results (30 days)
+CHART_CACHE_KEY_PREFIX = "chart_result:"
+CHART_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Maximum number of chart results kept in process memory (~50 KB each)
+CHART_CACHE_MAX_ENTRIES = 512
+
+# In-process LRU tier: key -> serialized chart JSON
+_local_cache: OrderedDict[str, str] = OrderedDict()
+_local_lock = threading.Lock()
+_stats = {"local_hits": 0, "redis_hits": 0, "misses": 0}
+
+
+def generate_chart_cache_key(
+    jd: float,
+    latitude: float,
+    longitude: float,
+    house_system: str,
+    language: str,
+) -> str:
+    """
+    Generate the content-addressed key of one localized chart result.
+
+    Args:
+        jd: Birth moment as UTC Julian Day
+        latitude: Geographic latitude
+        longitude: Geographic longitude
+        house_system: House system
+        language: Language of the localized chart
+
+    Returns:
+        SHA-256 hex digest
+    """
+    key_data = {
+        "jd": round(jd, 8),  # ~1 ms
+        "lat": round(float(latitude), 6),
+        "lon": round(float(longitude), 6),
+        "house_system": house_system,
+        "engine": CHART_ENGINE_VERSION,
+        "language": language,
+    }
+    key_string = json.dumps(key_data, sort_keys=True)
+    return hashlib.sha256(key_string.encode()).hexdigest()
+
+
+def _local_get(key: str) -> str | None:
+    with _local_lock:
+        value = _local_cache.get(key)
+        if value is not None:
+            _local_cache.move_to_end(key)
+        return value
+
+
+def _local_set(key: str, value: str) -> None:
+    with _local_lock:
+        _local_cache[key] = value
+        _local_cache.move_to_end(key)
+        while len(_local_cache) > CHART_CACHE_MAX_ENTRIES:
+            _local_cache.popitem(last=False)
+
+
+async def _redis_get_many(keys: list[str]) -> list[str | None]:
+    """Fetch several entries from Redis (all None if Redis is unavailable)."""
+    pool = get_async_redis_pool()
+    if not pool or not keys:
+        return [None] * len(keys)
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        values: list[str | None] = await client.mget(
+            [f"{CHART_CACHE_KEY_PREFIX}{key}" for key in keys]
+        )
+        return values
+    except Exception as e:
+        logger.debug(f"Chart cache Redis read failed: {e}")
+        return [None] * len(keys)
+
+
+async def _redis_set_many(entries: dict[str, str]) -> None:
+    """Store several entries in Redis (ignored if Redis is unavailable)."""
+    pool = get_async_redis_pool()
+    if not pool or not entries:
+        return
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        pipe = client.pipeline(transaction=False)
+        for key, value in entries.items():
+            pipe.setex(f"{CHART_CACHE_KEY_PREFIX}{key}", CHART_CACHE_TTL_SECONDS, value)
+        await pipe.execute()
+    except Exception as e:
+        logger.debug(f"Chart cache Redis write failed: {e}")
+
+
+def _calculate_localized(
+    birth_datetime: datetime,
+    timezone: str,
+    latitude: float,
+    longitude: float,
+    house_system: str,
+    languages: list[str],
+) -> dict[str, str]:
+    """Executor entry point: calculate a chart once and serialize it per language."""
+    core = calculate_chart_core(birth_datetime, timezone, latitude, longitude, house_system)
+    return {language: json.dumps(localize_chart(core, language)) for language in languages}
+
+
+async def get_or_calculate_birth_chart(
+    birth_datetime: datetime,
+    timezone: str,
+    latitude: float,
+    longitude: float,
+    house_system: str = "placidus",
+    languages: list[str] | None = None,
+    executor: Executor | None = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Get localized chart data from the cache, calculating only what is missing.
+
+    Async counterpart of calculate_birth_chart_all_languages. Each call
+    returns fresh dictionaries (with this call's calculation_timestamp), so
+    callers may mutate the result.
+
+    Args:
+        birth_datetime: Birth date and time
+        timezone: Timezone string
+        latitude: Geographic latitude
+        longitude: Geographic longitude
+        house_system: House system to use
+        languages: Languages to return (default: all SUPPORTED_LANGUAGES)
+        executor: Executor for cache misses (default: the event loop's thread pool)
+
+    Returns:
+        Language-keyed chart data ({"en-US": {...}, "pt-BR": {...}})
+    """
+    if languages is None:
+        languages = SUPPORTED_LANGUAGES
+
+    jd = convert_to_julian_day(birth_datetime, timezone, latitude, longitude)
+    keys = {
+        language: generate_chart_cache_key(jd, latitude, longitude, house_system, language)
+        for language in languages
+    }
+
+    # Tier 1: in-process LRU
+    serialized: dict[str, str] = {}
+    for language, key in keys.items():
+        value = _local_get(key)
+        if value is not None:
+            serialized[language] = value
+            _stats["local_hits"] += 1
+
+    # Tier 2: Redis
+    remote_languages = [language for language in languages if language not in serialized]
+    remote_values = await _redis_get_many([keys[language] for language in remote_languages])
+    for language, value in zip(remote_languages, remote_values, strict=True):
+        if value is not None:
+            serialized[language] = value
+            _local_set(keys[language], value)
+            _stats["redis_hits"] += 1
+
+    # Miss: run the ephemeris once and localize the missing languages
+    missing = [language for language in languages if language not in serialized]
+    if missing:
+        _stats["misses"] += len(missing)
+        calculated = await asyncio.get_running_loop().run_in_executor(
+            executor,
+            partial(
+                _calculate_localized,
+                birth_datetime,
+                timezone,
+                latitude,
+                longitude,
+                house_system,
+                missing,
+            ),
+        )
+        new_entries = {}
+        for language, value in calculated.items():
+            serialized[language] = value
+            new_entries[keys[language]] = value
+            _local_set(keys[language], value)
+        await _redis_set_many(new_entries)
+
+    # Cached results keep the time of their first calculation; report this one's
+    calculation_timestamp = datetime.now(UTC).isoformat()
+    return {
+        language: json.loads(serialized[language])
+        | {"calculation_timestamp": calculation_timestamp}
+        for language in languages
+    }
+
+
+def cache_info() -> dict[str, int]:
+    """Return hit/miss statistics of the chart result cache (this process)."""
+    with _local_lock:
+        size = len(_local_cache)
+    return {**_stats, "size": size, "max_size": CHART_CACHE_MAX_ENTRIES}
+
+
+def clear_local_cache() -> None:
+    """Drop the in-process tier and reset statistics (Redis entries are kept)."""
+    with _local_lock:
+        _local_cache.clear()
+    for stat in _stats:
+        _stats[stat] = 0
@@ -0,0 +1,214 @@
+"""
+Chart processing progress over Redis.
+
+Celery tasks and the chart endpoints publish every change of a chart's
+processing status (and of its PDF generation) here, so clients can follow
+progress without polling Postgres:
+
+- The latest state of each chart is kept in Redis (one key per kind, "chart"
+  and "pdf") and answers GET /charts/{id}/status and /pdf-status
+- Every change is also published on a per-chart pub/sub channel, streamed to
+  clients by GET /charts/{id}/events (server-sent events)
+
+States carry the owner's user_id, so endpoints can authorize a request
+without loading the chart. When no state is stored (Redis was unavailable, or
+the chart finished before its TTL), endpoints read the chart from the
+database and seed the state. Redis errors fail open.
+"""
+
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import redis.asyncio as aioredis
+from loguru import logger
+
+from app.core.config import settings
+from app.core.redis_pool import get_async_redis_pool
+from app.models.chart import BirthChart
+
+# Redis keys of the latest states and of the per-chart event channels
+CHART_PROGRESS_STATE_PREFIX = "chart_progress:state:"
+CHART_PROGRESS_CHANNEL_PREFIX = "chart_progress:events:"
+
+# How long a state outlives its last update (1 day)
+CHART_PROGRESS_STATE_TTL_SECONDS = 24 * 60 * 60
+
+# Kinds of progress tracked per chart
+PROGRESS_KINDS = ("chart", "pdf")
+
+# State fields that are not sent to clients
+_PRIVATE_FIELDS = ("user_id", "pdf_url")
+
+
+async def _publish(chart_id: UUID | str, state: dict[str, Any]) -> None:
+    """Store a state as the latest of its kind and publish it to subscribers."""
+    pool = get_async_redis_pool()
+    if not pool:
+        return
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        value = json.dumps(state, ensure_ascii=False, default=str)
+        pipe = client.pipeline(transaction=False)
+        pipe.setex(
+            f"{CHART_PROGRESS_STATE_PREFIX}{chart_id}:{state['kind']}",
+            CHART_PROGRESS_STATE_TTL_SECONDS,
+            value,
+        )
+        pipe.publish(f"{CHART_PROGRESS_CHANNEL_PREFIX}{chart_id}", value)
+        await pipe.execute()
+    except Exception as e:
+        logger.debug(f"Chart progress publish failed for {chart_id}: {e}")
+
+
+async def publish_chart_progress(chart: BirthChart) -> None:
+    """
+    Publish a chart's processing status (call after committing it).
+
+    Args:
+        chart: Chart with its current status, progress and error_message
+    """
+    await _publish(
+        chart.id,
+        {
+            "kind": "chart",
+            "chart_id": str(chart.id),
+            "user_id": str(chart.user_id),
+            "status": chart.status,
+            "progress": chart.progress,
+            "error_message": chart.error_message,
+            "task_id": chart.task_id,
+        },
+    )
+
+
+async def publish_pdf_progress(
+    chart_id: UUID | str,
+    user_id: UUID | str,
+    status: str,
+    error_message: str | None = None,
+    pdf_url: str | None = None,
+    generated_at: datetime | None = None,
+) -> None:
+    """
+    Publish a chart's PDF generation status.
+
+    Args:
+        chart_id: Chart ID
+        user_id: Chart owner ID
+        status: 'generating', 'ready' or 'failed'
+        error_message: Failure reason
+        pdf_url: Stored PDF location (kept server-side)
+        generated_at: When the PDF was generated
+    """
+    await _publish(
+        chart_id,
+        {
+            "kind": "pdf",
+            "chart_id": str(chart_id),
+            "user_id": str(user_id),
+            "status": status,
+            "error_message": error_message,
+            "pdf_url": pdf_url,
+            "generated_at": generated_at,
+        },
+    )
+
+
+async def get_progress_states(chart_id: UUID | str) -> dict[str, dict[str, Any]]:
+    """
+    Get the latest stored states of a chart.
+
+    Args:
+        chart_id: Chart ID
+
+    Returns:
+        States by kind ("chart", "pdf"); kinds without a state are omitted
+    """
+    pool = get_async_redis_pool()
+    if not pool:
+        return {}
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        values = await client.mget(
+            [f"{CHART_PROGRESS_STATE_PREFIX}{chart_id}:{kind}" for kind in PROGRESS_KINDS]
+        )
+    except Exception as e:
+        logger.debug(f"Chart progress read failed for {chart_id}: {e}")
+        return {}
+    return {
+        kind: json.loads(value) for kind, value in zip(PROGRESS_KINDS, values, strict=True) if value
+    }
+
+
+async def clear_progress_states(
+    chart_id: UUID | str,
+    kinds: tuple[str, ...] = PROGRESS_KINDS,
+) -> None:
+    """
+    Drop a chart's stored states (readers then fall back to the database).
+
+    Args:
+        chart_id: Chart ID
+        kinds: Kinds to drop (default: all, e.g. when the chart is deleted)
+    """
+    pool = get_async_redis_pool()
+    if not pool:
+        return
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        await client.delete(*(f"{CHART_PROGRESS_STATE_PREFIX}{chart_id}:{kind}" for kind in kinds))
+    except Exception as e:
+        logger.debug(f"Chart progress clear failed for {chart_id}: {e}")
+
+
+def to_event(state: dict[str, Any]) -> dict[str, Any]:
+    """Strip the server-side fields of a state before sending it to a client."""
+    return {key: value for key, value in state.items() if key not in _PRIVATE_FIELDS}
+
+
+async def stream_progress(
+    chart_id: UUID | str,
+    keepalive_seconds: float,
+) -> AsyncIterator[dict[str, Any] | None]:
+    """
+    Follow a chart's progress.
+
+    Subscribes to the chart's channel first and then yields the stored
+    states, so no change between the two is missed (a state may be yielded
+    twice). Afterwards yields every published state as it arrives, and None
+    whenever keepalive_seconds pass without one. Ends if Redis is unavailable.
+
+    Args:
+        chart_id: Chart ID
+        keepalive_seconds: Maximum seconds between two yields
+
+    Yields:
+        States (as stored), or None for a keepalive
+    """
+    try:
+        client = aioredis.from_url(str(settings.REDIS_URL), decode_responses=True)
+        pubsub = client.pubsub()
+        await pubsub.subscribe(f"{CHART_PROGRESS_CHANNEL_PREFIX}{chart_id}")
+    except Exception as e:
+        logger.warning(f"Chart progress subscription failed for {chart_id}: {e}")
+        return
+
+    try:
+        for state in (await get_progress_states(chart_id)).values():
+            yield state
+        while True:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=keepalive_seconds
+            )
+            yield json.loads(message["data"]) if message else None
+    except Exception as e:
+        logger.debug(f"Chart progress stream for {chart_id} ended: {e}")
+    finally:
+        try:
+            await pubsub.reset()
+            await client.close()
+        except Exception:
+            pass
@@ -15,13 +15,15 @@ from fastapi import Depends
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.calculation_executor import get_calculation_executor
 from app.core.database import get_db
 from app.models.chart import BirthChart
 from app.repositories.audit_repository import AuditRepository
 from app.repositories.chart_repository import ChartRepository
 from app.repositories.interpretation_repository import InterpretationRepository
 from app.schemas.chart import BirthChartCreate, BirthChartUpdate
-from app.services.astro_service import calculate_birth_chart
+from app.services.chart_cache_service import get_or_calculate_birth_chart
+from app.services.chart_progress_service import clear_progress_states, publish_chart_progress
 from app.services.interpretation_service_rag import InterpretationServiceRAG
 from app.tasks.astro_tasks import generate_birth_chart_task
 
@@ -90,23 +92,19 @@ class ChartService:
         Returns:
             Created birth chart
         """
-        # Calculate astrological data in BOTH languages
+        # Calculate astrological data once and localize it for ALL languages
         # This ensures users can switch languages without recalculation
-        from app.translations import SUPPORTED_LANGUAGES
-
-        chart_data_by_lang: dict[str, Any] = {}
-        for language in SUPPORTED_LANGUAGES:
-            logger.info(f"Calculating {language} chart data")
-            chart_data_by_lang[language] = calculate_birth_chart(
-                birth_datetime=chart_data.birth_datetime,
-                timezone=chart_data.birth_timezone,
-                latitude=chart_data.latitude,
-                longitude=chart_data.longitude,
-                house_system=chart_data.house_system,
-                language=language,
-            )
+        # (identical birth data is served from the chart result cache)
+        chart_data_by_lang: dict[str, Any] = await get_or_calculate_birth_chart(
+            birth_datetime=chart_data.birth_datetime,
+            timezone=chart_data.birth_timezone,
+            latitude=chart_data.latitude,
+            longitude=chart_data.longitude,
+            house_system=chart_data.house_system,
+            executor=get_calculation_executor(),
+        )
 
-        # Create chart record with language-keyed chart_data
+        # Create chart record (chart data is stored once the row exists)
         chart = BirthChart(
             id=uuid4(),
             user_id=user_id,
@@ -123,13 +121,14 @@ class ChartService:
             house_system=chart_data.house_system,
             zodiac_type=chart_data.zodiac_type,
             node_type=chart_data.node_type,
-            chart_data=chart_data_by_lang,
             status="completed",  # Immediately completed since sync
             progress=100,
             visibility="private",
         )
 
         created_chart = await self.chart_repo.create(chart)
+        await self.chart_repo.save_chart_data(created_chart, chart_data_by_lang)
+        await self.db.commit()
 
         # Generate AI interpretations automatically using RAG
         if generate_interpretations:
@@ -195,6 +194,7 @@ class ChartService:
         )
 
         created_chart = await self.chart_repo.create(chart)
+        await publish_chart_progress(created_chart)
         logger.info(f"Created chart {created_chart.id} for async processing")
 
         return created_chart
@@ -225,6 +225,35 @@ class ChartService:
             include_deleted=include_deleted,
         )
 
+    async def get_user_chart_summaries(
+        self,
+        user_id: UUID,
+        language: str,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[BirthChart]:
+        """
+        Get a user's birth charts for list views.
+
+        The full chart_data is not loaded; each chart's chart_summary holds
+        the Sun and Moon signs and the Ascendant instead.
+
+        Args:
+            user_id: User ID
+            language: Language of the summaries
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of birth charts with chart_summary populated
+        """
+        return await self.chart_repo.get_summaries_by_user(
+            user_id=user_id,
+            language=language,
+            skip=skip,
+            limit=limit,
+        )
+
     async def get_chart_by_id(
         self,
         chart_id: UUID,
@@ -259,6 +288,45 @@ class ChartService:
 
         return chart
 
+    async def get_chart_version(
+        self,
+        chart_id: UUID,
+        user_id: UUID | None = None,
+        is_admin: bool = False,
+    ) -> datetime | None:
+        """
+        Get a chart's updated_at with the same access rules as get_chart_by_id.
+
+        Reads only the id, owner and timestamp, so conditional requests can be
+        answered without loading chart_data.
+
+        Args:
+            chart_id: Chart ID
+            user_id: User ID (for authorization). Required if not admin.
+            is_admin: If True, bypasses ownership check (admin access)
+
+        Returns:
+            The chart's updated_at, or None if the chart is not accessible
+        """
+        if is_admin:
+            return await self.chart_repo.get_version(chart_id)
+        if user_id is None:
+            return None
+        return await self.chart_repo.get_version(chart_id, user_id)
+
+    async def get_chart_data(self, chart: BirthChart, language: str) -> dict[str, Any]:
+        """
+        Get a chart's data in one language.
+
+        Args:
+            chart: Birth chart
+            language: Language code ('pt-BR', 'en-US')
+
+        Returns:
+            Flat chart data for the language ({} while the chart has no data)
+        """
+        return await self.chart_repo.get_chart_data(chart, language)
+
     @staticmethod
     def _needs_recalculation(update_data: BirthChartUpdate, chart: BirthChart) -> bool:
         """
@@ -373,6 +441,7 @@ class ChartService:
         # Dispatch Celery task to recalculate chart and generate interpretations
         # This runs asynchronously and updates progress incrementally
         if needs_recalc:
+            await publish_chart_progress(updated_chart)
             generate_birth_chart_task.delay(str(chart_id))
             logger.info(f"Dispatched chart regeneration task for {chart_id}")
 
@@ -402,6 +471,7 @@ class ChartService:
             await self.chart_repo.soft_delete(chart)
         else:
             await self.chart_repo.delete(chart)
+        await clear_progress_states(chart_id)
 
     async def count_user_charts(
         self,
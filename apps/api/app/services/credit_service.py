@@ -16,11 +16,11 @@ from app.core.credit_config import (
 )
 from app.models.credit_transaction import CreditTransaction
 from app.models.enums import PlanType, TransactionType
-from app.models.user import User
 from app.models.user_credit import UserCredit
 from app.repositories.credit_repository import CreditRepository
 from app.repositories.credit_transaction_repository import CreditTransactionRepository
 from app.services.amplitude_service import amplitude_service
+from app.services.auth_principal_cache import AuthPrincipal
 
 
 class InsufficientCreditsError(Exception):
@@ -394,7 +394,7 @@ async def add_bonus_credits(
     db: AsyncSession,
     user_id: UUID,
     amount: int,
-    admin_user: User,
+    admin_user: AuthPrincipal,
     reason: str | None = None,
 ) -> CreditTransaction:
     """
@@ -456,7 +456,7 @@ async def refund_credits(
     db: AsyncSession,
     user_id: UUID,
     amount: int,
-    admin_user: User,
+    admin_user: AuthPrincipal,
     reason: str | None = None,
     original_transaction_id: UUID | None = None,
 ) -> CreditTransaction:
@@ -3,22 +3,283 @@ Service for managing AI interpretation cache.
 
 This service provides caching functionality to reduce OpenAI API costs
 by storing and reusing interpretations for identical inputs.
+
+Lookups are read-through over three tiers, all keyed by generate_cache_key:
+
+1. An in-process LRU (short TTL, bounds staleness across workers)
+2. Redis (shared by API and Celery workers)
+3. Postgres (``interpretation_cache`` table, the durable store)
+
+Hits never write to Postgres. Hit counts and last-access times are buffered
+in process, pushed to Redis hashes in batches, and applied to the table in
+bulk by the ``cache.flush_interpretation_hit_counts`` periodic task.
+Redis errors fail open (lookups fall through to Postgres).
 """
 
 import hashlib
 import json
+import threading
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
+import redis.asyncio as aioredis
 from loguru import logger
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import bindparam, delete, func, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.database import get_session_lock
+from app.core.redis_pool import get_async_redis_pool
 from app.models.interpretation_cache import InterpretationCache
 
+# Redis keys: cached content and buffered hit statistics
+INTERPRETATION_CACHE_KEY_PREFIX = "interpretation_cache:"
+INTERPRETATION_HITS_KEY = "interpretation_cache_stats:hits"
+INTERPRETATION_ACCESS_KEY = "interpretation_cache_stats:last_accessed"
+
+# Redis TTL for cached content (7 days; Postgres keeps the durable copy)
+INTERPRETATION_REDIS_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# In-process tier: entry count and TTL (entries removed elsewhere expire quickly)
+INTERPRETATION_LOCAL_MAX_ENTRIES = 2048
+INTERPRETATION_LOCAL_TTL_SECONDS = 300
+
+# Push buffered hits to Redis at most this often, or once this many keys are pending
+HIT_BUFFER_PUSH_INTERVAL_SECONDS = 10
+HIT_BUFFER_MAX_KEYS = 500
+
+# In-process LRU tier: cache_key -> (expires_at, content)
+_local_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+_local_lock = threading.Lock()
+
+# Buffered hits not yet pushed to Redis: cache_key -> (hits, last access epoch)
+_pending_hits: dict[str, tuple[int, float]] = {}
+_last_push = time.monotonic()
+
+
+def _local_get(cache_key: str) -> str | None:
+    with _local_lock:
+        entry = _local_cache.get(cache_key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del _local_cache[cache_key]
+            return None
+        _local_cache.move_to_end(cache_key)
+        return entry[1]
+
+
+def _local_set(cache_key: str, content: str) -> None:
+    with _local_lock:
+        _local_cache[cache_key] = (time.monotonic() + INTERPRETATION_LOCAL_TTL_SECONDS, content)
+        _local_cache.move_to_end(cache_key)
+        while len(_local_cache) > INTERPRETATION_LOCAL_MAX_ENTRIES:
+            _local_cache.popitem(last=False)
+
+
+async def _redis_get(cache_key: str) -> str | None:
+    """Read one entry from Redis (None if missing or Redis is unavailable)."""
+    pool = get_async_redis_pool()
+    if not pool:
+        return None
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        value: str | None = await client.get(f"{INTERPRETATION_CACHE_KEY_PREFIX}{cache_key}")
+        return value
+    except Exception as e:
+        logger.debug(f"Interpretation cache Redis read failed: {e}")
+        return None
+
+
+async def _redis_get_many(cache_keys: list[str]) -> list[str | None]:
+    """Read several entries from Redis (all None if Redis is unavailable)."""
+    pool = get_async_redis_pool()
+    if not pool or not cache_keys:
+        return [None] * len(cache_keys)
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        values: list[str | None] = await client.mget(
+            [f"{INTERPRETATION_CACHE_KEY_PREFIX}{key}" for key in cache_keys]
+        )
+        return values
+    except Exception as e:
+        logger.debug(f"Interpretation cache Redis read failed: {e}")
+        return [None] * len(cache_keys)
+
+
+async def _redis_set_many(entries: dict[str, str]) -> None:
+    """Write several entries to Redis in one pipeline (ignored if unavailable)."""
+    pool = get_async_redis_pool()
+    if not pool or not entries:
+        return
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        pipe = client.pipeline(transaction=False)
+        for cache_key, content in entries.items():
+            pipe.setex(
+                f"{INTERPRETATION_CACHE_KEY_PREFIX}{cache_key}",
+                INTERPRETATION_REDIS_TTL_SECONDS,
+                content,
+            )
+        await pipe.execute()
+    except Exception as e:
+        logger.debug(f"Interpretation cache Redis write failed: {e}")
+
+
+async def _redis_set(cache_key: str, content: str) -> None:
+    """Write one entry to Redis (ignored if Redis is unavailable)."""
+    pool = get_async_redis_pool()
+    if not pool:
+        return
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        await client.setex(
+            f"{INTERPRETATION_CACHE_KEY_PREFIX}{cache_key}",
+            INTERPRETATION_REDIS_TTL_SECONDS,
+            content,
+        )
+    except Exception as e:
+        logger.debug(f"Interpretation cache Redis write failed: {e}")
+
+
+async def _store_in_tiers(cache_key: str, content: str) -> None:
+    """Populate the local and Redis tiers with an entry."""
+    _local_set(cache_key, content)
+    await _redis_set(cache_key, content)
+
+
+async def evict_from_tiers(cache_keys: list[str]) -> None:
+    """Remove entries from the local and Redis tiers (e.g. after deleting rows)."""
+    if not cache_keys:
+        return
+    with _local_lock:
+        for cache_key in cache_keys:
+            _local_cache.pop(cache_key, None)
+
+    pool = get_async_redis_pool()
+    if not pool:
+        return
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        await client.delete(*[f"{INTERPRETATION_CACHE_KEY_PREFIX}{key}" for key in cache_keys])
+    except Exception as e:
+        logger.warning(f"Interpretation cache Redis eviction failed: {e}")
+
+
+async def clear_tiers() -> None:
+    """Drop every entry from the local and Redis tiers."""
+    with _local_lock:
+        _local_cache.clear()
+
+    pool = get_async_redis_pool()
+    if not pool:
+        return
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        batch: list[str] = []
+        async for key in client.scan_iter(match=f"{INTERPRETATION_CACHE_KEY_PREFIX}*", count=1000):
+            batch.append(key)
+            if len(batch) >= 1000:
+                await client.delete(*batch)
+                batch = []
+        if batch:
+            await client.delete(*batch)
+    except Exception as e:
+        logger.warning(f"Interpretation cache Redis clear failed: {e}")
+
+
+async def record_hit(cache_key: str) -> None:
+    """Buffer a cache hit; pushes the buffer to Redis when it is due."""
+    with _local_lock:
+        hits, _ = _pending_hits.get(cache_key, (0, 0.0))
+        _pending_hits[cache_key] = (hits + 1, time.time())
+        due = (
+            len(_pending_hits) >= HIT_BUFFER_MAX_KEYS
+            or time.monotonic() - _last_push >= HIT_BUFFER_PUSH_INTERVAL_SECONDS
+        )
+    if due:
+        await push_pending_hits()
+
+
+async def push_pending_hits() -> None:
+    """
+    Move buffered hits from this process into the shared Redis hashes.
+
+    If Redis is unavailable the buffer is kept (bounded by the number of
+    distinct keys) and retried on the next push.
+    """
+    global _last_push
+    with _local_lock:
+        _last_push = time.monotonic()
+        if not _pending_hits:
+            return
+        pending = dict(_pending_hits)
+        _pending_hits.clear()
+
+    pool = get_async_redis_pool()
+    try:
+        if not pool:
+            raise ConnectionError("Redis pool unavailable")
+        client = aioredis.Redis(connection_pool=pool)
+        pipe = client.pipeline(transaction=False)
+        for cache_key, (hits, accessed_at) in pending.items():
+            pipe.hincrby(INTERPRETATION_HITS_KEY, cache_key, hits)
+            pipe.hset(INTERPRETATION_ACCESS_KEY, cache_key, accessed_at)
+        await pipe.execute()
+    except Exception as e:
+        logger.debug(f"Could not push interpretation cache hits to Redis: {e}")
+        with _local_lock:
+            for cache_key, (hits, accessed_at) in pending.items():
+                if cache_key in _pending_hits or len(_pending_hits) < 10 * HIT_BUFFER_MAX_KEYS:
+                    current_hits, current_at = _pending_hits.get(cache_key, (0, 0.0))
+                    _pending_hits[cache_key] = (current_hits + hits, max(current_at, accessed_at))
+
+
+async def _drain_redis_hits() -> dict[str, tuple[int, float]]:
+    """Atomically read and reset the shared hit hashes."""
+    pool = get_async_redis_pool()
+    if not pool:
+        return {}
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        pipe = client.pipeline(transaction=True)
+        pipe.hgetall(INTERPRETATION_HITS_KEY)
+        pipe.hgetall(INTERPRETATION_ACCESS_KEY)
+        pipe.delete(INTERPRETATION_HITS_KEY, INTERPRETATION_ACCESS_KEY)
+        hits, accessed, _ = await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Could not read interpretation cache hits from Redis: {e}")
+        return {}
+    return {
+        cache_key: (int(count), float(accessed.get(cache_key, time.time())))
+        for cache_key, count in hits.items()
+    }
+
+
+async def _buffered_hit_total() -> int:
+    """Hits recorded but not yet written to Postgres (this process + Redis)."""
+    with _local_lock:
+        total = sum(hits for hits, _ in _pending_hits.values())
+    pool = get_async_redis_pool()
+    if pool:
+        try:
+            client = aioredis.Redis(connection_pool=pool)
+            total += sum(int(count) for count in await client.hvals(INTERPRETATION_HITS_KEY))
+        except Exception as e:
+            logger.debug(f"Could not read buffered hits from Redis: {e}")
+    return total
+
+
+def clear_local_state() -> None:
+    """Drop the in-process tier and hit buffer (Redis and Postgres are kept)."""
+    with _local_lock:
+        _local_cache.clear()
+        _pending_hits.clear()
+
 
 class InterpretationCacheService:
     """Service for managing interpretation cache operations."""
@@ -34,6 +295,8 @@ class InterpretationCacheService:
             db: Database session
         """
         self.db = db
+        # Generations of one chart run concurrently on this session; serialize its use
+        self._db_lock = get_session_lock(db)
 
     @staticmethod
     def generate_cache_key(
@@ -93,33 +356,77 @@ class InterpretationCacheService:
             interpretation_type, parameters, model, prompt_version, language
         )
 
-        stmt = select(InterpretationCache).where(InterpretationCache.cache_key == cache_key)
-        result = await self.db.execute(stmt)
-        cache_entry = result.scalar_one_or_none()
-
-        if cache_entry:
-            # Update hit count and last accessed time
-            # Use flush() instead of commit() to avoid conflicts with parent transaction
-            update_stmt = (
-                update(InterpretationCache)
-                .where(InterpretationCache.id == cache_entry.id)
-                .values(
-                    hit_count=InterpretationCache.hit_count + 1,
-                    last_accessed_at=func.now(),
-                )
+        # Tier 1 and 2: in-process LRU, then Redis
+        content = _local_get(cache_key)
+        if content is None:
+            content = await _redis_get(cache_key)
+            if content is not None:
+                _local_set(cache_key, content)
+
+        # Tier 3: Postgres
+        if content is None:
+            stmt = select(InterpretationCache.content).where(
+                InterpretationCache.cache_key == cache_key
             )
-            await self.db.execute(update_stmt)
-            await self.db.flush()
+            async with self._db_lock:
+                content = (await self.db.execute(stmt)).scalar_one_or_none()
+            if content is not None:
+                await _store_in_tiers(cache_key, content)
 
-            logger.debug(
-                f"Cache HIT for {interpretation_type}: {cache_entry.subject} "
-                f"(hits: {cache_entry.hit_count + 1})"
-            )
-            return cache_entry.content
+        if content is not None:
+            # Hit statistics are buffered and flushed by a periodic task
+            await record_hit(cache_key)
+            logger.debug(f"Cache HIT for {interpretation_type} with key {cache_key[:8]}...")
+            return content
 
         logger.debug(f"Cache MISS for {interpretation_type} with key {cache_key[:8]}...")
         return None
 
+    async def get_many(self, cache_keys: list[str]) -> dict[str, str]:
+        """
+        Get several cached interpretations by cache key.
+
+        Resolves what it can from the local and Redis tiers, then loads the
+        rest with a single ``WHERE cache_key IN (...)`` query.
+
+        Args:
+            cache_keys: Keys from generate_cache_key
+
+        Returns:
+            Dictionary of cache_key -> content for the keys that were found
+            (missing keys are absent)
+        """
+        found: dict[str, str] = {}
+        for cache_key in cache_keys:
+            content = _local_get(cache_key)
+            if content is not None:
+                found[cache_key] = content
+
+        remote_keys = [key for key in dict.fromkeys(cache_keys) if key not in found]
+        for cache_key, content in zip(remote_keys, await _redis_get_many(remote_keys), strict=True):
+            if content is not None:
+                found[cache_key] = content
+                _local_set(cache_key, content)
+
+        missing = [key for key in remote_keys if key not in found]
+        if missing:
+            stmt = select(InterpretationCache.cache_key, InterpretationCache.content).where(
+                InterpretationCache.cache_key.in_(missing)
+            )
+            async with self._db_lock:
+                rows = (await self.db.execute(stmt)).all()
+            loaded = {row.cache_key: row.content for row in rows}
+            for cache_key, content in loaded.items():
+                _local_set(cache_key, content)
+            await _redis_set_many(loaded)
+            found.update(loaded)
+
+        for cache_key in found:
+            await record_hit(cache_key)
+
+        logger.debug(f"Cache get_many: {len(found)}/{len(set(cache_keys))} hits")
+        return found
+
     async def set(
         self,
         interpretation_type: str,
@@ -159,29 +466,34 @@ class InterpretationCacheService:
             prompt_version=prompt_version,
         )
 
-        try:
-            self.db.add(cache_entry)
-            # Use flush() instead of commit() to avoid conflicts with parent transaction
-            await self.db.flush()
-            await self.db.refresh(cache_entry)
-
-            logger.info(f"Cached new interpretation for {interpretation_type}: {subject}")
-            return cache_entry
-        except IntegrityError:
-            # Race condition: another request already created this entry
-            await self.db.rollback()
-            logger.debug(f"Cache entry already exists for key {cache_key[:8]}... (race condition)")
+        async with self._db_lock:
+            try:
+                # Savepoint: a duplicate key must not roll back the caller's transaction
+                async with self.db.begin_nested():
+                    self.db.add(cache_entry)
+                    await self.db.flush()
+                await self.db.refresh(cache_entry)
+                await _store_in_tiers(cache_key, content)
+
+                logger.info(f"Cached new interpretation for {interpretation_type}: {subject}")
+                return cache_entry
+            except IntegrityError:
+                # Race condition: another request already created this entry
+                logger.debug(
+                    f"Cache entry already exists for key {cache_key[:8]}... (race condition)"
+                )
 
-            # Fetch and return the existing entry
-            existing = await self.db.execute(
-                select(InterpretationCache).where(InterpretationCache.cache_key == cache_key)
-            )
-            existing_entry = existing.scalar_one_or_none()
-            if existing_entry:
-                return existing_entry
+                # Fetch and return the existing entry
+                existing = await self.db.execute(
+                    select(InterpretationCache).where(InterpretationCache.cache_key == cache_key)
+                )
+                existing_entry = existing.scalar_one_or_none()
+                if existing_entry:
+                    await _store_in_tiers(cache_key, existing_entry.content)
+                    return existing_entry
 
-            # If somehow still not found, re-raise (shouldn't happen)
-            raise
+                # If somehow still not found, re-raise (shouldn't happen)
+                raise
 
     async def delete(self, cache_id: UUID) -> bool:
         """
@@ -193,11 +505,16 @@ class InterpretationCacheService:
         Returns:
             True if deleted, False if not found
         """
-        stmt = delete(InterpretationCache).where(InterpretationCache.id == cache_id)
-        result = await self.db.execute(stmt)
+        stmt = (
+            delete(InterpretationCache)
+            .where(InterpretationCache.id == cache_id)
+            .returning(InterpretationCache.cache_key)
+        )
+        deleted_keys = list((await self.db.execute(stmt)).scalars().all())
         await self.db.commit()
+        await evict_from_tiers(deleted_keys)
 
-        deleted: bool = result.rowcount > 0  # type: ignore[attr-defined]
+        deleted = bool(deleted_keys)
         if deleted:
             logger.info(f"Deleted cache entry {cache_id}")
         return deleted
@@ -215,11 +532,16 @@ class InterpretationCacheService:
         ttl = ttl_days or self.DEFAULT_TTL_DAYS
         cutoff_date = datetime.now(UTC) - timedelta(days=ttl)
 
-        stmt = delete(InterpretationCache).where(InterpretationCache.last_accessed_at < cutoff_date)
-        result = await self.db.execute(stmt)
+        stmt = (
+            delete(InterpretationCache)
+            .where(InterpretationCache.last_accessed_at < cutoff_date)
+            .returning(InterpretationCache.cache_key)
+        )
+        deleted_keys = list((await self.db.execute(stmt)).scalars().all())
         await self.db.commit()
+        await evict_from_tiers(deleted_keys)
 
-        count: int = result.rowcount  # type: ignore[attr-defined]
+        count = len(deleted_keys)
         if count > 0:
             logger.info(f"Cleared {count} expired cache entries (TTL: {ttl} days)")
         return count
@@ -236,13 +558,16 @@ class InterpretationCacheService:
         Returns:
             Number of entries deleted
         """
-        stmt = delete(InterpretationCache).where(
-            InterpretationCache.prompt_version == prompt_version
+        stmt = (
+            delete(InterpretationCache)
+            .where(InterpretationCache.prompt_version == prompt_version)
+            .returning(InterpretationCache.cache_key)
         )
-        result = await self.db.execute(stmt)
+        deleted_keys = list((await self.db.execute(stmt)).scalars().all())
         await self.db.commit()
+        await evict_from_tiers(deleted_keys)
 
-        count: int = result.rowcount  # type: ignore[attr-defined]
+        count = len(deleted_keys)
         if count > 0:
             logger.info(f"Cleared {count} cache entries for prompt version {prompt_version}")
         return count
@@ -257,11 +582,59 @@ class InterpretationCacheService:
         stmt = delete(InterpretationCache)
         result = await self.db.execute(stmt)
         await self.db.commit()
+        await clear_tiers()
 
         count: int = result.rowcount  # type: ignore[attr-defined]
         logger.warning(f"Cleared ALL {count} cache entries")
         return count
 
+    async def flush_hit_counts(self) -> int:
+        """
+        Apply buffered hit counts and last-access times to Postgres in bulk.
+
+        Collects this process's buffer and the shared Redis hashes, then runs a
+        single executemany UPDATE. On failure the hits are pushed back to Redis.
+
+        Returns:
+            Number of cache entries updated
+        """
+        await push_pending_hits()
+        pending = await _drain_redis_hits()
+        if not pending:
+            return 0
+
+        table = InterpretationCache.__table__
+        stmt = (
+            update(table)
+            .where(table.c.cache_key == bindparam("b_cache_key"))
+            .values(
+                hit_count=table.c.hit_count + bindparam("b_hits"),
+                last_accessed_at=bindparam("b_last_accessed_at"),
+            )
+        )
+        params = [
+            {
+                "b_cache_key": cache_key,
+                "b_hits": hits,
+                "b_last_accessed_at": datetime.fromtimestamp(accessed_at, UTC),
+            }
+            for cache_key, (hits, accessed_at) in pending.items()
+        ]
+        try:
+            await self.db.execute(stmt, params)
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            with _local_lock:
+                for cache_key, entry in pending.items():
+                    hits, accessed_at = _pending_hits.get(cache_key, (0, 0.0))
+                    _pending_hits[cache_key] = (hits + entry[0], max(accessed_at, entry[1]))
+            await push_pending_hits()
+            raise
+
+        logger.info(f"Flushed buffered hit counts for {len(params)} interpretation cache entries")
+        return len(params)
+
     async def get_stats(self) -> dict[str, Any]:
         """
         Get cache statistics.
@@ -277,7 +650,7 @@ class InterpretationCacheService:
         # Total hits
         hits_stmt = select(func.sum(InterpretationCache.hit_count))
         hits_result = await self.db.execute(hits_stmt)
-        total_hits = hits_result.scalar() or 0
+        total_hits = (hits_result.scalar() or 0) + await _buffered_hit_total()
 
         # Entries by type
         type_stmt = select(
@@ -7,6 +7,8 @@ interpretations, resulting in more accurate and contextually grounded responses.
 """
 
 import asyncio
+import json
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, TypedDict
 
@@ -20,6 +22,7 @@ from app.core.config import settings
 from app.models.chart import BirthChart
 from app.services.interpretation_cache_service import InterpretationCacheService
 from app.services.rag import hybrid_search_service
+from app.services.rag.embedding_cache_service import EmbeddingCacheService
 
 # =============================================================================
 # Constants
@@ -33,6 +36,17 @@ RAG_PROMPT_VERSION = "rag-v1"
 # Using 5 concurrent calls as a safe default for OpenAI's rate limits
 OPENAI_CONCURRENCY_LIMIT = 5
 
+# Upper bound for the output of one batched (multi-subject) request
+BATCH_MAX_TOKENS = 16000
+
+# Appended to the per-subject prompts of a batched request (structured JSON output)
+BATCH_PROMPT_INSTRUCTION = (
+    "Interprete cada item abaixo de forma independente, seguindo as instruções de cada um. "
+    "Responda apenas com um objeto JSON no formato "
+    '{"interpretations": {"<número do item>": "<interpretação>"}}, '
+    "com uma entrada para cada item."
+)
+
 
 # =============================================================================
 # Type Definitions
@@ -80,6 +94,19 @@ class ArabicPartData(TypedDict, total=False):
     house: int
 
 
+@dataclass
+class InterpretationSubject:
+    """One interpretation to resolve for a chart (planet, house, aspect or Arabic Part)."""
+
+    category: str  # Result group: "planets", "houses", "aspects", "arabic_parts"
+    key: str  # Subject key: "Sun", "1", "Sun-Trine-Moon", "fortune"
+    interpretation_type: str  # Stored type: "planet", "house", "aspect", "arabic_part"
+    cache_type: str  # Interpretation cache type: "planet_rag", "house_rag", ...
+    cache_params: dict[str, Any]
+    arguments: dict[str, Any]  # Keyword arguments of the matching generate_* method
+    search_query: str  # RAG retrieval query
+
+
 # Arabic Parts definitions
 ARABIC_PARTS: dict[str, dict[str, str]] = {
     "fortune": {
@@ -172,6 +199,9 @@ class InterpretationServiceRAG:
         # Initialize cache service
         self.cache_service = InterpretationCacheService(db) if use_cache else None
 
+        # Query embeddings are cached in process memory and, with use_cache, in Postgres
+        self.embedding_service = EmbeddingCacheService(self.client, db if use_cache else None)
+
         # Initialize interpretation repository for upsert operations
         from app.repositories.interpretation_repository import InterpretationRepository
 
@@ -307,7 +337,7 @@ class InterpretationServiceRAG:
 
     async def _get_embedding(self, text: str) -> list[float] | None:
         """
-        Generate embedding for text using OpenAI.
+        Get the embedding of a text (cached, see EmbeddingCacheService).
 
         Args:
             text: Text to embed
@@ -316,15 +346,28 @@ class InterpretationServiceRAG:
             Embedding vector or None if error
         """
         try:
-            response = await self.client.embeddings.create(
-                model="text-embedding-ada-002",
-                input=text,
-            )
-            return response.data[0].embedding
+            return await self.embedding_service.embed(text)
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
             return None
 
+    async def prefetch_embeddings(self, subjects: list[InterpretationSubject]) -> None:
+        """
+        Embed the retrieval queries of several subjects in one batch.
+
+        The vectors land in the embedding cache, so the per-subject
+        retrieve_context calls that follow do not call the embeddings API.
+
+        Args:
+            subjects: Subjects about to be generated
+        """
+        if not self.use_rag or not subjects:
+            return
+        try:
+            await self.embedding_service.embed_many([s.search_query for s in subjects])
+        except Exception as e:
+            logger.error(f"Failed to prefetch embeddings: {e}")
+
     async def retrieve_context(
         self,
         query: str,
@@ -399,7 +442,7 @@ class InterpretationServiceRAG:
 
         return "\n".join(context_parts)
 
-    async def generate_planet_interpretation(
+    def _planet_cache_params(
         self,
         planet: str,
         sign: str,
@@ -407,60 +450,124 @@ class InterpretationServiceRAG:
         dignities: dict[str, Any],
         sect: str,
         retrograde: bool,
-    ) -> str:
-        """
-        Generate RAG-enhanced interpretation for a planet placement.
-
-        Args:
-            planet: Planet name
-            sign: Zodiac sign
-            house: House number
-            dignities: Planet dignities
-            sect: Chart sect
-            retrograde: Whether planet is retrograde
-
-        Returns:
-            Generated interpretation text
-        """
-        # Validate input
-        validated_dignities = self._validate_dignities(planet, sign, dignities)
-        validated_sect = sect if sect in ["diurnal", "nocturnal"] else sect
-
-        # Build cache parameters
-        cache_params = {
+    ) -> dict[str, Any]:
+        """Build the interpretation cache parameters of a planet placement."""
+        return {
             "planet": planet,
             "sign": sign,
             "house": house,
-            "dignities": validated_dignities,
+            "dignities": self._validate_dignities(planet, sign, dignities),
             "sect": sect,
             "retrograde": retrograde,
         }
 
-        # Try cache first
-        if self.cache_service:
-            cached = await self.cache_service.get(
-                interpretation_type="planet_rag",
-                parameters=cache_params,
-                model=settings.OPENAI_MODEL,
-                prompt_version=self.prompts.get("version", "1.0"),
-                language=self.language,
-            )
-            if cached:
-                self._cache_hits += 1
-                logger.info(
-                    f"Using cached RAG interpretation for {planet} in {sign} ({self.language})"
-                )
-                return cached
-
-        self._cache_misses += 1
-
-        # Build search query for RAG
+    def _planet_search_query(
+        self,
+        planet: str,
+        sign: str,
+        house: int,
+        dignities: dict[str, Any],
+        retrograde: bool,
+    ) -> str:
+        """Build the RAG retrieval query for a planet placement."""
         search_query = f"{planet} in {sign} house {house}"
+        validated_dignities = self._validate_dignities(planet, sign, dignities)
         if validated_dignities:
             dignity_str = ", ".join(f"{k}: {v}" for k, v in validated_dignities.items())
             search_query += f" dignities {dignity_str}"
         if retrograde:
             search_query += " retrograde"
+        return search_query
+
+    @staticmethod
+    def _house_search_query(house: int, sign: str, ruler: str) -> str:
+        """Build the RAG retrieval query for a house."""
+        return f"house {house} in {sign} ruled by {ruler}"
+
+    @staticmethod
+    def _aspect_search_query(
+        planet1: str, planet2: str, aspect: str, sign1: str, sign2: str
+    ) -> str:
+        """Build the RAG retrieval query for an aspect."""
+        return f"{planet1} {aspect} {planet2} in {sign1} and {sign2}"
+
+    @staticmethod
+    def _arabic_part_search_query(part_key: str, sign: str, house: int) -> str:
+        """Build the RAG retrieval query for an Arabic Part."""
+        part_info = ARABIC_PARTS[part_key]
+        return f"{part_info['name']} {part_info['name_pt']} in {sign} house {house}"
+
+    @staticmethod
+    def _house_cache_params(
+        house: int, sign: str, ruler: str, ruler_dignities: dict[str, Any], sect: str
+    ) -> dict[str, Any]:
+        """Build the interpretation cache parameters of a house."""
+        return {
+            "house": house,
+            "sign": sign,
+            "ruler": ruler,
+            "ruler_dignities": ruler_dignities,
+            "sect": sect,
+        }
+
+    @staticmethod
+    def _aspect_cache_params(
+        planet1: str,
+        planet2: str,
+        aspect: str,
+        sign1: str,
+        sign2: str,
+        applying: bool,
+        sect: str,
+        dignities1: dict[str, Any],
+        dignities2: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Build the interpretation cache parameters of an aspect (orb excluded)."""
+        return {
+            "planet1": planet1,
+            "planet2": planet2,
+            "aspect": aspect,
+            "sign1": sign1,
+            "sign2": sign2,
+            "applying": applying,
+            "sect": sect,
+            "dignities1": dignities1,
+            "dignities2": dignities2,
+        }
+
+    @staticmethod
+    def _arabic_part_cache_params(
+        part_key: str, sign: str, house: int, sect: str
+    ) -> dict[str, Any]:
+        """Build the interpretation cache parameters of an Arabic Part."""
+        return {
+            "part_key": part_key,
+            "sign": sign,
+            "house": house,
+            "sect": sect,
+        }
+
+    async def _build_planet_prompt(
+        self,
+        planet: str,
+        sign: str,
+        house: int,
+        dignities: dict[str, Any],
+        sect: str,
+        retrograde: bool,
+    ) -> tuple[str, int]:
+        """
+        Build the RAG-enhanced user prompt for a planet placement.
+
+        Returns:
+            Tuple of (prompt, number of context documents)
+        """
+        # Validate input
+        validated_dignities = self._validate_dignities(planet, sign, dignities)
+        validated_sect = sect if sect in ["diurnal", "nocturnal"] else sect
+
+        # Build search query for RAG
+        search_query = self._planet_search_query(planet, sign, house, dignities, retrograde)
 
         # Retrieve relevant context
         documents = await self.retrieve_context(
@@ -489,98 +596,24 @@ class InterpretationServiceRAG:
         else:
             enhanced_prompt = base_prompt
 
-        # Generate interpretation
-        try:
-            response = await self.client.chat.completions.create(
-                model=settings.OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": self._get_system_prompt()},
-                    {"role": "user", "content": enhanced_prompt},
-                ],
-                max_tokens=settings.OPENAI_MAX_TOKENS,
-                temperature=settings.OPENAI_TEMPERATURE,
-            )
-
-            interpretation = response.choices[0].message.content
-            interpretation_text = interpretation.strip() if interpretation else ""
-
-            # Store in cache
-            if interpretation_text and self.cache_service:
-                await self.cache_service.set(
-                    interpretation_type="planet_rag",
-                    subject=planet,
-                    parameters=cache_params,
-                    content=interpretation_text,
-                    model=settings.OPENAI_MODEL,
-                    prompt_version=self.prompts.get("version", "1.0"),
-                    language=self.language,
-                )
-
-            # Log success
-            if interpretation_text:
-                logger.info(
-                    f"Successfully generated RAG-enhanced interpretation for {planet} in {sign} "
-                    f"({self.language}, used {len(documents)} context documents)"
-                )
-
-            return interpretation_text
-
-        except Exception as e:
-            logger.error(f"Error generating RAG interpretation for {planet} in {sign}: {e}")
-            if self.language.startswith("en"):
-                return f"Interpretation not available for {planet} in {sign}."
-            return f"Interpretação não disponível para {planet} em {sign}."
+        return enhanced_prompt, len(documents)
 
-    async def generate_house_interpretation(
+    async def _build_house_prompt(
         self,
         house: int,
         sign: str,
         ruler: str,
         ruler_dignities: dict[str, Any],
         sect: str,
-    ) -> str:
+    ) -> tuple[str, int]:
         """
-        Generate RAG-enhanced interpretation for a house.
-
-        Args:
-            house: House number (1-12)
-            sign: Sign on the cusp
-            ruler: Planet ruling the sign
-            ruler_dignities: Dignities of the ruler
-            sect: Chart sect
+        Build the RAG-enhanced user prompt for a house.
 
         Returns:
-            Generated interpretation text
+            Tuple of (prompt, number of context documents)
         """
-        # Build cache parameters
-        cache_params = {
-            "house": house,
-            "sign": sign,
-            "ruler": ruler,
-            "ruler_dignities": ruler_dignities,
-            "sect": sect,
-        }
-
-        # Try cache first
-        if self.cache_service:
-            cached = await self.cache_service.get(
-                interpretation_type="house_rag",
-                parameters=cache_params,
-                model=settings.OPENAI_MODEL,
-                prompt_version=self.prompts.get("version", "1.0"),
-                language=self.language,
-            )
-            if cached:
-                self._cache_hits += 1
-                logger.info(
-                    f"Using cached RAG interpretation for house {house} in {sign} ({self.language})"
-                )
-                return cached
-
-        self._cache_misses += 1
-
         # Build search query
-        search_query = f"house {house} in {sign} ruled by {ruler}"
+        search_query = self._house_search_query(house, sign, ruler)
 
         # Retrieve context
         documents = await self.retrieve_context(
@@ -608,48 +641,9 @@ class InterpretationServiceRAG:
         else:
             enhanced_prompt = base_prompt
 
-        # Generate interpretation
-        try:
-            response = await self.client.chat.completions.create(
-                model=settings.OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": self._get_system_prompt()},
-                    {"role": "user", "content": enhanced_prompt},
-                ],
-                max_tokens=settings.OPENAI_MAX_TOKENS,
-                temperature=settings.OPENAI_TEMPERATURE,
-            )
-
-            interpretation = response.choices[0].message.content
-            interpretation_text = interpretation.strip() if interpretation else ""
-
-            # Store in cache
-            if interpretation_text and self.cache_service:
-                await self.cache_service.set(
-                    interpretation_type="house_rag",
-                    subject=str(house),
-                    parameters=cache_params,
-                    content=interpretation_text,
-                    model=settings.OPENAI_MODEL,
-                    prompt_version=self.prompts.get("version", "1.0"),
-                    language=self.language,
-                )
-
-            if interpretation_text:
-                logger.info(
-                    f"Successfully generated RAG-enhanced interpretation for house {house} in {sign} "
-                    f"({self.language}, used {len(documents)} context documents)"
-                )
-
-            return interpretation_text
-
-        except Exception as e:
-            logger.error(f"Error generating RAG house interpretation: {e}")
-            if self.language.startswith("en"):
-                return f"Interpretation not available for house {house} in {sign}."
-            return f"Interpretação não disponível para casa {house} em {sign}."
+        return enhanced_prompt, len(documents)
 
-    async def generate_aspect_interpretation(
+    async def _build_aspect_prompt(
         self,
         planet1: str,
         planet2: str,
@@ -661,58 +655,15 @@ class InterpretationServiceRAG:
         sect: str,
         dignities1: dict[str, Any],
         dignities2: dict[str, Any],
-    ) -> str:
+    ) -> tuple[str, int]:
         """
-        Generate RAG-enhanced interpretation for an aspect.
-
-        Args:
-            planet1: First planet name
-            planet2: Second planet name
-            aspect: Aspect type (e.g., "Trine", "Square")
-            sign1: Sign of first planet
-            sign2: Sign of second planet
-            orb: Orb in degrees
-            applying: Whether aspect is applying
-            sect: Chart sect
-            dignities1: Dignities of first planet
-            dignities2: Dignities of second planet
+        Build the RAG-enhanced user prompt for an aspect.
 
         Returns:
-            Generated interpretation text
+            Tuple of (prompt, number of context documents)
         """
-        # Build cache parameters (orb excluded to maximize cache hits)
-        cache_params = {
-            "planet1": planet1,
-            "planet2": planet2,
-            "aspect": aspect,
-            "sign1": sign1,
-            "sign2": sign2,
-            "applying": applying,
-            "sect": sect,
-            "dignities1": dignities1,
-            "dignities2": dignities2,
-        }
-
-        # Try cache first
-        if self.cache_service:
-            cached = await self.cache_service.get(
-                interpretation_type="aspect_rag",
-                parameters=cache_params,
-                model=settings.OPENAI_MODEL,
-                prompt_version=self.prompts.get("version", "1.0"),
-                language=self.language,
-            )
-            if cached:
-                self._cache_hits += 1
-                logger.info(
-                    f"Using cached RAG interpretation for {planet1} {aspect} {planet2} ({self.language})"
-                )
-                return cached
-
-        self._cache_misses += 1
-
         # Build search query
-        search_query = f"{planet1} {aspect} {planet2} in {sign1} and {sign2}"
+        search_query = self._aspect_search_query(planet1, planet2, aspect, sign1, sign2)
 
         # Retrieve context
         documents = await self.retrieve_context(
@@ -746,6 +697,294 @@ class InterpretationServiceRAG:
         else:
             enhanced_prompt = base_prompt
 
+        return enhanced_prompt, len(documents)
+
+    async def _build_arabic_part_prompt(
+        self,
+        part_key: str,
+        sign: str,
+        house: int,
+        degree: float,
+        sect: str,
+    ) -> tuple[str, int]:
+        """
+        Build the RAG-enhanced user prompt for an Arabic Part.
+
+        Returns:
+            Tuple of (prompt, number of context documents)
+        """
+        part_name = ARABIC_PARTS[part_key]["name"]
+        part_name_pt = ARABIC_PARTS[part_key]["name_pt"]
+
+        # Build search query for RAG
+        search_query = self._arabic_part_search_query(part_key, sign, house)
+
+        # Retrieve relevant context
+        documents = await self.retrieve_context(
+            query=search_query,
+            filters={"document_type": ["text", "pdf", "interpretation"]},
+        )
+
+        # Format RAG context
+        rag_context = await self._format_rag_context(documents)
+
+        # Get sign ruler (imported at module level)
+        sign_ruler = get_sign_ruler(sign) or "Unknown"
+
+        # Build prompt
+        base_prompt = self.prompts["arabic_part_prompts"]["base"].format(
+            part_name=part_name,
+            part_name_pt=part_name_pt,
+            sign=sign,
+            house=house,
+            degree=round(degree, 1),
+            sect=sect,
+            sign_ruler=sign_ruler,
+            ruler_dignities="(consultar posição no mapa)",
+        )
+
+        if rag_context:
+            enhanced_prompt = f"{rag_context}\n\nCom base no contexto acima:\n\n{base_prompt}"
+        else:
+            enhanced_prompt = base_prompt
+
+        return enhanced_prompt, len(documents)
+
+    async def generate_planet_interpretation(
+        self,
+        planet: str,
+        sign: str,
+        house: int,
+        dignities: dict[str, Any],
+        sect: str,
+        retrograde: bool,
+    ) -> str:
+        """
+        Generate RAG-enhanced interpretation for a planet placement.
+
+        Args:
+            planet: Planet name
+            sign: Zodiac sign
+            house: House number
+            dignities: Planet dignities
+            sect: Chart sect
+            retrograde: Whether planet is retrograde
+
+        Returns:
+            Generated interpretation text
+        """
+        # Build cache parameters
+        cache_params = self._planet_cache_params(planet, sign, house, dignities, sect, retrograde)
+
+        # Try cache first
+        if self.cache_service:
+            cached = await self.cache_service.get(
+                interpretation_type="planet_rag",
+                parameters=cache_params,
+                model=settings.OPENAI_MODEL,
+                prompt_version=self.prompts.get("version", "1.0"),
+                language=self.language,
+            )
+            if cached:
+                self._cache_hits += 1
+                logger.info(
+                    f"Using cached RAG interpretation for {planet} in {sign} ({self.language})"
+                )
+                return cached
+
+        self._cache_misses += 1
+
+        enhanced_prompt, num_documents = await self._build_planet_prompt(
+            planet, sign, house, dignities, sect, retrograde
+        )
+
+        # Generate interpretation
+        try:
+            response = await self.client.chat.completions.create(
+                model=settings.OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": self._get_system_prompt()},
+                    {"role": "user", "content": enhanced_prompt},
+                ],
+                max_tokens=settings.OPENAI_MAX_TOKENS,
+                temperature=settings.OPENAI_TEMPERATURE,
+            )
+
+            interpretation = response.choices[0].message.content
+            interpretation_text = interpretation.strip() if interpretation else ""
+
+            # Store in cache
+            if interpretation_text and self.cache_service:
+                await self.cache_service.set(
+                    interpretation_type="planet_rag",
+                    subject=planet,
+                    parameters=cache_params,
+                    content=interpretation_text,
+                    model=settings.OPENAI_MODEL,
+                    prompt_version=self.prompts.get("version", "1.0"),
+                    language=self.language,
+                )
+
+            # Log success
+            if interpretation_text:
+                logger.info(
+                    f"Successfully generated RAG-enhanced interpretation for {planet} in {sign} "
+                    f"({self.language}, used {num_documents} context documents)"
+                )
+
+            return interpretation_text
+
+        except Exception as e:
+            logger.error(f"Error generating RAG interpretation for {planet} in {sign}: {e}")
+            if self.language.startswith("en"):
+                return f"Interpretation not available for {planet} in {sign}."
+            return f"Interpretação não disponível para {planet} em {sign}."
+
+    async def generate_house_interpretation(
+        self,
+        house: int,
+        sign: str,
+        ruler: str,
+        ruler_dignities: dict[str, Any],
+        sect: str,
+    ) -> str:
+        """
+        Generate RAG-enhanced interpretation for a house.
+
+        Args:
+            house: House number (1-12)
+            sign: Sign on the cusp
+            ruler: Planet ruling the sign
+            ruler_dignities: Dignities of the ruler
+            sect: Chart sect
+
+        Returns:
+            Generated interpretation text
+        """
+        # Build cache parameters
+        cache_params = self._house_cache_params(house, sign, ruler, ruler_dignities, sect)
+
+        # Try cache first
+        if self.cache_service:
+            cached = await self.cache_service.get(
+                interpretation_type="house_rag",
+                parameters=cache_params,
+                model=settings.OPENAI_MODEL,
+                prompt_version=self.prompts.get("version", "1.0"),
+                language=self.language,
+            )
+            if cached:
+                self._cache_hits += 1
+                logger.info(
+                    f"Using cached RAG interpretation for house {house} in {sign} ({self.language})"
+                )
+                return cached
+
+        self._cache_misses += 1
+
+        enhanced_prompt, num_documents = await self._build_house_prompt(
+            house, sign, ruler, ruler_dignities, sect
+        )
+
+        # Generate interpretation
+        try:
+            response = await self.client.chat.completions.create(
+                model=settings.OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": self._get_system_prompt()},
+                    {"role": "user", "content": enhanced_prompt},
+                ],
+                max_tokens=settings.OPENAI_MAX_TOKENS,
+                temperature=settings.OPENAI_TEMPERATURE,
+            )
+
+            interpretation = response.choices[0].message.content
+            interpretation_text = interpretation.strip() if interpretation else ""
+
+            # Store in cache
+            if interpretation_text and self.cache_service:
+                await self.cache_service.set(
+                    interpretation_type="house_rag",
+                    subject=str(house),
+                    parameters=cache_params,
+                    content=interpretation_text,
+                    model=settings.OPENAI_MODEL,
+                    prompt_version=self.prompts.get("version", "1.0"),
+                    language=self.language,
+                )
+
+            if interpretation_text:
+                logger.info(
+                    f"Successfully generated RAG-enhanced interpretation for house {house} in {sign} "
+                    f"({self.language}, used {num_documents} context documents)"
+                )
+
+            return interpretation_text
+
+        except Exception as e:
+            logger.error(f"Error generating RAG house interpretation: {e}")
+            if self.language.startswith("en"):
+                return f"Interpretation not available for house {house} in {sign}."
+            return f"Interpretação não disponível para casa {house} em {sign}."
+
+    async def generate_aspect_interpretation(
+        self,
+        planet1: str,
+        planet2: str,
+        aspect: str,
+        sign1: str,
+        sign2: str,
+        orb: float,
+        applying: bool,
+        sect: str,
+        dignities1: dict[str, Any],
+        dignities2: dict[str, Any],
+    ) -> str:
+        """
+        Generate RAG-enhanced interpretation for an aspect.
+
+        Args:
+            planet1: First planet name
+            planet2: Second planet name
+            aspect: Aspect type (e.g., "Trine", "Square")
+            sign1: Sign of first planet
+            sign2: Sign of second planet
+            orb: Orb in degrees
+            applying: Whether aspect is applying
+            sect: Chart sect
+            dignities1: Dignities of first planet
+            dignities2: Dignities of second planet
+
+        Returns:
+            Generated interpretation text
+        """
+        # Build cache parameters (orb excluded to maximize cache hits)
+        cache_params = self._aspect_cache_params(
+            planet1, planet2, aspect, sign1, sign2, applying, sect, dignities1, dignities2
+        )
+
+        # Try cache first
+        if self.cache_service:
+            cached = await self.cache_service.get(
+                interpretation_type="aspect_rag",
+                parameters=cache_params,
+                model=settings.OPENAI_MODEL,
+                prompt_version=self.prompts.get("version", "1.0"),
+                language=self.language,
+            )
+            if cached:
+                self._cache_hits += 1
+                logger.info(
+                    f"Using cached RAG interpretation for {planet1} {aspect} {planet2} ({self.language})"
+                )
+                return cached
+
+        self._cache_misses += 1
+
+        enhanced_prompt, num_documents = await self._build_aspect_prompt(
+            planet1, planet2, aspect, sign1, sign2, orb, applying, sect, dignities1, dignities2
+        )
+
         # Generate interpretation
         try:
             response = await self.client.chat.completions.create(
@@ -776,7 +1015,7 @@ class InterpretationServiceRAG:
             if interpretation_text:
                 logger.info(
                     f"Successfully generated RAG-enhanced interpretation for {planet1} {aspect} {planet2} "
-                    f"({self.language}, used {len(documents)} context documents)"
+                    f"({self.language}, used {num_documents} context documents)"
                 )
 
             return interpretation_text
@@ -816,12 +1055,7 @@ class InterpretationServiceRAG:
         part_name_pt = part_info["name_pt"]
 
         # Build cache parameters
-        cache_params = {
-            "part_key": part_key,
-            "sign": sign,
-            "house": house,
-            "sect": sect,
-        }
+        cache_params = self._arabic_part_cache_params(part_key, sign, house, sect)
 
         # Try cache first
         if self.cache_service:
@@ -841,38 +1075,10 @@ class InterpretationServiceRAG:
 
         self._cache_misses += 1
 
-        # Build search query for RAG
-        search_query = f"{part_name} {part_name_pt} in {sign} house {house}"
-
-        # Retrieve relevant context
-        documents = await self.retrieve_context(
-            query=search_query,
-            filters={"document_type": ["text", "pdf", "interpretation"]},
+        enhanced_prompt, num_documents = await self._build_arabic_part_prompt(
+            part_key, sign, house, degree, sect
         )
 
-        # Format RAG context
-        rag_context = await self._format_rag_context(documents)
-
-        # Get sign ruler (imported at module level)
-        sign_ruler = get_sign_ruler(sign) or "Unknown"
-
-        # Build prompt
-        base_prompt = self.prompts["arabic_part_prompts"]["base"].format(
-            part_name=part_name,
-            part_name_pt=part_name_pt,
-            sign=sign,
-            house=house,
-            degree=round(degree, 1),
-            sect=sect,
-            sign_ruler=sign_ruler,
-            ruler_dignities="(consultar posição no mapa)",
-        )
-
-        if rag_context:
-            enhanced_prompt = f"{rag_context}\n\nCom base no contexto acima:\n\n{base_prompt}"
-        else:
-            enhanced_prompt = base_prompt
-
         # Generate interpretation
         try:
             response = await self.client.chat.completions.create(
@@ -903,7 +1109,7 @@ class InterpretationServiceRAG:
             if interpretation_text:
                 logger.info(
                     f"Successfully generated RAG-enhanced interpretation for {part_name} in {sign} "
-                    f"({self.language}, used {len(documents)} context documents)"
+                    f"({self.language}, used {num_documents} context documents)"
                 )
 
             return interpretation_text
@@ -939,239 +1145,471 @@ class InterpretationServiceRAG:
                 logger.error(f"Failed to generate {category} interpretation for {key}: {e}")
                 return (category, key, "")
 
-    async def generate_all_rag_interpretations(
+    def collect_subjects(
         self,
-        chart: BirthChart,
-        chart_data: dict[str, Any],
-        force: bool = False,
-    ) -> dict[str, dict[str, str]]:
+        planets: list[dict[str, Any]],
+        houses: list[dict[str, Any]],
+        aspects: list[dict[str, Any]],
+        arabic_parts: dict[str, Any],
+        sect: str,
+        use_ruler_dignities: bool = False,
+    ) -> list[InterpretationSubject]:
         """
-        Generate all RAG-enhanced interpretations for a chart and save to database.
+        List every interpretation subject of a chart, with its cache parameters.
 
-        Uses parallel processing with semaphore limiting to speed up generation
-        while respecting OpenAI rate limits (max 5 concurrent calls).
+        Aspects are limited to settings.RAG_MAX_ASPECTS.
 
         Args:
-            chart: BirthChart model instance
-            chart_data: Calculated chart data
-            force: If True, regenerate interpretations even if they exist.
-                   If False (default), skip generation if interpretation already exists.
+            planets: Planet data of the chart
+            houses: House data of the chart
+            aspects: Aspect data of the chart
+            arabic_parts: Arabic Parts data keyed by part key
+            sect: Chart sect
+            use_ruler_dignities: Pass the house ruler's dignities to house
+                interpretations (otherwise an empty dict)
 
         Returns:
-            Dictionary with all interpretations grouped by type
+            Subjects in generation order (planets, houses, aspects, Arabic Parts)
         """
-        results: dict[str, dict[str, str]] = {
-            "planets": {},
-            "houses": {},
-            "aspects": {},
-            "arabic_parts": {},
-        }
-
-        # Extract language-specific data (supports both legacy flat and language-first format)
-        from app.utils.chart_data_accessor import extract_language_data
+        subjects: list[InterpretationSubject] = []
 
-        lang_data = extract_language_data(chart_data, self.language)
-        planets = lang_data.get("planets", [])
-        houses = lang_data.get("houses", [])
-        aspects = lang_data.get("aspects", [])
-        arabic_parts = lang_data.get("arabic_parts", {})
-        sect = lang_data.get("sect", "diurnal")
-
-        # Phase 1: Check which interpretations already exist and collect tasks
-        tasks: list[tuple[Any, str, str, str, dict[str, Any]]] = []
-        # Format: (coroutine, category, key, interpretation_type, params_for_db)
-
-        # Collect planet interpretation tasks
         for planet in planets:
             planet_name = planet.get("name", "")
             if not planet_name:
                 continue
-
-            sign = planet.get("sign", "")
-            house = planet.get("house", 1)
-            retrograde = planet.get("retrograde", False)
-            dignities = planet.get("dignities", {})
-
-            # Check if interpretation already exists (unless force=True)
-            if not force:
-                existing = await self.repo.get_by_chart_and_subject(
-                    chart_id=chart.id,  # type: ignore[arg-type]
-                    subject=planet_name,
+            arguments = {
+                "planet": planet_name,
+                "sign": planet.get("sign", ""),
+                "house": planet.get("house", 1),
+                "dignities": planet.get("dignities", {}),
+                "sect": sect,
+                "retrograde": planet.get("retrograde", False),
+            }
+            subjects.append(
+                InterpretationSubject(
+                    category="planets",
+                    key=planet_name,
                     interpretation_type="planet",
-                    language=self.language,
+                    cache_type="planet_rag",
+                    cache_params=self._planet_cache_params(**arguments),
+                    arguments=arguments,
+                    search_query=self._planet_search_query(
+                        planet_name,
+                        arguments["sign"],
+                        arguments["house"],
+                        arguments["dignities"],
+                        arguments["retrograde"],
+                    ),
                 )
-                if existing:
-                    logger.debug(
-                        f"Skipping planet {planet_name} - interpretation already exists ({self.language})"
-                    )
-                    results["planets"][planet_name] = existing.content
-                    continue
-
-            # Add to tasks for parallel generation
-            coro = self.generate_planet_interpretation(
-                planet=planet_name,
-                sign=sign,
-                house=house,
-                dignities=dignities,
-                sect=sect,
-                retrograde=retrograde,
             )
-            tasks.append((coro, "planets", planet_name, "planet", {}))
 
-        # Collect house interpretation tasks
         for house_data in houses:
             house_number = house_data.get("house", 0) or house_data.get("number", 0)
             house_sign = house_data.get("sign", "")
-
             if not house_number or not house_sign:
                 continue
 
-            house_key = str(house_number)
-
-            if not force:
-                existing = await self.repo.get_by_chart_and_subject(
-                    chart_id=chart.id,  # type: ignore[arg-type]
-                    subject=house_key,
+            ruler = get_sign_ruler(house_sign) or "Unknown"
+            ruler_dignities: dict[str, Any] = {}
+            if use_ruler_dignities:
+                ruler_data = next((p for p in planets if p.get("name") == ruler), {})
+                ruler_dignities = ruler_data.get("dignities", {})
+            arguments = {
+                "house": house_number,
+                "sign": house_sign,
+                "ruler": ruler,
+                "ruler_dignities": ruler_dignities,
+                "sect": sect,
+            }
+            subjects.append(
+                InterpretationSubject(
+                    category="houses",
+                    key=str(house_number),
                     interpretation_type="house",
-                    language=self.language,
+                    cache_type="house_rag",
+                    cache_params=self._house_cache_params(**arguments),
+                    arguments=arguments,
+                    search_query=self._house_search_query(house_number, house_sign, ruler),
                 )
-                if existing:
-                    logger.debug(
-                        f"Skipping house {house_number} - interpretation already exists ({self.language})"
-                    )
-                    results["houses"][house_key] = existing.content
-                    continue
-
-            ruler = get_sign_ruler(house_sign) or "Unknown"
-            coro = self.generate_house_interpretation(
-                house=house_number,
-                sign=house_sign,
-                ruler=ruler,
-                ruler_dignities={},
-                sect=sect,
             )
-            tasks.append((coro, "houses", house_key, "house", {"house_sign": house_sign}))
 
-        # Collect aspect interpretation tasks
-        max_aspects = settings.RAG_MAX_ASPECTS
-        for aspect in aspects[:max_aspects]:
+        for aspect in aspects[: settings.RAG_MAX_ASPECTS]:
             planet1 = aspect.get("planet1", "")
             planet2 = aspect.get("planet2", "")
             aspect_name = aspect.get("aspect", "")
-            orb = aspect.get("orb", 0.0)
-
             if not all([planet1, planet2, aspect_name]):
                 continue
 
-            aspect_key = f"{planet1}-{aspect_name}-{planet2}"
-
-            if not force:
-                existing = await self.repo.get_by_chart_and_subject(
-                    chart_id=chart.id,  # type: ignore[arg-type]
-                    subject=aspect_key,
-                    interpretation_type="aspect",
-                    language=self.language,
-                )
-                if existing:
-                    logger.debug(
-                        f"Skipping aspect {aspect_key} - interpretation already exists ({self.language})"
-                    )
-                    results["aspects"][aspect_key] = existing.content
-                    continue
-
             planet1_data: dict[str, Any] = next(
                 (p for p in planets if p.get("name") == planet1), {}
             )
             planet2_data: dict[str, Any] = next(
                 (p for p in planets if p.get("name") == planet2), {}
             )
-
-            coro = self.generate_aspect_interpretation(
-                planet1=planet1,
-                planet2=planet2,
-                aspect=aspect_name,
-                sign1=planet1_data.get("sign", ""),
-                sign2=planet2_data.get("sign", ""),
-                orb=orb,
-                applying=aspect.get("applying", False),
-                sect=sect,
-                dignities1=planet1_data.get("dignities", {}),
-                dignities2=planet2_data.get("dignities", {}),
+            arguments = {
+                "planet1": planet1,
+                "planet2": planet2,
+                "aspect": aspect_name,
+                "sign1": planet1_data.get("sign", ""),
+                "sign2": planet2_data.get("sign", ""),
+                "applying": aspect.get("applying", False),
+                "sect": sect,
+                "dignities1": planet1_data.get("dignities", {}),
+                "dignities2": planet2_data.get("dignities", {}),
+            }
+            subjects.append(
+                InterpretationSubject(
+                    category="aspects",
+                    key=f"{planet1}-{aspect_name}-{planet2}",
+                    interpretation_type="aspect",
+                    cache_type="aspect_rag",
+                    cache_params=self._aspect_cache_params(**arguments),
+                    arguments={**arguments, "orb": aspect.get("orb", 0.0)},
+                    search_query=self._aspect_search_query(
+                        planet1,
+                        planet2,
+                        aspect_name,
+                        arguments["sign1"],
+                        arguments["sign2"],
+                    ),
+                )
             )
-            tasks.append((coro, "aspects", aspect_key, "aspect", {}))
 
-        # Collect Arabic Parts interpretation tasks
         for part_key, part_data in arabic_parts.items():
             if part_key not in ARABIC_PARTS:
                 continue
-
-            if not force:
-                existing = await self.repo.get_by_chart_and_subject(
-                    chart_id=chart.id,  # type: ignore[arg-type]
-                    subject=part_key,
+            arguments = {
+                "part_key": part_key,
+                "sign": part_data.get("sign", ""),
+                "house": part_data.get("house", 1),
+                "degree": part_data.get("degree", 0.0),
+                "sect": sect,
+            }
+            subjects.append(
+                InterpretationSubject(
+                    category="arabic_parts",
+                    key=part_key,
                     interpretation_type="arabic_part",
-                    language=self.language,
+                    cache_type="arabic_part_rag",
+                    cache_params=self._arabic_part_cache_params(
+                        part_key, arguments["sign"], arguments["house"], sect
+                    ),
+                    arguments=arguments,
+                    search_query=self._arabic_part_search_query(
+                        part_key, arguments["sign"], arguments["house"]
+                    ),
                 )
-                if existing:
-                    logger.debug(
-                        f"Skipping arabic_part {part_key} - interpretation already exists ({self.language})"
-                    )
-                    results["arabic_parts"][part_key] = existing.content
-                    continue
-
-            coro = self.generate_arabic_part_interpretation(
-                part_key=part_key,
-                sign=part_data.get("sign", ""),
-                house=part_data.get("house", 1),
-                degree=part_data.get("degree", 0.0),
-                sect=sect,
             )
-            tasks.append((coro, "arabic_parts", part_key, "arabic_part", {}))
 
-        # Phase 2: Generate all interpretations in parallel with semaphore
-        if tasks:
+        return subjects
+
+    async def get_cached_subjects(
+        self, subjects: list[InterpretationSubject]
+    ) -> dict[tuple[str, str], str]:
+        """
+        Look up cached interpretations for several subjects in one batch.
+
+        Args:
+            subjects: Subjects from collect_subjects
+
+        Returns:
+            Dictionary of (category, key) -> cached content for the cache hits
+        """
+        if not self.cache_service or not subjects:
+            return {}
+
+        prompt_version = self.prompts.get("version", "1.0")
+        cache_keys = {
+            (subject.category, subject.key): InterpretationCacheService.generate_cache_key(
+                subject.cache_type,
+                subject.cache_params,
+                settings.OPENAI_MODEL,
+                prompt_version,
+                self.language,
+            )
+            for subject in subjects
+        }
+        found = await self.cache_service.get_many(list(cache_keys.values()))
+
+        cached = {
+            subject_id: found[cache_key]
+            for subject_id, cache_key in cache_keys.items()
+            if cache_key in found
+        }
+        self._cache_hits += len(cached)
+        return cached
+
+    async def build_subject_prompt(self, subject: InterpretationSubject) -> str:
+        """Build the RAG-enhanced user prompt of one subject."""
+        builders = {
+            "planet": self._build_planet_prompt,
+            "house": self._build_house_prompt,
+            "aspect": self._build_aspect_prompt,
+            "arabic_part": self._build_arabic_part_prompt,
+        }
+        prompt, _ = await builders[subject.interpretation_type](**subject.arguments)
+        return prompt
+
+    async def generate_subjects(
+        self,
+        subjects: list[InterpretationSubject],
+        batch: bool | None = None,
+    ) -> dict[tuple[str, str], str]:
+        """
+        Generate several subjects concurrently.
+
+        Args:
+            subjects: Subjects to generate (cache misses)
+            batch: Use multi-subject requests (see generate_subjects_batched).
+                   None (default) uses settings.RAG_BATCH_GENERATION.
+
+        Returns:
+            Dictionary of (category, key) -> generated content (failures are absent)
+        """
+        if not subjects:
+            return {}
+
+        if settings.RAG_BATCH_GENERATION if batch is None else batch:
             logger.info(
-                f"Generating {len(tasks)} interpretations in parallel "
-                f"(semaphore limit: {OPENAI_CONCURRENCY_LIMIT}) for chart {chart.id}"
+                f"Generating {len(subjects)} interpretations in batches of "
+                f"{settings.RAG_BATCH_SUBJECTS} ({self.language})"
+            )
+            return await self.generate_subjects_batched(subjects)
+
+        logger.info(
+            f"Generating {len(subjects)} interpretations in parallel "
+            f"(semaphore limit: {OPENAI_CONCURRENCY_LIMIT}, {self.language})"
+        )
+        return await self._generate_individually(subjects)
+
+    async def generate_subjects_batched(
+        self, subjects: list[InterpretationSubject]
+    ) -> dict[tuple[str, str], str]:
+        """
+        Generate several subjects with multi-subject requests.
+
+        Subjects are sent settings.RAG_BATCH_SUBJECTS per chat completion with
+        a JSON response format, so the system prompt and language instruction
+        are paid once per group instead of once per subject. Results are
+        cached per subject exactly like single generations; subjects missing
+        from a response are generated one by one.
+
+        Args:
+            subjects: Subjects to generate (cache misses)
+
+        Returns:
+            Dictionary of (category, key) -> generated content
+        """
+        size = max(1, settings.RAG_BATCH_SUBJECTS)
+        groups = [subjects[i : i + size] for i in range(0, len(subjects), size)]
+        group_results = await asyncio.gather(*(self._generate_group(group) for group in groups))
+
+        generated: dict[tuple[str, str], str] = {}
+        for group, results in zip(groups, group_results, strict=True):
+            for subject in group:
+                content = results.get((subject.category, subject.key))
+                if content:
+                    generated[(subject.category, subject.key)] = content
+                    await self._cache_subject(subject, content)
+
+        missing = [s for s in subjects if (s.category, s.key) not in generated]
+        if missing:
+            logger.warning(
+                f"{len(missing)} interpretations missing from batched responses, "
+                "generating them individually"
+            )
+            generated.update(await self._generate_individually(missing))
+
+        return generated
+
+    async def _generate_group(
+        self, subjects: list[InterpretationSubject]
+    ) -> dict[tuple[str, str], str]:
+        """Generate one group of subjects with a single JSON chat completion."""
+        prompts = await asyncio.gather(*(self.build_subject_prompt(s) for s in subjects))
+        items = "\n\n".join(f"### {i}\n{prompt}" for i, prompt in enumerate(prompts, 1))
+        self._cache_misses += len(subjects)
+
+        async with self._semaphore:
+            try:
+                response = await self.client.chat.completions.create(
+                    model=settings.OPENAI_MODEL,
+                    messages=[
+                        {"role": "system", "content": self._get_system_prompt()},
+                        {"role": "user", "content": f"{BATCH_PROMPT_INSTRUCTION}\n\n{items}"},
+                    ],
+                    max_tokens=min(settings.OPENAI_MAX_TOKENS * len(subjects), BATCH_MAX_TOKENS),
+                    temperature=settings.OPENAI_TEMPERATURE,
+                    response_format={"type": "json_object"},
+                )
+                data = json.loads(response.choices[0].message.content or "{}")
+            except Exception as e:
+                logger.error(f"Batched generation of {len(subjects)} interpretations failed: {e}")
+                return {}
+
+        interpretations = data.get("interpretations") if isinstance(data, dict) else None
+        if not isinstance(interpretations, dict):
+            logger.error("Batched response has no interpretations object")
+            return {}
+
+        generated: dict[tuple[str, str], str] = {}
+        for i, subject in enumerate(subjects, 1):
+            content = interpretations.get(str(i))
+            if isinstance(content, str) and content.strip():
+                generated[(subject.category, subject.key)] = content.strip()
+
+        logger.info(
+            f"Generated {len(generated)}/{len(subjects)} RAG interpretations in one request "
+            f"({self.language})"
+        )
+        return generated
+
+    async def _cache_subject(self, subject: InterpretationSubject, content: str) -> None:
+        """Store a generated interpretation in the interpretation cache."""
+        if not self.cache_service:
+            return
+        try:
+            await self.cache_service.set(
+                interpretation_type=subject.cache_type,
+                subject=subject.key,
+                parameters=subject.cache_params,
+                content=content,
+                model=settings.OPENAI_MODEL,
+                prompt_version=self.prompts.get("version", "1.0"),
+                language=self.language,
             )
+        except Exception as e:
+            logger.error(f"Failed to cache {subject.interpretation_type} {subject.key}: {e}")
+
+    async def _generate_individually(
+        self, subjects: list[InterpretationSubject]
+    ) -> dict[tuple[str, str], str]:
+        """Generate subjects one request each, in parallel with semaphore limiting."""
+        results = await asyncio.gather(
+            *(
+                self._generate_with_semaphore(self.generate_subject(s), s.key, s.category)
+                for s in subjects
+            ),
+            return_exceptions=True,
+        )
+
+        generated: dict[tuple[str, str], str] = {}
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"Task failed with exception: {result}")
+                continue
+            category, key, interpretation = result
+            if interpretation:
+                generated[(category, key)] = interpretation
+        return generated
+
+    async def generate_subject(self, subject: InterpretationSubject) -> str:
+        """Generate the interpretation of one subject with its generate_* method."""
+        generators = {
+            "planet": self.generate_planet_interpretation,
+            "house": self.generate_house_interpretation,
+            "aspect": self.generate_aspect_interpretation,
+            "arabic_part": self.generate_arabic_part_interpretation,
+        }
+        return await generators[subject.interpretation_type](**subject.arguments)
+
+    async def generate_all_rag_interpretations(
+        self,
+        chart: BirthChart,
+        chart_data: dict[str, Any],
+        force: bool = False,
+        batch: bool | None = None,
+    ) -> dict[str, dict[str, str]]:
+        """
+        Generate all RAG-enhanced interpretations for a chart and save to database.
+
+        Uses parallel processing with semaphore limiting to speed up generation
+        while respecting OpenAI rate limits (max 5 concurrent calls).
+
+        Args:
+            chart: BirthChart model instance
+            chart_data: Calculated chart data
+            force: If True, regenerate interpretations even if they exist.
+                   If False (default), skip generation if interpretation already exists.
+            batch: Generate with multi-subject requests (see generate_subjects_batched).
+                   None (default) uses settings.RAG_BATCH_GENERATION.
 
-            # Create semaphore-wrapped tasks
-            semaphore_tasks = [
-                self._generate_with_semaphore(coro, key, category)
-                for coro, category, key, _, _ in tasks
-            ]
+        Returns:
+            Dictionary with all interpretations grouped by type
+        """
+        results: dict[str, dict[str, str]] = {
+            "planets": {},
+            "houses": {},
+            "aspects": {},
+            "arabic_parts": {},
+        }
 
-            # Run all tasks in parallel
-            generation_results = await asyncio.gather(*semaphore_tasks, return_exceptions=True)
+        # Extract language-specific data (supports both legacy flat and language-first format)
+        from app.utils.chart_data_accessor import extract_language_data
 
-            # Process results and prepare for database save
-            task_map = {
-                (t[1], t[2]): (t[3], t[4]) for t in tasks
-            }  # (category, key) -> (type, params)
+        lang_data = extract_language_data(chart_data, self.language)
+        planets = lang_data.get("planets", [])
+        houses = lang_data.get("houses", [])
+        aspects = lang_data.get("aspects", [])
+        arabic_parts = lang_data.get("arabic_parts", {})
+        sect = lang_data.get("sect", "diurnal")
 
-            for result in generation_results:
-                if isinstance(result, BaseException):
-                    logger.error(f"Task failed with exception: {result}")
-                    continue
+        subjects = self.collect_subjects(planets, houses, aspects, arabic_parts, sect)
 
-                # result is tuple[str, str, str | None] from _generate_with_semaphore
-                category, key, interpretation = result  # type: ignore[misc]
+        # Phase 1: Partition subjects into already saved, cached and missing
+        existing = (
+            {}
+            if force
+            else await self.repo.get_existing_subjects(
+                chart_id=chart.id,  # type: ignore[arg-type]
+                language=self.language,
+            )
+        )
+        pending: list[InterpretationSubject] = []
+        for subject in subjects:
+            content = existing.get((subject.interpretation_type, subject.key))
+            if content is not None:
+                logger.debug(
+                    f"Skipping {subject.interpretation_type} {subject.key} - "
+                    f"interpretation already exists ({self.language})"
+                )
+                results[subject.category][subject.key] = content
+            else:
+                pending.append(subject)
+
+        cached = await self.get_cached_subjects(pending)
+        new_keys: set[tuple[str, str]] = set()
+        tasks: list[InterpretationSubject] = []
+        for subject in pending:
+            new_keys.add((subject.category, subject.key))
+            content = cached.get((subject.category, subject.key))
+            if content:
+                results[subject.category][subject.key] = content
+            else:
+                tasks.append(subject)
+
+        # Phase 2: Generate the missing interpretations
+        if tasks:
+            # Embed all retrieval queries in one request
+            await self.prefetch_embeddings(tasks)
+
+            logger.info(f"Generating {len(tasks)} missing interpretations for chart {chart.id}")
+            generated = await self.generate_subjects(tasks, batch=batch)
+
+            for subject in tasks:
+                interpretation = generated.get((subject.category, subject.key), "")
                 if not interpretation:
                     # Handle empty interpretation for houses
-                    if category == "houses":
-                        task_info: tuple[str | None, dict[str, str]] = task_map.get(
-                            (category, key), (None, {})
-                        )
-                        params = task_info[1] if task_info else {}
-                        house_sign = params.get("house_sign", "")
+                    if subject.category == "houses":
+                        house_sign = subject.arguments["sign"]
                         interpretation = (
-                            f"Casa {key} ({house_sign}): "
+                            f"Casa {subject.key} ({house_sign}): "
                             f"Esta casa governa áreas específicas da vida conforme sua posição em {house_sign}."
                         )
                     else:
                         continue
 
-                results[category][key] = interpretation
+                results[subject.category][subject.key] = interpretation
 
         # Phase 3: Save all new interpretations to database
         for category, interpretations in results.items():
@@ -1185,9 +1623,8 @@ class InterpretationServiceRAG:
             interpretation_type = type_map[category]
 
             for key, content in interpretations.items():
-                # Only save if this was a newly generated interpretation
-                was_generated = any(t[1] == category and t[2] == key for t in tasks)
-                if was_generated and content:
+                # Only save if this was a newly resolved interpretation
+                if (category, key) in new_keys and content:
                     try:
                         await self.repo.upsert_interpretation(
                             chart_id=chart.id,
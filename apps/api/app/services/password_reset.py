@@ -17,6 +17,7 @@ from app.core.security import get_password_hash
 from app.models.password_reset import PasswordResetToken
 from app.models.user import User
 from app.repositories.audit_repository import AuditRepository
+from app.services.auth_principal_cache import invalidate_principal
 from app.services.email import EmailService
 
 
@@ -177,6 +178,7 @@ class PasswordResetService:
         reset_token.used = True
 
         await db.commit()
+        await invalidate_principal(user.id)
 
         # Audit log: password changed
         audit_repo = AuditRepository(db)
@@ -0,0 +1,101 @@
+"""
+Redis cache for anonymous public chart listings.
+
+The public listing endpoints (paginated list, featured, categories) return
+the same JSON to every visitor and only change when an admin edits a chart,
+so their serialized responses are cached in Redis for
+PUBLIC_CHART_CACHE_TTL_SECONDS.
+
+Every cached key is also recorded in a Redis set, so PublicChartService can
+drop all of them at once after a create, update or delete. View counts shown
+in listings may lag by up to the TTL. Redis errors fail open (the response is
+built from the database).
+"""
+
+import hashlib
+import json
+from typing import Any
+
+import redis.asyncio as aioredis
+from loguru import logger
+
+from app.core.redis_pool import get_async_redis_pool
+
+# Redis keys and TTL for cached listing responses (5 minutes)
+PUBLIC_CHART_CACHE_KEY_PREFIX = "public_charts_response:"
+PUBLIC_CHART_CACHE_KEYS_SET = "public_charts_response_keys"
+PUBLIC_CHART_CACHE_TTL_SECONDS = 5 * 60
+
+
+def generate_cache_key(endpoint: str, params: dict[str, Any]) -> str:
+    """
+    Generate the Redis key of one listing response.
+
+    Args:
+        endpoint: Listing name ("list", "featured", "categories")
+        params: Query parameters the response depends on
+
+    Returns:
+        Redis key
+    """
+    key_string = json.dumps(params, sort_keys=True, default=str)
+    digest = hashlib.sha256(key_string.encode()).hexdigest()[:32]
+    return f"{PUBLIC_CHART_CACHE_KEY_PREFIX}{endpoint}:{digest}"
+
+
+async def get_cached_response(key: str) -> str | None:
+    """
+    Get a cached response body.
+
+    Args:
+        key: Key from generate_cache_key
+
+    Returns:
+        Serialized JSON body, or None on a miss
+    """
+    pool = get_async_redis_pool()
+    if not pool:
+        return None
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        value: str | None = await client.get(key)
+        return value
+    except Exception as e:
+        logger.debug(f"Public chart cache read failed: {e}")
+        return None
+
+
+async def cache_response(key: str, body: str) -> None:
+    """
+    Store a response body.
+
+    Args:
+        key: Key from generate_cache_key
+        body: Serialized JSON body
+    """
+    pool = get_async_redis_pool()
+    if not pool:
+        return
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        pipe = client.pipeline(transaction=False)
+        pipe.setex(key, PUBLIC_CHART_CACHE_TTL_SECONDS, body)
+        pipe.sadd(PUBLIC_CHART_CACHE_KEYS_SET, key)
+        pipe.expire(PUBLIC_CHART_CACHE_KEYS_SET, PUBLIC_CHART_CACHE_TTL_SECONDS)
+        await pipe.execute()
+    except Exception as e:
+        logger.debug(f"Public chart cache write failed: {e}")
+
+
+async def invalidate_public_chart_cache() -> None:
+    """Drop every cached listing response (call after a public chart changes)."""
+    pool = get_async_redis_pool()
+    if not pool:
+        return
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        keys = await client.smembers(PUBLIC_CHART_CACHE_KEYS_SET)
+        await client.delete(PUBLIC_CHART_CACHE_KEYS_SET, *keys)
+        logger.debug(f"Invalidated {len(keys)} cached public chart listings")
+    except Exception as e:
+        logger.warning(f"Public chart cache invalidation failed: {e}")
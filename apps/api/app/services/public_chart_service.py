@@ -8,8 +8,10 @@ from uuid import UUID
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.calculation_executor import get_calculation_executor
 from app.models.public_chart import PublicChart
 from app.repositories.public_chart_repository import PublicChartRepository
+from app.repositories.public_interpretation_repository import PublicInterpretationRepository
 from app.schemas.public_chart import (
     PublicChartCreate,
     PublicChartDetail,
@@ -17,7 +19,17 @@ from app.schemas.public_chart import (
     PublicChartPreview,
     PublicChartUpdate,
 )
-from app.services.astro_service import calculate_birth_chart
+from app.services.chart_cache_service import get_or_calculate_birth_chart
+from app.services.interpretation_service_rag import (
+    RAG_MODEL_ID,
+    RAG_PROMPT_VERSION,
+    InterpretationServiceRAG,
+)
+from app.services.public_chart_cache import invalidate_public_chart_cache
+from app.utils.chart_data_accessor import extract_language_data
+
+# Language of chart_data calculated by this service (calculate_birth_chart default)
+PUBLIC_CHART_LANGUAGE = "pt-BR"
 
 
 def generate_slug(name: str) -> str:
@@ -66,14 +78,18 @@ class PublicChartService:
         if await self.repository.slug_exists(data.slug):
             raise ValueError(f"Slug '{data.slug}' already exists")
 
-        # Calculate chart data
-        chart_data = calculate_birth_chart(
+        # Calculate chart data (off the event loop, served from the chart result cache
+        # when this birth data was calculated before)
+        chart_data_by_lang = await get_or_calculate_birth_chart(
             birth_datetime=data.birth_datetime,
             timezone=data.birth_timezone,
             latitude=data.latitude,
             longitude=data.longitude,
             house_system=data.house_system,
+            languages=[PUBLIC_CHART_LANGUAGE],
+            executor=get_calculation_executor(),
         )
+        chart_data = chart_data_by_lang[PUBLIC_CHART_LANGUAGE]
 
         # Create chart
         chart = PublicChart(
@@ -106,6 +122,7 @@ class PublicChartService:
         )
 
         created_chart = await self.repository.create(chart)
+        await invalidate_public_chart_cache()
         logger.info(f"Created public chart: {created_chart.full_name} ({created_chart.slug})")
         return created_chart
 
@@ -238,18 +255,21 @@ class PublicChartService:
 
         # Recalculate chart data if needed
         if needs_recalculation:
-            chart_data = calculate_birth_chart(
+            chart_data_by_lang = await get_or_calculate_birth_chart(
                 birth_datetime=chart.birth_datetime,
                 timezone=chart.birth_timezone,
                 latitude=float(chart.latitude),
                 longitude=float(chart.longitude),
                 house_system=chart.house_system,
+                languages=[PUBLIC_CHART_LANGUAGE],
+                executor=get_calculation_executor(),
             )
-            chart.chart_data = chart_data
+            chart.chart_data = chart_data_by_lang[PUBLIC_CHART_LANGUAGE]
             logger.info(f"Recalculated chart data for: {chart.full_name}")
 
         await self.db.commit()
         await self.db.refresh(chart)
+        await invalidate_public_chart_cache()
 
         logger.info(f"Updated public chart: {chart.full_name} ({chart.slug})")
         return chart
@@ -269,9 +289,84 @@ class PublicChartService:
             return False
 
         await self.repository.delete(chart)
+        await invalidate_public_chart_cache()
         logger.info(f"Deleted public chart: {chart.full_name} ({chart.slug})")
         return True
 
+    async def generate_interpretations(
+        self,
+        chart: PublicChart,
+        language: str,
+    ) -> dict[str, dict[str, str]]:
+        """
+        Generate and save the RAG interpretations of a public chart in one language.
+
+        Cached subjects are resolved in one batch and the misses are generated
+        concurrently (see InterpretationServiceRAG.generate_subjects). All
+        interpretations are then written with one bulk upsert and committed.
+
+        Args:
+            chart: Public chart with chart_data
+            language: Language code ('pt-BR', 'en-US')
+
+        Returns:
+            Interpretations grouped by category ("planets", "houses", "aspects",
+            "arabic_parts") and keyed by subject
+        """
+        results: dict[str, dict[str, str]] = {
+            "planets": {},
+            "houses": {},
+            "aspects": {},
+            "arabic_parts": {},
+        }
+
+        rag_service = InterpretationServiceRAG(
+            self.db, use_cache=True, use_rag=True, language=language
+        )
+        chart_data = extract_language_data(chart.chart_data or {}, language)
+        subjects = rag_service.collect_subjects(
+            planets=chart_data.get("planets", []),
+            houses=chart_data.get("houses", []),
+            aspects=chart_data.get("aspects", []),
+            arabic_parts=chart_data.get("arabic_parts", {}),
+            sect=chart_data.get("sect", "diurnal"),
+            use_ruler_dignities=True,
+        )
+
+        cached = await rag_service.get_cached_subjects(subjects)
+        missing = [s for s in subjects if (s.category, s.key) not in cached]
+        await rag_service.prefetch_embeddings(missing)
+        generated = await rag_service.generate_subjects(missing)
+
+        rows = []
+        for subject in subjects:
+            content = cached.get((subject.category, subject.key)) or generated.get(
+                (subject.category, subject.key)
+            )
+            if not content:
+                continue
+            results[subject.category][subject.key] = content
+            rows.append(
+                {
+                    "chart_id": chart.id,
+                    "interpretation_type": subject.interpretation_type,
+                    "subject": subject.key,
+                    "content": content,
+                    "language": language,
+                    "openai_model": RAG_MODEL_ID,
+                    "prompt_version": RAG_PROMPT_VERSION,
+                }
+            )
+
+        await PublicInterpretationRepository(self.db).bulk_upsert(rows)
+        await self.db.commit()
+
+        logger.info(
+            f"Saved {len(rows)}/{len(subjects)} interpretations for public chart "
+            f"{chart.slug} ({language}, {len(missing)} generated)"
+        )
+        return results
+
     async def list_charts_admin(
         self,
         page: int = 1,
@@ -1,52 +1,162 @@
-"""BM25 service for sparse keyword search."""
-
+"""
+BM25 service for sparse keyword search.
+
+The index is an inverted index held in NumPy arrays:
+
+- ``vocabulary`` maps each term to a term id; ``_df`` holds the number of
+  live documents containing each term
+- Postings are stored in CSR form: the postings of term ``t`` are
+  ``_post_docs[_offsets[t]:_offsets[t + 1]]`` with term frequencies in
+  ``_post_tfs``
+- Postings of documents added since the last merge are buffered per term and
+  merged into the arrays once they outgrow the merged postings, so ingesting
+  N documents costs O(N) overall instead of one full rebuild per document
+- Removed documents are tombstoned (their statistics are subtracted at once)
+  and dropped from the arrays by a compaction once they exceed
+  COMPACTION_TOMBSTONE_RATIO of the index
+
+Queries only touch the postings of their terms and select the top results
+with ``np.argpartition``. Scores follow BM25 Okapi (negative IDFs are
+floored at ``epsilon`` times the average IDF).
+
+Persistence: ``save`` writes the compacted index (``.npy`` arrays plus a JSON
+file with the vocabulary, document IDs and previews) to a new directory under
+settings.RAG_BM25_INDEX_DIR and atomically points the ``CURRENT`` file at it.
+Every process loads the current index with the arrays memory-mapped
+read-only, so workers share the pages and start without rebuilding. Searches
+pick up a newer index at most every INDEX_REFRESH_SECONDS; a process copies
+the arrays into memory only when it modifies the index.
+
+Writers in several processes share the directory: ``persist`` holds an
+exclusive ``flock`` on ``CURRENT.lock`` while it loads the newest index,
+replays this process's unsaved changes onto it and saves the result, so no
+writer drops documents saved by another.
+"""
+
+import fcntl
+import json
+import os
 import re
+import shutil
+import time
 from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
 from typing import Any
+from uuid import uuid4
 
 import numpy as np
 from loguru import logger
-from rank_bm25 import BM25Okapi  # type: ignore[import-untyped]
 
+from app.core.config import settings
 
-class BM25Service:
-    """
-    Service for BM25 sparse keyword search.
+# Fraction of tombstoned documents that triggers a compaction
+COMPACTION_TOMBSTONE_RATIO = 0.25
+
+# Buffered postings are merged once they exceed this count and the merged postings
+MIN_MERGE_POSTINGS = 4096
+
+# Number of leading tokens kept per document for result previews
+PREVIEW_TOKENS = 10
 
-    Memory Considerations:
-        This implementation stores the entire tokenized corpus in memory. For large
-        corpora (>100k documents), memory usage can become significant. Consider:
+# On-disk index layout
+INDEX_FORMAT_VERSION = 1
+CURRENT_INDEX_FILE = "CURRENT"
+INDEX_LOCK_FILE = "CURRENT.lock"
+INDEX_ARRAYS = ("offsets", "postings_docs", "postings_tfs", "doc_lengths", "document_frequencies")
 
-        1. For corpora >100k docs: Use a database-backed BM25 implementation or
-           disk-based index (e.g., Whoosh, Elasticsearch).
+# How often a process checks for a newer persisted index
+INDEX_REFRESH_SECONDS = 5.0
 
-        2. For corpora >1M docs: Consider using approximate methods like:
-           - SPLADE (learned sparse representations)
-           - BM25 with inverted index sharding
-           - Hybrid approaches with vector-only retrieval
 
-        3. For incremental updates: The current implementation rebuilds the index
-           on each add/remove operation. For frequent updates, consider batching
-           changes and rebuilding periodically, or using a streaming BM25 variant.
+def _grow(array: np.ndarray, size: int) -> np.ndarray:
+    """Return ``array`` with capacity for at least ``size`` entries (doubling)."""
+    if size <= len(array):
+        return array
+    grown = np.zeros(max(size, 2 * len(array), 16), dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
+
+
+class BM25Service:
+    """
+    Service for BM25 sparse keyword search.
 
-        Current implementation is optimized for corpora <50k documents with
-        infrequent updates, which is typical for astrological knowledge bases.
+    Documents are addressed by their external document ID; internally each
+    document gets a slot in the per-document arrays. Memory use is dominated
+    by the postings (one entry per distinct term per document) and a forward
+    index of the same size used for deletes and compaction.
     """
 
-    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        epsilon: float = 0.25,
+        index_dir: str | Path | None = None,
+    ) -> None:
         """
         Initialize BM25 service.
 
         Args:
             k1: Term frequency saturation parameter
             b: Length normalization parameter
+            epsilon: Floor for negative IDFs, as a fraction of the average IDF
+            index_dir: Directory of the persisted index (None: memory only)
         """
         self.k1 = k1
         self.b = b
-        self.corpus: list[list[str]] = []
-        self.document_ids: list[str] = []
-        self.bm25: BM25Okapi | None = None
+        self.epsilon = epsilon
         self.stopwords = self._get_stopwords()
+        self.index_dir = Path(index_dir) if index_dir else None
+        self._loaded_version: str | None = None  # Persisted index this state matches
+        self._dirty = False  # Modified since the last load/save
+        # Changes since the last load/save, replayed onto a newer persisted index:
+        # (document ID, tokens) adds, (document ID, None) removes, (None, None) resets
+        self._journal: list[tuple[str | None, list[str] | None]] = []
+        self._checked_at = 0.0
+        self._reset()
+
+    def _reset(self) -> None:
+        """Empty the index."""
+        self.vocabulary: dict[str, int] = {}
+        self._df = np.zeros(0, dtype=np.int64)
+
+        # Merged postings (CSR by term id)
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._post_docs = np.zeros(0, dtype=np.int64)
+        self._post_tfs = np.zeros(0, dtype=np.int64)
+
+        # Postings added since the last merge: term id -> (doc slots, term frequencies)
+        self._pending: dict[int, tuple[list[int], list[int]]] = {}
+        self._pending_postings = 0
+
+        # Per-document slots; tombstoned slots have _alive False
+        self._slot_ids: list[str] = []
+        self._slot_terms: list[np.ndarray] = []  # Forward index: term ids
+        self._slot_tfs: list[np.ndarray] = []  # Forward index: term frequencies
+        self._previews: list[list[str]] = []
+        self._doc_len = np.zeros(0, dtype=np.int64)
+        self._alive = np.zeros(0, dtype=bool)
+        self._slots_by_id: dict[str, int] = {}
+
+        self._total_length = 0
+        self._tombstones = 0
+        self._idf: np.ndarray | None = None
+
+        # Arrays are read-only memory maps of a persisted index (no forward index)
+        self._mapped = False
+
+    @property
+    def num_documents(self) -> int:
+        """Number of (live) documents in the index."""
+        return len(self._slots_by_id)
+
+    @property
+    def document_ids(self) -> list[str]:
+        """IDs of the indexed documents, in insertion order."""
+        return [doc_id for slot, doc_id in enumerate(self._slot_ids) if self._alive[slot]]
 
     def _get_stopwords(self) -> set[str]:
         """Get common English, Portuguese and astrological stopwords."""
@@ -411,7 +521,7 @@ class BM25Service:
         document_ids: list[str],
     ) -> None:
         """
-        Build BM25 index from documents.
+        Build BM25 index from documents (replaces the current index).
 
         Args:
             documents: List of document texts
@@ -420,19 +530,196 @@ class BM25Service:
         if len(documents) != len(document_ids):
             raise ValueError("Documents and IDs must have same length")
 
-        # Tokenize all documents
-        self.corpus = [self.tokenize(doc) for doc in documents]
-        self.document_ids = document_ids
-
-        # Build BM25 index
-        self.bm25 = BM25Okapi(
-            self.corpus,
-            k1=self.k1,
-            b=self.b,
-        )
+        self._reset()
+        self._journal = [(None, None)]
+        for document, document_id in zip(documents, document_ids, strict=True):
+            tokens = self.tokenize(document)
+            self._add(tokens, document_id)
+            self._journal.append((document_id, tokens))
+        self._merge_postings()
+        self._dirty = True
 
         logger.info(f"Built BM25 index with {len(documents)} documents")
 
+    def _add(self, tokens: list[str], document_id: str) -> None:
+        """Add one tokenized document (replacing a document with the same ID)."""
+        self._materialize()
+        self._dirty = True
+        if document_id in self._slots_by_id:
+            self._remove(document_id)
+
+        counts = Counter(tokens)
+        term_ids = np.empty(len(counts), dtype=np.int64)
+        for i, term in enumerate(counts):
+            term_id = self.vocabulary.get(term)
+            if term_id is None:
+                term_id = self.vocabulary[term] = len(self.vocabulary)
+            term_ids[i] = term_id
+        tfs = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+
+        slot = len(self._slot_ids)
+        self._slot_ids.append(document_id)
+        self._slot_terms.append(term_ids)
+        self._slot_tfs.append(tfs)
+        self._previews.append(tokens[:PREVIEW_TOKENS])
+        self._doc_len = _grow(self._doc_len, slot + 1)
+        self._doc_len[slot] = len(tokens)
+        self._alive = _grow(self._alive, slot + 1)
+        self._alive[slot] = True
+        self._slots_by_id[document_id] = slot
+
+        self._df = _grow(self._df, len(self.vocabulary))
+        self._df[term_ids] += 1
+        self._total_length += len(tokens)
+        self._idf = None
+
+        for term_id, tf in zip(term_ids.tolist(), tfs.tolist(), strict=True):
+            docs, term_tfs = self._pending.setdefault(term_id, ([], []))
+            docs.append(slot)
+            term_tfs.append(tf)
+        self._pending_postings += len(term_ids)
+
+    def _remove(self, document_id: str) -> None:
+        """Tombstone a document and subtract it from the statistics."""
+        self._materialize()
+        self._dirty = True
+        slot = self._slots_by_id.pop(document_id)
+        self._alive[slot] = False
+        self._df[self._slot_terms[slot]] -= 1
+        self._total_length -= int(self._doc_len[slot])
+        self._tombstones += 1
+        self._idf = None
+
+    def _merge_postings(self) -> None:
+        """
+        Rebuild the CSR postings from the forward index of the live documents.
+
+        Drops tombstoned slots (renumbering the remaining ones) and empties the
+        pending buffer.
+        """
+        if self._tombstones:
+            live = np.flatnonzero(self._alive[: len(self._slot_ids)]).tolist()
+            self._slot_ids = [self._slot_ids[slot] for slot in live]
+            self._slot_terms = [self._slot_terms[slot] for slot in live]
+            self._slot_tfs = [self._slot_tfs[slot] for slot in live]
+            self._previews = [self._previews[slot] for slot in live]
+            self._doc_len = self._doc_len[live]
+            self._alive = np.ones(len(live), dtype=bool)
+            self._slots_by_id = {doc_id: slot for slot, doc_id in enumerate(self._slot_ids)}
+            self._tombstones = 0
+
+        num_terms = len(self.vocabulary)
+        if self._slot_terms:
+            terms = np.concatenate(self._slot_terms)
+            tfs = np.concatenate(self._slot_tfs)
+            docs = np.repeat(np.arange(len(self._slot_terms)), [len(t) for t in self._slot_terms])
+            order = np.argsort(terms, kind="stable")  # Keeps each posting list sorted by doc
+            self._post_docs = docs[order]
+            self._post_tfs = tfs[order]
+            self._offsets = np.concatenate(
+                ([0], np.cumsum(np.bincount(terms, minlength=num_terms)))
+            )
+        else:
+            self._post_docs = np.zeros(0, dtype=np.int64)
+            self._post_tfs = np.zeros(0, dtype=np.int64)
+            self._offsets = np.zeros(num_terms + 1, dtype=np.int64)
+
+        self._pending = {}
+        self._pending_postings = 0
+
+    def _materialize(self) -> None:
+        """Copy memory-mapped arrays into memory and rebuild the forward index."""
+        if not self._mapped:
+            return
+
+        self._offsets = np.array(self._offsets)
+        self._post_docs = np.array(self._post_docs)
+        self._post_tfs = np.array(self._post_tfs)
+        self._doc_len = np.array(self._doc_len)
+        self._df = np.array(self._df)
+
+        # Forward index: transpose the postings (sorted by term) to doc order
+        terms = np.repeat(np.arange(len(self._offsets) - 1), np.diff(self._offsets))
+        order = np.argsort(self._post_docs, kind="stable")
+        splits = np.cumsum(np.bincount(self._post_docs, minlength=len(self._slot_ids)))[:-1]
+        if self._slot_ids:
+            self._slot_terms = np.split(terms[order], splits)
+            self._slot_tfs = np.split(self._post_tfs[order], splits)
+        self._mapped = False
+
+    def _maintain(self) -> None:
+        """Merge buffered postings or compact tombstones when they have grown enough."""
+        slots = len(self._slot_ids)
+        if self._tombstones and self._tombstones > COMPACTION_TOMBSTONE_RATIO * slots:
+            self._merge_postings()
+        elif self._pending_postings > max(MIN_MERGE_POSTINGS, len(self._post_docs)):
+            self._merge_postings()
+
+    def _postings(self, term_id: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return (doc slots, term frequencies) of a term, merged and pending."""
+        if term_id + 1 < len(self._offsets):
+            start, end = self._offsets[term_id], self._offsets[term_id + 1]
+            docs, tfs = self._post_docs[start:end], self._post_tfs[start:end]
+        else:
+            docs, tfs = self._post_docs[:0], self._post_tfs[:0]
+
+        pending = self._pending.get(term_id)
+        if pending:
+            docs = np.concatenate((docs, pending[0]))
+            tfs = np.concatenate((tfs, pending[1]))
+        return docs, tfs
+
+    def _get_idf(self) -> np.ndarray:
+        """IDF of every term (0 for terms no live document contains)."""
+        if self._idf is None:
+            n = self.num_documents
+            df = self._df[: len(self.vocabulary)]
+            present = df > 0
+            idf = np.zeros(len(df))
+            idf[present] = np.log(n - df[present] + 0.5) - np.log(df[present] + 0.5)
+            if present.any():
+                eps = self.epsilon * idf[present].mean()
+                idf[present & (idf < 0)] = eps
+            self._idf = idf
+        return self._idf
+
+    def _score(self, query_tokens: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Score the live documents that contain at least one query term.
+
+        Returns:
+            Tuple of (doc slots, scores)
+        """
+        if not self.num_documents:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+
+        idf = self._get_idf()
+        avgdl = self._total_length / self.num_documents
+        doc_parts: list[np.ndarray] = []
+        score_parts: list[np.ndarray] = []
+
+        for term, count in Counter(query_tokens).items():
+            term_id = self.vocabulary.get(term)
+            if term_id is None:
+                continue
+            docs, tfs = self._postings(term_id)
+            keep = self._alive[docs]
+            docs, tfs = docs[keep], tfs[keep]
+            if not len(docs):
+                continue
+
+            doc_len = self._doc_len[docs]
+            denominator = tfs + self.k1 * (1 - self.b + self.b * doc_len / avgdl)
+            doc_parts.append(docs)
+            score_parts.append(count * idf[term_id] * (tfs * (self.k1 + 1) / denominator))
+
+        if not doc_parts:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+
+        docs, inverse = np.unique(np.concatenate(doc_parts), return_inverse=True)
+        scores = np.bincount(inverse, weights=np.concatenate(score_parts))
+        return docs, scores
+
     def search(
         self,
         query: str,
@@ -442,6 +729,8 @@ class BM25Service:
         """
         Search documents using BM25.
 
+        Only documents containing at least one query term are candidates.
+
         Args:
             query: Search query
             limit: Maximum number of results
@@ -450,7 +739,8 @@ class BM25Service:
         Returns:
             List of search results with scores
         """
-        if not self.bm25 or not self.corpus:
+        self.refresh()
+        if not self.num_documents:
             logger.warning("BM25 index not built, returning empty results")
             return []
 
@@ -460,54 +750,43 @@ class BM25Service:
             logger.warning("Empty query after tokenization")
             return []
 
-        # Get BM25 scores
-        scores = self.bm25.get_scores(query_tokens)
-
-        # Get top results
-        ranked_indices = np.argsort(scores)[::-1][:limit]
-
-        # Filter by minimum score and format results
-        results = []
-        for idx in ranked_indices:
-            score = float(scores[idx])
-            if score >= min_score:
-                results.append(
-                    {
-                        "document_id": self.document_ids[idx],
-                        "score": score,
-                        "tokens": self.corpus[idx][:10],  # First 10 tokens for preview
-                    }
-                )
+        docs, scores = self._score(query_tokens)
+        keep = scores >= min_score
+        docs, scores = docs[keep], scores[keep]
+
+        # Top results: partial selection, then sort only the selected ones
+        if limit <= 0:
+            return []
+        if len(scores) > limit:
+            top = np.argpartition(-scores, limit - 1)[:limit]
+            docs, scores = docs[top], scores[top]
+        order = np.lexsort((docs, -scores))
+
+        results = [
+            {
+                "document_id": self._slot_ids[slot],
+                "score": float(score),
+                "tokens": self._previews[slot],  # First tokens for preview
+            }
+            for slot, score in zip(docs[order].tolist(), scores[order].tolist(), strict=True)
+        ]
 
         logger.debug(f"BM25 search found {len(results)} results for query: {query}")
         return results
 
     def add_document(self, document: str, document_id: str) -> None:
         """
-        Add a single document to existing index.
+        Add a single document to the index (replaces a document with the same ID).
 
         Args:
             document: Document text
             document_id: Document ID
         """
-        if not self.bm25:
-            # Initialize with single document if index doesn't exist
-            self.build_index([document], [document_id])
-            return
-
-        # Tokenize new document
+        self.refresh(force=True)
         tokens = self.tokenize(document)
-
-        # Add to corpus
-        self.corpus.append(tokens)
-        self.document_ids.append(document_id)
-
-        # Rebuild BM25 (required as BM25Okapi doesn't support incremental updates)
-        self.bm25 = BM25Okapi(
-            self.corpus,
-            k1=self.k1,
-            b=self.b,
-        )
+        self._add(tokens, document_id)
+        self._journal.append((document_id, tokens))
+        self._maintain()
 
         logger.debug(f"Added document {document_id} to BM25 index")
 
@@ -517,7 +796,7 @@ class BM25Service:
         document_ids: list[str],
     ) -> None:
         """
-        Add multiple documents efficiently (rebuilds index once).
+        Add multiple documents to the index.
 
         Args:
             documents: List of document texts
@@ -529,23 +808,12 @@ class BM25Service:
         if not documents:
             return
 
-        if not self.bm25:
-            # Initialize with all documents if index doesn't exist
-            self.build_index(documents, document_ids)
-            return
-
-        # Tokenize all new documents
-        for doc, doc_id in zip(documents, document_ids, strict=True):
-            tokens = self.tokenize(doc)
-            self.corpus.append(tokens)
-            self.document_ids.append(doc_id)
-
-        # Rebuild BM25 once after all additions
-        self.bm25 = BM25Okapi(
-            self.corpus,
-            k1=self.k1,
-            b=self.b,
-        )
+        self.refresh(force=True)
+        for document, document_id in zip(documents, document_ids, strict=True):
+            tokens = self.tokenize(document)
+            self._add(tokens, document_id)
+            self._journal.append((document_id, tokens))
+        self._maintain()
 
         logger.info(f"Added {len(documents)} documents to BM25 index in batch")
 
@@ -559,25 +827,13 @@ class BM25Service:
         Returns:
             True if document was found and removed
         """
-        if document_id not in self.document_ids:
+        self.refresh(force=True)
+        if document_id not in self._slots_by_id:
             return False
 
-        # Find index
-        idx = self.document_ids.index(document_id)
-
-        # Remove from corpus and IDs
-        del self.corpus[idx]
-        del self.document_ids[idx]
-
-        # Rebuild BM25 if documents remain
-        if self.corpus:
-            self.bm25 = BM25Okapi(
-                self.corpus,
-                k1=self.k1,
-                b=self.b,
-            )
-        else:
-            self.bm25 = None
+        self._remove(document_id)
+        self._journal.append((document_id, None))
+        self._maintain()
 
         logger.debug(f"Removed document {document_id} from BM25 index")
         return True
@@ -607,16 +863,10 @@ class BM25Service:
             BM25 score
         """
         # Build temporary index with single document
-        temp_bm25 = BM25Okapi(
-            [self.tokenize(document)],
-            k1=self.k1,
-            b=self.b,
-        )
-
-        # Calculate score
-        query_tokens = self.tokenize(query)
-        scores = temp_bm25.get_scores(query_tokens)
+        temp_index = BM25Service(k1=self.k1, b=self.b, epsilon=self.epsilon)
+        temp_index.add_document(document, "document")
 
+        _, scores = temp_index._score(self.tokenize(query))
         return float(scores[0]) if scores.size > 0 else 0.0
 
     def get_index_stats(self) -> dict[str, Any]:
@@ -626,7 +876,7 @@ class BM25Service:
         Returns:
             Dictionary with index statistics
         """
-        if not self.corpus:
+        if not self.num_documents:
             return {
                 "num_documents": 0,
                 "avg_doc_length": 0,
@@ -634,20 +884,208 @@ class BM25Service:
                 "unique_terms": 0,
             }
 
-        # Calculate statistics
-        doc_lengths = [len(doc) for doc in self.corpus]
-        all_terms = [term for doc in self.corpus for term in doc]
-        unique_terms = set(all_terms)
-
         return {
-            "num_documents": len(self.corpus),
-            "avg_doc_length": np.mean(doc_lengths) if doc_lengths else 0,
-            "total_terms": len(all_terms),
-            "unique_terms": len(unique_terms),
+            "num_documents": self.num_documents,
+            "avg_doc_length": self._total_length / self.num_documents,
+            "total_terms": self._total_length,
+            "unique_terms": int(np.count_nonzero(self._df[: len(self.vocabulary)])),
+            "postings": len(self._post_docs) + self._pending_postings,
+            "tombstones": self._tombstones,
+            "persisted_version": self._loaded_version,
+            "memory_mapped": self._mapped,
             "k1": self.k1,
             "b": self.b,
         }
 
+    def save(self, directory: str | Path) -> str:
+        """
+        Write the index to a new version directory and make it current.
+
+        Args:
+            directory: Index root directory
+
+        Returns:
+            Name of the written version
+        """
+        self._materialize()
+        self._merge_postings()
+
+        root = Path(directory)
+        root.mkdir(parents=True, exist_ok=True)
+        current_file = root / CURRENT_INDEX_FILE
+        previous = current_file.read_text().strip() if current_file.exists() else None
+
+        version = f"index-{uuid4().hex}"
+        staging = root / f".{version}"
+        staging.mkdir()
+        arrays = {
+            "offsets": self._offsets,
+            "postings_docs": self._post_docs,
+            "postings_tfs": self._post_tfs,
+            "doc_lengths": self._doc_len[: len(self._slot_ids)],
+            "document_frequencies": self._df[: len(self.vocabulary)],
+        }
+        for name in INDEX_ARRAYS:
+            np.save(staging / f"{name}.npy", arrays[name])
+        meta = {
+            "format": INDEX_FORMAT_VERSION,
+            "vocabulary": list(self.vocabulary),
+            "document_ids": self._slot_ids,
+            "previews": self._previews,
+        }
+        (staging / "meta.json").write_text(json.dumps(meta, ensure_ascii=False))
+        staging.rename(root / version)
+
+        # Atomically switch readers to the new version
+        pointer = root / f".{CURRENT_INDEX_FILE}.{version}"
+        pointer.write_text(version)
+        os.replace(pointer, current_file)
+
+        # Keep the previous version for readers that are still switching
+        for path in root.glob("index-*"):
+            if path.name not in (version, previous):
+                shutil.rmtree(path, ignore_errors=True)
+
+        self._loaded_version = version
+        self._dirty = False
+        self._journal = []
+        logger.info(f"Saved BM25 index {version} ({self.num_documents} documents)")
+        return version
+
+    def load(self, directory: str | Path) -> bool:
+        """
+        Load the current persisted index, memory-mapping its arrays.
+
+        Args:
+            directory: Index root directory
+
+        Returns:
+            True if an index was loaded
+        """
+        root = Path(directory)
+        try:
+            version = (root / CURRENT_INDEX_FILE).read_text().strip()
+        except FileNotFoundError:
+            return False
+
+        path = root / version
+        meta = json.loads((path / "meta.json").read_text())
+        if meta.get("format") != INDEX_FORMAT_VERSION:
+            logger.warning(f"Ignoring BM25 index {version} with format {meta.get('format')}")
+            return False
+
+        arrays = {name: _load_array(path / f"{name}.npy") for name in INDEX_ARRAYS}
+
+        self._reset()
+        self.vocabulary = {term: term_id for term_id, term in enumerate(meta["vocabulary"])}
+        self._offsets = arrays["offsets"]
+        self._post_docs = arrays["postings_docs"]
+        self._post_tfs = arrays["postings_tfs"]
+        self._doc_len = arrays["doc_lengths"]
+        self._df = arrays["document_frequencies"]
+        self._slot_ids = meta["document_ids"]
+        self._previews = meta["previews"]
+        self._alive = np.ones(len(self._slot_ids), dtype=bool)
+        self._slots_by_id = {doc_id: slot for slot, doc_id in enumerate(self._slot_ids)}
+        self._total_length = int(self._doc_len.sum())
+        self._mapped = True
+
+        self._loaded_version = version
+        self._dirty = False
+        self._journal = []
+        logger.info(f"Loaded BM25 index {version} ({self.num_documents} documents)")
+        return True
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Load a newer persisted index, if any.
+
+        Unsaved local changes are never replaced. Without ``force`` the index
+        directory is checked at most every INDEX_REFRESH_SECONDS.
+
+        Returns:
+            True if a newer index was loaded
+        """
+        if self.index_dir is None or self._dirty:
+            return False
+
+        now = time.monotonic()
+        if not force and now - self._checked_at < INDEX_REFRESH_SECONDS:
+            return False
+        self._checked_at = now
+
+        try:
+            version = (self.index_dir / CURRENT_INDEX_FILE).read_text().strip()
+            if version == self._loaded_version:
+                return False
+            return self.load(self.index_dir)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"Failed to load BM25 index: {e}")
+            return False
+
+    def persist(self) -> None:
+        """
+        Save local changes to the index directory (no-op without changes).
+
+        Runs under the directory's write lock. If another process saved a
+        newer index since this one was loaded, the local changes are replayed
+        onto it before saving. On failure the changes are kept and replayed
+        onto the newest index by the next persist.
+        """
+        if self.index_dir is None or not self._dirty:
+            return
+        journal = self._journal
+        try:
+            with self._write_lock(self.index_dir):
+                current_file = self.index_dir / CURRENT_INDEX_FILE
+                current = current_file.read_text().strip() if current_file.exists() else None
+                if current is not None and current != self._loaded_version:
+                    self.load(self.index_dir)
+                    self._replay(journal)
+                self.save(self.index_dir)
+        except Exception as e:
+            logger.error(f"Failed to save BM25 index: {e}")
+            # The in-memory state may be partly rebased; rebuild it on the next persist
+            self._journal = journal
+            self._loaded_version = None
+            self._dirty = True
+
+    def _replay(self, journal: list[tuple[str | None, list[str] | None]]) -> None:
+        """Apply journaled changes to the loaded index."""
+        for document_id, tokens in journal:
+            if document_id is None:
+                self._reset()
+            elif tokens is None:
+                if document_id in self._slots_by_id:
+                    self._remove(document_id)
+            else:
+                self._add(tokens, document_id)
+        self._journal = journal
+        self._dirty = True
+        self._maintain()
+
+    @staticmethod
+    @contextmanager
+    def _write_lock(directory: Path) -> Iterator[None]:
+        """Hold an exclusive lock on the index directory (blocks other writers)."""
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / INDEX_LOCK_FILE, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _load_array(path: Path) -> np.ndarray:
+    """Memory-map a saved array read-only (empty arrays cannot be mapped)."""
+    try:
+        return np.load(path, mmap_mode="r")
+    except ValueError:
+        return np.load(path)
+
 
 # Global instance for shared BM25 index
-bm25_service = BM25Service()
+bm25_service = BM25Service(index_dir=settings.RAG_BM25_INDEX_DIR)
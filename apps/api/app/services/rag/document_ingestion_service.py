@@ -1,14 +1,18 @@
 """Document ingestion service for processing and indexing content."""
 
+import asyncio
 import hashlib
+from collections import Counter
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import tiktoken
 from loguru import logger
-from sqlalchemy import delete
+from sqlalchemy import delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
@@ -16,6 +20,51 @@ from app.models.search_index import SearchIndex
 from app.models.vector_document import VectorDocument
 from app.services.rag.bm25_service import bm25_service
 from app.services.rag.qdrant_service import qdrant_service
+from app.services.rag.retrieval_cache import bump_corpus_version
+
+# Embeds a batch of texts (None where an embedding could not be generated)
+EmbedBatchFunc = Callable[[list[str]], Awaitable[list[list[float] | None]]]
+
+
+@dataclass
+class IngestionItem:
+    """One text to ingest (a whole document or a PDF page)."""
+
+    title: str
+    content: str
+    document_type: str
+    metadata: dict[str, Any] = field(default_factory=dict)
+    collection_name: str = "astrology_knowledge"
+
+
+@dataclass
+class IngestionStats:
+    """Counters of a bulk ingestion."""
+
+    items: int = 0
+    chunks: int = 0  # Chunks saved to the database
+    indexed: int = 0  # Saved chunks with a vector in Qdrant
+    failed: int = 0  # Chunks in batches that could not be saved
+
+
+@dataclass
+class _Chunk:
+    """A chunk on its way through the ingestion pipeline."""
+
+    row: dict[str, Any]  # VectorDocument column values
+    tokens: list[str]  # BM25 tokens
+
+
+async def _iterate(
+    items: Iterable[IngestionItem] | AsyncIterable[IngestionItem],
+) -> AsyncIterator[IngestionItem]:
+    """Iterate sync and async item sources alike."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
 
 
 class DocumentIngestionService:
@@ -110,6 +159,7 @@ class DocumentIngestionService:
         metadata: dict[str, Any] | None = None,
         collection_name: str = "astrology_knowledge",
         get_embeddings_func: Any | None = None,
+        persist_index: bool = True,
     ) -> list[VectorDocument]:
         """
         Ingest text document into the RAG system.
@@ -122,6 +172,8 @@ class DocumentIngestionService:
             metadata: Optional metadata
             collection_name: Qdrant collection name
             get_embeddings_func: Function to generate embeddings
+            persist_index: Save the BM25 index afterwards (False when the
+                caller ingests several documents and persists once)
 
         Returns:
             List of created VectorDocument objects
@@ -208,6 +260,8 @@ class DocumentIngestionService:
 
             # Commit all documents
             await db.commit()
+            if persist_index:
+                self.bm25.persist()
 
             logger.info(f"Successfully ingested {len(documents)} chunks for '{title}'")
             return documents
@@ -217,6 +271,10 @@ class DocumentIngestionService:
             await db.rollback()
             raise
 
+        finally:
+            # Indexes may have changed even if the transaction failed
+            await bump_corpus_version()
+
     async def ingest_pdf(
         self,
         db: AsyncSession,
@@ -237,56 +295,258 @@ class DocumentIngestionService:
             List of created VectorDocument objects
         """
         try:
-            # Import PyPDF2 only when needed (no type stubs available)
-            import PyPDF2  # type: ignore[import-not-found]
-
             documents = []
-            metadata = metadata or {}
+            pages = await asyncio.to_thread(self.read_pdf_pages, pdf_path, metadata)
+            logger.info(f"Processing PDF '{pdf_path.name}' with {len(pages)} text pages")
+
+            for page in pages:
+                page_docs = await self.ingest_text(
+                    db=db,
+                    title=page.title,
+                    content=page.content,
+                    document_type=page.document_type,
+                    metadata=page.metadata,
+                    get_embeddings_func=get_embeddings_func,
+                    persist_index=False,
+                )
+                documents.extend(page_docs)
+
+            self.bm25.persist()
+            logger.info(f"Successfully ingested PDF '{pdf_path.name}' ({len(documents)} chunks)")
+            return documents
 
-            # Extract text from PDF
-            with open(pdf_path, "rb") as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                num_pages = len(pdf_reader.pages)
+        except ImportError:
+            logger.error("PyPDF2 not installed. Install with: pip install PyPDF2")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to ingest PDF '{pdf_path}': {e}")
+            raise
 
-                logger.info(f"Processing PDF '{pdf_path.name}' with {num_pages} pages")
+    def read_pdf_pages(
+        self,
+        pdf_path: Path,
+        metadata: dict[str, Any] | None = None,
+    ) -> list[IngestionItem]:
+        """
+        Extract the non-empty pages of a PDF as ingestion items.
 
-                # Process each page
-                for page_num in range(num_pages):
-                    page = pdf_reader.pages[page_num]
-                    page_text = page.extract_text()
+        Blocking (PDF parsing); run it with ``asyncio.to_thread`` from async code.
+
+        Args:
+            pdf_path: Path to PDF file
+            metadata: Optional metadata for every page
 
-                    if not page_text.strip():
-                        continue
+        Returns:
+            One IngestionItem per page with text
+        """
+        # Import PyPDF2 only when needed (no type stubs available)
+        import PyPDF2  # type: ignore[import-not-found]
 
-                    # Add page-specific metadata
-                    page_metadata = {
-                        **metadata,
-                        "source": str(pdf_path),
-                        "page": page_num + 1,
-                        "total_pages": num_pages,
-                    }
-
-                    # Ingest page text
-                    page_docs = await self.ingest_text(
-                        db=db,
+        metadata = metadata or {}
+        items = []
+        with open(pdf_path, "rb") as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            num_pages = len(pdf_reader.pages)
+            for page_num, page in enumerate(pdf_reader.pages):
+                page_text = page.extract_text()
+                if not page_text.strip():
+                    continue
+                items.append(
+                    IngestionItem(
                         title=f"{pdf_path.stem} - Page {page_num + 1}",
                         content=page_text,
                         document_type="pdf",
-                        metadata=page_metadata,
-                        get_embeddings_func=get_embeddings_func,
+                        metadata={
+                            **metadata,
+                            "source": str(pdf_path),
+                            "page": page_num + 1,
+                            "total_pages": num_pages,
+                        },
                     )
+                )
+        return items
 
-                    documents.extend(page_docs)
+    async def ingest_many(
+        self,
+        db: AsyncSession,
+        items: Iterable[IngestionItem] | AsyncIterable[IngestionItem],
+        embed_batch_func: EmbedBatchFunc | None = None,
+        batch_size: int | None = None,
+        concurrency: int | None = None,
+    ) -> IngestionStats:
+        """
+        Ingest many documents through a bounded, batched pipeline.
 
-            logger.info(f"Successfully ingested PDF '{pdf_path.name}' ({len(documents)} chunks)")
-            return documents
+        Stages: chunking (in a worker thread) -> embedding and Qdrant upsert
+        of whole batches, ``concurrency`` batches at a time -> bulk insert of
+        the VectorDocument and SearchIndex rows (a single writer, one commit
+        per batch) -> BM25 index. The queues between stages are bounded, so a
+        slow stage holds back the earlier ones instead of buffering the whole
+        library in memory. A batch that fails to save is rolled back and
+        counted in ``failed``; the other batches are kept.
 
-        except ImportError:
-            logger.error("PyPDF2 not installed. Install with: pip install PyPDF2")
-            raise
+        Args:
+            db: Database session (used only by the writer stage)
+            items: Documents to ingest (a sync or async iterable)
+            embed_batch_func: Function embedding a list of texts in one request
+            batch_size: Chunks per batch (default: settings.RAG_INGEST_BATCH_SIZE)
+            concurrency: Batches embedded concurrently
+                (default: settings.RAG_INGEST_CONCURRENCY)
+
+        Returns:
+            Ingestion counters
+        """
+        batch_size = batch_size or settings.RAG_INGEST_BATCH_SIZE
+        concurrency = concurrency or settings.RAG_INGEST_CONCURRENCY
+        stats = IngestionStats()
+
+        # None marks the end of the stream (one per embedding worker)
+        embed_queue: asyncio.Queue[list[_Chunk] | None] = asyncio.Queue(maxsize=concurrency)
+        write_queue: asyncio.Queue[list[_Chunk] | None] = asyncio.Queue(maxsize=concurrency)
+
+        async def produce() -> None:
+            batch: list[_Chunk] = []
+            async for item in _iterate(items):
+                chunks = await asyncio.to_thread(self._build_chunks, item)
+                stats.items += 1
+                for chunk in chunks:
+                    batch.append(chunk)
+                    if len(batch) == batch_size:
+                        await embed_queue.put(batch)
+                        batch = []
+            if batch:
+                await embed_queue.put(batch)
+            for _ in range(concurrency):
+                await embed_queue.put(None)
+
+        async def embed() -> None:
+            while (batch := await embed_queue.get()) is not None:
+                if embed_batch_func and self.qdrant.enabled:
+                    await self._index_vectors(batch, embed_batch_func)
+                await write_queue.put(batch)
+            await write_queue.put(None)
+
+        async def write() -> None:
+            finished = 0
+            while finished < concurrency:
+                batch = await write_queue.get()
+                if batch is None:
+                    finished += 1
+                elif await self._save_batch(db, batch):
+                    stats.chunks += len(batch)
+                    stats.indexed += sum(1 for chunk in batch if chunk.row["indexed_at"])
+                else:
+                    stats.failed += len(batch)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(produce())
+                for _ in range(concurrency):
+                    group.create_task(embed())
+                group.create_task(write())
+        finally:
+            self.bm25.persist()
+            await bump_corpus_version()
+
+        logger.info(
+            f"Ingested {stats.items} documents: {stats.chunks} chunks saved, "
+            f"{stats.indexed} with vectors, {stats.failed} failed"
+        )
+        return stats
+
+    def _build_chunks(self, item: IngestionItem) -> list[_Chunk]:
+        """Chunk one item into VectorDocument rows (IDs assigned up front)."""
+        texts = self._chunk_text(item.content)
+        chunks = []
+        for i, text in enumerate(texts):
+            metadata = {
+                **item.metadata,
+                "original_title": item.title,
+                "chunk_index": i,
+                "total_chunks": len(texts),
+                "token_count": self._count_tokens(text),
+            }
+            row = {
+                "id": uuid4(),
+                "collection_name": item.collection_name,
+                "document_type": item.document_type,
+                "title": f"{item.title} (chunk {i + 1}/{len(texts)})"
+                if len(texts) > 1
+                else item.title,
+                "content": text,
+                "chunk_index": i,
+                "total_chunks": len(texts),
+                "doc_metadata": metadata,
+                "vector_id": self._generate_document_id(text, metadata),
+                "embedding_model": None,
+                "indexed_at": None,
+            }
+            chunks.append(_Chunk(row=row, tokens=self.bm25.tokenize(text)))
+        return chunks
+
+    async def _index_vectors(self, batch: list[_Chunk], embed_batch_func: EmbedBatchFunc) -> None:
+        """Embed a batch with one request and upsert its vectors to Qdrant at once."""
+        try:
+            vectors = await embed_batch_func([chunk.row["content"] for chunk in batch])
         except Exception as e:
-            logger.error(f"Failed to ingest PDF '{pdf_path}': {e}")
-            raise
+            logger.error(f"Failed to embed {len(batch)} chunks: {e}")
+            return
+
+        embedded = [(chunk, vector) for chunk, vector in zip(batch, vectors, strict=True) if vector]
+        if len(embedded) < len(batch):
+            logger.warning(f"No embedding generated for {len(batch) - len(embedded)} chunks")
+        if not embedded:
+            return
+
+        success = await self.qdrant.upsert_vectors(
+            vectors=[vector for _, vector in embedded],
+            payloads=[
+                {
+                    "document_id": str(chunk.row["id"]),
+                    "title": chunk.row["title"],
+                    "document_type": chunk.row["document_type"],
+                    "content": chunk.row["content"][:500],  # Store first 500 chars for preview
+                    "metadata": chunk.row["doc_metadata"],
+                }
+                for chunk, _ in embedded
+            ],
+            ids=[chunk.row["vector_id"] for chunk, _ in embedded],
+        )
+        if success:
+            indexed_at = datetime.now(UTC)
+            for chunk, _ in embedded:
+                chunk.row["indexed_at"] = indexed_at
+                chunk.row["embedding_model"] = settings.OPENAI_EMBEDDING_MODEL
+
+    async def _save_batch(self, db: AsyncSession, batch: list[_Chunk]) -> bool:
+        """Bulk insert a batch's rows in one transaction, then add it to BM25."""
+        search_rows = []
+        for chunk in batch:
+            term_freqs = dict(Counter(chunk.tokens))
+            search_rows.append(
+                {
+                    "index_name": chunk.row["collection_name"],
+                    "document_id": chunk.row["id"],
+                    "tokens": " ".join(chunk.tokens),
+                    "token_frequencies": term_freqs,
+                    "doc_length": len(term_freqs),
+                }
+            )
+
+        try:
+            await db.execute(insert(VectorDocument), [chunk.row for chunk in batch])
+            await db.execute(insert(SearchIndex), search_rows)
+            await db.commit()
+        except Exception as e:
+            logger.error(f"Failed to save {len(batch)} chunks: {e}")
+            await db.rollback()
+            return False
+
+        self.bm25.add_documents_batch(
+            [chunk.row["content"] for chunk in batch],
+            [chunk.row["vector_id"] for chunk in batch],
+        )
+        return True
 
     async def delete_document(
         self,
@@ -324,6 +584,7 @@ class DocumentIngestionService:
             # Delete document
             await db.delete(doc)
             await db.commit()
+            self.bm25.persist()
 
             logger.info(f"Successfully deleted document {document_id}")
             return True
@@ -333,6 +594,9 @@ class DocumentIngestionService:
             await db.rollback()
             return False
 
+        finally:
+            await bump_corpus_version()
+
     async def update_document(
         self,
         db: AsyncSession,
@@ -396,6 +660,7 @@ class DocumentIngestionService:
             doc.updated_at = datetime.now(UTC)
 
             await db.commit()
+            self.bm25.persist()
 
             logger.info(f"Successfully updated document {document_id}")
             return doc
@@ -405,6 +670,9 @@ class DocumentIngestionService:
             await db.rollback()
             return None
 
+        finally:
+            await bump_corpus_version()
+
     async def get_ingestion_stats(self, db: AsyncSession) -> dict[str, Any]:
         """
         Get statistics about ingested documents.
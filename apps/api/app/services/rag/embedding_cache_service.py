@@ -0,0 +1,218 @@
+"""
+Cache for text embeddings used by RAG retrieval.
+
+Interpretation queries repeat across charts ("Mars in Aries house 1", ...), so
+each embedding is stored by a SHA-256 of (embedding model, normalized text) in
+two tiers:
+
+1. An in-process LRU (bounded number of vectors)
+2. The ``embedding_cache`` table in Postgres (shared by every process)
+
+Texts that miss both tiers are embedded with one embeddings API request per
+batch (up to EMBEDDING_BATCH_SIZE inputs), so a whole chart's queries cost a
+single request instead of one per query. Failures of the Postgres tier are
+logged and ignored (the embedding is requested from the API as usual).
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import get_session_lock
+from app.models.embedding_cache import EmbeddingCache
+
+# Maximum number of vectors kept in process memory (~12 KB each at 1536 dims)
+EMBEDDING_CACHE_MAX_ENTRIES = 4096
+
+# Maximum number of inputs per embeddings API request
+EMBEDDING_BATCH_SIZE = 256
+
+# In-process LRU tier: key -> embedding vector
+_local_cache: OrderedDict[str, list[float]] = OrderedDict()
+_local_lock = threading.Lock()
+
+
+def normalize_embedding_text(text: str) -> str:
+    """Collapse whitespace so trivially different queries share an embedding."""
+    return " ".join(text.split())
+
+
+def generate_embedding_cache_key(model: str, text: str) -> str:
+    """
+    Generate the cache key of one embedding.
+
+    Args:
+        model: Embedding model name
+        text: Text to embed (normalized before hashing)
+
+    Returns:
+        SHA-256 hex digest
+    """
+    key_string = json.dumps(
+        {"model": model, "text": normalize_embedding_text(text)}, ensure_ascii=False
+    )
+    return hashlib.sha256(key_string.encode()).hexdigest()
+
+
+def _local_get(key: str) -> list[float] | None:
+    with _local_lock:
+        value = _local_cache.get(key)
+        if value is not None:
+            _local_cache.move_to_end(key)
+        return value
+
+
+def _local_set(key: str, value: list[float]) -> None:
+    with _local_lock:
+        _local_cache[key] = value
+        _local_cache.move_to_end(key)
+        while len(_local_cache) > EMBEDDING_CACHE_MAX_ENTRIES:
+            _local_cache.popitem(last=False)
+
+
+def clear_local_embeddings() -> None:
+    """Drop the in-process tier (Postgres entries are kept)."""
+    with _local_lock:
+        _local_cache.clear()
+
+
+class EmbeddingCacheService:
+    """Embed texts through the local and Postgres caches."""
+
+    def __init__(
+        self,
+        client: Any,
+        db: AsyncSession | None = None,
+        model: str | None = None,
+    ):
+        """
+        Initialize embedding cache service.
+
+        Args:
+            client: OpenAI-compatible async client (``client.embeddings.create``)
+            db: Database session for the persistent tier (None: memory only)
+            model: Embedding model (default: settings.OPENAI_EMBEDDING_MODEL)
+        """
+        self.client = client
+        self.db = db
+        self.model = model or settings.OPENAI_EMBEDDING_MODEL
+
+    async def embed(self, text: str) -> list[float] | None:
+        """
+        Get the embedding of one text.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector or None if it could not be generated
+        """
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(self, texts: list[str]) -> list[list[float] | None]:
+        """
+        Get the embeddings of several texts, requesting only the uncached ones.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors in input order (None where generation failed)
+        """
+        normalized = [normalize_embedding_text(text) for text in texts]
+        keys = [generate_embedding_cache_key(self.model, text) for text in normalized]
+
+        # Tier 1: in-process LRU
+        found: dict[str, list[float]] = {}
+        for key in keys:
+            vector = _local_get(key)
+            if vector is not None:
+                found[key] = vector
+
+        # Tier 2: Postgres
+        missing = {
+            key: text for key, text in zip(keys, normalized, strict=True) if key not in found
+        }
+        if missing:
+            loaded = await self._load(list(missing))
+            for key, vector in loaded.items():
+                found[key] = vector
+                _local_set(key, vector)
+                del missing[key]
+
+        # Miss: embed the rest in batched API requests
+        if missing:
+            generated = await self._generate(missing)
+            for key, vector in generated.items():
+                found[key] = vector
+                _local_set(key, vector)
+            await self._store(generated, missing)
+
+        logger.debug(
+            f"Embeddings: {len(set(keys)) - len(missing)}/{len(set(keys))} cached, "
+            f"{len(missing)} requested"
+        )
+        return [found.get(key) for key in keys]
+
+    async def _load(self, keys: list[str]) -> dict[str, list[float]]:
+        """Load cached embeddings from Postgres."""
+        if self.db is None:
+            return {}
+        try:
+            stmt = select(EmbeddingCache.cache_key, EmbeddingCache.embedding).where(
+                EmbeddingCache.cache_key.in_(keys)
+            )
+            # Queries of one chart are embedded concurrently on this session
+            async with get_session_lock(self.db):
+                rows = (await self.db.execute(stmt)).all()
+            return {row.cache_key: list(row.embedding) for row in rows}
+        except Exception as e:
+            logger.warning(f"Embedding cache read failed: {e}")
+            return {}
+
+    async def _generate(self, texts: dict[str, str]) -> dict[str, list[float]]:
+        """Embed texts with one API request per EMBEDDING_BATCH_SIZE inputs."""
+        items = list(texts.items())
+        generated: dict[str, list[float]] = {}
+        for start in range(0, len(items), EMBEDDING_BATCH_SIZE):
+            batch = items[start : start + EMBEDDING_BATCH_SIZE]
+            try:
+                response = await self.client.embeddings.create(
+                    model=self.model,
+                    input=[text for _, text in batch],
+                )
+            except Exception as e:
+                logger.error(f"Failed to generate {len(batch)} embeddings: {e}")
+                continue
+            for item in response.data:
+                generated[batch[item.index][0]] = list(item.embedding)
+        return generated
+
+    async def _store(self, vectors: dict[str, list[float]], texts: dict[str, str]) -> None:
+        """Persist new embeddings in Postgres (existing keys are left untouched)."""
+        if self.db is None or not vectors:
+            return
+        try:
+            stmt = (
+                insert(EmbeddingCache)
+                .values(
+                    [
+                        {"cache_key": key, "model": self.model, "text": texts[key], "embedding": v}
+                        for key, v in vectors.items()
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=["cache_key"])
+            )
+            # Savepoint: a failed insert must not abort the caller's transaction
+            async with get_session_lock(self.db), self.db.begin_nested():
+                await self.db.execute(stmt)
+        except Exception as e:
+            logger.warning(f"Embedding cache write failed: {e}")
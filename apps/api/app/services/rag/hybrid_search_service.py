@@ -6,6 +6,11 @@ from loguru import logger
 
 from app.services.rag.bm25_service import bm25_service
 from app.services.rag.qdrant_service import qdrant_service
+from app.services.rag.retrieval_cache import (
+    cache_results,
+    generate_retrieval_cache_key,
+    get_cached_results,
+)
 
 
 class HybridSearchService:
@@ -210,20 +215,57 @@ class HybridSearchService:
         limit: int = 10,
         fusion_method: str = "rrf",  # "rrf" or "weighted"
         filters: dict[str, Any] | None = None,
+        use_cache: bool = True,
     ) -> list[dict[str, Any]]:
         """
         Perform hybrid search combining dense and sparse retrieval.
 
+        Repeated searches are served from the retrieval cache until the corpus
+        changes (see app.services.rag.retrieval_cache).
+
         Args:
             query: Text query for BM25
             query_vector: Embedding vector for dense search
             limit: Maximum number of results
             fusion_method: Method to combine results ("rrf" or "weighted")
             filters: Optional filters for vector search
+            use_cache: Whether to read and fill the retrieval cache
 
         Returns:
             Combined and ranked search results
         """
+        if not use_cache:
+            return await self._search(query, query_vector, limit, fusion_method, filters)
+
+        # The query vector is a function of the query text, so the text identifies
+        # the search; only whether dense search runs at all changes the result
+        cache_key = await generate_retrieval_cache_key(
+            query=query,
+            filters=filters,
+            limit=limit,
+            fusion_method=fusion_method,
+            alpha=self.alpha,
+            has_vector=bool(query_vector) and self.qdrant.enabled,
+        )
+        cached = await get_cached_results(cache_key)
+        if cached is not None:
+            logger.debug(f"Hybrid search cache hit for query: {query[:50]}")
+            return cached
+
+        results = await self._search(query, query_vector, limit, fusion_method, filters)
+        if results:
+            await cache_results(cache_key, results)
+        return results
+
+    async def _search(
+        self,
+        query: str,
+        query_vector: list[float] | None,
+        limit: int,
+        fusion_method: str,
+        filters: dict[str, Any] | None,
+    ) -> list[dict[str, Any]]:
+        """Run BM25 and vector search and fuse the results (uncached)."""
         results = []
 
         # Perform dense search if vector provided
@@ -1,5 +1,6 @@
 """Qdrant vector database service for semantic search."""
 
+import asyncio
 from typing import Any
 
 from loguru import logger
@@ -121,8 +122,9 @@ class QdrantService:
                 for point_id, vector, payload in zip(ids, vectors, payloads, strict=False)
             ]
 
-            # Upsert to Qdrant
-            self.client.upsert(
+            # Upsert to Qdrant (in a thread: the sync client would block the event loop)
+            await asyncio.to_thread(
+                self.client.upsert,
                 collection_name=self.collection_name,
                 points=points,
                 wait=True,  # Wait for operation to complete
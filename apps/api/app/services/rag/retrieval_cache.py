@@ -0,0 +1,187 @@
+"""
+Cache for hybrid search results.
+
+Interpretation queries are deterministic ("Venus in Libra house 7 ..."), and
+the RAG corpus only changes on ingestion, so repeated searches can reuse a
+previous result instead of running BM25 scoring and a Qdrant search again.
+
+Entries are keyed by a SHA-256 of (query, filters, limit, fusion method,
+fusion weight, whether a query vector was given, corpus version) and stored in
+two tiers:
+
+1. An in-process LRU (bounded number of entries)
+2. Redis (shared by API workers, Celery workers and scripts), with a TTL
+
+DocumentIngestionService calls bump_corpus_version() after every ingest,
+update or delete. The version is a Redis counter, so a bump in one process
+changes every key in all processes (each process re-reads the counter at
+most every CORPUS_VERSION_REFRESH_SECONDS). Redis errors fail open.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+import redis.asyncio as aioredis
+from loguru import logger
+
+from app.core.redis_pool import get_async_redis_pool
+
+# Redis keys and TTL for cached search results (1 day)
+RETRIEVAL_CACHE_KEY_PREFIX = "rag_retrieval:"
+CORPUS_VERSION_KEY = "rag_corpus_version"
+RETRIEVAL_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Maximum number of search results kept in process memory
+RETRIEVAL_CACHE_MAX_ENTRIES = 1024
+
+# How long a process trusts its copy of the shared corpus version
+CORPUS_VERSION_REFRESH_SECONDS = 5.0
+
+# In-process LRU tier: key -> serialized results JSON
+_local_cache: OrderedDict[str, str] = OrderedDict()
+_local_lock = threading.Lock()
+
+# Corpus version: shared Redis counter plus bumps made by this process
+_shared_version = "0"
+_shared_version_read_at = 0.0
+_local_version = 0
+
+
+async def get_corpus_version() -> str:
+    """Return the current corpus version (shared counter + local bumps)."""
+    global _shared_version, _shared_version_read_at
+    now = time.monotonic()
+    if now - _shared_version_read_at >= CORPUS_VERSION_REFRESH_SECONDS:
+        _shared_version_read_at = now
+        pool = get_async_redis_pool()
+        if pool:
+            try:
+                client = aioredis.Redis(connection_pool=pool)
+                _shared_version = await client.get(CORPUS_VERSION_KEY) or "0"
+            except Exception as e:
+                logger.debug(f"Corpus version read failed: {e}")
+    return f"{_shared_version}.{_local_version}"
+
+
+async def bump_corpus_version() -> None:
+    """Invalidate every cached search result (call after the corpus changes)."""
+    global _local_version, _shared_version, _shared_version_read_at
+    _local_version += 1
+    with _local_lock:
+        _local_cache.clear()
+
+    pool = get_async_redis_pool()
+    if pool:
+        try:
+            client = aioredis.Redis(connection_pool=pool)
+            _shared_version = str(await client.incr(CORPUS_VERSION_KEY))
+            _shared_version_read_at = time.monotonic()
+        except Exception as e:
+            logger.warning(f"Corpus version bump failed: {e}")
+
+
+async def generate_retrieval_cache_key(
+    query: str,
+    filters: dict[str, Any] | None,
+    limit: int,
+    fusion_method: str,
+    alpha: float,
+    has_vector: bool,
+) -> str:
+    """
+    Generate the cache key of one hybrid search.
+
+    Args:
+        query: Text query
+        filters: Vector search filters
+        limit: Maximum number of results
+        fusion_method: "rrf" or "weighted"
+        alpha: Dense weight of weighted fusion
+        has_vector: Whether a query vector was given (dense search ran)
+
+    Returns:
+        SHA-256 hex digest
+    """
+    key_data = {
+        "query": query,
+        "filters": filters or {},
+        "limit": limit,
+        "fusion": fusion_method,
+        "alpha": alpha,
+        "dense": has_vector,
+        "corpus": await get_corpus_version(),
+    }
+    key_string = json.dumps(key_data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(key_string.encode()).hexdigest()
+
+
+def _local_get(key: str) -> str | None:
+    with _local_lock:
+        value = _local_cache.get(key)
+        if value is not None:
+            _local_cache.move_to_end(key)
+        return value
+
+
+def _local_set(key: str, value: str) -> None:
+    with _local_lock:
+        _local_cache[key] = value
+        _local_cache.move_to_end(key)
+        while len(_local_cache) > RETRIEVAL_CACHE_MAX_ENTRIES:
+            _local_cache.popitem(last=False)
+
+
+async def get_cached_results(key: str) -> list[dict[str, Any]] | None:
+    """
+    Get cached search results (a fresh copy) or None on a miss.
+
+    Args:
+        key: Key from generate_retrieval_cache_key
+    """
+    value = _local_get(key)
+    if value is None:
+        pool = get_async_redis_pool()
+        if pool:
+            try:
+                client = aioredis.Redis(connection_pool=pool)
+                value = await client.get(f"{RETRIEVAL_CACHE_KEY_PREFIX}{key}")
+            except Exception as e:
+                logger.debug(f"Retrieval cache Redis read failed: {e}")
+        if value is None:
+            return None
+        _local_set(key, value)
+
+    results: list[dict[str, Any]] = json.loads(value)
+    return results
+
+
+async def cache_results(key: str, results: list[dict[str, Any]]) -> None:
+    """
+    Store search results in both tiers.
+
+    Args:
+        key: Key from generate_retrieval_cache_key
+        results: Search results (JSON-serializable)
+    """
+    value = json.dumps(results, ensure_ascii=False, default=str)
+    _local_set(key, value)
+
+    pool = get_async_redis_pool()
+    if pool:
+        try:
+            client = aioredis.Redis(connection_pool=pool)
+            await client.setex(
+                f"{RETRIEVAL_CACHE_KEY_PREFIX}{key}", RETRIEVAL_CACHE_TTL_SECONDS, value
+            )
+        except Exception as e:
+            logger.debug(f"Retrieval cache Redis write failed: {e}")
+
+
+def clear_local_cache() -> None:
+    """Drop the in-process tier (Redis entries are kept)."""
+    with _local_lock:
+        _local_cache.clear()
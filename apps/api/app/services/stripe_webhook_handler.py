@@ -21,6 +21,7 @@ from app.repositories.subscription_repository import SubscriptionRepository
 from app.repositories.user_repository import UserRepository
 from app.repositories.webhook_event_repository import WebhookEventRepository
 from app.services.amplitude_service import amplitude_service
+from app.services.auth_principal_cache import invalidate_principal
 from app.services.credit_service import add_purchased_credits, allocate_credits
 from app.services.stripe_service import stripe_service
 
@@ -251,6 +252,7 @@ async def handle_checkout_session_completed(
     )
 
     await db.commit()
+    await invalidate_principal(user_id)
 
     # Track with Amplitude
     amplitude_service.track(
@@ -394,6 +396,7 @@ async def handle_subscription_deleted(
     )
 
     await db.commit()
+    await invalidate_principal(subscription.user_id)
 
     # Track with Amplitude
     amplitude_service.track(
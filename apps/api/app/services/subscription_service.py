@@ -9,12 +9,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.enums import SubscriptionChangeType, SubscriptionStatus, UserRole
 from app.models.subscription import Subscription
 from app.models.subscription_history import SubscriptionHistory
-from app.models.user import User
 from app.repositories.audit_repository import AuditRepository
 from app.repositories.subscription_history_repository import SubscriptionHistoryRepository
 from app.repositories.subscription_repository import SubscriptionRepository
 from app.repositories.user_repository import UserRepository
 from app.services.amplitude_service import amplitude_service
+from app.services.auth_principal_cache import AuthPrincipal, invalidate_principal
 
 
 async def _create_history_record(
@@ -55,7 +55,7 @@ async def grant_premium_subscription(
     db: AsyncSession,
     user_id: UUID,
     days: int | None,
-    admin_user: User,
+    admin_user: AuthPrincipal,
 ) -> Subscription:
     """
     Grant premium subscription to a user.
@@ -135,6 +135,7 @@ async def grant_premium_subscription(
     # Commit everything atomically
     await db.commit()
     await db.refresh(subscription)
+    await invalidate_principal(user_id)
 
     # Track with Amplitude
     grant_properties: dict[str, str | int | float | bool | list[str]] = {
@@ -162,7 +163,7 @@ async def grant_premium_subscription(
 async def revoke_premium_subscription(
     db: AsyncSession,
     user_id: UUID,
-    admin_user: User,
+    admin_user: AuthPrincipal,
 ) -> None:
     """
     Revoke premium subscription from a user.
@@ -225,6 +226,7 @@ async def revoke_premium_subscription(
 
     # Commit everything atomically
     await db.commit()
+    await invalidate_principal(user_id)
 
     # Track with Amplitude
     revoke_properties: dict[str, str | int | float | bool | list[str]] = {
@@ -247,7 +249,7 @@ async def extend_premium_subscription(
     db: AsyncSession,
     user_id: UUID,
     extend_days: int,
-    admin_user: User,
+    admin_user: AuthPrincipal,
 ) -> Subscription:
     """
     Extend an existing premium subscription without resetting started_at.
@@ -328,6 +330,7 @@ async def extend_premium_subscription(
     # Commit everything atomically
     await db.commit()
     await db.refresh(subscription)
+    await invalidate_principal(user_id)
 
     # Track with Amplitude
     amplitude_service.track(
@@ -437,6 +440,7 @@ async def check_and_expire_subscriptions(db: AsyncSession) -> int:
 
     # Commit all changes atomically
     await db.commit()
+    await invalidate_principal(*(subscription.user_id for subscription in expired_subscriptions))
 
     if count > 0:
         logger.info(f"Expired {count} subscriptions")
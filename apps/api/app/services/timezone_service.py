@@ -9,14 +9,22 @@ Features:
 """
 
 from datetime import UTC, datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo, available_timezones
 
+import swisseph as swe
 from loguru import logger
 from timezonefinder import TimezoneFinder
 
 # Initialize timezone finder (lazy loading)
 _tf: TimezoneFinder | None = None
 
+# Bounded memo caches for conversions repeated across requests and bulk jobs
+TIMEZONE_CACHE_SIZE = 4096
+
+# Coordinates are rounded to 4 decimals (~11 m) before the polygon lookup
+COORDINATE_PRECISION = 4
+
 
 def _get_timezone_finder() -> TimezoneFinder:
     """Get or create TimezoneFinder instance (lazy loading for performance)."""
@@ -26,6 +34,83 @@ def _get_timezone_finder() -> TimezoneFinder:
     return _tf
 
 
+@lru_cache(maxsize=TIMEZONE_CACHE_SIZE)
+def _timezone_at(latitude: float, longitude: float) -> str | None:
+    """Memoized TimezoneFinder polygon lookup (coordinates already rounded)."""
+    return _get_timezone_finder().timezone_at(lat=latitude, lng=longitude)
+
+
+@lru_cache(maxsize=TIMEZONE_CACHE_SIZE)
+def _utc_offset(timezone_id: str, date: datetime) -> tuple[float, bool]:
+    """Memoized (offset_hours, is_dst) of a timezone at a date."""
+    tz = ZoneInfo(timezone_id)
+    dt_local = date.replace(tzinfo=tz) if date.tzinfo is None else date.astimezone(tz)
+
+    offset = dt_local.utcoffset()
+    dst = dt_local.dst()
+
+    offset_hours = offset.total_seconds() / 3600 if offset else 0
+    is_dst = bool(dst and dst.total_seconds() > 0)
+    return (offset_hours, is_dst)
+
+
+@lru_cache(maxsize=TIMEZONE_CACHE_SIZE)
+def _julian_day(dt: datetime, timezone_id: str) -> float:
+    """Memoized UTC Julian Day of a datetime (timezone_id only used if dt is naive)."""
+    if dt.tzinfo is not None:
+        dt_utc = dt.astimezone(UTC)
+    else:
+        dt_utc = dt.replace(tzinfo=ZoneInfo(timezone_id)).astimezone(UTC)
+
+    jd: float = swe.julday(  # type: ignore[no-any-return]
+        dt_utc.year,
+        dt_utc.month,
+        dt_utc.day,
+        dt_utc.hour + dt_utc.minute / 60.0 + dt_utc.second / 3600.0,
+    )
+    return jd
+
+
+def local_datetime_to_julian_day(dt: datetime, timezone_id: str) -> float:
+    """
+    Convert a birth datetime to a UTC Julian Day (memoized).
+
+    Args:
+        dt: Timezone-aware datetime, or naive local time in timezone_id
+        timezone_id: IANA timezone identifier (ignored for aware datetimes)
+
+    Returns:
+        Julian Day number (UT)
+    """
+    # Aware datetimes don't depend on timezone_id: share one cache entry
+    return _julian_day(dt, "" if dt.tzinfo is not None else timezone_id)
+
+
+def cache_info() -> dict[str, dict[str, int]]:
+    """Return hit/miss statistics of the timezone memo caches."""
+    stats = {}
+    for name, cached in (
+        ("julian_day", _julian_day),
+        ("timezone_at", _timezone_at),
+        ("historical_offset", _utc_offset),
+    ):
+        info = cached.cache_info()
+        stats[name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "max_size": info.maxsize or 0,
+        }
+    return stats
+
+
+def clear_caches() -> None:
+    """Drop all memoized timezone conversions."""
+    _julian_day.cache_clear()
+    _timezone_at.cache_clear()
+    _utc_offset.cache_clear()
+
+
 # Common timezone regions for grouping
 TIMEZONE_REGIONS = {
     "America": "Americas",
@@ -208,8 +293,9 @@ class TimezoneService:
             IANA timezone identifier or None if not found
         """
         try:
-            tf = _get_timezone_finder()
-            timezone_id = tf.timezone_at(lat=latitude, lng=longitude)
+            timezone_id = _timezone_at(
+                round(latitude, COORDINATE_PRECISION), round(longitude, COORDINATE_PRECISION)
+            )
             if timezone_id:
                 logger.debug(
                     f"Detected timezone {timezone_id} for coordinates ({latitude}, {longitude})"
@@ -240,20 +326,7 @@ class TimezoneService:
             Tuple of (offset_hours, is_dst) or None if invalid
         """
         try:
-            tz = ZoneInfo(timezone_id)
-            # Create timezone-aware datetime
-            if date.tzinfo is None:
-                dt_local = date.replace(tzinfo=tz)
-            else:
-                dt_local = date.astimezone(tz)
-
-            offset = dt_local.utcoffset()
-            dst = dt_local.dst()
-
-            offset_hours = offset.total_seconds() / 3600 if offset else 0
-            is_dst = bool(dst and dst.total_seconds() > 0)
-
-            return (offset_hours, is_dst)
+            return _utc_offset(timezone_id, date)
         except (KeyError, ValueError) as e:
             logger.warning(f"Failed to get historical offset: {e}")
             return None
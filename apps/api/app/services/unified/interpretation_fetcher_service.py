@@ -3,8 +3,12 @@ Interpretation fetcher service implementing 3-tier cache hierarchy.
 
 This service orchestrates the intelligent caching strategy:
 Database → InterpretationCache → RAG Generation
+
+Concurrent generations of the same interpretation are coalesced through a
+Redis lease keyed by the interpretation cache key (see singleflight).
 """
 
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
@@ -13,6 +17,8 @@ from loguru import logger
 from app.domain.interfaces.interpretation_generator import IInterpretationGenerator
 from app.domain.interfaces.interpretation_storage import IInterpretationStorage
 from app.domain.interpretation import InterpretationResult
+from app.services.interpretation_cache_service import InterpretationCacheService
+from app.services.unified import singleflight
 
 
 class InterpretationFetcherService:
@@ -28,6 +34,7 @@ class InterpretationFetcherService:
     - Prompt version detection (marks outdated interpretations)
     - Async cache-to-DB backfill via Celery
     - Immediate DB persistence for fresh generations
+    - Coalescing of concurrent identical generations (one LLM call per stampede)
     """
 
     def __init__(
@@ -94,14 +101,87 @@ class InterpretationFetcherService:
                 await self._queue_backfill(chart_id, cache_result, language)
                 return cache_result
 
-        # Tier 3: Generate with RAG
-        result = await self._generate_fresh(chart_data, interpretation_type, subject, language)
+        # Tier 3: Generate with RAG (one generation per key across requests)
+        flight_key = self._singleflight_key(
+            chart_id, chart_data, interpretation_type, subject, language
+        )
+        token = await singleflight.acquire_lease(flight_key)
+
+        if token is None:
+            published = await singleflight.wait_for_result(flight_key)
+            if published is not None:
+                result = self._from_published(published)
+                # The leader already saved its own chart's copy
+                if published["chart_id"] != str(chart_id):
+                    await self._save_to_database(chart_id, result, language)
+                logger.debug(f"Coalesced generation: {interpretation_type}:{subject}")
+                return result
+
+            # Leader failed or timed out: generate without coalescing
+            logger.info(f"Singleflight fallback: {interpretation_type}:{subject}")
+            result = await self._generate_fresh(chart_data, interpretation_type, subject, language)
+            await self._save_to_database(chart_id, result, language)
+            return result
+
+        try:
+            result = await self._generate_fresh(chart_data, interpretation_type, subject, language)
+
+            # Save to database immediately
+            await self._save_to_database(chart_id, result, language)
 
-        # Save to database immediately
-        await self._save_to_database(chart_id, result, language)
+            await singleflight.publish_result(
+                flight_key, {"chart_id": str(chart_id), "result": result.to_dict()}
+            )
+        finally:
+            await singleflight.release_lease(flight_key, token)
 
         return result
 
+    def _singleflight_key(
+        self,
+        chart_id: UUID,
+        chart_data: dict[str, Any],
+        interpretation_type: str,
+        subject: str,
+        language: str,
+    ) -> str:
+        """
+        Build the coalescing key of a generation.
+
+        This is the interpretation cache key, so identical placements of
+        different charts share one generation. Subjects without cache
+        parameters (e.g. growth) are chart-specific and keyed by chart.
+
+        Returns:
+            SHA-256 hex digest
+        """
+        parameters = self._extract_parameters(chart_data, interpretation_type, subject)
+        if not parameters:
+            parameters = {"chart_id": str(chart_id), "subject": subject}
+        return InterpretationCacheService.generate_cache_key(
+            interpretation_type=interpretation_type,
+            parameters=parameters,
+            model=self.generator.get_model_id(),
+            prompt_version=self.current_version,
+            language=language,
+        )
+
+    @staticmethod
+    def _from_published(published: dict[str, Any]) -> InterpretationResult:
+        """Rebuild the leader's InterpretationResult from its published dict."""
+        data = published["result"]
+        generated_at = data.get("generated_at")
+        return InterpretationResult(
+            content=data["content"],
+            subject=data["subject"],
+            interpretation_type=data["interpretation_type"],
+            source="rag",
+            prompt_version=data["prompt_version"],
+            rag_sources=data.get("rag_sources") or None,
+            generated_at=datetime.fromisoformat(generated_at) if generated_at else None,
+            openai_model=data.get("openai_model", "gpt-4o-mini-rag"),
+        )
+
     async def _check_database(
         self,
         chart_id: UUID,
@@ -0,0 +1,164 @@
+"""
+Redis-backed request coalescing ("singleflight") for interpretation generation.
+
+When several requests miss every cache tier for the same interpretation (a
+trending public chart, a double-clicked regenerate), only one of them should
+pay for the LLM call. Requests are coalesced by a key (the interpretation
+cache key):
+
+1. The first request takes a lease (``SET NX PX``) and becomes the leader
+2. Other requests (followers) poll for the leader's published result
+3. The leader publishes its result with a short TTL and releases the lease
+
+Followers stop waiting after SINGLEFLIGHT_WAIT_SECONDS, or as soon as the
+lease disappears without a result (the leader failed), and then generate
+themselves. Leases expire after SINGLEFLIGHT_LEASE_SECONDS so a crashed
+leader cannot block a key. Redis errors fail open: every request becomes a
+leader, which is the behavior without coalescing.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any
+from uuid import uuid4
+
+import redis.asyncio as aioredis
+from loguru import logger
+
+from app.core.redis_pool import get_async_redis_pool
+
+# Redis keys for leases and published results
+SINGLEFLIGHT_LEASE_PREFIX = "interpretation_singleflight:lease:"
+SINGLEFLIGHT_RESULT_PREFIX = "interpretation_singleflight:result:"
+
+# Lease lifetime (longer than a slow generation) and result lifetime
+SINGLEFLIGHT_LEASE_SECONDS = 90
+SINGLEFLIGHT_RESULT_TTL_SECONDS = 60
+
+# How long followers wait for the leader, and how often they poll
+SINGLEFLIGHT_WAIT_SECONDS = 60.0
+SINGLEFLIGHT_POLL_INTERVAL_SECONDS = 0.1
+SINGLEFLIGHT_MAX_POLL_INTERVAL_SECONDS = 1.0
+
+# Delete the lease only if it still belongs to the caller
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+async def acquire_lease(key: str) -> str | None:
+    """
+    Try to become the leader for a key.
+
+    Args:
+        key: Coalescing key
+
+    Returns:
+        Lease token if the caller is the leader (always when Redis is
+        unavailable), None if another request holds the lease
+    """
+    token = uuid4().hex
+    pool = get_async_redis_pool()
+    if not pool:
+        return token
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        acquired = await client.set(
+            f"{SINGLEFLIGHT_LEASE_PREFIX}{key}",
+            token,
+            px=SINGLEFLIGHT_LEASE_SECONDS * 1000,
+            nx=True,
+        )
+        return token if acquired else None
+    except Exception as e:
+        logger.debug(f"Singleflight lease failed, proceeding without coalescing: {e}")
+        return token
+
+
+async def release_lease(key: str, token: str) -> None:
+    """Release a lease taken by acquire_lease (no-op if it expired or was taken over)."""
+    pool = get_async_redis_pool()
+    if not pool:
+        return
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        await client.eval(_RELEASE_SCRIPT, 1, f"{SINGLEFLIGHT_LEASE_PREFIX}{key}", token)
+    except Exception as e:
+        logger.debug(f"Singleflight lease release failed: {e}")
+
+
+async def publish_result(key: str, result: dict[str, Any]) -> None:
+    """
+    Publish the leader's result for waiting followers.
+
+    Args:
+        key: Coalescing key
+        result: JSON-serializable result
+    """
+    pool = get_async_redis_pool()
+    if not pool:
+        return
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        await client.setex(
+            f"{SINGLEFLIGHT_RESULT_PREFIX}{key}",
+            SINGLEFLIGHT_RESULT_TTL_SECONDS,
+            json.dumps(result, ensure_ascii=False, default=str),
+        )
+    except Exception as e:
+        logger.debug(f"Singleflight result publish failed: {e}")
+
+
+async def _poll(key: str) -> tuple[str | None, bool]:
+    """Read (published result, whether the lease is still held)."""
+    pool = get_async_redis_pool()
+    if not pool:
+        return None, False
+    try:
+        client = aioredis.Redis(connection_pool=pool)
+        # Lease first: the leader publishes before releasing, so a released
+        # lease followed by a missing result means the leader gave up
+        pipe = client.pipeline(transaction=False)
+        pipe.exists(f"{SINGLEFLIGHT_LEASE_PREFIX}{key}")
+        pipe.get(f"{SINGLEFLIGHT_RESULT_PREFIX}{key}")
+        leased, value = await pipe.execute()
+        return value, bool(leased)
+    except Exception as e:
+        logger.debug(f"Singleflight poll failed: {e}")
+        return None, False
+
+
+async def wait_for_result(
+    key: str,
+    timeout: float = SINGLEFLIGHT_WAIT_SECONDS,
+) -> dict[str, Any] | None:
+    """
+    Wait for the leader of a key to publish its result.
+
+    Args:
+        key: Coalescing key
+        timeout: Maximum seconds to wait
+
+    Returns:
+        The published result, or None on timeout or if the leader gave up
+        (the caller should then generate itself)
+    """
+    deadline = time.monotonic() + timeout
+    interval = SINGLEFLIGHT_POLL_INTERVAL_SECONDS
+    while True:
+        value, leased = await _poll(key)
+        if value is not None:
+            result: dict[str, Any] = json.loads(value)
+            return result
+        if not leased:
+            logger.debug(f"Singleflight leader for {key[:16]} finished without a result")
+            return None
+        if time.monotonic() >= deadline:
+            logger.warning(f"Timed out waiting for singleflight leader of {key[:16]}")
+            return None
+        await asyncio.sleep(interval)
+        interval = min(interval * 2, SINGLEFLIGHT_MAX_POLL_INTERVAL_SECONDS)
@@ -13,11 +13,13 @@ from app.core.security import get_password_hash, verify_password
 from app.models.chart import AuditLog, BirthChart
 from app.models.user import User
 from app.repositories.audit_repository import AuditRepository
+from app.repositories.chart_repository import ChartRepository
 from app.repositories.user_repository import UserRepository
 from app.schemas.password import PasswordChange
 from app.schemas.user import UserUpdate
 from app.schemas.user_activity import UserActivityItem, UserActivityList
 from app.schemas.user_stats import UserStats
+from app.services.auth_principal_cache import invalidate_principal
 
 
 async def update_profile(
@@ -263,6 +265,7 @@ async def export_data(
     )
     result = await db.execute(stmt)
     charts = result.scalars().all()
+    chart_repo = ChartRepository(db)
 
     # Get audit logs
     audit_stmt = (
@@ -307,7 +310,7 @@ async def export_data(
                 "city": chart.city,
                 "country": chart.country,
                 "created_at": chart.created_at.isoformat(),
-                "chart_data": chart.chart_data,
+                "chart_data": await chart_repo.get_chart_data_all_languages(chart),
             }
             for chart in charts
         ],
@@ -352,3 +355,4 @@ async def soft_delete_user(
 
     # Soft delete user
     await user_repo.soft_delete(user)
+    await invalidate_principal(user.id)
@@ -12,15 +12,25 @@ from app.core.celery_app import celery_app
 
 if TYPE_CHECKING:
     from celery import Task
+    from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import create_task_local_session
+from app.models.chart import BirthChart
 from app.repositories.chart_repository import ChartRepository
-from app.services.astro_service import calculate_birth_chart
+from app.services.chart_cache_service import get_or_calculate_birth_chart
+from app.services.chart_progress_service import publish_chart_progress
 from app.services.interpretation_service_rag import InterpretationServiceRAG
 
 # Primary language generated immediately, secondary languages deferred
 PRIMARY_LANGUAGE = "pt-BR"
 
 
+async def _commit_progress(db: "AsyncSession", chart: BirthChart, progress: int) -> None:
+    """Commit a chart's progress and publish it to status subscribers."""
+    chart.progress = progress
+    await db.commit()
+    await publish_chart_progress(chart)
+
+
 @celery_app.task(bind=True, name="astro.generate_birth_chart", max_retries=3)
 def generate_birth_chart_task(self: "Task", chart_id: str) -> dict[str, str]:
     """
@@ -70,43 +80,36 @@ async def _generate_birth_chart_async(task_id: str, chart_id: str) -> dict[str,
             try:
                 # Update task_id and initial progress
                 chart.task_id = task_id
-                chart.progress = 10
-                await db.commit()
+                await _commit_progress(db, chart, 10)
                 logger.info(f"Starting chart generation for {chart_id}")
 
                 # Step 1: Calculate astrological data in BOTH languages (fast ~200-400ms)
                 # This ensures users can switch languages without waiting for recalculation
-                chart.progress = 20
-                await db.commit()
+                await _commit_progress(db, chart, 20)
                 logger.info(f"Calculating planetary positions for {chart_id}")
 
-                # Generate chart data for both supported languages
+                # Calculate once, then localize for every supported language
+                # (identical birth data is served from the chart result cache)
                 from app.translations import SUPPORTED_LANGUAGES
 
-                chart_data_by_lang: dict[str, Any] = {}
-                for language in SUPPORTED_LANGUAGES:
-                    logger.info(f"Calculating {language} chart data for {chart_id}")
-                    chart_data_by_lang[language] = calculate_birth_chart(
-                        birth_datetime=chart.birth_datetime,
-                        timezone=chart.birth_timezone,
-                        latitude=float(chart.latitude),
-                        longitude=float(chart.longitude),
-                        house_system=chart.house_system,
-                        language=language,
-                    )
+                chart_data_by_lang: dict[str, Any] = await get_or_calculate_birth_chart(
+                    birth_datetime=chart.birth_datetime,
+                    timezone=chart.birth_timezone,
+                    latitude=float(chart.latitude),
+                    longitude=float(chart.longitude),
+                    house_system=chart.house_system,
+                )
 
-                # Step 2: Save language-keyed chart data
-                chart.chart_data = chart_data_by_lang
-                chart.progress = 30
-                await db.commit()
+                # Step 2: Save chart data (shared section + one row per language)
+                await chart_repo.save_chart_data(chart, chart_data_by_lang)
+                await _commit_progress(db, chart, 30)
                 logger.info(
                     f"Chart calculations completed for {chart_id} in {len(SUPPORTED_LANGUAGES)} languages"
                 )
 
                 # Step 3: Generate AI interpretations for PRIMARY language only
                 # Secondary languages are deferred to background task for faster UX
-                chart.progress = 40
-                await db.commit()
+                await _commit_progress(db, chart, 40)
                 logger.info(
                     f"Generating primary language ({PRIMARY_LANGUAGE}) interpretations for {chart_id}"
                 )
@@ -123,8 +126,7 @@ async def _generate_birth_chart_async(task_id: str, chart_id: str) -> dict[str,
                     )
                     await rag_db.commit()
 
-                chart.progress = 70
-                await db.commit()
+                await _commit_progress(db, chart, 70)
 
                 # Step 3.5: Generate growth interpretations for primary language only
                 logger.info(
@@ -140,8 +142,7 @@ async def _generate_birth_chart_async(task_id: str, chart_id: str) -> dict[str,
                     )
                     await growth_db.commit()
 
-                chart.progress = 90
-                await db.commit()
+                await _commit_progress(db, chart, 90)
 
                 # Step 3.6: Queue secondary languages for background processing
                 secondary_languages = [
@@ -155,9 +156,8 @@ async def _generate_birth_chart_async(task_id: str, chart_id: str) -> dict[str,
 
                 # Step 4: Mark as completed
                 chart.status = "completed"
-                chart.progress = 100
                 chart.error_message = None
-                await db.commit()
+                await _commit_progress(db, chart, 100)
 
                 logger.info(f"Chart {chart_id} generation completed successfully")
                 return {"status": "completed", "message": "Chart generated successfully"}
@@ -169,6 +169,7 @@ async def _generate_birth_chart_async(task_id: str, chart_id: str) -> dict[str,
                     chart.status = "failed"
                     chart.error_message = str(e)[:500]  # Truncate long error messages
                     await db.commit()
+                    await publish_chart_progress(chart)
                 except Exception as commit_error:
                     logger.warning(
                         f"Failed to commit error status for chart {chart_id}: {commit_error}"
@@ -242,6 +243,7 @@ async def _generate_secondary_language_async(chart_id: str, language: str) -> di
                 logger.info(
                     f"Starting secondary language ({language}) generation for chart {chart_id}"
                 )
+                chart_data = await chart_repo.get_chart_data(chart, language)
 
                 # Generate RAG-enhanced interpretations for secondary language
                 async with TaskSessionLocal() as rag_db:
@@ -250,7 +252,7 @@ async def _generate_secondary_language_async(chart_id: str, language: str) -> di
                     )
                     await rag_service.generate_all_rag_interpretations(
                         chart=chart,
-                        chart_data=chart.chart_data,
+                        chart_data=chart_data,
                     )
                     await rag_db.commit()
 
@@ -260,7 +262,7 @@ async def _generate_secondary_language_async(chart_id: str, language: str) -> di
                 async with TaskSessionLocal() as growth_db:
                     growth_service = PersonalGrowthService(language=language, db=growth_db)
                     await growth_service.generate_growth_suggestions(
-                        chart_data=chart.chart_data,
+                        chart_data=chart_data,
                         chart_id=UUID(chart_id),
                     )
                     await growth_db.commit()
@@ -68,6 +68,34 @@ async def _cleanup_expired_interpretations_async(ttl_days: int) -> dict[str, int
         return result
 
 
+@celery_app.task(name="cache.flush_interpretation_hit_counts")
+def flush_interpretation_hit_counts() -> dict[str, int | str]:
+    """
+    Write buffered interpretation cache hit counts to the database.
+
+    Cache reads never update ``interpretation_cache``; they buffer hit counts
+    and last-access times in Redis. This task applies them in one bulk UPDATE.
+
+    **Scheduling**: Run every minute.
+
+    Returns:
+        Dict with the number of entries updated
+    """
+    return asyncio.run(_flush_interpretation_hit_counts_async())
+
+
+async def _flush_interpretation_hit_counts_async() -> dict[str, int | str]:
+    """Async version of the hit count flush task."""
+    async with AsyncSessionLocal() as db:
+        cache_service = InterpretationCacheService(db)
+        updated_count = await cache_service.flush_hit_counts()
+
+        return {
+            "updated_count": updated_count,
+            "flush_time": datetime.now(UTC).isoformat(),
+        }
+
+
 @celery_app.task(name="cache.get_cache_statistics")
 def get_cache_statistics() -> dict:
     """
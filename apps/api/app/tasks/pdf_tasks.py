@@ -16,6 +16,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.celery_app import celery_app
 from app.core.database import AsyncSessionLocal
 from app.models.chart import BirthChart
+from app.repositories.chart_repository import ChartRepository
+from app.services.chart_progress_service import publish_pdf_progress
 from app.services.interpretation_service_rag import InterpretationServiceRAG
 from app.services.pdf_service import PDFService
 from app.services.s3_service import s3_service
@@ -60,7 +62,8 @@ def generate_chart_pdf_task(self: celery_app.Task, chart_id_str: str) -> dict[st
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         try:
-            result = loop.run_until_complete(_generate_pdf_async(chart_id))
+            final_attempt = self.request.retries >= self.max_retries
+            result = loop.run_until_complete(_generate_pdf_async(chart_id, final_attempt))
             return result
         finally:
             # Give pending tasks time to complete
@@ -74,12 +77,13 @@ def generate_chart_pdf_task(self: celery_app.Task, chart_id_str: str) -> dict[st
         raise self.retry(exc=exc) from exc
 
 
-async def _generate_pdf_async(chart_id: UUID) -> dict[str, str]:
+async def _generate_pdf_async(chart_id: UUID, final_attempt: bool = True) -> dict[str, str]:
     """
     Internal async function for PDF generation.
 
     Args:
         chart_id: Chart UUID
+        final_attempt: Whether a failure is reported as final (no retry follows)
 
     Returns:
         Dictionary with pdf_url and status
@@ -121,6 +125,9 @@ async def _generate_pdf_async(chart_id: UUID) -> dict[str, str]:
                 logger.error(f"Chart {chart_id} has no calculated data")
                 raise ValueError(f"Chart {chart_id} has no calculated data")
 
+            # Shared section + the PDF language only (the template is in Portuguese)
+            chart_data = await ChartRepository(db).get_chart_data(chart, "pt-BR")
+
             # 1.5. Log if replacing existing PDF (no deletion needed, will overwrite)
             if chart.pdf_url:
                 logger.info(f"Will overwrite existing PDF: {chart.pdf_url}")
@@ -161,7 +168,7 @@ async def _generate_pdf_async(chart_id: UUID) -> dict[str, str]:
                 rag_service = InterpretationServiceRAG(db, use_cache=True, use_rag=True)
                 interpretations = await rag_service.generate_all_rag_interpretations(
                     chart=chart,
-                    chart_data=chart.chart_data,
+                    chart_data=chart_data,
                 )
                 logger.info("RAG interpretations generated successfully")
 
@@ -174,7 +181,7 @@ async def _generate_pdf_async(chart_id: UUID) -> dict[str, str]:
             logger.info(f"Preparing template data for chart {chart_id}")
             template_data = pdf_service.prepare_template_data(
                 chart_data={
-                    **chart.chart_data,
+                    **chart_data,
                     "person_name": chart.person_name,
                     "birth_datetime": chart.birth_datetime,
                     "city": chart.city,
@@ -289,6 +296,13 @@ async def _generate_pdf_async(chart_id: UUID) -> dict[str, str]:
             chart.pdf_generating = False
             chart.pdf_task_id = None
             await db.commit()
+            await publish_pdf_progress(
+                chart_id,
+                chart.user_id,
+                "ready",
+                pdf_url=pdf_url,
+                generated_at=chart.pdf_generated_at,
+            )
 
             logger.info(f"PDF generation complete for chart {chart_id}: {pdf_url}")
 
@@ -312,6 +326,13 @@ async def _generate_pdf_async(chart_id: UUID) -> dict[str, str]:
                     chart.pdf_task_id = None
                     await db.commit()
                     logger.info(f"Cleared generation flags for chart {chart_id}")
+                    # A retry keeps the PDF "generating" for status subscribers
+                    await publish_pdf_progress(
+                        chart_id,
+                        chart.user_id,
+                        "failed" if final_attempt else "generating",
+                        error_message=str(exc)[:500],
+                    )
         except Exception as db_error:
             logger.error(f"Failed to clear generation flags: {db_error}")
         raise exc
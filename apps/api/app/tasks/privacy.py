@@ -15,6 +15,7 @@ from app.models.password_reset import PasswordResetToken
 from app.models.user import OAuthAccount, User
 from app.models.user_consent import UserConsent
 from app.services.amplitude_service import amplitude_service
+from app.services.auth_principal_cache import invalidate_principal
 
 
 @celery_app.task(name="privacy.cleanup_deleted_users")
@@ -65,6 +66,7 @@ async def _cleanup_deleted_users_async() -> dict[str, int]:
             "password_reset_tokens_deleted": 0,
         }
 
+        deleted_user_ids = []
         for user in users_to_delete:
             logger.info(f"Hard deleting user {user.id} (email: {user.email})")
 
@@ -121,6 +123,7 @@ async def _cleanup_deleted_users_async() -> dict[str, int]:
             )
 
             # 6. Deletar usuário
+            deleted_user_ids.append(user.id)
             await db.delete(user)
             stats["users_deleted"] += 1
 
@@ -128,6 +131,7 @@ async def _cleanup_deleted_users_async() -> dict[str, int]:
 
         # Commit todas as exclusões
         await db.commit()
+        await invalidate_principal(*deleted_user_ids)
 
         logger.info(f"Hard delete completed: {stats}")
         return stats
@@ -7,6 +7,10 @@ Handles both legacy flat format and new language-first format.
 Formats supported:
 - Language-first (new): {"en-US": {...}, "pt-BR": {...}}
 - Flat (legacy): {"planets": [...], "houses": [...], "aspects": [...]}
+
+Birth charts additionally store chart data split in two parts (see
+split_chart_data): a flat language-neutral section plus translated sections
+per language, recombined with merge_chart_data.
 """
 
 from typing import Any
@@ -16,6 +20,18 @@ from loguru import logger
 # Supported languages
 SUPPORTED_LANGUAGES = {"en-US", "pt-BR"}
 
+# Sections built with translations (always stored per language)
+LOCALIZED_SECTIONS = frozenset(
+    {
+        "lunar_phase",
+        "solar_phase",
+        "prenatal_syzygy",
+        "lord_of_nativity",
+        "temperament",
+        "mentality",
+    }
+)
+
 
 def extract_language_data(chart_data: dict[str, Any], language: str = "pt-BR") -> dict[str, Any]:
     """
@@ -155,3 +171,63 @@ def validate_language_data(chart_data: dict[str, Any], language: str) -> tuple[b
         return False, f"Missing required keys: {missing_keys}"
 
     return True, ""
+
+
+def split_chart_data(
+    chart_data: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """
+    Split language-first chart_data into a shared section and per-language sections.
+
+    LOCALIZED_SECTIONS, and any other section whose value differs between
+    languages, go to the per-language part. Everything else (positions, houses,
+    aspects, dignities, lots, sect) is stored once. Top-level keys that are not
+    languages (e.g. on-demand results) stay in the shared section.
+
+    Args:
+        chart_data: Language-first chart_data ({"en-US": {...}, "pt-BR": {...}})
+
+    Returns:
+        Tuple of (shared section, {language: localized sections})
+
+    Examples:
+        >>> split_chart_data({"en-US": {"ascendant": 1.0, "lunar_phase": {"name": "New"}},
+        ...                   "pt-BR": {"ascendant": 1.0, "lunar_phase": {"name": "Nova"}}})
+        ({"ascendant": 1.0}, {"en-US": {"lunar_phase": {...}}, "pt-BR": {"lunar_phase": {...}}})
+    """
+    by_language = {lang: data for lang, data in chart_data.items() if lang in SUPPORTED_LANGUAGES}
+    neutral = {key: value for key, value in chart_data.items() if key not in SUPPORTED_LANGUAGES}
+    if not by_language:
+        return neutral, {}
+
+    sections = set().union(*(data.keys() for data in by_language.values()))
+    for section in sections - LOCALIZED_SECTIONS:
+        values = [data.get(section) for data in by_language.values()]
+        present = all(section in data for data in by_language.values())
+        if present and all(value == values[0] for value in values[1:]):
+            neutral[section] = values[0]
+
+    localized = {
+        lang: {key: value for key, value in data.items() if key not in neutral}
+        for lang, data in by_language.items()
+    }
+    return neutral, localized
+
+
+def merge_chart_data(
+    neutral: dict[str, Any],
+    localized: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """
+    Combine the shared section with one language's sections (inverse of split_chart_data).
+
+    Args:
+        neutral: Shared, language-neutral section
+        localized: Sections of one language (None for legacy flat data)
+
+    Returns:
+        Flat chart data for that language
+    """
+    if not localized:
+        return neutral
+    return {**neutral, **localized}
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Build the lunation table shipped with app/astro (app/astro/lunations.npz).
+
+The table holds the Julian Day of every New Moon and Full Moon between 1800
+and 2200 and is used by the prenatal syzygy and Hyleg calculations. Re-run
+this script only if the ephemeris flags or the table range change.
+
+Usage:
+    uv run python scripts/build_lunation_table.py [--output PATH]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from app.astro.lunations import LUNATION_TABLE_PATH, build_lunation_table
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Build the New Moon / Full Moon table")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=LUNATION_TABLE_PATH,
+        help=f"Output file (default: {LUNATION_TABLE_PATH})",
+    )
+    args = parser.parse_args()
+
+    logger.info("Computing New Moons and Full Moons for 1800-2200...")
+    table = build_lunation_table()
+
+    np.savez_compressed(args.output, **table)
+    logger.success(
+        f"Wrote {len(table['new_moon'])} New Moons and {len(table['full_moon'])} Full Moons "
+        f"to {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,10 @@ This script generates RAG-enhanced interpretations for all public charts, includ
 
 Supports multiple languages: pt-BR and en-US
 
+Charts are processed concurrently (each in its own database session). Within
+a chart, uncached subjects are generated concurrently and saved with one bulk
+upsert per language (see PublicChartService.generate_interpretations).
+
 Usage:
     uv run python scripts/generate_public_chart_interpretations.py [--clear] [--verbose] [--lang LANG]
 
@@ -19,6 +23,7 @@ Arguments:
     --verbose: Enable verbose logging
     --lang: Language code (pt-BR or en-US, default: both)
     --chart: Generate for specific chart slug only
+    --concurrency: Number of charts processed at the same time (default: 3)
 """
 
 import argparse
@@ -28,7 +33,7 @@ from pathlib import Path
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Add parent directory to path for imports
@@ -41,8 +46,11 @@ from app.core.database import AsyncSessionLocal
 from app.models.public_chart import PublicChart
 from app.models.public_chart_interpretation import PublicChartInterpretation
 from app.repositories.public_interpretation_repository import PublicInterpretationRepository
-from app.services.interpretation_service_rag import InterpretationServiceRAG
 from app.services.personal_growth_service import PersonalGrowthService
+from app.services.public_chart_service import PublicChartService
+
+# Default number of charts processed at the same time
+DEFAULT_CONCURRENCY = 3
 
 
 def get_chart_data_for_language(chart: PublicChart, language: str) -> dict[str, Any] | None:
@@ -76,252 +84,10 @@ def get_chart_data_for_language(chart: PublicChart, language: str) -> dict[str,
 
 async def clear_chart_interpretations(db: AsyncSession, chart_id: UUID) -> int:
     """Delete all existing interpretations for a chart."""
-    stmt = select(PublicChartInterpretation).where(PublicChartInterpretation.chart_id == chart_id)
+    stmt = delete(PublicChartInterpretation).where(PublicChartInterpretation.chart_id == chart_id)
     result = await db.execute(stmt)
-    interpretations = result.scalars().all()
-
-    count = 0
-    for interp in interpretations:
-        await db.delete(interp)
-        count += 1
-
-    await db.commit()
-    return count
-
-
-async def generate_planet_interpretations(
-    db: AsyncSession,
-    chart: PublicChart,
-    rag_service: InterpretationServiceRAG,
-    language: str,
-    repo: PublicInterpretationRepository,
-) -> int:
-    """Generate interpretations for all planets."""
-    chart_data = get_chart_data_for_language(chart, language)
-    if not chart_data:
-        return 0
-
-    planets_data = chart_data.get("planets", [])
-    sect = chart_data.get("sect", "diurnal")
-    count = 0
-
-    for planet in planets_data:
-        planet_name = planet.get("name", "")
-        if not planet_name:
-            continue
-
-        sign = planet.get("sign", "")
-        house = planet.get("house", 1)
-        retrograde = planet.get("retrograde", False)
-        dignities = planet.get("dignities", {})
-
-        interpretation = await rag_service.generate_planet_interpretation(
-            planet=planet_name,
-            sign=sign,
-            house=house,
-            dignities=dignities,
-            sect=sect,
-            retrograde=retrograde,
-        )
-
-        # Use upsert to handle updates
-        await repo.upsert_interpretation(
-            chart_id=chart.id,
-            interpretation_type="planet",
-            subject=planet_name,
-            content=interpretation,
-            language=language,
-            openai_model="gpt-4o-mini-rag",
-            prompt_version="rag-v1",
-        )
-        count += 1
-
-    await db.commit()
-    return count
-
-
-async def generate_house_interpretations(
-    db: AsyncSession,
-    chart: PublicChart,
-    rag_service: InterpretationServiceRAG,
-    language: str,
-    repo: PublicInterpretationRepository,
-) -> int:
-    """Generate interpretations for all houses."""
-    chart_data = get_chart_data_for_language(chart, language)
-    if not chart_data:
-        return 0
-
-    houses_data = chart_data.get("houses", [])
-    planets_data = chart_data.get("planets", [])
-    sect = chart_data.get("sect", "diurnal")
-    count = 0
-
-    for house in houses_data:
-        house_number = house.get("house", 0) or house.get("number", 0)
-        house_sign = house.get("sign", "")
-
-        if not house_number or not house_sign:
-            continue
-
-        from app.astro.dignities import get_sign_ruler
-
-        ruler = get_sign_ruler(house_sign) or "Unknown"
-
-        # Find ruler's dignities
-        ruler_dignities: dict[str, Any] = {}
-        for planet_data in planets_data:
-            if planet_data.get("name") == ruler:
-                ruler_dignities = planet_data.get("dignities", {})
-                break
-
-        interpretation = await rag_service.generate_house_interpretation(
-            house=house_number,
-            sign=house_sign,
-            ruler=ruler,
-            ruler_dignities=ruler_dignities,
-            sect=sect,
-        )
-
-        # Use upsert to handle updates
-        await repo.upsert_interpretation(
-            chart_id=chart.id,
-            interpretation_type="house",
-            subject=str(house_number),
-            content=interpretation,
-            language=language,
-            openai_model="gpt-4o-mini-rag",
-            prompt_version="rag-v1",
-        )
-        count += 1
-
-    await db.commit()
-    return count
-
-
-async def generate_aspect_interpretations(
-    db: AsyncSession,
-    chart: PublicChart,
-    rag_service: InterpretationServiceRAG,
-    language: str,
-    repo: PublicInterpretationRepository,
-) -> int:
-    """Generate interpretations for aspects."""
-    chart_data = get_chart_data_for_language(chart, language)
-    if not chart_data:
-        return 0
-
-    aspects_list = chart_data.get("aspects", [])
-    planets_data = chart_data.get("planets", [])
-    sect = chart_data.get("sect", "diurnal")
-    max_aspects = settings.RAG_MAX_ASPECTS
-    count = 0
-
-    for aspect in aspects_list[:max_aspects]:
-        planet1 = aspect.get("planet1", "")
-        planet2 = aspect.get("planet2", "")
-        aspect_name = aspect.get("aspect", "")
-        orb = aspect.get("orb", 0.0)
-
-        if not all([planet1, planet2, aspect_name]):
-            continue
-
-        planet1_data: dict[str, Any] = next(
-            (p for p in planets_data if p.get("name") == planet1), {}
-        )
-        planet2_data: dict[str, Any] = next(
-            (p for p in planets_data if p.get("name") == planet2), {}
-        )
-
-        sign1 = planet1_data.get("sign", "")
-        sign2 = planet2_data.get("sign", "")
-        dignities1 = planet1_data.get("dignities", {})
-        dignities2 = planet2_data.get("dignities", {})
-        applying = aspect.get("applying", False)
-
-        interpretation = await rag_service.generate_aspect_interpretation(
-            planet1=planet1,
-            planet2=planet2,
-            aspect=aspect_name,
-            sign1=sign1,
-            sign2=sign2,
-            orb=orb,
-            applying=applying,
-            sect=sect,
-            dignities1=dignities1,
-            dignities2=dignities2,
-        )
-
-        aspect_key = f"{planet1}-{aspect_name}-{planet2}"
-
-        # Use upsert to handle updates
-        await repo.upsert_interpretation(
-            chart_id=chart.id,
-            interpretation_type="aspect",
-            subject=aspect_key,
-            content=interpretation,
-            language=language,
-            openai_model="gpt-4o-mini-rag",
-            prompt_version="rag-v1",
-        )
-        count += 1
-
     await db.commit()
-    return count
-
-
-async def generate_arabic_parts_interpretations(
-    db: AsyncSession,
-    chart: PublicChart,
-    rag_service: InterpretationServiceRAG,
-    language: str,
-    repo: PublicInterpretationRepository,
-) -> int:
-    """Generate interpretations for Arabic Parts."""
-    chart_data = get_chart_data_for_language(chart, language)
-    if not chart_data:
-        return 0
-
-    arabic_parts_data = chart_data.get("arabic_parts", {})
-    if not arabic_parts_data:
-        return 0
-
-    from app.services.interpretation_service_rag import ARABIC_PARTS
-
-    count = 0
-
-    sect = chart_data.get("sect", "diurnal")
-
-    for part_key, part_data in arabic_parts_data.items():
-        if part_key not in ARABIC_PARTS:
-            continue
-
-        sign = part_data.get("sign", "")
-        house = part_data.get("house", 1)
-        degree = part_data.get("degree", 0.0)
-
-        interpretation = await rag_service.generate_arabic_part_interpretation(
-            part_key=part_key,
-            sign=sign,
-            house=house,
-            degree=degree,
-            sect=sect,
-        )
-
-        # Use upsert to handle updates
-        await repo.upsert_interpretation(
-            chart_id=chart.id,
-            interpretation_type="arabic_part",
-            subject=part_key,
-            content=interpretation,
-            language=language,
-            openai_model="gpt-4o-mini-rag",
-            prompt_version="rag-v1",
-        )
-        count += 1
-
-    await db.commit()
-    return count
+    return int(result.rowcount or 0)
 
 
 async def generate_growth_interpretation(
@@ -384,62 +150,100 @@ async def generate_chart_interpretations(
     clear: bool = False,
 ) -> dict[str, int]:
     """Generate all interpretations for a single chart."""
-    logger.info(f"\n{'=' * 60}")
-    logger.info(f"Chart: {chart.full_name} ({chart.slug})")
-    logger.info(f"Language: {language}")
-    logger.info(f"{'=' * 60}")
+    logger.info(f"Chart: {chart.full_name} ({chart.slug}), language: {language}")
 
     # Clear existing interpretations if requested
     if clear:
         deleted = await clear_chart_interpretations(db, chart.id)
         logger.info(f"Deleted {deleted} existing interpretations")
 
-    # Initialize repository and RAG service with cache enabled
     repo = PublicInterpretationRepository(db)
-    rag_service = InterpretationServiceRAG(db, use_cache=True, use_rag=True, language=language)
-
-    # Generate all interpretation types
-    counts = {}
-
-    logger.info("Generating planet interpretations...")
-    counts["planets"] = await generate_planet_interpretations(
-        db, chart, rag_service, language, repo
-    )
-    logger.success(f"✓ Generated {counts['planets']} planet interpretations")
-
-    logger.info("Generating house interpretations...")
-    counts["houses"] = await generate_house_interpretations(db, chart, rag_service, language, repo)
-    logger.success(f"✓ Generated {counts['houses']} house interpretations")
 
-    logger.info("Generating aspect interpretations...")
-    counts["aspects"] = await generate_aspect_interpretations(
-        db, chart, rag_service, language, repo
+    # Planets, houses, aspects and Arabic Parts: generated concurrently and
+    # saved with one bulk upsert
+    if not get_chart_data_for_language(chart, language):
+        return {}
+    results = await PublicChartService(db).generate_interpretations(chart, language)
+    counts = {category: len(items) for category, items in results.items()}
+    logger.success(
+        f"✓ {chart.slug} ({language}): {counts['planets']} planets, "
+        f"{counts['houses']} houses, {counts['aspects']} aspects, "
+        f"{counts['arabic_parts']} Arabic Parts"
     )
-    logger.success(f"✓ Generated {counts['aspects']} aspect interpretations")
-
-    logger.info("Generating Arabic Parts interpretations...")
-    counts["arabic_parts"] = await generate_arabic_parts_interpretations(
-        db, chart, rag_service, language, repo
-    )
-    logger.success(f"✓ Generated {counts['arabic_parts']} Arabic Parts interpretations")
 
     # Generate growth interpretations
-    logger.info("Generating growth suggestions...")
+    logger.info(f"Generating growth suggestions for {chart.slug} ({language})...")
     counts["growth"] = await generate_growth_interpretation(db, chart, language, repo)
     logger.success(f"✓ Generated {counts['growth']} growth interpretations")
 
     total = sum(counts.values())
-    logger.info(f"\nTotal interpretations generated: {total}")
+    logger.info(f"Total interpretations generated for {chart.slug} ({language}): {total}")
 
     return counts
 
 
+async def process_chart(
+    chart_id: UUID,
+    languages: list[str],
+    clear: bool,
+    semaphore: asyncio.Semaphore,
+    total_counts: dict[str, int],
+) -> tuple[int, int]:
+    """
+    Generate one chart's interpretations in every language in its own session.
+
+    Returns:
+        (successful languages, failed languages)
+    """
+    success_count = 0
+    fail_count = 0
+
+    async with semaphore, AsyncSessionLocal() as chart_db:
+        try:
+            chart_stmt = select(PublicChart).where(PublicChart.id == chart_id)
+            chart = (await chart_db.execute(chart_stmt)).scalar_one_or_none()
+
+            if not chart:
+                logger.warning(f"Chart {chart_id} not found, skipping...")
+                return 0, len(languages)
+
+            logger.info(f"Processing {chart.full_name}...")
+
+            # Only clear once before processing all languages
+            # (not inside the loop, which would delete previous language's data)
+            should_clear = clear
+            for language in languages:
+                try:
+                    counts = await generate_chart_interpretations(
+                        chart_db, chart, language, should_clear
+                    )
+                    should_clear = False  # Only clear on first iteration
+
+                    # Aggregate counts
+                    for key, value in counts.items():
+                        total_counts[key] = total_counts.get(key, 0) + value
+
+                    success_count += 1
+
+                except Exception as e:
+                    logger.error(f"Failed to generate {language} interpretations: {e}")
+                    await chart_db.rollback()
+                    fail_count += 1
+
+        except Exception as exc:
+            logger.error(f"Failed to process chart {chart_id}: {exc}")
+            return success_count, len(languages) - success_count
+
+    return success_count, fail_count
+
+
 async def main(
     clear: bool = False,
     verbose: bool = False,
     languages: list[str] | None = None,
     chart_slug: str | None = None,
     skip_completed: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
 ) -> None:
     """Main entry point."""
     if verbose:
@@ -460,6 +264,7 @@ async def main(
     logger.info(f"Languages: {', '.join(languages)}")
     logger.info(f"Clear existing: {clear}")
     logger.info(f"Skip completed: {skip_completed}")
+    logger.info(f"Concurrency: {concurrency}")
     if chart_slug:
         logger.info(f"Specific chart: {chart_slug}")
     logger.info(f"{'=' * 60}\n")
@@ -505,52 +310,17 @@ async def main(
 
             logger.info(f"Found {len(charts)} charts to process\n")
 
-            # Process each chart in each language
+            # Process charts concurrently, each chart in each language
             total_counts: dict[str, int] = {}
-            success_count = 0
-            fail_count = 0
-
-            for i, chart in enumerate(charts, 1):
-                # Create fresh session for each chart to avoid transaction issues
-                async with AsyncSessionLocal() as chart_db:
-                    try:
-                        logger.info(f"\n[{i}/{len(charts)}] Processing {chart.full_name}...")
-
-                        # Reload chart in new session
-                        chart_stmt = select(PublicChart).where(PublicChart.id == chart.id)
-                        chart_result = await chart_db.execute(chart_stmt)
-                        fresh_chart = chart_result.scalar_one_or_none()
-
-                        if not fresh_chart:
-                            logger.warning(f"Chart {chart.id} not found, skipping...")
-                            fail_count += len(languages)
-                            continue
-
-                        # Only clear once before processing all languages
-                        # (not inside the loop, which would delete previous language's data)
-                        should_clear = clear
-                        for language in languages:
-                            try:
-                                counts = await generate_chart_interpretations(
-                                    chart_db, fresh_chart, language, should_clear
-                                )
-                                should_clear = False  # Only clear on first iteration
-
-                                # Aggregate counts
-                                for key, value in counts.items():
-                                    total_counts[key] = total_counts.get(key, 0) + value
-
-                                success_count += 1
-
-                            except Exception as e:
-                                logger.error(f"Failed to generate {language} interpretations: {e}")
-                                await chart_db.rollback()
-                                fail_count += 1
-                                continue
-
-                    except Exception as exc:
-                        logger.error(f"Failed to process chart {chart.id}: {exc}")
-                        fail_count += len(languages)
+            semaphore = asyncio.Semaphore(concurrency)
+            outcomes = await asyncio.gather(
+                *(
+                    process_chart(chart.id, languages, clear, semaphore, total_counts)
+                    for chart in charts
+                )
+            )
+            success_count = sum(ok for ok, _ in outcomes)
+            fail_count = sum(failed for _, failed in outcomes)
 
             # Final summary
             logger.info(f"\n{'=' * 60}")
@@ -588,9 +358,24 @@ if __name__ == "__main__":
         action="store_true",
         help="Skip charts that already have interpretations",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Number of charts processed at the same time (default: {DEFAULT_CONCURRENCY})",
+    )
 
     args = parser.parse_args()
 
     languages = ["pt-BR", "en-US"] if args.lang == "both" else [args.lang]
 
-    asyncio.run(main(args.clear, args.verbose, languages, args.chart, args.skip_completed))
+    asyncio.run(
+        main(
+            args.clear,
+            args.verbose,
+            languages,
+            args.chart,
+            args.skip_completed,
+            max(1, args.concurrency),
+        )
+    )
@@ -40,7 +40,7 @@ sys.path.insert(0, "/app")
 from app.core.database import AsyncSessionLocal
 from app.models.chart import BirthChart
 from app.models.public_chart import PublicChart
-from app.services.astro_service import calculate_birth_chart
+from app.services.astro_service import calculate_birth_chart_all_languages
 from app.translations import SUPPORTED_LANGUAGES
 from app.utils.chart_data_accessor import is_language_first_format, validate_language_data
 
@@ -71,17 +71,14 @@ async def migrate_birth_chart(chart: BirthChart, dry_run: bool = False) -> bool:
 
     try:
         # Regenerate chart data for all supported languages
-        chart_data_by_lang: dict[str, Any] = {}
-        for language in SUPPORTED_LANGUAGES:
-            logger.debug(f"Calculating {language} chart data for BirthChart {chart.id}")
-            chart_data_by_lang[language] = calculate_birth_chart(
-                birth_datetime=chart.birth_datetime,
-                timezone=chart.birth_timezone,
-                latitude=float(chart.latitude),
-                longitude=float(chart.longitude),
-                house_system=chart.house_system,
-                language=language,
-            )
+        logger.debug(f"Calculating chart data for BirthChart {chart.id}")
+        chart_data_by_lang: dict[str, Any] = calculate_birth_chart_all_languages(
+            birth_datetime=chart.birth_datetime,
+            timezone=chart.birth_timezone,
+            latitude=float(chart.latitude),
+            longitude=float(chart.longitude),
+            house_system=chart.house_system,
+        )
 
         # Validate the new data before saving
         for language in SUPPORTED_LANGUAGES:
@@ -118,17 +115,14 @@ async def migrate_public_chart(chart: PublicChart, dry_run: bool = False) -> boo
 
     try:
         # Regenerate chart data for all supported languages
-        chart_data_by_lang: dict[str, Any] = {}
-        for language in SUPPORTED_LANGUAGES:
-            logger.debug(f"Calculating {language} chart data for PublicChart {chart.slug}")
-            chart_data_by_lang[language] = calculate_birth_chart(
-                birth_datetime=chart.birth_datetime,
-                timezone=chart.birth_timezone,
-                latitude=float(chart.latitude),
-                longitude=float(chart.longitude),
-                house_system=chart.house_system or "placidus",
-                language=language,
-            )
+        logger.debug(f"Calculating chart data for PublicChart {chart.slug}")
+        chart_data_by_lang: dict[str, Any] = calculate_birth_chart_all_languages(
+            birth_datetime=chart.birth_datetime,
+            timezone=chart.birth_timezone,
+            latitude=float(chart.latitude),
+            longitude=float(chart.longitude),
+            house_system=chart.house_system or "placidus",
+        )
 
         # Validate the new data before saving
         for language in SUPPORTED_LANGUAGES:
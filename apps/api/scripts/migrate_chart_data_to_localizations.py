@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Migration script to split language-keyed chart_data into a shared section plus
+one birth_chart_localizations row per language.
+
+Before: birth_charts.chart_data = {"en-US": {...}, "pt-BR": {...}}
+After:  birth_charts.chart_data = {...shared positions, houses, aspects...}
+        birth_chart_localizations = [("en-US", {...}), ("pt-BR", {...})]
+
+Readers handle both layouts, so the migration can run while the API is up.
+Charts are processed in batches (keyset pagination by id), one commit per batch.
+
+Only BirthCharts are migrated; PublicChart keeps its language-keyed chart_data.
+
+Usage:
+    # Dry run (no changes)
+    uv run python scripts/migrate_chart_data_to_localizations.py --dry-run
+
+    # Migrate all charts
+    uv run python scripts/migrate_chart_data_to_localizations.py
+
+    # Migrate specific chart
+    uv run python scripts/migrate_chart_data_to_localizations.py --chart-id <uuid>
+
+    # Rebuild language-keyed chart_data (run before downgrading the migration)
+    uv run python scripts/migrate_chart_data_to_localizations.py --revert
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import UTC, datetime
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import Select, exists, or_, select
+
+# Add the app directory to the path
+sys.path.insert(0, "/app")
+
+from app.core.database import AsyncSessionLocal
+from app.models.chart import BirthChart
+from app.models.chart_localization import BirthChartLocalization
+from app.repositories.chart_repository import ChartRepository
+from app.translations import SUPPORTED_LANGUAGES
+
+DEFAULT_BATCH_SIZE = 200
+
+
+def build_query(revert: bool, chart_id: str | None) -> Select[tuple[BirthChart]]:
+    """Select the charts still to migrate (or to revert), ordered by id."""
+    is_language_first = or_(
+        *(BirthChart.chart_data.has_key(language) for language in SUPPORTED_LANGUAGES)
+    )
+    has_localizations = exists().where(BirthChartLocalization.chart_id == BirthChart.id)
+
+    query = select(BirthChart).where(BirthChart.chart_data.isnot(None))
+    if revert:
+        query = query.where(~is_language_first, has_localizations)
+    else:
+        query = query.where(is_language_first)
+
+    if chart_id:
+        query = query.where(BirthChart.id == UUID(chart_id))
+    return query.order_by(BirthChart.id)
+
+
+async def main(
+    dry_run: bool = False,
+    chart_id: str | None = None,
+    revert: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> None:
+    """Main migration function."""
+    start_time = datetime.now(UTC)
+
+    logger.info("=" * 70)
+    logger.info("Chart Data Migration to Per-Language Rows")
+    logger.info("=" * 70)
+    logger.info(f"Mode: {'DRY RUN' if dry_run else 'LIVE MIGRATION'}")
+    logger.info(f"Direction: {'revert to language-keyed chart_data' if revert else 'split'}")
+    logger.info(f"Batch size: {batch_size}")
+    if chart_id:
+        logger.info(f"Target: Specific chart {chart_id}")
+    logger.info("")
+
+    query = build_query(revert, chart_id)
+    migrated = 0
+    failed = 0
+    last_id: UUID | None = None
+
+    while True:
+        async with AsyncSessionLocal() as db:
+            batch_query = query if last_id is None else query.where(BirthChart.id > last_id)
+            result = await db.execute(batch_query.limit(batch_size))
+            charts = result.scalars().all()
+            if not charts:
+                break
+            last_id = charts[-1].id
+
+            chart_repo = ChartRepository(db)
+            for chart in charts:
+                if dry_run:
+                    logger.info(f"[DRY RUN] Would migrate BirthChart {chart.id}")
+                    migrated += 1
+                    continue
+                try:
+                    async with db.begin_nested():
+                        if revert:
+                            chart.chart_data = await chart_repo.get_chart_data_all_languages(chart)
+                        else:
+                            await chart_repo.save_chart_data(chart, chart.chart_data)
+                    migrated += 1
+                except Exception as e:
+                    logger.error(f"✗ Failed to migrate BirthChart {chart.id}: {e}")
+                    failed += 1
+
+            if not dry_run:
+                await db.commit()
+            logger.info(f"Processed {migrated + failed} charts (last id {last_id})")
+
+    # Summary
+    elapsed = (datetime.now(UTC) - start_time).total_seconds()
+
+    logger.info("")
+    logger.info("=" * 70)
+    logger.info("Migration Summary")
+    logger.info("=" * 70)
+    logger.info(f"  ✓ Migrated: {migrated}")
+    logger.info(f"  ✗ Failed: {failed}")
+    logger.info(f"\nElapsed time: {elapsed:.2f} seconds")
+
+    if dry_run:
+        logger.info("\n[DRY RUN] No changes were made to the database")
+    elif migrated == 0 and failed == 0:
+        logger.info("\nℹ️  No charts needed migration")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Split language-keyed chart data into per-language rows"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would be migrated without making changes",
+    )
+    parser.add_argument(
+        "--chart-id",
+        type=str,
+        help="Migrate a specific BirthChart by UUID",
+    )
+    parser.add_argument(
+        "--revert",
+        action="store_true",
+        help="Rebuild language-keyed chart_data from the per-language rows",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Charts per batch and commit (default: {DEFAULT_BATCH_SIZE})",
+    )
+
+    args = parser.parse_args()
+
+    asyncio.run(
+        main(
+            dry_run=args.dry_run,
+            chart_id=args.chart_id,
+            revert=args.revert,
+            batch_size=args.batch_size,
+        )
+    )
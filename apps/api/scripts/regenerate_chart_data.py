@@ -28,10 +28,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from loguru import logger
 
+from app.astro.ephemeris import cache_info as ephemeris_cache_info
 from app.core.database import AsyncSessionLocal
 from app.models.chart import BirthChart
 from app.models.public_chart import PublicChart
 from app.services.astro_service import calculate_birth_chart
+from app.services.timezone_service import cache_info as timezone_cache_info
 
 
 async def regenerate_birth_charts(
@@ -228,6 +230,13 @@ async def main() -> None:
             logger.info("REGENERATION COMPLETE")
             logger.info(f"{'=' * 60}")
             logger.info(f"✓ Total success: {total_success}")
+            stats = ephemeris_cache_info()
+            logger.info(
+                f"Ephemeris cache: {stats['hits']} hits, {stats['misses']} misses "
+                f"({stats['size']} entries)"
+            )
+            jd_stats = timezone_cache_info()["julian_day"]
+            logger.info(f"Julian Day cache: {jd_stats['hits']} hits, {jd_stats['misses']} misses")
             if total_fail > 0:
                 logger.warning(f"✗ Total failed: {total_fail}")
             if args.dry_run:
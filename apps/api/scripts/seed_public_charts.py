@@ -34,7 +34,7 @@ from loguru import logger
 from app.core.database import AsyncSessionLocal
 from app.models.public_chart import PublicChart
 from app.models.public_chart_interpretation import PublicChartInterpretation
-from app.services.astro_service import calculate_birth_chart
+from app.services.chart_cache_service import get_or_calculate_birth_chart
 
 # Famous personalities with accurate birth data from AstroDatabank
 PERSONALITIES = [
@@ -802,30 +802,17 @@ def generate_chart_data(personality: dict[str, Any]) -> dict[str, Any]:
     Returns a dict with language keys: {"en-US": {...}, "pt-BR": {...}}
     This allows the API to return the correct language based on the request.
     """
-    # Generate chart data for both languages
-    chart_data_en = calculate_birth_chart(
+    # Ephemeris work runs once (or not at all when re-seeding: results are cached
+    # by birth data); each language is a cheap localization pass
+    return get_or_calculate_birth_chart(
         birth_datetime=personality["birth_datetime"],
         timezone=personality["birth_timezone"],
         latitude=personality["latitude"],
         longitude=personality["longitude"],
         house_system="placidus",
-        language="en-US",
+        languages=["en-US", "pt-BR"],
     )
 
-    chart_data_pt = calculate_birth_chart(
-        birth_datetime=personality["birth_datetime"],
-        timezone=personality["birth_timezone"],
-        latitude=personality["latitude"],
-        longitude=personality["longitude"],
-        house_system="placidus",
-        language="pt-BR",
-    )
-
-    return {
-        "en-US": chart_data_en,
-        "pt-BR": chart_data_pt,
-    }
-
 
 async def seed_personality(db: AsyncSession, personality: dict[str, Any]) -> None:
     """Seed a single personality with chart (interpretations generated on-demand)."""
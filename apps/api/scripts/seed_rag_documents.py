@@ -16,6 +16,9 @@ Usage:
 
     # Clear existing documents first
     docker compose exec api uv run python scripts/seed_rag_documents.py --clear
+
+    # Tune the bulk pipeline (chunks per batch, batches embedded concurrently)
+    docker compose exec api uv run python scripts/seed_rag_documents.py --batch-size 128 --concurrency 8
 """
 
 import asyncio
@@ -47,6 +50,8 @@ from app.models import (  # noqa: F401
     VectorDocument,
 )
 from app.services.rag import document_ingestion_service
+from app.services.rag.document_ingestion_service import IngestionItem
+from app.services.rag.embedding_cache_service import EmbeddingCacheService
 
 # Sample astrology documents to ingest
 ASTROLOGY_DOCUMENTS = [
@@ -549,19 +554,6 @@ Sect é um conceito fundamental da astrologia tradicional que divide mapas em di
 ]
 
 
-async def generate_embedding(text: str, client: AsyncOpenAI) -> list[float] | None:
-    """Generate embedding for text using OpenAI."""
-    try:
-        response = await client.embeddings.create(
-            model=settings.OPENAI_EMBEDDING_MODEL,
-            input=text,
-        )
-        return response.data[0].embedding
-    except Exception as e:
-        logger.error(f"Failed to generate embedding: {e}")
-        return None
-
-
 async def clear_existing_documents(db: AsyncSession) -> None:
     """Clear all existing documents from database."""
     try:
@@ -569,6 +561,10 @@ async def clear_existing_documents(db: AsyncSession) -> None:
         await db.execute(delete(SearchIndex))
         await db.execute(delete(VectorDocument))
         await db.commit()
+
+        # The persisted BM25 index would otherwise keep the deleted chunks
+        document_ingestion_service.bm25.build_index([], [])
+        document_ingestion_service.bm25.persist()
         logger.info("✅ Cleared existing documents")
     except Exception as e:
         logger.error(f"Failed to clear documents: {e}")
@@ -576,13 +572,20 @@ async def clear_existing_documents(db: AsyncSession) -> None:
         raise
 
 
-async def seed_documents(clear: bool = False, verbose: bool = False) -> None:
+async def seed_documents(
+    clear: bool = False,
+    verbose: bool = False,
+    batch_size: int | None = None,
+    concurrency: int | None = None,
+) -> None:
     """
     Seed RAG system with astrology knowledge documents.
 
     Args:
         clear: If True, clear existing documents first
         verbose: Enable verbose logging
+        batch_size: Chunks per embedding/Qdrant/database batch
+        concurrency: Batches embedded concurrently
     """
     if verbose:
         logger.remove()
@@ -603,9 +606,18 @@ async def seed_documents(clear: bool = False, verbose: bool = False) -> None:
 
     openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
 
-    # Create embedding function
-    async def get_embeddings(text: str) -> list[float] | None:
-        return await generate_embedding(text, openai_client)
+    # Batched embedding function (one API request per batch of chunks)
+    embedding_service = EmbeddingCacheService(openai_client)
+
+    items = [
+        IngestionItem(
+            title=doc_data["title"],
+            content=doc_data["content"],
+            document_type=doc_data["document_type"],
+            metadata=doc_data.get("metadata", {}),
+        )
+        for doc_data in ASTROLOGY_DOCUMENTS
+    ]
 
     # Connect to database
     async with AsyncSessionLocal() as db:
@@ -613,40 +625,22 @@ async def seed_documents(clear: bool = False, verbose: bool = False) -> None:
         if clear:
             await clear_existing_documents(db)
 
-        # Ingest each document
-        total_chunks = 0
-        failed = 0
-
-        for idx, doc_data in enumerate(ASTROLOGY_DOCUMENTS, 1):
-            try:
-                logger.info(f"\n[{idx}/{len(ASTROLOGY_DOCUMENTS)}] Ingesting: {doc_data['title']}")
-
-                documents = await document_ingestion_service.ingest_text(
-                    db=db,
-                    title=doc_data["title"],
-                    content=doc_data["content"],
-                    document_type=doc_data["document_type"],
-                    metadata=doc_data.get("metadata", {}),
-                    get_embeddings_func=get_embeddings,
-                )
-
-                total_chunks += len(documents)
-                logger.info(
-                    f"✅ Successfully ingested '{doc_data['title']}' ({len(documents)} chunks)"
-                )
-
-            except Exception as e:
-                logger.error(f"❌ Failed to ingest '{doc_data['title']}': {e}")
-                failed += 1
+        result = await document_ingestion_service.ingest_many(
+            db=db,
+            items=items,
+            embed_batch_func=embedding_service.embed_many,
+            batch_size=batch_size,
+            concurrency=concurrency,
+        )
 
     # Print summary
     logger.info("\n" + "=" * 70)
     logger.info("SEEDING SUMMARY")
     logger.info("=" * 70)
     logger.info(f"Total documents: {len(ASTROLOGY_DOCUMENTS)}")
-    logger.info(f"✅ Successfully ingested: {len(ASTROLOGY_DOCUMENTS) - failed}")
-    logger.info(f"❌ Failed: {failed}")
-    logger.info(f"📦 Total chunks created: {total_chunks}")
+    logger.info(f"📦 Total chunks created: {result.chunks}")
+    logger.info(f"🧭 Chunks with embeddings: {result.indexed}")
+    logger.info(f"❌ Failed chunks: {result.failed}")
     logger.info("=" * 70)
 
     # Get final stats
@@ -683,10 +677,31 @@ def main() -> int:
         help="Enable verbose logging",
     )
 
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help=f"Chunks per batch (default: {settings.RAG_INGEST_BATCH_SIZE})",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help=f"Batches embedded concurrently (default: {settings.RAG_INGEST_CONCURRENCY})",
+    )
+
     args = parser.parse_args()
 
     try:
-        asyncio.run(seed_documents(clear=args.clear, verbose=args.verbose))
+        asyncio.run(
+            seed_documents(
+                clear=args.clear,
+                verbose=args.verbose,
+                batch_size=args.batch_size,
+                concurrency=args.concurrency,
+            )
+        )
         return 0
     except Exception as e:
         logger.error(f"Seeding failed: {e}")
@@ -4,21 +4,29 @@ Script to download RAG documents from S3 and ingest into Qdrant + PostgreSQL.
 
 This script:
 1. Lists all documents in S3 bucket (genesis-dev-559050210551) with prefix rag_documents
-2. Downloads each document
+2. Downloads and extracts documents, several at a time
 3. Ingests into PostgreSQL vector_documents table
 4. Creates embeddings and stores in Qdrant
 5. Creates BM25 search indices
 
+Steps 3-5 run as a batched pipeline (DocumentIngestionService.ingest_many):
+chunks are embedded in batches with one API request each, upserted to Qdrant
+and inserted into PostgreSQL in bulk.
+
 Usage:
     docker compose exec api uv run python scripts/seed_rag_from_s3.py
 
     # With options
     docker compose exec api uv run python scripts/seed_rag_from_s3.py --clear --verbose
+
+    # Tune the pipeline (chunks per batch, batches/downloads in flight)
+    docker compose exec api uv run python scripts/seed_rag_from_s3.py --batch-size 128 --concurrency 8
 """
 
 import asyncio
 import sys
 import tempfile
+from collections.abc import AsyncIterator
 from pathlib import Path
 
 sys.path.insert(0, "/app")
@@ -48,19 +56,8 @@ from app.models import (  # noqa: F401
     VectorDocument,
 )
 from app.services.rag import document_ingestion_service
-
-
-async def generate_embedding(text: str, client: AsyncOpenAI) -> list[float] | None:
-    """Generate embedding for text using OpenAI."""
-    try:
-        response = await client.embeddings.create(
-            model=settings.OPENAI_EMBEDDING_MODEL,
-            input=text,
-        )
-        return response.data[0].embedding
-    except Exception as e:
-        logger.error(f"Failed to generate embedding: {e}")
-        return None
+from app.services.rag.document_ingestion_service import IngestionItem
+from app.services.rag.embedding_cache_service import EmbeddingCacheService
 
 
 async def clear_existing_documents(db: AsyncSession) -> None:
@@ -70,6 +67,10 @@ async def clear_existing_documents(db: AsyncSession) -> None:
         await db.execute(delete(SearchIndex))
         await db.execute(delete(VectorDocument))
         await db.commit()
+
+        # The persisted BM25 index would otherwise keep the deleted chunks
+        document_ingestion_service.bm25.build_index([], [])
+        document_ingestion_service.bm25.persist()
         logger.info("✅ Cleared existing documents from PostgreSQL")
     except Exception as e:
         logger.error(f"Failed to clear documents: {e}")
@@ -149,50 +150,103 @@ def determine_document_type(key: str) -> str:
     return "unknown"
 
 
-async def ingest_document(
-    db: AsyncSession,
+def load_document_items(
     file_path: Path,
     document_type: str,
     metadata: dict,
-    get_embeddings_func,
-) -> int:
+) -> list[IngestionItem]:
     """
-    Ingest a document (text or PDF) into the RAG system.
+    Extract ingestion items from a downloaded document.
 
     Returns:
-        Number of chunks created
+        One item per PDF page with text, or a single item for a text file
     """
+    if file_path.suffix.lower() == ".pdf":
+        return document_ingestion_service.read_pdf_pages(file_path, metadata)
+
+    with open(file_path, encoding="utf-8") as f:
+        content = f.read()
+
+    title = file_path.stem.replace("_", " ").replace("-", " ").title()
+    return [
+        IngestionItem(
+            title=title,
+            content=content,
+            document_type=document_type,
+            metadata=metadata,
+        )
+    ]
+
+
+def fetch_document(bucket: str, s3_doc: dict, download_dir: Path) -> list[IngestionItem] | None:
+    """
+    Download one S3 document and extract its items (blocking).
+
+    Returns:
+        Ingestion items, or None if the document could not be downloaded or read
+    """
+    key = s3_doc["key"]
+    download_dir.mkdir(parents=True, exist_ok=True)
+    local_path = download_dir / Path(key).name
+
+    if not download_s3_document(bucket, key, local_path):
+        return None
+
+    metadata = {
+        "s3_bucket": bucket,
+        "s3_key": key,
+        "source": "s3",
+        "file_size": s3_doc["size"],
+        "last_modified": s3_doc["last_modified"].isoformat(),
+    }
+
     try:
-        # Check file extension
-        if file_path.suffix.lower() == ".pdf":
-            # Ingest as PDF
-            documents = await document_ingestion_service.ingest_pdf(
-                db=db,
-                pdf_path=file_path,
-                metadata=metadata,
-                get_embeddings_func=get_embeddings_func,
-            )
-        else:
-            # Ingest as text
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
+        return load_document_items(local_path, determine_document_type(key), metadata)
+    except Exception as e:
+        logger.error(f"Failed to read {key}: {e}")
+        return None
+    finally:
+        # Clean up downloaded file
+        local_path.unlink(missing_ok=True)
 
-            title = file_path.stem.replace("_", " ").replace("-", " ").title()
 
-            documents = await document_ingestion_service.ingest_text(
-                db=db,
-                title=title,
-                content=content,
-                document_type=document_type,
-                metadata=metadata,
-                get_embeddings_func=get_embeddings_func,
+async def iter_s3_items(
+    bucket: str,
+    s3_documents: list[dict],
+    temp_dir: Path,
+    concurrency: int,
+    failed_keys: list[str],
+) -> AsyncIterator[IngestionItem]:
+    """
+    Download and extract S3 documents ``concurrency`` at a time, yielding their items.
+
+    The next downloads start only when the ingestion pipeline has taken the
+    previous items, so downloads never run far ahead of ingestion.
+    Keys that could not be ingested are appended to ``failed_keys``.
+    """
+    for start in range(0, len(s3_documents), concurrency):
+        window = list(enumerate(s3_documents[start : start + concurrency], start + 1))
+        results = await asyncio.gather(
+            *(
+                # One directory per document: keys may share a file name
+                asyncio.to_thread(fetch_document, bucket, s3_doc, temp_dir / str(idx))
+                for idx, s3_doc in window
             )
+        )
 
-        return len(documents)
+        for (idx, s3_doc), items in zip(window, results, strict=True):
+            size_mb = s3_doc["size"] / (1024 * 1024)
+            if items is None:
+                logger.error(f"❌ [{idx}/{len(s3_documents)}] Failed: {s3_doc['key']}")
+                failed_keys.append(s3_doc["key"])
+                continue
 
-    except Exception as e:
-        logger.error(f"Failed to ingest {file_path}: {e}")
-        raise
+            logger.info(
+                f"[{idx}/{len(s3_documents)}] Extracted {s3_doc['key']} "
+                f"({size_mb:.2f} MB, {len(items)} sections)"
+            )
+            for item in items:
+                yield item
 
 
 async def seed_from_s3(
@@ -200,6 +254,8 @@ async def seed_from_s3(
     prefix: str = "rag_documents",
     clear: bool = False,
     verbose: bool = False,
+    batch_size: int | None = None,
+    concurrency: int | None = None,
 ) -> None:
     """
     Download documents from S3 and seed RAG system.
@@ -209,6 +265,8 @@ async def seed_from_s3(
         prefix: S3 key prefix
         clear: If True, clear existing documents first
         verbose: Enable verbose logging
+        batch_size: Chunks per embedding/Qdrant/database batch
+        concurrency: Batches embedded (and documents downloaded) concurrently
     """
     if verbose:
         logger.remove()
@@ -236,8 +294,9 @@ async def seed_from_s3(
     # Initialize OpenAI client
     openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
 
-    async def get_embeddings(text: str) -> list[float] | None:
-        return await generate_embedding(text, openai_client)
+    # Batched embedding function (one API request per batch of chunks)
+    embedding_service = EmbeddingCacheService(openai_client)
+    concurrency = concurrency or settings.RAG_INGEST_CONCURRENCY
 
     # Connect to database
     async with AsyncSessionLocal() as db:
@@ -256,73 +315,28 @@ async def seed_from_s3(
         logger.warning(f"No documents found in s3://{bucket}/{prefix}")
         return
 
-    # Process each document
-    total_chunks = 0
-    failed = 0
-    temp_dir = Path(tempfile.mkdtemp())
-
-    try:
-        for idx, s3_doc in enumerate(s3_documents, 1):
-            key = s3_doc["key"]
-            size_mb = s3_doc["size"] / (1024 * 1024)
-
-            logger.info(f"\n[{idx}/{len(s3_documents)}] Processing: {key} ({size_mb:.2f} MB)")
-
-            # Download to temp directory
-            filename = Path(key).name
-            local_path = temp_dir / filename
-
-            if not download_s3_document(bucket, key, local_path):
-                logger.error(f"❌ Failed to download {key}")
-                failed += 1
-                continue
-
-            # Determine document type and metadata
-            doc_type = determine_document_type(key)
-            metadata = {
-                "s3_bucket": bucket,
-                "s3_key": key,
-                "source": "s3",
-                "file_size": s3_doc["size"],
-                "last_modified": s3_doc["last_modified"].isoformat(),
-            }
-
-            # Ingest document
-            try:
-                async with AsyncSessionLocal() as db:
-                    chunks = await ingest_document(
-                        db=db,
-                        file_path=local_path,
-                        document_type=doc_type,
-                        metadata=metadata,
-                        get_embeddings_func=get_embeddings,
-                    )
-
-                    total_chunks += chunks
-                    logger.info(f"✅ Successfully ingested {filename} ({chunks} chunks)")
-
-            except Exception as e:
-                logger.error(f"❌ Failed to ingest {filename}: {e}")
-                failed += 1
-
-            # Clean up downloaded file
-            local_path.unlink(missing_ok=True)
-
-    finally:
-        # Clean up temp directory
-        try:
-            temp_dir.rmdir()
-        except Exception:
-            pass
+    # Download, extract and ingest through the pipeline
+    failed_keys: list[str] = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        async with AsyncSessionLocal() as db:
+            result = await document_ingestion_service.ingest_many(
+                db=db,
+                items=iter_s3_items(bucket, s3_documents, Path(temp_dir), concurrency, failed_keys),
+                embed_batch_func=embedding_service.embed_many,
+                batch_size=batch_size,
+                concurrency=concurrency,
+            )
 
     # Print summary
     logger.info("\n" + "=" * 70)
     logger.info("SEEDING SUMMARY")
     logger.info("=" * 70)
     logger.info(f"Total S3 documents: {len(s3_documents)}")
-    logger.info(f"✅ Successfully ingested: {len(s3_documents) - failed}")
-    logger.info(f"❌ Failed: {failed}")
-    logger.info(f"📦 Total chunks created: {total_chunks}")
+    logger.info(f"✅ Successfully extracted: {len(s3_documents) - len(failed_keys)}")
+    logger.info(f"❌ Failed documents: {len(failed_keys)}")
+    logger.info(f"📦 Total chunks created: {result.chunks}")
+    logger.info(f"🧭 Chunks with embeddings: {result.indexed}")
+    logger.info(f"❌ Failed chunks: {result.failed}")
     logger.info("=" * 70)
 
     # Get final stats
@@ -374,6 +388,20 @@ def main() -> int:
         help="Enable verbose logging",
     )
 
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help=f"Chunks per batch (default: {settings.RAG_INGEST_BATCH_SIZE})",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help=f"Batches and downloads in flight (default: {settings.RAG_INGEST_CONCURRENCY})",
+    )
+
     args = parser.parse_args()
 
     try:
@@ -383,6 +411,8 @@ def main() -> int:
                 prefix=args.prefix,
                 clear=args.clear,
                 verbose=args.verbose,
+                batch_size=args.batch_size,
+                concurrency=args.concurrency,
             )
         )
         return 0
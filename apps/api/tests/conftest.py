@@ -35,6 +35,13 @@ from app.models.blog_post import BlogPost  # noqa: E402
 from app.models.chart import AuditLog, BirthChart  # noqa: E402
 from app.models.enums import UserRole  # noqa: E402
 from app.models.user import OAuthAccount, User  # noqa: E402
+from app.services import (  # noqa: E402
+    auth_principal_cache,
+    chart_progress_service,
+    interpretation_cache_service,
+    public_chart_cache,
+)
+from app.services.rag import bm25_service, embedding_cache_service, retrieval_cache  # noqa: E402
 
 # Create test database engine
 test_engine = create_async_engine(
@@ -132,6 +139,53 @@ async def reset_rate_limits():
         await redis.close()
 
 
+@pytest.fixture(autouse=True)
+def isolate_interpretation_cache_tiers(monkeypatch: pytest.MonkeyPatch):
+    """
+    Keep interpretation cache tiers from leaking between tests.
+
+    Database changes are rolled back after each test, so cached content must
+    not survive in the in-process or Redis tiers either.
+    """
+    interpretation_cache_service.clear_local_state()
+    monkeypatch.setattr(interpretation_cache_service, "get_async_redis_pool", lambda: None)
+    yield
+    interpretation_cache_service.clear_local_state()
+
+
+@pytest.fixture(autouse=True)
+def isolate_rag_caches(monkeypatch: pytest.MonkeyPatch):
+    """Keep cached embeddings, search results and the BM25 index from leaking between tests."""
+    embedding_cache_service.clear_local_embeddings()
+    retrieval_cache.clear_local_cache()
+    monkeypatch.setattr(retrieval_cache, "get_async_redis_pool", lambda: None)
+    monkeypatch.setattr(bm25_service, "index_dir", None)
+    yield
+    embedding_cache_service.clear_local_embeddings()
+    retrieval_cache.clear_local_cache()
+
+
+@pytest.fixture(autouse=True)
+def isolate_public_chart_cache(monkeypatch: pytest.MonkeyPatch):
+    """Keep cached public chart listings from outliving each test's rolled-back data."""
+    monkeypatch.setattr(public_chart_cache, "get_async_redis_pool", lambda: None)
+
+
+@pytest.fixture(autouse=True)
+def isolate_chart_progress(monkeypatch: pytest.MonkeyPatch):
+    """Keep progress states of rolled-back charts from answering later status checks."""
+    monkeypatch.setattr(chart_progress_service, "get_async_redis_pool", lambda: None)
+
+
+@pytest.fixture(autouse=True)
+def isolate_auth_principals(monkeypatch: pytest.MonkeyPatch):
+    """Keep cached principals of rolled-back users from authenticating later tests."""
+    auth_principal_cache.clear_local_cache()
+    monkeypatch.setattr(auth_principal_cache, "get_async_redis_pool", lambda: None)
+    yield
+    auth_principal_cache.clear_local_cache()
+
+
 @pytest.fixture
 async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:  # type: ignore[misc]  # noqa: UP043
     """
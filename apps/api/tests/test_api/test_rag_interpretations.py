@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.chart import BirthChart
 from app.models.interpretation import ChartInterpretation
 from app.models.user import User
+from app.repositories.chart_repository import ChartRepository
 from app.services.interpretation_service_rag import RAG_PROMPT_VERSION
 
 
@@ -159,6 +160,37 @@ async def test_chart_with_interpretations(
     return chart
 
 
+@pytest.fixture
+async def test_chart_with_localized_data(
+    db_session: AsyncSession,
+    test_user: User,
+    test_chart_data: dict,
+) -> BirthChart:
+    """Create a test chart stored like calculated charts (shared section + translations)."""
+    chart = BirthChart(
+        id=uuid4(),
+        user_id=test_user.id,
+        person_name="Localized Chart",
+        birth_datetime=datetime(1990, 5, 15, 10, 30, tzinfo=UTC),
+        birth_timezone="America/Sao_Paulo",
+        latitude=-23.5505,
+        longitude=-46.6333,
+        city="São Paulo",
+        country="Brazil",
+        house_system="placidus",
+        zodiac_type="tropical",
+        status="completed",
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC),
+    )
+    db_session.add(chart)
+    await db_session.flush()
+    await ChartRepository(db_session).save_chart_data(chart, test_chart_data)
+    await db_session.commit()
+    await db_session.refresh(chart)
+    return chart
+
+
 @pytest.fixture
 def mock_rag_services():
     """Mock RAG services for interpretation generation."""
@@ -252,6 +284,27 @@ class TestRAGInterpretationsEndpoints:
         assert "metadata" in data
         assert "planets" in data
 
+    @pytest.mark.asyncio
+    async def test_get_interpretations_generates_from_localized_data(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        test_chart_with_localized_data: BirthChart,
+        mock_rag_services,
+    ):
+        """Test that charts saved with save_chart_data get interpretations for every subject."""
+        response = await client.get(
+            f"/api/v1/charts/{test_chart_with_localized_data.id}/interpretations",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data["planets"]) == {"Sun", "Moon"}
+        assert data["houses"]
+        assert data["aspects"]
+        mock_rag_services.generate_planet_interpretation.assert_awaited()
+
     @pytest.mark.asyncio
     async def test_get_interpretations_unauthorized(
         self,
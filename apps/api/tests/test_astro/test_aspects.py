@@ -0,0 +1,140 @@
+"""
+Tests for the shared aspect engine.
+"""
+
+import random
+
+import numpy as np
+
+from app.astro.aspects import find_aspects, find_aspects_many
+from app.services.astro_service import ASPECTS, is_aspect_applying
+
+
+def _brute_force(
+    lon_a: list[float], lon_b: list[float], within_set: bool = False
+) -> list[tuple[int, int, str, float]]:
+    """All-pairs reference implementation."""
+    matches = []
+    for i, a in enumerate(lon_a):
+        for j, b in enumerate(lon_b):
+            if within_set and j <= i:
+                continue
+            separation = abs(a - b)
+            if separation > 180:
+                separation = 360 - separation
+            for name, data in ASPECTS.items():
+                orb = abs(separation - data["angle"])
+                if orb <= data["orb"]:
+                    matches.append((i, j, name, orb))
+    return matches
+
+
+class TestFindAspects:
+    """Tests for aspects between two sets of points."""
+
+    def test_matches_brute_force(self) -> None:
+        """Test random point sets against an all-pairs search."""
+        rng = random.Random(7)
+        for _ in range(50):
+            lon_a = [rng.uniform(0, 360) for _ in range(rng.randint(1, 15))]
+            lon_b = [rng.uniform(0, 360) for _ in range(rng.randint(1, 15))]
+
+            matches = find_aspects(lon_a, ASPECTS, longitudes_b=lon_b)
+
+            assert [(m.index_a, m.index_b, m.aspect, m.orb) for m in matches] == _brute_force(
+                lon_a, lon_b
+            )
+
+    def test_within_one_set(self) -> None:
+        """Test that each pair is reported once, in input order."""
+        rng = random.Random(11)
+        lon = [rng.uniform(0, 360) for _ in range(13)]
+
+        matches = find_aspects(lon, ASPECTS)
+
+        assert [(m.index_a, m.index_b, m.aspect, m.orb) for m in matches] == _brute_force(
+            lon, lon, within_set=True
+        )
+
+    def test_wrap_around_zero_aries(self) -> None:
+        """Test a conjunction and an opposition across 0°."""
+        matches = find_aspects([359.0], ASPECTS, longitudes_b=[3.0, 181.0])
+
+        assert [(m.aspect, m.index_b) for m in matches] == [("Conjunction", 0), ("Opposition", 1)]
+        assert abs(matches[0].angle - 4.0) < 1e-9
+
+    def test_orb_limit_is_inclusive(self) -> None:
+        """Test that a separation exactly at the orb limit is an aspect."""
+        matches = find_aspects([10.0], {"Square": {"angle": 90, "orb": 7}}, longitudes_b=[107.0])
+
+        assert len(matches) == 1
+        assert matches[0].orb == 7.0
+
+    def test_applying_matches_scalar_rule(self) -> None:
+        """Test applying/separating against is_aspect_applying."""
+        lon = [10.0, 95.0, 130.0, 250.0]
+        speeds = [1.0, 0.5, -0.1, 13.0]
+
+        for match in find_aspects(lon, ASPECTS, speeds_a=speeds):
+            assert match.applying == is_aspect_applying(
+                lon[match.index_a],
+                lon[match.index_b],
+                speeds[match.index_a],
+                speeds[match.index_b],
+                match.aspect_angle,
+            )
+
+    def test_applying_follows_the_faster_point(self) -> None:
+        """Test applying/separating from the relative speed of the pair."""
+        # Opposition at 175°: the faster point closes on 180°
+        closing = find_aspects([175.0], ASPECTS, longitudes_b=[0.0], speeds_a=[1.0], speeds_b=[0.1])
+        # Conjunction with the faster Moon already past the Sun
+        past = find_aspects([95.0], ASPECTS, longitudes_b=[90.0], speeds_a=[13.0], speeds_b=[1.0])
+
+        assert [m.applying for m in closing] == [True]
+        assert [m.applying for m in past] == [False]
+
+    def test_without_speeds(self) -> None:
+        """Test that applying is None when speeds are not given."""
+        matches = find_aspects([0.0], ASPECTS, longitudes_b=[120.0])
+        assert matches[0].applying is None
+
+    def test_empty_input(self) -> None:
+        """Test empty point sets."""
+        assert find_aspects([], ASPECTS, longitudes_b=[10.0]) == []
+        assert find_aspects([10.0], ASPECTS, longitudes_b=[]) == []
+
+
+class TestFindAspectsMany:
+    """Tests for the vectorized multi-chart path."""
+
+    def test_matches_single_chart_engine(self) -> None:
+        """Test every chart of a stack against find_aspects."""
+        rng = np.random.default_rng(3)
+        longitudes = rng.uniform(0, 360, size=(20, 12))
+        speeds = rng.uniform(-1, 2, size=(20, 12))
+
+        result = find_aspects_many(longitudes, ASPECTS, speeds)
+
+        for chart in range(len(longitudes)):
+            rows = result.chart == chart
+            expected = find_aspects(longitudes[chart], ASPECTS, speeds_a=speeds[chart])
+            assert [(m.index_a, m.index_b, m.aspect, m.applying) for m in expected] == list(
+                zip(
+                    result.index_a[rows].tolist(),
+                    result.index_b[rows].tolist(),
+                    [result.aspect_names[k] for k in result.aspect[rows]],
+                    result.applying[rows].tolist(),
+                    strict=True,
+                )
+            )
+
+    def test_missing_points_are_ignored(self) -> None:
+        """Test that NaN longitudes never form aspects."""
+        longitudes = np.array([[0.0, np.nan, 120.0]])
+
+        result = find_aspects_many(longitudes, ASPECTS)
+
+        assert result.index_a.tolist() == [0]
+        assert result.index_b.tolist() == [2]
+        assert result.applying is None
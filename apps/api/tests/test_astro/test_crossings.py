@@ -0,0 +1,68 @@
+"""
+Tests for the longitude crossing solver.
+"""
+
+import swisseph as swe
+
+from app.astro.crossings import find_longitude_crossings
+from app.astro.ephemeris import calc_position
+
+J2000 = 2451545.0
+
+
+def _angular_distance(lon1: float, lon2: float) -> float:
+    """Absolute shortest distance between two longitudes."""
+    return abs((lon1 - lon2 + 180) % 360 - 180)
+
+
+class TestSunCrossings:
+    """Tests for a body that never turns retrograde."""
+
+    def test_single_precise_crossing(self) -> None:
+        """Test that the Sun crosses its own position exactly once per window."""
+        target = calc_position(J2000, swe.SUN)[0]
+        crossings = find_longitude_crossings(swe.SUN, target, J2000 - 3, J2000 + 3)
+
+        assert len(crossings) == 1
+        assert abs(crossings[0].jd - J2000) < 1e-5
+        assert _angular_distance(crossings[0].longitude, target) < 1e-6
+        assert crossings[0].is_retrograde is False
+
+    def test_wrap_at_zero_aries(self) -> None:
+        """Test a crossing of 0° Aries (longitude wraps from 359° to 0°)."""
+        # March equinox 2000 falls on March 20
+        crossings = find_longitude_crossings(swe.SUN, 0.0, 2451620.0, 2451630.0)
+
+        assert len(crossings) == 1
+        assert _angular_distance(crossings[0].longitude, 0.0) < 1e-6
+
+    def test_opposite_point_is_not_a_crossing(self) -> None:
+        """Test that passing the point opposite the target is ignored."""
+        target = (calc_position(J2000, swe.SUN)[0] + 180) % 360
+        crossings = find_longitude_crossings(swe.SUN, target, J2000 - 3, J2000 + 3)
+
+        assert crossings == []
+
+
+class TestRetrogradeCrossings:
+    """Tests for bodies with retrograde passes."""
+
+    def test_saturn_triple_pass(self) -> None:
+        """Test that Saturn's retrograde loop yields direct, retrograde, direct passes."""
+        # Saturn station retrograde ~2000-09-12, station direct ~2001-01-25
+        station_jd = 2451800.0
+        target = calc_position(station_jd, swe.SATURN)[0] - 1.0
+        crossings = find_longitude_crossings(swe.SATURN, target, station_jd - 200, station_jd + 300)
+
+        assert len(crossings) == 3
+        assert [c.is_retrograde for c in crossings] == [False, True, False]
+        assert crossings[0].jd < crossings[1].jd < crossings[2].jd
+        for crossing in crossings:
+            assert _angular_distance(crossing.longitude, target) < 1e-6
+
+    def test_no_crossing_in_window(self) -> None:
+        """Test that an unreached longitude returns an empty list."""
+        saturn_lon = calc_position(J2000, swe.SATURN)[0]
+        crossings = find_longitude_crossings(swe.SATURN, saturn_lon + 90, J2000, J2000 + 30)
+
+        assert crossings == []
@@ -2,8 +2,14 @@
 Tests for essential dignities calculation module.
 """
 
+import numpy as np
+
 from app.astro.dignities import (
+    DIGNITY_TABLE_PLANETS,
+    SIGNS,
+    _compute_essential_dignities,
     calculate_essential_dignities,
+    get_dignity_scores,
     get_planet_in_face,
     get_planet_in_term,
     get_sign_ruler,
@@ -248,3 +254,47 @@ class TestComprehensiveDignities:
         assert result["is_exalted"] is True
         assert result["score"] >= 4
         assert result["classification"] == "dignified"
+
+
+class TestDignityTables:
+    """Test that the precomputed lookup tables match the rule-based calculation."""
+
+    def test_table_matches_rules_at_fractional_degrees(self) -> None:
+        """Every table entry should equal a direct calculation inside that degree."""
+        for planet in DIGNITY_TABLE_PLANETS:
+            for sect in ("diurnal", "nocturnal"):
+                for sign in SIGNS:
+                    for degree in (0.0, 5.99, 6.0, 14.5, 29.999):
+                        assert calculate_essential_dignities(
+                            planet, sign, degree, sect
+                        ) == _compute_essential_dignities(planet, sign, degree, sect)
+
+    def test_results_are_independent_copies(self) -> None:
+        """Mutating a result should not change later lookups."""
+        first = calculate_essential_dignities("Mars", "Aries", 5.0, "diurnal")
+        first["dignities"].clear()
+        first["score"] = 0
+
+        second = calculate_essential_dignities("Mars", "Aries", 5.0, "diurnal")
+        assert second["dignities"]
+        assert second["score"] > 0
+
+    def test_positions_outside_tables(self) -> None:
+        """Non-classical planets and out-of-range degrees use the rule-based path."""
+        assert calculate_essential_dignities("Uranus", "Aries", 5.0, "diurnal")["score"] == 0
+        result = calculate_essential_dignities("Mars", "Aries", 30.0, "diurnal")
+        assert result["is_ruler"] is True
+        assert result["face_ruler"] is None
+
+    def test_vectorized_scores(self) -> None:
+        """get_dignity_scores should match per-position scores."""
+        longitudes = np.array([0.0, 5.5, 123.4, 299.99, 359.999])
+        scores = get_dignity_scores("Saturn", longitudes, "nocturnal")
+
+        expected = [
+            calculate_essential_dignities("Saturn", SIGNS[int(lon // 30)], lon % 30, "nocturnal")[
+                "score"
+            ]
+            for lon in longitudes
+        ]
+        assert scores.tolist() == expected
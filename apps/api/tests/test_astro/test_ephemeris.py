@@ -0,0 +1,85 @@
+"""
+Tests for the batch ephemeris engine.
+"""
+
+import numpy as np
+import swisseph as swe
+
+from app.astro.ephemeris import (
+    DEFAULT_FLAGS,
+    cache_info,
+    calc_position,
+    calc_positions,
+    clear_cache,
+)
+
+J2000 = 2451545.0
+
+
+class TestCalcPositions:
+    """Tests for vectorized position lookups."""
+
+    def test_result_shapes(self) -> None:
+        """Test that results are (n_jd, n_body) arrays."""
+        jds = J2000 + np.arange(10)
+        batch = calc_positions(jds, [swe.SUN, swe.MOON, swe.SATURN])
+
+        assert batch.longitudes.shape == (10, 3)
+        assert batch.latitudes.shape == (10, 3)
+        assert batch.speeds.shape == (10, 3)
+        assert batch.bodies == (swe.SUN, swe.MOON, swe.SATURN)
+
+    def test_matches_swisseph(self) -> None:
+        """Test that batch values match direct swe.calc_ut calls."""
+        jds = J2000 + np.linspace(0, 400, 7)
+        batch = calc_positions(jds, [swe.SUN, swe.MARS])
+
+        for i, jd in enumerate(jds):
+            for j, body in enumerate((swe.SUN, swe.MARS)):
+                expected, _ = swe.calc_ut(float(jd), body, DEFAULT_FLAGS)
+                assert batch.longitudes[i, j] == expected[0]
+                assert batch.latitudes[i, j] == expected[1]
+                assert batch.speeds[i, j] == expected[3]
+
+    def test_preserves_input_order_with_duplicates(self) -> None:
+        """Test that duplicate and unsorted JDs map back to the requested order."""
+        jds = [J2000 + 5, J2000, J2000 + 5]
+        batch = calc_positions(jds, [swe.MOON])
+
+        moon = batch.longitude_of(swe.MOON)
+        assert moon[0] == moon[2]
+        assert moon[0] != moon[1]
+        assert moon[1] == calc_position(J2000, swe.MOON)[0]
+
+    def test_scalar_input(self) -> None:
+        """Test that a single JD is accepted."""
+        batch = calc_positions(J2000, [swe.SUN])
+
+        assert batch.longitudes.shape == (1, 1)
+        assert 280 < batch.longitude_of(swe.SUN)[0] < 281
+
+
+class TestMemoization:
+    """Tests for the (jd, body, flags) memo cache."""
+
+    def test_repeated_lookups_hit_cache(self) -> None:
+        """Test that repeating a batch is served from the cache."""
+        clear_cache()
+        jds = J2000 + np.arange(5)
+
+        calc_positions(jds, [swe.SUN, swe.MOON])
+        first = cache_info()
+        calc_positions(jds, [swe.SUN, swe.MOON])
+        second = cache_info()
+
+        assert first["misses"] == 10
+        assert second["misses"] == 10
+        assert second["hits"] - first["hits"] == 10
+
+    def test_flags_are_part_of_key(self) -> None:
+        """Test that different flags are cached separately."""
+        clear_cache()
+        calc_position(J2000, swe.SUN, DEFAULT_FLAGS)
+        calc_position(J2000, swe.SUN, swe.FLG_MOSEPH)
+
+        assert cache_info()["misses"] == 2
@@ -0,0 +1,94 @@
+"""
+Tests for the precomputed lunation index.
+"""
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+from app.astro.lunations import (
+    SYNODIC_MONTH_DAYS,
+    TABLE_END_JD,
+    TABLE_START_JD,
+    compute_syzygies,
+    find_previous_syzygy,
+    load_lunation_table,
+)
+
+
+def _elongation(jd: float) -> float:
+    sun, _ = swe.calc_ut(jd, swe.SUN, swe.FLG_MOSEPH)
+    moon, _ = swe.calc_ut(jd, swe.MOON, swe.FLG_MOSEPH)
+    return (moon[0] - sun[0]) % 360
+
+
+class TestLunationTable:
+    """Tests for the shipped New Moon / Full Moon table."""
+
+    def test_table_covers_range(self) -> None:
+        """Table should span 1800-2200 without gaps."""
+        table = load_lunation_table()
+
+        for syzygy_type in ("new_moon", "full_moon"):
+            jds = table[syzygy_type]
+            assert jds[0] - TABLE_START_JD < SYNODIC_MONTH_DAYS
+            assert TABLE_END_JD - jds[-1] < SYNODIC_MONTH_DAYS
+            gaps = np.diff(jds)
+            assert gaps.min() > 29.0
+            assert gaps.max() < 30.0
+
+    def test_table_matches_fresh_computation(self) -> None:
+        """A slice of the table should match a fresh computation."""
+        start = 2451545.0
+        end = start + 365
+        table = load_lunation_table()["new_moon"]
+        shipped = table[(table >= start) & (table < end)]
+
+        fresh = compute_syzygies(start, end, "new_moon")
+
+        assert len(shipped) == len(fresh)
+        assert np.allclose(shipped, fresh, atol=1e-5)
+
+
+class TestFindPreviousSyzygy:
+    """Tests for syzygy lookup."""
+
+    @pytest.mark.parametrize("birth_jd", [2378600.0, 2440000.3, 2460000.0, 2520000.7])
+    def test_new_moon_precision(self, birth_jd: float) -> None:
+        """Found New Moon should be exact to a small fraction of a degree."""
+        jd = find_previous_syzygy(birth_jd, "new_moon")
+        elongation = _elongation(jd)
+
+        assert jd <= birth_jd
+        assert birth_jd - jd < SYNODIC_MONTH_DAYS
+        assert min(elongation, 360 - elongation) < 1e-4
+
+    @pytest.mark.parametrize("birth_jd", [2378600.0, 2440000.3, 2460000.0, 2520000.7])
+    def test_full_moon_precision(self, birth_jd: float) -> None:
+        """Found Full Moon should be exact to a small fraction of a degree."""
+        jd = find_previous_syzygy(birth_jd, "full_moon")
+
+        assert jd <= birth_jd
+        assert birth_jd - jd < SYNODIC_MONTH_DAYS
+        assert abs(_elongation(jd) - 180) < 1e-4
+
+    def test_outside_table_range(self) -> None:
+        """Dates outside 1800-2200 should fall back to a direct search."""
+        birth_jd = 2300000.0  # 1585
+        jd = find_previous_syzygy(birth_jd, "new_moon")
+        elongation = _elongation(jd)
+
+        assert jd <= birth_jd
+        assert birth_jd - jd < SYNODIC_MONTH_DAYS
+        assert min(elongation, 360 - elongation) < 1e-4
+
+    def test_fallback_agrees_with_table(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Table lookup and fallback search should find the same syzygy."""
+        birth_jd = 2460000.0
+        from_table = find_previous_syzygy(birth_jd, "full_moon")
+
+        empty = {"new_moon": np.empty(0), "full_moon": np.empty(0)}
+        monkeypatch.setattr("app.astro.lunations.load_lunation_table", lambda: empty)
+        from_search = find_previous_syzygy(birth_jd, "full_moon")
+
+        assert from_table == pytest.approx(from_search, abs=1e-5)
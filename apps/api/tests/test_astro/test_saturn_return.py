@@ -10,8 +10,8 @@ from datetime import UTC, datetime
 
 import pytest
 
+from app.astro.crossings import TOLERANCE_DEGREES
 from app.astro.saturn_return import (
-    PRECISION_DEGREES,
     SATURN_SIDEREAL_PERIOD_DAYS,
     SATURN_SIDEREAL_PERIOD_YEARS,
     SIGNS,
@@ -46,8 +46,8 @@ class TestConstants:
 
     def test_precision_degrees(self) -> None:
         """Test precision is appropriately small."""
-        # Precision should be less than 0.01 degrees
-        assert PRECISION_DEGREES < 0.01
+        # Crossing search precision should be less than 0.01 degrees
+        assert TOLERANCE_DEGREES < 0.01
 
     def test_signs_list(self) -> None:
         """Test signs list is complete."""
@@ -247,7 +247,7 @@ class TestFindExactCrossing:
 
         if crossing_jd:
             crossing_lon, _, _ = get_saturn_position(crossing_jd)
-            assert abs(longitude_diff(crossing_lon, target)) < PRECISION_DEGREES * 10
+            assert abs(longitude_diff(crossing_lon, target)) < 0.01
 
     def test_returns_none_for_no_crossing(self) -> None:
         """Test returns None when no crossing exists."""
@@ -6,18 +6,20 @@ returns to its natal position. Unlike Saturn, the Sun never retrogrades,
 so there is always exactly one pass per year.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime
 
 import pytest
 
+from app.astro.crossings import MAX_ITERATIONS, TOLERANCE_DEGREES
 from app.astro.solar_return import (
-    MAX_ITERATIONS,
-    PRECISION_DEGREES,
     SEARCH_WINDOW_DAYS,
     SIGNS,
     SUN_TROPICAL_YEAR_DAYS,
+    aiter_solar_returns,
     calculate_comparison,
     calculate_multiple_solar_returns,
+    calculate_multiple_solar_returns_async,
     calculate_solar_return,
     calculate_sr_to_natal_aspects,
     datetime_to_jd,
@@ -27,6 +29,7 @@ from app.astro.solar_return import (
     get_sign_from_longitude,
     get_solar_return_interpretation,
     get_sun_position,
+    iter_solar_returns,
     jd_to_datetime,
     longitude_diff,
     normalize_longitude,
@@ -44,8 +47,8 @@ class TestConstants:
 
     def test_precision_degrees(self) -> None:
         """Test precision is appropriately small."""
-        # Precision should be less than 0.001 degrees
-        assert PRECISION_DEGREES < 0.001
+        # Crossing search precision should be less than 0.001 degrees
+        assert TOLERANCE_DEGREES < 0.001
 
     def test_search_window_days(self) -> None:
         """Test search window is reasonable."""
@@ -605,6 +608,88 @@ class TestCalculateMultipleSolarReturns:
         years = [r["chart"]["return_year"] for r in returns]
         assert years == [2015, 2016, 2017, 2018, 2019, 2020]
 
+    def test_parallel_matches_serial(self) -> None:
+        """Test that pooled results equal single-year calculations."""
+        kwargs = {
+            "natal_sun_longitude": 200.0,
+            "birth_datetime": datetime(1978, 10, 12, 6, 0, 0, tzinfo=UTC),
+            "latitude": -23.55,
+            "longitude": -46.63,
+            "timezone": "America/Sao_Paulo",
+        }
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            returns = calculate_multiple_solar_returns(
+                start_year=2020, end_year=2024, executor=executor, **kwargs
+            )
+
+        for year, sr_data in zip(range(2020, 2025), returns, strict=True):
+            assert sr_data == calculate_solar_return(target_year=year, **kwargs)
+
+    def test_iter_yields_every_year(self) -> None:
+        """Test that streaming yields one (year, data) pair per year."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = dict(
+                iter_solar_returns(
+                    natal_sun_longitude=100.0,
+                    birth_datetime=datetime(1990, 6, 15, 12, 0, 0, tzinfo=UTC),
+                    start_year=2020,
+                    end_year=2023,
+                    latitude=40.0,
+                    longitude=-74.0,
+                    timezone="America/New_York",
+                    executor=executor,
+                )
+            )
+
+        assert sorted(results) == [2020, 2021, 2022, 2023]
+        for year, sr_data in results.items():
+            assert sr_data["chart"]["return_year"] == year
+
+    async def test_async_returns_ordered_years(self) -> None:
+        """Test the async variant returns years in order."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            returns = await calculate_multiple_solar_returns_async(
+                natal_sun_longitude=50.0,
+                birth_datetime=datetime(1985, 3, 10, 8, 0, 0, tzinfo=UTC),
+                start_year=2018,
+                end_year=2021,
+                latitude=35.0,
+                longitude=139.0,
+                timezone="Asia/Tokyo",
+                executor=executor,
+            )
+
+        assert [r["chart"]["return_year"] for r in returns] == [2018, 2019, 2020, 2021]
+
+    async def test_async_iter_cancels_remaining_years(self) -> None:
+        """Test that stopping the async stream early cancels pending years."""
+        submitted: list[Future] = []
+
+        class RecordingExecutor(ThreadPoolExecutor):
+            def submit(self, fn, /, *args, **kwargs):
+                future = super().submit(fn, *args, **kwargs)
+                submitted.append(future)
+                return future
+
+        with RecordingExecutor(max_workers=1) as executor:
+            stream = aiter_solar_returns(
+                natal_sun_longitude=100.0,
+                birth_datetime=datetime(1990, 6, 15, 12, 0, 0, tzinfo=UTC),
+                start_year=2000,
+                end_year=2020,
+                latitude=40.0,
+                longitude=-74.0,
+                timezone="America/New_York",
+                executor=executor,
+            )
+            year, sr_data = await anext(stream)
+            await stream.aclose()
+
+        assert sr_data["chart"]["return_year"] == year
+        assert len(submitted) == 21
+        # Only years already running when the stream closed may have finished
+        assert sum(future.cancelled() for future in submitted) >= 18
+
 
 class TestKnownSolarReturns:
     """Test against known Solar Return dates for verification."""
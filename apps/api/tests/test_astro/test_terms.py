@@ -15,8 +15,10 @@ from app.astro.terms import (
     DOROTHEAN_TERMS,
     EGYPTIAN_TERMS,
     PTOLEMAIC_TERMS,
+    TERM_SYSTEMS,
     TermSystem,
     get_all_term_rulers,
+    get_planet_in_term,
     get_term_ruler,
     get_terms_table,
 )
@@ -176,17 +178,17 @@ class TestChaldeanTerms:
         """Fire signs (Aries, Leo, Sagittarius) should have Jupiter first."""
         for sign in ["Aries", "Leo", "Sagittarius"]:
             first_ruler = CHALDEAN_TERMS[sign][0][2]
-            assert (
-                first_ruler == "Jupiter"
-            ), f"{sign} (fire sign) should have Jupiter first, got {first_ruler}"
+            assert first_ruler == "Jupiter", (
+                f"{sign} (fire sign) should have Jupiter first, got {first_ruler}"
+            )
 
     def test_earth_signs_venus_first(self) -> None:
         """Earth signs (Taurus, Virgo, Capricorn) should have Venus first."""
         for sign in ["Taurus", "Virgo", "Capricorn"]:
             first_ruler = CHALDEAN_TERMS[sign][0][2]
-            assert (
-                first_ruler == "Venus"
-            ), f"{sign} (earth sign) should have Venus first, got {first_ruler}"
+            assert first_ruler == "Venus", (
+                f"{sign} (earth sign) should have Venus first, got {first_ruler}"
+            )
 
     def test_air_signs_pattern(self) -> None:
         """Air signs should follow the Chaldean air triplicity pattern."""
@@ -201,9 +203,9 @@ class TestChaldeanTerms:
         """Water signs (Cancer, Scorpio, Pisces) should have Mars first."""
         for sign in ["Cancer", "Scorpio"]:
             first_ruler = CHALDEAN_TERMS[sign][0][2]
-            assert (
-                first_ruler == "Mars"
-            ), f"{sign} (water sign) should have Mars first, got {first_ruler}"
+            assert first_ruler == "Mars", (
+                f"{sign} (water sign) should have Mars first, got {first_ruler}"
+            )
         # Pisces is an exception - Venus first
         assert CHALDEAN_TERMS["Pisces"][0][2] == "Venus"
 
@@ -404,6 +406,32 @@ class TestGetTermsTable:
         assert degrees == [8, 7, 6, 5, 4]
 
 
+# =============================================================================
+# Test Term Lookup Tables
+# =============================================================================
+
+
+class TestTermTables:
+    """Test that table lookups match the per-sign term lists."""
+
+    @pytest.mark.parametrize("system", list(TermSystem))
+    def test_get_term_ruler_matches_term_lists(self, system: TermSystem) -> None:
+        """Every fractional degree should resolve to its listed term."""
+        for tenth in range(3600):
+            longitude = tenth / 10
+            result = get_term_ruler(longitude, system)
+            terms = TERM_SYSTEMS[system][result["sign"]]
+            expected = next(t for t in terms if t[0] <= result["degree_in_sign"] < t[1])
+            assert (result["term_start"], result["term_end"], result["term_ruler"]) == expected
+
+    def test_get_planet_in_term_edges(self) -> None:
+        """Out-of-range inputs should return None."""
+        assert get_planet_in_term("Aries", 0.0) == "Jupiter"
+        assert get_planet_in_term("Aries", 30.0) is None
+        assert get_planet_in_term("Aries", -0.1) is None
+        assert get_planet_in_term("InvalidSign", 5.0) is None
+
+
 # =============================================================================
 # Test TermSystem Enum
 # =============================================================================
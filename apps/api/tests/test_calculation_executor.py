@@ -0,0 +1,91 @@
+"""
+Tests for the calculation executor.
+"""
+
+import time
+
+import pytest
+
+from app.core.calculation_executor import (
+    CalculationExecutor,
+    get_calculation_executor,
+    get_solar_return_executor,
+    shutdown_solar_return_executor,
+)
+from app.core.config import settings
+
+
+def _add(a: int, b: int) -> int:
+    return a + b
+
+
+def _fail() -> None:
+    raise ValueError("boom")
+
+
+def _sleep(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+
+@pytest.fixture
+def executor():
+    """Thread-backed executor (process pools are exercised in deployment)."""
+    calc_executor = CalculationExecutor(kind="thread", max_workers=2)
+    yield calc_executor
+    calc_executor.shutdown()
+
+
+async def test_run_returns_result(executor: CalculationExecutor) -> None:
+    """Test that run awaits the function result."""
+    assert await executor.run(_add, 2, b=3) == 5
+
+
+async def test_run_propagates_exceptions(executor: CalculationExecutor) -> None:
+    """Test that worker exceptions are raised to the caller and counted."""
+    with pytest.raises(ValueError, match="boom"):
+        await executor.run(_fail)
+
+    assert executor.get_metrics()["failed"] == 1
+
+
+def test_submit_returns_future(executor: CalculationExecutor) -> None:
+    """Test the concurrent.futures interface."""
+    assert executor.submit(_add, 1, 1).result(timeout=5) == 2
+
+
+def test_metrics_track_queue_and_latency(executor: CalculationExecutor) -> None:
+    """Test queue depth while saturated and latency once drained."""
+    futures = [executor.submit(_sleep, 0.05) for _ in range(5)]
+    busy = executor.get_metrics()
+    assert busy["in_flight"] == 5
+    assert busy["queue_depth"] == 3
+
+    for future in futures:
+        future.result(timeout=5)
+
+    metrics = executor.get_metrics()
+    assert metrics["in_flight"] == 0
+    assert metrics["completed"] == 5
+    assert metrics["run_ms_p50"] >= 40
+    assert metrics["wait_ms_p95"] > 0
+
+
+def test_process_pool_runs_calculation() -> None:
+    """Test that the process pool variant runs picklable functions."""
+    calc_executor = CalculationExecutor(kind="process", max_workers=1)
+    try:
+        assert calc_executor.submit(_add, 20, 22).result(timeout=60) == 42
+    finally:
+        calc_executor.shutdown()
+
+
+def test_solar_return_executor_is_separate_pool() -> None:
+    """Test that Solar Return fan-out does not share the calculation queue."""
+    try:
+        sr_executor = get_solar_return_executor()
+        assert sr_executor is not get_calculation_executor()
+        assert sr_executor.max_workers == settings.SOLAR_RETURN_EXECUTOR_WORKERS
+        assert get_solar_return_executor() is sr_executor
+    finally:
+        shutdown_solar_return_executor()
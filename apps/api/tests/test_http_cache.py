@@ -0,0 +1,64 @@
+"""
+Tests for ETag / If-None-Match helpers.
+"""
+
+from datetime import UTC, datetime
+
+from starlette.requests import Request
+
+from app.core.http_cache import make_etag, not_modified, not_modified_response
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class TestMakeEtag:
+    """Tests for make_etag."""
+
+    def test_etag_is_quoted_and_stable(self):
+        """The same parts should always give the same quoted ETag."""
+        updated_at = datetime(2026, 1, 1, tzinfo=UTC)
+        etag = make_etag("chart-id", updated_at, "en-US")
+
+        assert etag == make_etag("chart-id", updated_at, "en-US")
+        assert etag.startswith('"') and etag.endswith('"')
+
+    def test_etag_depends_on_every_part(self):
+        """Changing the language or timestamp should change the ETag."""
+        updated_at = datetime(2026, 1, 1, tzinfo=UTC)
+        etag = make_etag("chart-id", updated_at, "en-US")
+
+        assert etag != make_etag("chart-id", updated_at, "pt-BR")
+        assert etag != make_etag("chart-id", datetime(2026, 1, 2, tzinfo=UTC), "en-US")
+
+
+class TestNotModified:
+    """Tests for If-None-Match handling."""
+
+    def test_no_header_is_modified(self):
+        """Requests without If-None-Match always get a full response."""
+        assert not not_modified(_request(), make_etag("a"))
+
+    def test_matching_etag_in_list(self):
+        """Any listed ETag, strong or weak, should match."""
+        etag = make_etag("a")
+
+        assert not_modified(_request(f'"other", {etag}'), etag)
+        assert not_modified(_request(f"W/{etag}"), etag)
+        assert not_modified(_request("*"), etag)
+
+    def test_stale_etag_is_modified(self):
+        """An outdated ETag should get a full response."""
+        assert not not_modified(_request(make_etag("old")), make_etag("new"))
+
+    def test_not_modified_response_has_no_body(self):
+        """304 responses should carry the validators only."""
+        etag = make_etag("a")
+        response = not_modified_response(etag)
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["ETag"] == etag
+        assert "no-cache" in response.headers["Cache-Control"]
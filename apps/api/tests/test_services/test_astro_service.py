@@ -13,6 +13,7 @@ Tests cover:
 """
 
 from datetime import datetime
+from unittest.mock import patch
 
 from app.schemas.chart import PlanetPosition
 from app.services.astro_service import (
@@ -31,6 +32,8 @@ from app.services.astro_service import (
     calculate_arabic_parts,
     calculate_aspects,
     calculate_birth_chart,
+    calculate_birth_chart_all_languages,
+    calculate_chart_core,
     calculate_houses,
     calculate_planets,
     calculate_sect,
@@ -41,6 +44,7 @@ from app.services.astro_service import (
     get_planet_sect_status,
     get_sign_and_position,
     is_aspect_applying,
+    localize_chart,
 )
 
 
@@ -1630,6 +1634,57 @@ class TestCalculateBirthChart:
             assert "dominant" in chart["temperament"] or "primary" in chart["temperament"]
 
 
+class TestChartCoreLocalization:
+    """Tests for the language-neutral core and per-language localization pass."""
+
+    BIRTH = {
+        "birth_datetime": datetime(1990, 6, 15, 12, 0, 0),
+        "timezone": "America/Sao_Paulo",
+        "latitude": -23.5505,
+        "longitude": -46.6333,
+        "house_system": "placidus",
+    }
+
+    def test_localize_matches_calculate_birth_chart(self):
+        """Test that core + localization reproduces calculate_birth_chart output."""
+        core = calculate_chart_core(**self.BIRTH)
+        localized = localize_chart(core, "en-US")
+        direct = calculate_birth_chart(**self.BIRTH, language="en-US")
+
+        localized.pop("calculation_timestamp")
+        direct.pop("calculation_timestamp")
+        assert localized == direct
+
+    def test_all_languages_runs_ephemeris_once(self):
+        """Test that every language is localized from a single core calculation."""
+        with patch(
+            "app.services.astro_service.calculate_chart_core", wraps=calculate_chart_core
+        ) as core_spy:
+            charts = calculate_birth_chart_all_languages(**self.BIRTH)
+
+        assert core_spy.call_count == 1
+        assert set(charts) == {"en-US", "pt-BR"}
+        assert charts["en-US"]["planets"] == charts["pt-BR"]["planets"]
+        assert (
+            charts["en-US"]["lunar_phase"]["phase_key"]
+            == (charts["pt-BR"]["lunar_phase"]["phase_key"])
+        )
+        assert (
+            charts["en-US"]["prenatal_syzygy"]["type_name"]
+            != (charts["pt-BR"]["prenatal_syzygy"]["type_name"])
+        )
+
+    def test_languages_do_not_share_mutable_state(self):
+        """Test that localized charts are independent copies of the core data."""
+        charts = calculate_birth_chart_all_languages(**self.BIRTH)
+
+        charts["en-US"]["planets"][0]["dignities"]["score"] = 999
+        charts["en-US"]["arabic_parts"]["fortune"]["house"] = 99
+
+        assert charts["pt-BR"]["planets"][0]["dignities"]["score"] != 999
+        assert charts["pt-BR"]["arabic_parts"]["fortune"]["house"] != 99
+
+
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
 
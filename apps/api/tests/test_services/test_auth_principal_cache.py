@@ -0,0 +1,171 @@
+"""
+Tests for cached authentication principals.
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core.dependencies import get_current_principal, require_admin, require_premium
+from app.core.security import create_access_token
+from app.models.enums import UserRole
+from app.services import auth_principal_cache
+from app.services.auth_principal_cache import AuthPrincipal
+
+
+class FakeRedis:
+    """Minimal dict-backed stand-in for the async redis client."""
+
+    store: dict[str, str] = {}
+
+    def __init__(self, connection_pool: object = None) -> None:
+        pass
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def setex(self, key: str, ttl: int, value: str) -> None:
+        self.store[key] = value
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.store.pop(key, None)
+
+
+@pytest.fixture
+def fake_redis():
+    """Route principal cache Redis calls to an in-memory store."""
+    FakeRedis.store = {}
+    with (
+        patch.object(auth_principal_cache, "get_async_redis_pool", return_value=MagicMock()),
+        patch.object(auth_principal_cache.aioredis, "Redis", FakeRedis),
+    ):
+        yield FakeRedis
+
+
+def _principal(**overrides: object) -> AuthPrincipal:
+    values: dict[str, object] = {
+        "id": uuid4(),
+        "email": "user@example.com",
+        "role": UserRole.FREE.value,
+        "is_superuser": False,
+        "is_active": True,
+        "email_verified": True,
+    }
+    return AuthPrincipal(**(values | overrides))  # type: ignore[arg-type]
+
+
+def _credentials(principal: AuthPrincipal) -> HTTPAuthorizationCredentials:
+    token = create_access_token(data={"sub": str(principal.id)})
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+class TestPrincipalCache:
+    """Tests for the two cache tiers."""
+
+    def test_json_round_trip(self) -> None:
+        """Test that a principal survives serialization for Redis."""
+        principal = _principal(
+            password_changed_at=datetime(2026, 1, 1, tzinfo=UTC),
+            deleted_at=None,
+        )
+
+        assert AuthPrincipal.from_json(principal.to_json()) == principal
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_is_shared(self, fake_redis: type[FakeRedis]) -> None:
+        """Test that a principal cached by another process is found in Redis."""
+        principal = _principal()
+        await auth_principal_cache.cache_principal(principal)
+        auth_principal_cache.clear_local_cache()
+
+        assert await auth_principal_cache.get_cached_principal(principal.id) == principal
+
+    @pytest.mark.asyncio
+    async def test_local_tier_expires(self) -> None:
+        """Test that the in-process copy is only trusted for a short time."""
+        principal = _principal()
+        await auth_principal_cache.cache_principal(principal)
+        assert await auth_principal_cache.get_cached_principal(principal.id) == principal
+
+        with patch.object(auth_principal_cache, "AUTH_PRINCIPAL_LOCAL_TTL_SECONDS", 0):
+            await auth_principal_cache.cache_principal(principal)
+        assert await auth_principal_cache.get_cached_principal(principal.id) is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_both_tiers(self, fake_redis: type[FakeRedis]) -> None:
+        """Test that invalidation forces the next request to reload the user."""
+        principal = _principal()
+        await auth_principal_cache.cache_principal(principal)
+
+        await auth_principal_cache.invalidate_principal(principal.id)
+
+        assert await auth_principal_cache.get_cached_principal(principal.id) is None
+        assert fake_redis.store == {}
+
+    def test_role_properties_match_user(self) -> None:
+        """Test that admin and premium checks follow the User model's rules."""
+        assert _principal(role=UserRole.PREMIUM.value).is_premium
+        assert not _principal(role=UserRole.PREMIUM.value).is_admin
+        assert _principal(is_superuser=True).is_admin
+        assert _principal(role="unknown").user_role == UserRole.FREE
+
+
+class TestGetCurrentPrincipal:
+    """Tests for authentication through the cache."""
+
+    @pytest.mark.asyncio
+    async def test_cached_principal_skips_database(self) -> None:
+        """Test that a cached principal authenticates without a query."""
+        principal = _principal()
+        await auth_principal_cache.cache_principal(principal)
+        db = AsyncMock()
+
+        result = await get_current_principal(_credentials(principal), db)
+
+        assert result == principal
+        db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_loads_and_caches_user(self) -> None:
+        """Test that the first request loads the user once and caches it."""
+        principal = _principal()
+        user = MagicMock(**{field: getattr(principal, field) for field in principal.__dict__})
+        db = AsyncMock()
+        db.execute.return_value = MagicMock(scalar_one_or_none=MagicMock(return_value=user))
+
+        result = await get_current_principal(_credentials(principal), db)
+
+        assert result == principal
+        assert await auth_principal_cache.get_cached_principal(principal.id) == principal
+        db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_checks_still_apply(self) -> None:
+        """Test that inactive users and tokens older than a password reset are rejected."""
+        inactive = _principal(is_active=False)
+        reset = _principal(password_changed_at=datetime.now(UTC) + timedelta(minutes=1))
+        await auth_principal_cache.cache_principal(inactive)
+        await auth_principal_cache.cache_principal(reset)
+
+        with pytest.raises(HTTPException) as inactive_error:
+            await get_current_principal(_credentials(inactive), AsyncMock())
+        with pytest.raises(HTTPException) as reset_error:
+            await get_current_principal(_credentials(reset), AsyncMock())
+
+        assert inactive_error.value.status_code == 403
+        assert reset_error.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_role_dependencies_use_principal(self) -> None:
+        """Test that require_premium and require_admin check the cached role."""
+        premium = _principal(role=UserRole.PREMIUM.value)
+
+        assert await require_premium(premium) == premium
+        with pytest.raises(HTTPException) as error:
+            await require_admin(premium)
+        assert error.value.status_code == 403
@@ -0,0 +1,165 @@
+"""
+Tests for the content-addressed chart result cache.
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services import chart_cache_service
+from app.services.astro_service import calculate_birth_chart_all_languages
+from app.services.chart_cache_service import (
+    cache_info,
+    clear_local_cache,
+    generate_chart_cache_key,
+    get_or_calculate_birth_chart,
+)
+
+BIRTH_DATA = {
+    "birth_datetime": datetime(1990, 5, 17, 14, 30),
+    "timezone": "America/Sao_Paulo",
+    "latitude": -23.5505,
+    "longitude": -46.6333,
+}
+
+
+class FakeRedis:
+    """Minimal dict-backed stand-in for the async redis client."""
+
+    store: dict[str, str] = {}
+
+    def __init__(self, connection_pool: object = None) -> None:
+        pass
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction: bool = True) -> "FakeRedis":
+        return self
+
+    def setex(self, key: str, ttl: int, value: str) -> None:
+        self.store[key] = value
+
+    async def execute(self) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache():
+    """Start every test with empty tiers and no Redis."""
+    clear_local_cache()
+    FakeRedis.store = {}
+    with patch.object(chart_cache_service, "get_async_redis_pool", return_value=None):
+        yield
+    clear_local_cache()
+
+
+class TestChartCacheKey:
+    """Tests for cache key generation."""
+
+    def test_key_is_stable(self) -> None:
+        """Test that identical inputs give identical keys."""
+        args = (2448029.1, -23.5, -46.6, "placidus", "pt-BR")
+        assert generate_chart_cache_key(*args) == generate_chart_cache_key(*args)
+        assert len(generate_chart_cache_key(*args)) == 64
+
+    def test_key_depends_on_every_component(self) -> None:
+        """Test that each component changes the key."""
+        base = (2448029.1, -23.5, -46.6, "placidus", "pt-BR")
+        variants = [
+            (2448029.2, -23.5, -46.6, "placidus", "pt-BR"),
+            (2448029.1, -23.6, -46.6, "placidus", "pt-BR"),
+            (2448029.1, -23.5, -46.7, "placidus", "pt-BR"),
+            (2448029.1, -23.5, -46.6, "koch", "pt-BR"),
+            (2448029.1, -23.5, -46.6, "placidus", "en-US"),
+        ]
+        keys = {generate_chart_cache_key(*variant) for variant in variants}
+        assert generate_chart_cache_key(*base) not in keys
+        assert len(keys) == len(variants)
+
+    def test_engine_version_invalidates(self) -> None:
+        """Test that bumping the engine version changes the key."""
+        args = (2448029.1, -23.5, -46.6, "placidus", "pt-BR")
+        before = generate_chart_cache_key(*args)
+        with patch.object(chart_cache_service, "CHART_ENGINE_VERSION", "next"):
+            assert generate_chart_cache_key(*args) != before
+
+
+class TestGetOrCalculateBirthChart:
+    """Tests for the two-tier lookup."""
+
+    @pytest.mark.asyncio
+    async def test_matches_direct_calculation(self) -> None:
+        """Test that cached output equals an uncached calculation."""
+        expected = calculate_birth_chart_all_languages(**BIRTH_DATA)
+
+        first = await get_or_calculate_birth_chart(**BIRTH_DATA)
+        second = await get_or_calculate_birth_chart(**BIRTH_DATA)
+
+        for result in (first, second):
+            for language, data in expected.items():
+                # Only the calculation timestamp may differ
+                assert result[language] | {"calculation_timestamp": None} == data | {
+                    "calculation_timestamp": None
+                }
+
+    @pytest.mark.asyncio
+    async def test_second_call_hits_local_tier(self) -> None:
+        """Test that a repeated call does not recalculate."""
+        await get_or_calculate_birth_chart(**BIRTH_DATA)
+        with patch.object(chart_cache_service, "calculate_chart_core") as core:
+            await get_or_calculate_birth_chart(**BIRTH_DATA)
+            core.assert_not_called()
+
+        stats = cache_info()
+        assert stats["misses"] == 2  # one per language on the first call
+        assert stats["local_hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_results_are_independent_copies(self) -> None:
+        """Test that mutating a returned chart does not poison the cache."""
+        first = await get_or_calculate_birth_chart(**BIRTH_DATA, languages=["pt-BR"])
+        first["pt-BR"]["planets"].clear()
+
+        second = await get_or_calculate_birth_chart(**BIRTH_DATA, languages=["pt-BR"])
+        assert second["pt-BR"]["planets"]
+
+    @pytest.mark.asyncio
+    async def test_cached_results_get_a_fresh_timestamp(self) -> None:
+        """Test that a chart served from the cache reports when it was requested."""
+        first = await get_or_calculate_birth_chart(**BIRTH_DATA, languages=["pt-BR"])
+        later = datetime.now(UTC) + timedelta(seconds=1)
+        with patch.object(chart_cache_service, "datetime") as clock:
+            clock.now.return_value = later
+            second = await get_or_calculate_birth_chart(**BIRTH_DATA, languages=["pt-BR"])
+
+        assert first["pt-BR"]["calculation_timestamp"] != later.isoformat()
+        assert second["pt-BR"]["calculation_timestamp"] == later.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_only_missing_languages_are_localized(self) -> None:
+        """Test that a cached language is reused when another is requested."""
+        await get_or_calculate_birth_chart(**BIRTH_DATA, languages=["pt-BR"])
+        with patch.object(
+            chart_cache_service, "localize_chart", wraps=chart_cache_service.localize_chart
+        ) as localize:
+            await get_or_calculate_birth_chart(**BIRTH_DATA, languages=["pt-BR", "en-US"])
+            assert [c.args[1] for c in localize.call_args_list] == ["en-US"]
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_is_shared(self) -> None:
+        """Test that another process (empty local tier) is served from Redis."""
+        with (
+            patch.object(chart_cache_service, "get_async_redis_pool", return_value=MagicMock()),
+            patch.object(chart_cache_service.aioredis, "Redis", FakeRedis),
+        ):
+            await get_or_calculate_birth_chart(**BIRTH_DATA)
+            assert len(FakeRedis.store) == 2
+
+            clear_local_cache()
+            with patch.object(chart_cache_service, "calculate_chart_core") as core:
+                await get_or_calculate_birth_chart(**BIRTH_DATA)
+                core.assert_not_called()
+
+        assert cache_info()["redis_hits"] == 2
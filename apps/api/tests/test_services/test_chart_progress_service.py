@@ -0,0 +1,169 @@
+"""
+Tests for chart processing progress over Redis.
+"""
+
+import json
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.services import chart_progress_service
+
+
+class FakeRedis:
+    """Minimal dict-backed stand-in for the async redis client (and its pipeline)."""
+
+    store: dict[str, str] = {}
+    published: list[tuple[str, str]] = []
+
+    def __init__(self, connection_pool: object = None) -> None:
+        pass
+
+    def setex(self, key: str, ttl: int, value: str) -> None:
+        self.store[key] = value
+
+    def publish(self, channel: str, value: str) -> None:
+        self.published.append((channel, value))
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.store.get(key) for key in keys]
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.store.pop(key, None)
+
+    def pipeline(self, transaction: bool = True) -> "FakeRedis":
+        return self
+
+    async def execute(self) -> list[Any]:
+        return []
+
+
+@pytest.fixture
+def fake_redis():
+    """Route progress Redis calls to an in-memory store."""
+    FakeRedis.store = {}
+    FakeRedis.published = []
+    with (
+        patch.object(chart_progress_service, "get_async_redis_pool", return_value=MagicMock()),
+        patch.object(chart_progress_service.aioredis, "Redis", FakeRedis),
+    ):
+        yield FakeRedis
+
+
+def _chart(**overrides: Any) -> MagicMock:
+    values = {
+        "id": uuid4(),
+        "user_id": uuid4(),
+        "status": "processing",
+        "progress": 40,
+        "error_message": None,
+        "task_id": "task-1",
+    }
+    return MagicMock(**(values | overrides))
+
+
+class TestProgressStates:
+    """Tests for publishing and reading progress states."""
+
+    @pytest.mark.asyncio
+    async def test_chart_progress_is_stored_and_published(
+        self, fake_redis: type[FakeRedis]
+    ) -> None:
+        """Test that a chart update becomes the latest state and an event."""
+        chart = _chart()
+
+        await chart_progress_service.publish_chart_progress(chart)
+
+        states = await chart_progress_service.get_progress_states(chart.id)
+        assert states["chart"]["progress"] == 40
+        assert states["chart"]["user_id"] == str(chart.user_id)
+        channel, value = fake_redis.published[0]
+        assert channel == f"{chart_progress_service.CHART_PROGRESS_CHANNEL_PREFIX}{chart.id}"
+        assert json.loads(value) == states["chart"]
+
+    @pytest.mark.asyncio
+    async def test_later_updates_replace_the_state(self, fake_redis: type[FakeRedis]) -> None:
+        """Test that only the latest state of each kind is kept."""
+        chart = _chart()
+        await chart_progress_service.publish_chart_progress(chart)
+        await chart_progress_service.publish_chart_progress(_chart(id=chart.id, status="completed"))
+        await chart_progress_service.publish_pdf_progress(chart.id, chart.user_id, "generating")
+
+        states = await chart_progress_service.get_progress_states(chart.id)
+
+        assert states["chart"]["status"] == "completed"
+        assert states["pdf"]["status"] == "generating"
+
+    @pytest.mark.asyncio
+    async def test_events_hide_server_side_fields(self, fake_redis: type[FakeRedis]) -> None:
+        """Test that owner and storage location are not sent to clients."""
+        chart_id = uuid4()
+        await chart_progress_service.publish_pdf_progress(
+            chart_id,
+            uuid4(),
+            "ready",
+            pdf_url="s3://bucket/report.pdf",
+            generated_at=datetime.now(UTC),
+        )
+
+        event = chart_progress_service.to_event(
+            (await chart_progress_service.get_progress_states(chart_id))["pdf"]
+        )
+
+        assert event["status"] == "ready"
+        assert "pdf_url" not in event
+        assert "user_id" not in event
+
+    @pytest.mark.asyncio
+    async def test_clear_drops_selected_kinds(self, fake_redis: type[FakeRedis]) -> None:
+        """Test that clearing one kind keeps the others."""
+        chart = _chart()
+        await chart_progress_service.publish_chart_progress(chart)
+        await chart_progress_service.publish_pdf_progress(chart.id, chart.user_id, "generating")
+
+        await chart_progress_service.clear_progress_states(chart.id, kinds=("pdf",))
+
+        assert set(await chart_progress_service.get_progress_states(chart.id)) == {"chart"}
+
+    @pytest.mark.asyncio
+    async def test_redis_unavailable_returns_no_state(self) -> None:
+        """Test that readers fall back to the database without Redis."""
+        with patch.object(chart_progress_service, "get_async_redis_pool", return_value=None):
+            await chart_progress_service.publish_chart_progress(_chart())
+            assert await chart_progress_service.get_progress_states(uuid4()) == {}
+
+
+class TestStreamProgress:
+    """Tests for following a chart's progress."""
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_stored_state_then_events(
+        self, fake_redis: type[FakeRedis]
+    ) -> None:
+        """Test that subscribers get the current state first, then updates and keepalives."""
+        chart = _chart()
+        await chart_progress_service.publish_chart_progress(chart)
+        update = {"kind": "chart", "status": "completed", "progress": 100}
+
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.reset = AsyncMock()
+        pubsub.get_message = AsyncMock(side_effect=[{"data": json.dumps(update)}, None])
+        client = MagicMock(close=AsyncMock())
+        client.pubsub.return_value = pubsub
+
+        with patch.object(chart_progress_service.aioredis, "from_url", return_value=client):
+            stream = chart_progress_service.stream_progress(chart.id, keepalive_seconds=1)
+            received = [await anext(stream) for _ in range(3)]
+            await stream.aclose()
+
+        assert received[0]["progress"] == 40
+        assert received[1] == update
+        assert received[2] is None
+        pubsub.subscribe.assert_awaited_once()
+        pubsub.reset.assert_awaited_once()
+        client.close.assert_awaited_once()
@@ -3,12 +3,15 @@ Tests for chart_service.py - Update functionality and ChartService class
 """
 
 from datetime import UTC, datetime
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
-from app.schemas.chart import BirthChartUpdate
+from app.repositories.chart_repository import ChartRepository
+from app.schemas.chart import BirthChartSummary, BirthChartUpdate
 from app.services.chart_service import (
     ChartNotFoundError,
     ChartService,
@@ -17,6 +20,7 @@ from app.services.chart_service import (
     get_chart_service,
     update_birth_chart,
 )
+from app.utils.chart_data_accessor import merge_chart_data, split_chart_data
 
 
 class TestNeedsRecalculation:
@@ -587,6 +591,30 @@ class TestChartServiceWithMockedRepos:
                         user_id=user_id, skip=10, limit=20, include_deleted=False
                     )
 
+    @pytest.mark.asyncio
+    async def test_get_user_chart_summaries_uses_repo(self):
+        """get_user_chart_summaries should delegate to the summary query."""
+        user_id = uuid4()
+        mock_charts = [MagicMock()]
+        mock_db = AsyncMock()
+
+        with patch("app.services.chart_service.ChartRepository") as MockChartRepo:
+            with patch("app.services.chart_service.InterpretationRepository"):
+                with patch("app.services.chart_service.AuditRepository"):
+                    mock_repo = AsyncMock()
+                    mock_repo.get_summaries_by_user.return_value = mock_charts
+                    MockChartRepo.return_value = mock_repo
+
+                    service = ChartService(mock_db)
+                    result = await service.get_user_chart_summaries(
+                        user_id, "en-US", skip=20, limit=20
+                    )
+
+                    assert result == mock_charts
+                    mock_repo.get_summaries_by_user.assert_called_once_with(
+                        user_id=user_id, language="en-US", skip=20, limit=20
+                    )
+
     @pytest.mark.asyncio
     async def test_delete_birth_chart_soft_delete(self):
         """delete_birth_chart should use soft delete by default."""
@@ -628,3 +656,153 @@ class TestChartServiceWithMockedRepos:
 
                     mock_repo.delete.assert_called_once_with(mock_chart)
                     mock_repo.soft_delete.assert_not_called()
+
+
+class TestChartSummaries:
+    """Tests for the chart list projection."""
+
+    @pytest.mark.asyncio
+    async def test_summary_query_does_not_select_chart_data(self):
+        """The list query should project chart_data instead of loading it."""
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(return_value=MagicMock())
+
+        await ChartRepository(mock_db).get_summaries_by_user(uuid4(), "en-US")
+
+        stmt = mock_db.execute.await_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        select_list = sql.split(" FROM ")[0]
+        assert "birth_charts.chart_data," not in select_list
+        assert "jsonb_path_query_first" in select_list
+        assert "birth_charts.person_name" in select_list
+
+    @pytest.mark.asyncio
+    async def test_version_query_does_not_load_chart_data(self):
+        """The ETag pre-check should read id/updated_at/user_id with the owner filter."""
+        updated_at = datetime.now(UTC)
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(
+            return_value=MagicMock(
+                one_or_none=MagicMock(return_value=SimpleNamespace(updated_at=updated_at))
+            )
+        )
+
+        result = await ChartRepository(mock_db).get_version(uuid4(), uuid4())
+
+        stmt = mock_db.execute.await_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        select_list, conditions = sql.split("FROM")
+        assert result == updated_at
+        assert "chart_data" not in select_list
+        assert "birth_charts.updated_at" in select_list
+        assert "birth_charts.user_id = " in conditions
+        assert "birth_charts.deleted_at IS NULL" in conditions
+
+    def test_summary_schema_reads_chart_summary(self):
+        """BirthChartSummary should serialize chart_summary as chart_data."""
+        now = datetime.now(UTC)
+        summary = {"planets": [{"name": "Sun", "sign": "Leo"}], "ascendant": 12.5}
+        chart = SimpleNamespace(
+            id=uuid4(),
+            user_id=uuid4(),
+            person_name="Ana",
+            gender=None,
+            birth_datetime=now,
+            birth_timezone="UTC",
+            latitude=0.0,
+            longitude=0.0,
+            city=None,
+            country=None,
+            notes=None,
+            tags=None,
+            house_system="placidus",
+            zodiac_type="tropical",
+            node_type="true",
+            status="completed",
+            progress=100,
+            error_message=None,
+            chart_summary=summary,
+            pdf_url=None,
+            pdf_generated_at=None,
+            pdf_generating=False,
+            pdf_task_id=None,
+            visibility="private",
+            share_uuid=None,
+            created_at=now,
+            updated_at=now,
+            deleted_at=None,
+        )
+
+        data = BirthChartSummary.model_validate(chart).model_dump(by_alias=True)
+
+        assert data["chart_data"] == summary
+
+
+LANGUAGE_FIRST_CHART_DATA = {
+    "en-US": {
+        "planets": [{"name": "Sun", "sign": "Leo"}],
+        "sect": "diurnal",
+        "lunar_phase": {"name": "Full Moon"},
+    },
+    "pt-BR": {
+        "planets": [{"name": "Sun", "sign": "Leo"}],
+        "sect": "diurnal",
+        "lunar_phase": {"name": "Lua Cheia"},
+    },
+}
+
+
+class TestChartLocalizations:
+    """Tests for storing chart data as a shared section plus per-language rows."""
+
+    def test_split_and_merge_round_trip(self):
+        """Splitting then merging should give back each language's data."""
+        neutral, localized = split_chart_data(LANGUAGE_FIRST_CHART_DATA)
+
+        assert neutral == {"planets": [{"name": "Sun", "sign": "Leo"}], "sect": "diurnal"}
+        assert localized["en-US"] == {"lunar_phase": {"name": "Full Moon"}}
+        for language, data in LANGUAGE_FIRST_CHART_DATA.items():
+            assert merge_chart_data(neutral, localized[language]) == data
+
+    @pytest.mark.asyncio
+    async def test_save_chart_data_upserts_localizations(self):
+        """save_chart_data should keep the shared section on the chart."""
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock()
+        mock_db.flush = AsyncMock()
+        chart = MagicMock(id=uuid4())
+
+        await ChartRepository(mock_db).save_chart_data(chart, LANGUAGE_FIRST_CHART_DATA)
+
+        assert chart.chart_data == {"planets": [{"name": "Sun", "sign": "Leo"}], "sect": "diurnal"}
+        upsert, cleanup = (call.args[0] for call in mock_db.execute.await_args_list)
+        sql = str(upsert.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT ON CONSTRAINT uq_birth_chart_localization DO UPDATE" in sql
+        assert "DELETE FROM birth_chart_localizations" in str(cleanup)
+        mock_db.flush.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_chart_data_merges_language_row(self):
+        """get_chart_data should merge the shared section with one language."""
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = {"lunar_phase": {"name": "Lua Cheia"}}
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(return_value=result)
+        chart = MagicMock(id=uuid4(), chart_data={"sect": "diurnal"})
+
+        data = await ChartRepository(mock_db).get_chart_data(chart, "pt-BR")
+
+        assert data == {"sect": "diurnal", "lunar_phase": {"name": "Lua Cheia"}}
+        mock_db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_chart_data_reads_unmigrated_charts(self):
+        """Language-first chart_data should be read without a query."""
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock()
+        chart = MagicMock(id=uuid4(), chart_data=LANGUAGE_FIRST_CHART_DATA)
+
+        data = await ChartRepository(mock_db).get_chart_data(chart, "en-US")
+
+        assert data == LANGUAGE_FIRST_CHART_DATA["en-US"]
+        mock_db.execute.assert_not_awaited()
@@ -0,0 +1,137 @@
+"""
+Tests for the RAG query embedding cache.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.rag import embedding_cache_service
+from app.services.rag.embedding_cache_service import (
+    EmbeddingCacheService,
+    clear_local_embeddings,
+    generate_embedding_cache_key,
+)
+
+
+class StubEmbeddingClient:
+    """Embeddings client that derives a vector from the text length."""
+
+    def __init__(self) -> None:
+        self.requests: list[list[str]] = []
+        self.embeddings = SimpleNamespace(create=self.create)
+
+    async def create(self, model: str, input: list[str]) -> SimpleNamespace:
+        self.requests.append(list(input))
+        return SimpleNamespace(
+            data=[
+                SimpleNamespace(index=i, embedding=[float(len(text)), 1.0])
+                for i, text in enumerate(input)
+            ]
+        )
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache():
+    """Start every test with an empty in-process tier."""
+    clear_local_embeddings()
+    yield
+    clear_local_embeddings()
+
+
+class TestEmbeddingCacheKey:
+    """Tests for cache key generation."""
+
+    def test_whitespace_is_normalized(self) -> None:
+        """Test that whitespace differences share a key."""
+        assert generate_embedding_cache_key("m", "Mars in  Aries\n") == (
+            generate_embedding_cache_key("m", "Mars in Aries")
+        )
+
+    def test_model_is_part_of_key(self) -> None:
+        """Test that another embedding model gets another key."""
+        assert generate_embedding_cache_key("a", "Mars") != generate_embedding_cache_key(
+            "b", "Mars"
+        )
+
+
+class TestEmbeddingCacheService:
+    """Tests for cached and batched embedding."""
+
+    async def test_batch_uses_one_request(self) -> None:
+        """Test that a batch of misses is embedded with one API request."""
+        client = StubEmbeddingClient()
+        service = EmbeddingCacheService(client, model="stub")
+
+        vectors = await service.embed_many(["Sun in Leo", "Moon", "Sun in  Leo"])
+
+        assert client.requests == [["Sun in Leo", "Moon"]]
+        assert vectors == [[10.0, 1.0], [4.0, 1.0], [10.0, 1.0]]
+
+    async def test_repeated_text_is_served_from_memory(self) -> None:
+        """Test that a cached text does not call the API again."""
+        client = StubEmbeddingClient()
+        service = EmbeddingCacheService(client, model="stub")
+
+        await service.embed_many(["Sun in Leo", "Moon"])
+        vector = await service.embed("Moon")
+
+        assert vector == [4.0, 1.0]
+        assert len(client.requests) == 1
+
+    async def test_large_batches_are_split(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that inputs are sent in chunks of EMBEDDING_BATCH_SIZE."""
+        monkeypatch.setattr(embedding_cache_service, "EMBEDDING_BATCH_SIZE", 2)
+        client = StubEmbeddingClient()
+        service = EmbeddingCacheService(client, model="stub")
+
+        vectors = await service.embed_many(["a", "bb", "ccc"])
+
+        assert [len(request) for request in client.requests] == [2, 1]
+        assert vectors == [[1.0, 1.0], [2.0, 1.0], [3.0, 1.0]]
+
+    async def test_api_failure_returns_none(self) -> None:
+        """Test that a failed request yields None and is not cached."""
+        client = MagicMock()
+        client.embeddings.create = AsyncMock(side_effect=RuntimeError("down"))
+        service = EmbeddingCacheService(client, model="stub")
+
+        assert await service.embed("Moon") is None
+        assert await service.embed("Moon") is None
+        assert client.embeddings.create.await_count == 2
+
+    async def test_database_tier(self) -> None:
+        """Test that embeddings stored in Postgres skip the API."""
+        key = generate_embedding_cache_key("stub", "Moon")
+        result = MagicMock()
+        result.all.return_value = [SimpleNamespace(cache_key=key, embedding=[0.5, 0.5])]
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+        client = StubEmbeddingClient()
+        service = EmbeddingCacheService(client, db=db, model="stub")
+
+        assert await service.embed("Moon") == [0.5, 0.5]
+        assert client.requests == []
+
+    async def test_concurrent_use_of_one_session_is_serialized(self) -> None:
+        """Test that concurrent lookups never run two statements on the session at once."""
+        active = 0
+        overlapped = False
+
+        async def execute(*args: object) -> MagicMock:
+            nonlocal active, overlapped
+            active += 1
+            overlapped = overlapped or active > 1
+            await asyncio.sleep(0)
+            active -= 1
+            return MagicMock(all=MagicMock(return_value=[]))
+
+        db = MagicMock()
+        db.execute = execute
+        service = EmbeddingCacheService(StubEmbeddingClient(), db=db, model="stub")
+
+        await asyncio.gather(*(service.embed(f"Query {i}") for i in range(5)))
+
+        assert not overlapped
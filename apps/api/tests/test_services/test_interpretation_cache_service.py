@@ -2,10 +2,98 @@
 Tests for the InterpretationCacheService.
 """
 
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.services.interpretation_cache_service import InterpretationCacheService
+from app.services import interpretation_cache_service
+from app.services.interpretation_cache_service import (
+    INTERPRETATION_CACHE_KEY_PREFIX,
+    INTERPRETATION_HITS_KEY,
+    InterpretationCacheService,
+    clear_local_state,
+    push_pending_hits,
+)
+
+PLANET_PARAMS = {"planet": "Sun", "sign": "Aries"}
+
+
+class FakeRedis:
+    """Minimal dict-backed stand-in for the async redis client."""
+
+    store: dict[str, Any] = {}
+
+    def __init__(self, connection_pool: object = None) -> None:
+        pass
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.store.get(key) for key in keys]
+
+    async def setex(self, key: str, ttl: int, value: str) -> None:
+        self.store[key] = value
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    async def hincrby(self, name: str, key: str, amount: int) -> None:
+        table = self.store.setdefault(name, {})
+        table[key] = str(int(table.get(key, 0)) + amount)
+
+    async def hset(self, name: str, key: str, value: float) -> None:
+        self.store.setdefault(name, {})[key] = str(value)
+
+    async def hgetall(self, name: str) -> dict[str, str]:
+        return dict(self.store.get(name, {}))
+
+    async def hvals(self, name: str) -> list[str]:
+        return list(self.store.get(name, {}).values())
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues FakeRedis commands and returns their results on execute()."""
+
+    def __init__(self, client: FakeRedis) -> None:
+        self._client = client
+        self._commands: list[tuple[str, tuple[Any, ...]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any) -> None:
+            self._commands.append((name, args))
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        commands, self._commands = self._commands, []
+        return [await getattr(self._client, name)(*args) for name, args in commands]
+
+
+def _db_returning(content: str | None) -> MagicMock:
+    """Mock session whose SELECT returns the given content."""
+    db = MagicMock()
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = content
+    db.execute = AsyncMock(return_value=result)
+    db.commit = AsyncMock()
+    db.rollback = AsyncMock()
+    return db
+
+
+async def _get(service: InterpretationCacheService) -> str | None:
+    return await service.get(
+        interpretation_type="planet",
+        parameters=PLANET_PARAMS,
+        model="gpt-4o-mini",
+        prompt_version="1.0",
+    )
 
 
 class TestCacheKeyGeneration:
@@ -101,6 +189,146 @@ class TestCacheKeyGeneration:
         assert key1 != key2
 
 
+class TestCacheTiers:
+    """Tests for the in-process and Redis tiers in front of Postgres."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_tiers(self):
+        """Start with empty tiers and a fake Redis."""
+        clear_local_state()
+        FakeRedis.store = {}
+        with (
+            patch.object(
+                interpretation_cache_service, "get_async_redis_pool", return_value=MagicMock()
+            ),
+            patch.object(interpretation_cache_service.aioredis, "Redis", FakeRedis),
+        ):
+            yield
+        clear_local_state()
+
+    async def test_repeated_get_skips_database(self):
+        """Test that a hit is served from process memory after the first read."""
+        db = _db_returning("Sun in Aries")
+        service = InterpretationCacheService(db)
+
+        assert await _get(service) == "Sun in Aries"
+        assert await _get(service) == "Sun in Aries"
+
+        # One SELECT, no hit-count UPDATE
+        assert db.execute.await_count == 1
+
+    async def test_redis_tier_is_shared(self):
+        """Test that another process (empty local tier) is served from Redis."""
+        await _get(InterpretationCacheService(_db_returning("Sun in Aries")))
+        clear_local_state()
+
+        db = _db_returning(None)
+        assert await _get(InterpretationCacheService(db)) == "Sun in Aries"
+        db.execute.assert_not_awaited()
+
+    async def test_miss_is_not_cached(self):
+        """Test that a miss falls through to Postgres every time."""
+        db = _db_returning(None)
+        service = InterpretationCacheService(db)
+
+        assert await _get(service) is None
+        assert await _get(service) is None
+        assert db.execute.await_count == 2
+
+    async def test_get_many_resolves_each_tier_once(self):
+        """Test that get_many reads local, Redis and Postgres with one query."""
+        await _get(InterpretationCacheService(_db_returning("Sun in Aries")))
+        local_key = InterpretationCacheService.generate_cache_key(
+            "planet", PLANET_PARAMS, "gpt-4o-mini", "1.0"
+        )
+        FakeRedis.store[f"{INTERPRETATION_CACHE_KEY_PREFIX}redis-key"] = "From Redis"
+        db = _db_returning(None)
+        db.execute.return_value.all.return_value = [
+            MagicMock(cache_key="db-key", content="From Postgres")
+        ]
+
+        found = await InterpretationCacheService(db).get_many(
+            [local_key, "redis-key", "db-key", "unknown-key"]
+        )
+
+        assert found == {
+            local_key: "Sun in Aries",
+            "redis-key": "From Redis",
+            "db-key": "From Postgres",
+        }
+        assert db.execute.await_count == 1
+        assert FakeRedis.store[f"{INTERPRETATION_CACHE_KEY_PREFIX}db-key"] == "From Postgres"
+
+    async def test_hits_are_buffered_and_flushed_in_bulk(self):
+        """Test that hit counts reach Postgres in one executemany UPDATE."""
+        service = InterpretationCacheService(_db_returning("Sun in Aries"))
+        for _ in range(3):
+            await _get(service)
+
+        await push_pending_hits()
+        cache_key = InterpretationCacheService.generate_cache_key(
+            "planet", PLANET_PARAMS, "gpt-4o-mini", "1.0"
+        )
+        assert FakeRedis.store[INTERPRETATION_HITS_KEY] == {cache_key: "3"}
+
+        db = _db_returning(None)
+        updated = await InterpretationCacheService(db).flush_hit_counts()
+
+        assert updated == 1
+        params = db.execute.await_args.args[1]
+        assert [(p["b_cache_key"], p["b_hits"]) for p in params] == [(cache_key, 3)]
+        assert INTERPRETATION_HITS_KEY not in FakeRedis.store
+
+    async def test_flush_without_hits_does_nothing(self):
+        """Test that an idle flush does not touch the database."""
+        db = _db_returning(None)
+        assert await InterpretationCacheService(db).flush_hit_counts() == 0
+        db.execute.assert_not_awaited()
+
+    async def test_delete_evicts_tiers(self):
+        """Test that deleting a row removes it from both tiers."""
+        await _get(InterpretationCacheService(_db_returning("Sun in Aries")))
+        cache_key = InterpretationCacheService.generate_cache_key(
+            "planet", PLANET_PARAMS, "gpt-4o-mini", "1.0"
+        )
+
+        db = _db_returning(None)
+        db.execute.return_value.scalars.return_value.all.return_value = [cache_key]
+        assert await InterpretationCacheService(db).delete(MagicMock()) is True
+
+        assert await _get(InterpretationCacheService(_db_returning(None))) is None
+
+    async def test_duplicate_set_keeps_the_transaction(self):
+        """Test that a concurrent insert of the same key only rolls back a savepoint."""
+        existing = MagicMock(content="Sun in Aries")
+        db = _db_returning(None)
+        db.execute.return_value.scalar_one_or_none.return_value = existing
+        db.flush = AsyncMock(side_effect=IntegrityError("INSERT", {}, Exception("duplicate")))
+
+        entry = await InterpretationCacheService(db).set(
+            interpretation_type="planet",
+            subject="Sun",
+            parameters=PLANET_PARAMS,
+            content="Sun in Aries",
+            model="gpt-4o-mini",
+            prompt_version="1.0",
+        )
+
+        assert entry is existing
+        db.begin_nested.assert_called_once()
+        db.rollback.assert_not_awaited()
+
+    def test_services_on_one_session_share_a_lock(self):
+        """Test that every cache service on a session serializes on the same lock."""
+        db = _db_returning(None)
+
+        first = InterpretationCacheService(db)
+        second = InterpretationCacheService(db)
+
+        assert first._db_lock is second._db_lock
+        assert first._db_lock is not InterpretationCacheService(_db_returning(None))._db_lock
+
+
 class TestCacheOperations:
     """Tests for cache operations with database."""
 
@@ -0,0 +1,189 @@
+"""
+Tests for InterpretationFetcherService generation coalescing.
+"""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.domain.interpretation import InterpretationResult
+from app.services.unified import singleflight
+from app.services.unified.interpretation_fetcher_service import InterpretationFetcherService
+
+CHART_DATA = {
+    "planets": [{"name": "Sun", "sign": "Leo", "house": 10, "dignities": {}}],
+    "sect": "diurnal",
+}
+
+
+class FakeRedis:
+    """Minimal dict-backed stand-in for the async redis client."""
+
+    store: dict[str, str] = {}
+
+    def __init__(self, connection_pool: object = None) -> None:
+        pass
+
+    async def set(self, key: str, value: str, px: int, nx: bool) -> bool:
+        if nx and key in self.store:
+            return False
+        self.store[key] = value
+        return True
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def exists(self, key: str) -> int:
+        return int(key in self.store)
+
+    async def setex(self, key: str, ttl: int, value: str) -> None:
+        self.store[key] = value
+
+    async def eval(self, script: str, numkeys: int, key: str, token: str) -> int:
+        if self.store.get(key) == token:
+            del self.store[key]
+            return 1
+        return 0
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues FakeRedis commands and returns their results on execute()."""
+
+    def __init__(self, client: FakeRedis) -> None:
+        self._client = client
+        self._commands: list[tuple[str, tuple[Any, ...]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any) -> None:
+            self._commands.append((name, args))
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        return [await getattr(self._client, name)(*args) for name, args in self._commands]
+
+
+@pytest.fixture
+def fake_redis():
+    """Route singleflight Redis calls to an in-memory store."""
+    FakeRedis.store = {}
+    with (
+        patch.object(singleflight, "get_async_redis_pool", return_value=MagicMock()),
+        patch.object(singleflight.aioredis, "Redis", FakeRedis),
+        patch.object(singleflight, "SINGLEFLIGHT_POLL_INTERVAL_SECONDS", 0.01),
+    ):
+        yield FakeRedis.store
+
+
+def _fetcher(generate: AsyncMock) -> InterpretationFetcherService:
+    db_storage = MagicMock()
+    db_storage.get_by_chart = AsyncMock(return_value=[])
+    db_storage.save = AsyncMock()
+    cache_storage = MagicMock()
+    cache_storage.get_single = AsyncMock(return_value=None)
+    generator = MagicMock()
+    generator.get_model_id.return_value = "model"
+    generator.generate = generate
+    return InterpretationFetcherService(db_storage, cache_storage, generator, "v1")
+
+
+def _slow_generation(content: str = "Sun in Leo") -> AsyncMock:
+    async def generate(**kwargs: Any) -> InterpretationResult:
+        await asyncio.sleep(0.05)
+        return InterpretationResult(
+            content=content,
+            subject=kwargs["subject"],
+            interpretation_type=kwargs["interpretation_type"],
+            source="rag",
+            prompt_version="v1",
+        )
+
+    return AsyncMock(side_effect=generate)
+
+
+class TestSingleflight:
+    """Tests for coalescing concurrent identical generations."""
+
+    @pytest.mark.asyncio
+    async def test_stampede_generates_once(self, fake_redis: dict[str, str]) -> None:
+        """Test that concurrent requests for one subject share a generation."""
+        generate = _slow_generation()
+        fetcher = _fetcher(generate)
+        chart_id = uuid4()
+
+        results = await asyncio.gather(
+            *(fetcher.fetch_or_generate(chart_id, CHART_DATA, "planet", "Sun") for _ in range(4))
+        )
+
+        assert generate.await_count == 1
+        assert {result.content for result in results} == {"Sun in Leo"}
+        # Followers do not save the leader's chart again
+        assert fetcher.db_storage.save.await_count == 1  # type: ignore[attr-defined]
+        assert not any(key.startswith(singleflight.SINGLEFLIGHT_LEASE_PREFIX) for key in fake_redis)
+
+    @pytest.mark.asyncio
+    async def test_followers_save_their_own_chart(self, fake_redis: dict[str, str]) -> None:
+        """Test that a follower for another chart saves the shared result."""
+        generate = _slow_generation()
+        fetcher = _fetcher(generate)
+        charts = [uuid4(), uuid4()]
+
+        await asyncio.gather(
+            *(fetcher.fetch_or_generate(c, CHART_DATA, "planet", "Sun") for c in charts)
+        )
+
+        assert generate.await_count == 1
+        saved = [c.args[0] for c in fetcher.db_storage.save.await_args_list]  # type: ignore[attr-defined]
+        assert sorted(saved) == sorted(charts)
+
+    @pytest.mark.asyncio
+    async def test_follower_falls_back_when_leader_fails(self, fake_redis: dict[str, str]) -> None:
+        """Test that followers generate themselves if the leader gave up."""
+        calls = 0
+
+        async def generate(**kwargs: Any) -> InterpretationResult:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            if calls == 1:
+                raise RuntimeError("LLM down")
+            return InterpretationResult(
+                content="Retry",
+                subject="Sun",
+                interpretation_type="planet",
+                source="rag",
+                prompt_version="v1",
+            )
+
+        fetcher = _fetcher(AsyncMock(side_effect=generate))
+        chart_id = uuid4()
+
+        leader, follower = await asyncio.gather(
+            fetcher.fetch_or_generate(chart_id, CHART_DATA, "planet", "Sun"),
+            fetcher.fetch_or_generate(chart_id, CHART_DATA, "planet", "Sun"),
+            return_exceptions=True,
+        )
+
+        assert isinstance(leader, RuntimeError)
+        assert isinstance(follower, InterpretationResult)
+        assert follower.content == "Retry"
+
+    @pytest.mark.asyncio
+    async def test_redis_unavailable_generates_normally(self) -> None:
+        """Test that requests are not coalesced (nor blocked) without Redis."""
+        generate = _slow_generation()
+        fetcher = _fetcher(generate)
+
+        with patch.object(singleflight, "get_async_redis_pool", return_value=None):
+            await asyncio.gather(
+                fetcher.fetch_or_generate(uuid4(), CHART_DATA, "planet", "Sun"),
+                fetcher.fetch_or_generate(uuid4(), CHART_DATA, "planet", "Sun"),
+            )
+
+        assert generate.await_count == 2
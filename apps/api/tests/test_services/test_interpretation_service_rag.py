@@ -4,14 +4,19 @@ Tests for InterpretationServiceRAG.
 Tests the RAG-enhanced interpretation service for extended Arabic Parts.
 """
 
+import json
+import re
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.services.interpretation_cache_service import InterpretationCacheService
 from app.services.interpretation_service_rag import (
     ARABIC_PARTS,
     InterpretationServiceRAG,
 )
+from app.services.rag.embedding_cache_service import clear_local_embeddings
 
 # =============================================================================
 # Module-level fixtures to avoid duplication
@@ -248,3 +253,197 @@ class TestCacheHitTracking:
 
         assert result == cached_interpretation
         assert service_with_cache._cache_hits == 1
+
+
+class TestSubjectPartition:
+    """Tests for resolving saved and cached subjects before generation."""
+
+    CHART_DATA = {
+        "planets": [
+            {"name": "Sun", "sign": "Leo", "house": 10, "dignities": {}},
+            {"name": "Moon", "sign": "Cancer", "house": 9, "dignities": {}},
+        ],
+        "houses": [{"house": 1, "sign": "Scorpio"}],
+        "aspects": [{"planet1": "Sun", "planet2": "Moon", "aspect": "Sextile", "orb": 1.0}],
+        "arabic_parts": {"fortune": {"sign": "Aries", "house": 6, "degree": 3.0}},
+        "sect": "diurnal",
+    }
+
+    @pytest.fixture
+    def service(self, mock_rag_service: InterpretationServiceRAG) -> InterpretationServiceRAG:
+        """Service with a mocked cache and repository."""
+        mock_rag_service.cache_service = MagicMock()
+        mock_rag_service.cache_service.get = AsyncMock(return_value=None)
+        mock_rag_service.cache_service.set = AsyncMock()
+        mock_rag_service.cache_service.get_many = AsyncMock(return_value={})
+        mock_rag_service.repo = MagicMock()
+        mock_rag_service.repo.get_existing_subjects = AsyncMock(return_value={})
+        mock_rag_service.repo.upsert_interpretation = AsyncMock()
+        mock_rag_service.db.flush = AsyncMock()
+        return mock_rag_service
+
+    def _subjects(self, service: InterpretationServiceRAG) -> list:
+        data = self.CHART_DATA
+        return service.collect_subjects(
+            data["planets"], data["houses"], data["aspects"], data["arabic_parts"], data["sect"]
+        )
+
+    def test_collect_subjects(self, service: InterpretationServiceRAG) -> None:
+        """Test that every chart element becomes one subject."""
+        subjects = self._subjects(service)
+
+        assert [(s.category, s.key) for s in subjects] == [
+            ("planets", "Sun"),
+            ("planets", "Moon"),
+            ("houses", "1"),
+            ("aspects", "Sun-Sextile-Moon"),
+            ("arabic_parts", "fortune"),
+        ]
+        assert subjects[2].arguments["ruler"] == "Mars"
+
+    @pytest.mark.asyncio
+    async def test_batch_keys_match_single_lookups(self, service: InterpretationServiceRAG) -> None:
+        """Test that get_cached_subjects asks for the keys generate_* would use."""
+        subjects = self._subjects(service)
+
+        await service.get_cached_subjects(subjects)
+        batch_keys = service.cache_service.get_many.call_args.args[0]  # type: ignore[union-attr]
+
+        for subject in subjects:
+            await service.generate_subject(subject)
+        single_keys = [
+            InterpretationCacheService.generate_cache_key(
+                c.kwargs["interpretation_type"],
+                c.kwargs["parameters"],
+                c.kwargs["model"],
+                c.kwargs["prompt_version"],
+                c.kwargs["language"],
+            )
+            for c in service.cache_service.get.call_args_list  # type: ignore[union-attr]
+        ]
+
+        assert batch_keys == single_keys
+
+    @pytest.mark.asyncio
+    async def test_only_missing_subjects_are_generated(
+        self, service: InterpretationServiceRAG
+    ) -> None:
+        """Test that saved and cached subjects skip the LLM."""
+        subjects = self._subjects(service)
+        service.repo.get_existing_subjects.return_value = {("planet", "Sun"): "Saved Sun"}  # type: ignore[attr-defined]
+        await service.get_cached_subjects(subjects[1:2])
+        moon_key = service.cache_service.get_many.call_args.args[0][0]  # type: ignore[union-attr]
+        service.cache_service.get_many.return_value = {moon_key: "Cached Moon"}  # type: ignore[union-attr]
+        chart = MagicMock(id="chart-id")
+
+        results = await service.generate_all_rag_interpretations(chart, self.CHART_DATA)
+
+        assert results["planets"] == {"Sun": "Saved Sun", "Moon": "Cached Moon"}
+        assert service.client.chat.completions.create.await_count == 3
+        saved = [
+            c.kwargs["subject"]
+            for c in service.repo.upsert_interpretation.call_args_list  # type: ignore[attr-defined]
+        ]
+        assert "Sun" not in saved
+        assert "Moon" in saved
+
+    @pytest.mark.asyncio
+    async def test_retrieval_queries_are_embedded_in_one_request(
+        self, service: InterpretationServiceRAG
+    ) -> None:
+        """Test that a chart's retrieval queries share one embeddings request."""
+        clear_local_embeddings()
+        embeddings_create = AsyncMock(
+            side_effect=lambda model, input: MagicMock(
+                data=[MagicMock(index=i, embedding=[0.1]) for i in range(len(input))]
+            )
+        )
+        service.embedding_service.client = MagicMock()
+        service.embedding_service.client.embeddings.create = embeddings_create
+        service.embedding_service.db = None
+
+        await service.generate_all_rag_interpretations(MagicMock(id="chart-id"), self.CHART_DATA)
+
+        assert embeddings_create.await_count == 1
+        assert len(embeddings_create.await_args.kwargs["input"]) == 5
+        clear_local_embeddings()
+
+
+class FakeBatchChatClient:
+    """Chat client answering multi-subject JSON prompts ("### <n>" items)."""
+
+    def __init__(self, skip: set[str] | None = None) -> None:
+        self.requests: list[dict] = []
+        self.skip = skip or set()  # Item numbers left out of the JSON answer
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs) -> SimpleNamespace:
+        self.requests.append(kwargs)
+        prompt = kwargs["messages"][-1]["content"]
+        if "response_format" in kwargs:
+            items = re.findall(r"^### (\d+)$", prompt, flags=re.MULTILINE)
+            content = json.dumps(
+                {"interpretations": {i: f"Batched {i}" for i in items if i not in self.skip}}
+            )
+        else:
+            content = "Single interpretation"
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class TestBatchedGeneration:
+    """Tests for whole-chart generation with multi-subject requests."""
+
+    @pytest.fixture
+    def service(self, mock_rag_service: InterpretationServiceRAG) -> InterpretationServiceRAG:
+        """Service with a mocked cache and repository."""
+        mock_rag_service.use_rag = False
+        mock_rag_service.cache_service = MagicMock()
+        mock_rag_service.cache_service.get = AsyncMock(return_value=None)
+        mock_rag_service.cache_service.set = AsyncMock()
+        mock_rag_service.cache_service.get_many = AsyncMock(return_value={})
+        mock_rag_service.repo = MagicMock()
+        mock_rag_service.repo.get_existing_subjects = AsyncMock(return_value={})
+        mock_rag_service.repo.upsert_interpretation = AsyncMock()
+        mock_rag_service.db.flush = AsyncMock()
+        return mock_rag_service
+
+    @pytest.mark.asyncio
+    async def test_subjects_are_grouped_into_json_requests(
+        self, service: InterpretationServiceRAG
+    ) -> None:
+        """Test that batch mode sends one JSON request per group and splits the results."""
+        client = FakeBatchChatClient()
+        service.client = client  # type: ignore[assignment]
+
+        with patch("app.services.interpretation_service_rag.settings.RAG_BATCH_SUBJECTS", 2):
+            results = await service.generate_all_rag_interpretations(
+                MagicMock(id="chart-id"), TestSubjectPartition.CHART_DATA, batch=True
+            )
+
+        assert len(client.requests) == 3  # 5 subjects, 2 per request
+        assert all(r["response_format"] == {"type": "json_object"} for r in client.requests)
+        assert results["planets"] == {"Sun": "Batched 1", "Moon": "Batched 2"}
+        assert results["arabic_parts"] == {"fortune": "Batched 1"}
+
+        cached = [c.kwargs["subject"] for c in service.cache_service.set.call_args_list]  # type: ignore[union-attr]
+        assert sorted(cached) == sorted(["Sun", "Moon", "1", "Sun-Sextile-Moon", "fortune"])
+        assert service.repo.upsert_interpretation.await_count == 5  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_missing_items_are_generated_individually(
+        self, service: InterpretationServiceRAG
+    ) -> None:
+        """Test that subjects left out of a batched answer fall back to single requests."""
+        client = FakeBatchChatClient(skip={"2"})
+        service.client = client  # type: ignore[assignment]
+        subjects = service.collect_subjects(
+            TestSubjectPartition.CHART_DATA["planets"], [], [], {}, "diurnal"
+        )
+
+        generated = await service.generate_subjects_batched(subjects)
+
+        assert generated == {
+            ("planets", "Sun"): "Batched 1",
+            ("planets", "Moon"): "Single interpretation",
+        }
+        assert len(client.requests) == 2
@@ -0,0 +1,213 @@
+"""
+Tests for public chart interpretation generation and the listing cache.
+"""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from starlette.requests import Request
+
+from app.api.v1.endpoints.public_charts import _cached_listing
+from app.repositories.public_interpretation_repository import PublicInterpretationRepository
+from app.schemas.public_chart import PublicChartUpdate
+from app.services import public_chart_cache
+from app.services.interpretation_service_rag import InterpretationSubject
+from app.services.public_chart_service import PublicChartService
+
+
+def _subject(category: str, key: str, interpretation_type: str) -> InterpretationSubject:
+    return InterpretationSubject(
+        category=category,
+        key=key,
+        interpretation_type=interpretation_type,
+        cache_type=f"{interpretation_type}_rag",
+        cache_params={},
+        arguments={},
+        search_query=key,
+    )
+
+
+SUBJECTS = [
+    _subject("planets", "Sun", "planet"),
+    _subject("planets", "Moon", "planet"),
+    _subject("houses", "1", "house"),
+    _subject("aspects", "Sun-Trine-Moon", "aspect"),
+]
+
+
+@pytest.fixture
+def mock_db() -> MagicMock:
+    """Create mock database session."""
+    db = MagicMock()
+    db.execute = AsyncMock()
+    db.commit = AsyncMock()
+    return db
+
+
+@pytest.fixture
+def rag_service() -> MagicMock:
+    """RAG service with one cached subject and generated others."""
+    service = MagicMock()
+    service.collect_subjects.return_value = SUBJECTS
+    service.get_cached_subjects = AsyncMock(return_value={("planets", "Sun"): "Cached Sun"})
+    service.prefetch_embeddings = AsyncMock()
+    service.generate_subjects = AsyncMock(
+        return_value={
+            ("planets", "Moon"): "Generated Moon",
+            ("houses", "1"): "Generated house",
+            ("aspects", "Sun-Trine-Moon"): "",
+        }
+    )
+    return service
+
+
+class TestGenerateInterpretations:
+    """Tests for PublicChartService.generate_interpretations."""
+
+    @pytest.mark.asyncio
+    async def test_misses_are_generated_together_and_saved_once(
+        self, mock_db: MagicMock, rag_service: MagicMock
+    ) -> None:
+        """Test that only misses are generated and all rows share one upsert."""
+        chart = MagicMock(id="chart-id", slug="chart", chart_data={"planets": []})
+
+        with patch(
+            "app.services.public_chart_service.InterpretationServiceRAG",
+            return_value=rag_service,
+        ):
+            results = await PublicChartService(mock_db).generate_interpretations(chart, "en-US")
+
+        assert results["planets"] == {"Sun": "Cached Sun", "Moon": "Generated Moon"}
+        assert results["houses"] == {"1": "Generated house"}
+        assert results["aspects"] == {}
+        generated = rag_service.generate_subjects.await_args.args[0]
+        assert [s.key for s in generated] == ["Moon", "1", "Sun-Trine-Moon"]
+
+        assert mock_db.execute.await_count == 1
+        mock_db.commit.assert_awaited_once()
+        stmt = mock_db.execute.await_args.args[0]
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        assert {value for name, value in params.items() if name.startswith("subject")} == {
+            "Sun",
+            "Moon",
+            "1",
+        }
+
+
+class TestBulkUpsert:
+    """Tests for PublicInterpretationRepository.bulk_upsert."""
+
+    @pytest.mark.asyncio
+    async def test_statement_updates_on_conflict(self, mock_db: MagicMock) -> None:
+        """Test that rows are written with one INSERT ... ON CONFLICT DO UPDATE."""
+        rows = [
+            {
+                "chart_id": "chart-id",
+                "interpretation_type": "planet",
+                "subject": "Sun",
+                "content": "Sun text",
+                "language": "en-US",
+                "openai_model": "model",
+                "prompt_version": "v1",
+            }
+        ]
+
+        written = await PublicInterpretationRepository(mock_db).bulk_upsert(rows)
+
+        assert written == 1
+        sql = str(mock_db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT ON CONSTRAINT uq_public_chart_interpretation DO UPDATE" in sql
+
+    @pytest.mark.asyncio
+    async def test_empty_rows_skip_the_database(self, mock_db: MagicMock) -> None:
+        """Test that an empty batch does not execute a statement."""
+        assert await PublicInterpretationRepository(mock_db).bulk_upsert([]) == 0
+        mock_db.execute.assert_not_awaited()
+
+
+class FakeRedis:
+    """Minimal dict-backed stand-in for the async redis client (and its pipeline)."""
+
+    store: dict[str, Any] = {}
+
+    def __init__(self, connection_pool: object = None) -> None:
+        pass
+
+    async def get(self, key: str) -> Any:
+        return self.store.get(key)
+
+    def setex(self, key: str, ttl: int, value: str) -> None:
+        self.store[key] = value
+
+    def sadd(self, key: str, member: str) -> None:
+        self.store.setdefault(key, set()).add(member)
+
+    def expire(self, key: str, ttl: int) -> None:
+        pass
+
+    async def smembers(self, key: str) -> set[str]:
+        return set(self.store.get(key, set()))
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.store.pop(key, None)
+
+    def pipeline(self, transaction: bool = True) -> "FakeRedis":
+        return self
+
+    async def execute(self) -> list[Any]:
+        return []
+
+
+@pytest.fixture
+def fake_redis():
+    """Route listing cache Redis calls to an in-memory store."""
+    FakeRedis.store = {}
+    with (
+        patch.object(public_chart_cache, "get_async_redis_pool", return_value=MagicMock()),
+        patch.object(public_chart_cache.aioredis, "Redis", FakeRedis),
+    ):
+        yield FakeRedis.store
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class TestListingCache:
+    """Tests for the public listing response cache."""
+
+    @pytest.mark.asyncio
+    async def test_listing_is_built_once_and_revalidated(self, fake_redis: dict[str, Any]) -> None:
+        """Test that a cached listing skips the build and answers 304 for its ETag."""
+        build = AsyncMock(return_value='[{"slug":"einstein"}]')
+
+        first = await _cached_listing(_request(), "featured", {"limit": 10}, build)
+        second = await _cached_listing(
+            _request(first.headers["ETag"]), "featured", {"limit": 10}, build
+        )
+
+        build.assert_awaited_once()
+        assert first.status_code == 200
+        assert first.body == b'[{"slug":"einstein"}]'
+        assert second.status_code == 304
+
+    @pytest.mark.asyncio
+    async def test_admin_update_invalidates_listings(
+        self, fake_redis: dict[str, Any], mock_db: MagicMock
+    ) -> None:
+        """Test that updating a public chart drops every cached listing."""
+        await public_chart_cache.cache_response(
+            public_chart_cache.generate_cache_key("list", {}), "{}"
+        )
+        chart = MagicMock(full_name="Einstein", slug="einstein")
+        mock_db.refresh = AsyncMock()
+        service = PublicChartService(mock_db)
+        service.repository.get_by_id = AsyncMock(return_value=chart)  # type: ignore[method-assign]
+
+        await service.update_chart(chart.id, PublicChartUpdate(featured=True))
+
+        assert fake_redis == {}
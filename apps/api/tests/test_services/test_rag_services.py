@@ -1,5 +1,8 @@
 """Tests for RAG services."""
 
+import math
+import random
+from collections import Counter
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -7,9 +10,31 @@ import pytest
 
 from app.models.vector_document import VectorDocument
 from app.services.rag.bm25_service import BM25Service
-from app.services.rag.document_ingestion_service import DocumentIngestionService
+from app.services.rag.document_ingestion_service import DocumentIngestionService, IngestionItem
 from app.services.rag.hybrid_search_service import HybridSearchService
 from app.services.rag.qdrant_service import QdrantService
+from app.services.rag.retrieval_cache import bump_corpus_version
+
+
+def _okapi_scores(
+    corpus: list[list[str]], query: list[str], k1: float, b: float, epsilon: float
+) -> list[float]:
+    """Reference BM25 Okapi scores computed document by document."""
+    df = Counter(term for document in corpus for term in set(document))
+    idf = {
+        term: math.log(len(corpus) - count + 0.5) - math.log(count + 0.5)
+        for term, count in df.items()
+    }
+    floor = epsilon * sum(idf.values()) / len(idf)
+    idf = {term: value if value >= 0 else floor for term, value in idf.items()}
+    avgdl = sum(len(document) for document in corpus) / len(corpus)
+
+    scores = []
+    for document in corpus:
+        tf = Counter(document)
+        norm = k1 * (1 - b + b * len(document) / avgdl)
+        scores.append(sum(idf[t] * tf[t] * (k1 + 1) / (tf[t] + norm) for t in query if t in tf))
+    return scores
 
 
 class TestBM25Service:
@@ -68,9 +93,8 @@ class TestBM25Service:
 
         service.build_index(documents, document_ids)
 
-        assert len(service.corpus) == 3
-        assert len(service.document_ids) == 3
-        assert service.bm25 is not None
+        assert service.num_documents == 3
+        assert service.document_ids == document_ids
 
     def test_search(self):
         """Test BM25 search."""
@@ -97,12 +121,12 @@ class TestBM25Service:
 
         # Add first document
         service.add_document("Sun in Leo brings confidence", "doc1")
-        assert len(service.corpus) == 1
+        assert service.num_documents == 1
         assert "doc1" in service.document_ids
 
         # Add second document
         service.add_document("Moon in Cancer nurtures emotions", "doc2")
-        assert len(service.corpus) == 2
+        assert service.num_documents == 2
         assert "doc2" in service.document_ids
 
     def test_remove_document(self):
@@ -114,7 +138,7 @@ class TestBM25Service:
         # Remove document
         success = service.remove_document("doc1")
         assert success
-        assert len(service.corpus) == 1
+        assert service.num_documents == 1
         assert "doc1" not in service.document_ids
         assert "doc2" in service.document_ids
 
@@ -122,6 +146,155 @@ class TestBM25Service:
         success = service.remove_document("doc3")
         assert not success
 
+    def test_scores_match_okapi_reference(self):
+        """Test scores against a plain BM25 Okapi through adds, replacements and removals."""
+        rng = random.Random(5)
+        words = [f"term{i}" for i in range(60)]
+        service = BM25Service()
+        documents: dict[str, str] = {}
+
+        for step in range(300):
+            doc_id = f"doc{rng.randint(0, 80)}"
+            if rng.random() < 0.3 and doc_id in documents:
+                del documents[doc_id]
+                assert service.remove_document(doc_id)
+            else:
+                text = " ".join(rng.choices(words[: rng.randint(3, 60)], k=rng.randint(1, 30)))
+                documents.pop(doc_id, None)
+                documents[doc_id] = text
+                service.add_document(text, doc_id)
+
+            if step % 25 == 0 and len(documents) > 2:
+                ids = list(documents)
+                corpus = [service.tokenize(documents[i]) for i in ids]
+                query = " ".join(rng.choices(words, k=3))
+                expected = _okapi_scores(
+                    corpus, service.tokenize(query), service.k1, service.b, service.epsilon
+                )
+
+                for result in service.search(query, limit=len(ids)):
+                    assert result["score"] == pytest.approx(
+                        expected[ids.index(result["document_id"])]
+                    )
+                assert service.document_ids == ids
+
+    def test_search_returns_top_matches_only(self):
+        """Test that only documents containing a query term are ranked, best first."""
+        service = BM25Service()
+        service.build_index(
+            [
+                "Saturn Saturn Saturn discipline",
+                "Saturn discipline structure",
+                "Venus love beauty",
+                "Jupiter growth",
+                "Mars action",
+            ],
+            ["d1", "d2", "d3", "d4", "d5"],
+        )
+
+        results = service.search("saturn", limit=1)
+        assert [r["document_id"] for r in results] == ["d1"]
+
+        results = service.search("saturn venus", limit=10)
+        assert {r["document_id"] for r in results} == {"d1", "d2", "d3"}
+        assert [r["score"] for r in results] == sorted((r["score"] for r in results), reverse=True)
+
+    def test_removed_documents_are_compacted(self):
+        """Test that tombstoned documents are dropped from the postings."""
+        service = BM25Service()
+        service.build_index([f"Moon phase{i}" for i in range(8)], [f"d{i}" for i in range(8)])
+
+        for i in range(3):
+            service.remove_document(f"d{i}")
+
+        stats = service.get_index_stats()
+        assert stats["num_documents"] == 5
+        assert stats["tombstones"] == 0  # 3/8 > COMPACTION_TOMBSTONE_RATIO
+        assert service.document_ids == [f"d{i}" for i in range(3, 8)]
+        assert [r["document_id"] for r in service.search("phase1 phase5")] == ["d5"]
+
+    def test_saved_index_is_memory_mapped(self, tmp_path):
+        """Test that a loaded index memory-maps its arrays and scores the same."""
+        documents = [f"Moon phase{i} in house {i % 4}" for i in range(20)]
+        service = BM25Service()
+        service.build_index(documents, [f"d{i}" for i in range(20)])
+        service.save(tmp_path)
+
+        loaded = BM25Service()
+        assert loaded.load(tmp_path)
+
+        stats = loaded.get_index_stats()
+        assert stats["memory_mapped"]
+        assert stats["num_documents"] == 20
+        assert loaded.search("phase3 moon") == service.search("phase3 moon")
+
+    def test_loaded_index_can_be_modified(self, tmp_path):
+        """Test that a loaded index accepts additions and removals."""
+        service = BM25Service()
+        service.build_index(["Sun in Leo", "Moon in Cancer"], ["sun", "moon"])
+        service.save(tmp_path)
+
+        loaded = BM25Service()
+        loaded.load(tmp_path)
+        loaded.add_document("Mars in Aries", "mars")
+        loaded.remove_document("sun")
+
+        assert not loaded.get_index_stats()["memory_mapped"]
+        assert loaded.document_ids == ["moon", "mars"]
+        assert [r["document_id"] for r in loaded.search("cancer")] == ["moon"]
+        assert [r["document_id"] for r in loaded.search("aries")] == ["mars"]
+
+    def test_index_dir_is_shared(self, tmp_path):
+        """Test that instances sharing an index directory see each other's changes."""
+        writer = BM25Service(index_dir=tmp_path)
+        writer.add_documents_batch(["Sun in Leo", "Moon in Cancer"], ["sun", "moon"])
+        writer.persist()
+
+        # A fresh process extends the persisted index instead of replacing it
+        other = BM25Service(index_dir=tmp_path)
+        other.add_document("Mars in Aries", "mars")
+        other.persist()
+
+        reader = BM25Service(index_dir=tmp_path)
+        assert [r["document_id"] for r in reader.search("leo")] == ["sun"]
+        assert reader.document_ids == ["sun", "moon", "mars"]
+        assert len(list(tmp_path.glob("index-*"))) == 2  # Current and previous
+
+    def test_concurrent_writers_keep_each_others_documents(self, tmp_path):
+        """Test that a writer saving after another replays its changes onto the newer index."""
+        base = BM25Service(index_dir=tmp_path)
+        base.add_documents_batch(["Sun in Leo", "Moon in Cancer"], ["sun", "moon"])
+        base.persist()
+
+        first = BM25Service(index_dir=tmp_path)
+        second = BM25Service(index_dir=tmp_path)
+        first.add_document("Mars in Aries", "mars")
+        second.add_document("Venus in Libra", "venus")
+        second.remove_document("sun")
+        second.persist()
+        first.persist()
+
+        reader = BM25Service(index_dir=tmp_path)
+        assert reader.refresh(force=True)
+        assert sorted(reader.document_ids) == ["mars", "moon", "venus"]
+        assert (tmp_path / "CURRENT.lock").exists()
+
+    def test_failed_persist_is_retried(self, tmp_path):
+        """Test that changes survive a failed save and reach the next one."""
+        writer = BM25Service(index_dir=tmp_path)
+        writer.add_document("Sun in Leo", "sun")
+        with patch.object(writer, "save", side_effect=OSError("disk full")):
+            writer.persist()
+
+        other = BM25Service(index_dir=tmp_path)
+        other.add_document("Moon in Cancer", "moon")
+        other.persist()
+        writer.persist()
+
+        reader = BM25Service(index_dir=tmp_path)
+        assert reader.refresh(force=True)
+        assert sorted(reader.document_ids) == ["moon", "sun"]
+
     def test_get_term_frequencies(self):
         """Test term frequency calculation."""
         service = BM25Service()
@@ -309,6 +482,30 @@ class TestHybridSearchService:
                 assert len(results) > 0
                 assert results[0]["document_id"] == "doc1"
 
+    @pytest.mark.asyncio
+    async def test_search_repeats_are_cached(self):
+        """Test that a repeated search skips BM25 and Qdrant until the corpus changes."""
+        service = HybridSearchService()
+
+        with patch.object(service.qdrant, "search") as mock_qdrant:
+            with patch.object(service.bm25, "search") as mock_bm25:
+                service.qdrant.enabled = True
+                mock_qdrant.return_value = [{"id": "doc1", "score": 0.9, "payload": {}}]
+                mock_bm25.return_value = [{"document_id": "doc1", "score": 10}]
+
+                first = await service.search(query="Venus Libra", query_vector=[0.1], limit=5)
+                second = await service.search(query="Venus Libra", query_vector=[0.1], limit=5)
+                assert second == first
+                assert mock_qdrant.call_count == 1
+
+                # Another limit is another search
+                await service.search(query="Venus Libra", query_vector=[0.1], limit=3)
+                assert mock_qdrant.call_count == 2
+
+                await bump_corpus_version()
+                await service.search(query="Venus Libra", query_vector=[0.1], limit=5)
+                assert mock_qdrant.call_count == 3
+
 
 class TestDocumentIngestionService:
     """Test document ingestion service."""
@@ -389,6 +586,60 @@ class TestDocumentIngestionService:
             assert documents[0].document_type == "text"
             assert mock_db.commit.called
 
+    @pytest.mark.asyncio
+    async def test_ingest_many_batches_each_stage(self):
+        """Test that bulk ingestion embeds, upserts and inserts per batch."""
+        service = DocumentIngestionService()
+        items = [
+            IngestionItem(
+                title=f"Doc {i}", content=f"Saturn return number {i}", document_type="text"
+            )
+            for i in range(5)
+        ]
+        embedded: list[list[str]] = []
+
+        async def embed_batch(texts: list[str]) -> list[list[float] | None]:
+            embedded.append(texts)
+            return [[0.1, 0.2] for _ in texts]
+
+        mock_db = AsyncMock()
+        with (
+            patch.object(service.qdrant, "enabled", True),
+            patch.object(service.qdrant, "upsert_vectors", AsyncMock(return_value=True)) as upsert,
+            patch.object(service.bm25, "add_documents_batch") as add_batch,
+            patch.object(service.bm25, "persist"),
+        ):
+            stats = await service.ingest_many(
+                mock_db, items, embed_batch_func=embed_batch, batch_size=2, concurrency=2
+            )
+
+        assert (stats.items, stats.chunks, stats.indexed, stats.failed) == (5, 5, 5, 0)
+        assert sorted(len(texts) for texts in embedded) == [1, 2, 2]
+        assert upsert.await_count == 3
+        assert mock_db.execute.await_count == 6  # VectorDocument + SearchIndex per batch
+        assert mock_db.commit.await_count == 3
+        assert sum(len(c.args[1]) for c in add_batch.call_args_list) == 5
+
+    @pytest.mark.asyncio
+    async def test_ingest_many_keeps_other_batches_on_failure(self):
+        """Test that a batch failing to save is rolled back and counted."""
+        service = DocumentIngestionService()
+        items = [
+            IngestionItem(title=f"Doc {i}", content=f"Moon phase {i}", document_type="text")
+            for i in range(4)
+        ]
+
+        mock_db = AsyncMock()
+        mock_db.execute = AsyncMock(side_effect=[RuntimeError("duplicate"), None, None])
+        with (
+            patch.object(service.bm25, "add_documents_batch"),
+            patch.object(service.bm25, "persist"),
+        ):
+            stats = await service.ingest_many(mock_db, items, batch_size=2, concurrency=1)
+
+        assert (stats.chunks, stats.indexed, stats.failed) == (2, 0, 2)
+        mock_db.rollback.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_delete_document(self):
         """Test document deletion."""
@@ -0,0 +1,96 @@
+"""
+Tests for TimezoneService memoized conversions.
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import pytest
+import swisseph as swe
+
+from app.services import timezone_service
+from app.services.timezone_service import (
+    TimezoneService,
+    cache_info,
+    clear_caches,
+    local_datetime_to_julian_day,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    """Start every test with empty memo caches."""
+    clear_caches()
+    yield
+    clear_caches()
+
+
+class TestJulianDayCache:
+    """Tests for the (local datetime, tz) -> UTC JD cache."""
+
+    def test_naive_datetime_uses_timezone(self) -> None:
+        """Test that naive datetimes are interpreted in the given timezone."""
+        # 1990-05-17 14:30 in Sao Paulo (UTC-3) is 17:30 UTC
+        jd = local_datetime_to_julian_day(datetime(1990, 5, 17, 14, 30), "America/Sao_Paulo")
+        assert jd == pytest.approx(swe.julday(1990, 5, 17, 17.5))
+
+    def test_aware_datetime_ignores_timezone(self) -> None:
+        """Test that aware datetimes share one entry regardless of timezone name."""
+        dt = datetime(1990, 5, 17, 17, 30, tzinfo=UTC)
+        first = local_datetime_to_julian_day(dt, "America/Sao_Paulo")
+        second = local_datetime_to_julian_day(dt, "Europe/Berlin")
+
+        assert first == second == pytest.approx(swe.julday(1990, 5, 17, 17.5))
+        assert cache_info()["julian_day"] == {
+            "hits": 1,
+            "misses": 1,
+            "size": 1,
+            "max_size": timezone_service.TIMEZONE_CACHE_SIZE,
+        }
+
+    def test_historical_dst_offset(self) -> None:
+        """Test that historical DST rules are applied."""
+        # Sao Paulo observed DST (UTC-2) in January 1990
+        jd = local_datetime_to_julian_day(datetime(1990, 1, 15, 12, 0), "America/Sao_Paulo")
+        assert jd == pytest.approx(swe.julday(1990, 1, 15, 14.0))
+
+
+class TestTimezoneLookupCache:
+    """Tests for the rounded (lat, lon) -> tz id cache."""
+
+    def test_nearby_coordinates_share_lookup(self) -> None:
+        """Test that coordinates equal after rounding hit the cache."""
+        with patch.object(
+            timezone_service,
+            "_get_timezone_finder",
+            wraps=timezone_service._get_timezone_finder,
+        ) as finder:
+            first = TimezoneService.detect_timezone_from_coordinates(-23.55051, -46.63331)
+            second = TimezoneService.detect_timezone_from_coordinates(-23.55049, -46.63329)
+
+        assert first == second == "America/Sao_Paulo"
+        assert finder.call_count == 1
+        assert cache_info()["timezone_at"]["hits"] == 1
+
+
+class TestHistoricalOffsetCache:
+    """Tests for memoized historical offsets."""
+
+    def test_offset_and_dst(self) -> None:
+        """Test offsets for a DST and a standard-time date."""
+        summer = TimezoneService.get_historical_offset("Europe/Berlin", datetime(2020, 7, 1))
+        winter = TimezoneService.get_historical_offset("Europe/Berlin", datetime(2020, 1, 1))
+
+        assert summer == (2.0, True)
+        assert winter == (1.0, False)
+
+    def test_invalid_timezone_returns_none(self) -> None:
+        """Test that unknown timezones are not cached as results."""
+        assert TimezoneService.get_historical_offset("Mars/Olympus", datetime(2020, 1, 1)) is None
+        assert cache_info()["historical_offset"]["size"] == 0
+
+    def test_aware_date_is_converted(self) -> None:
+        """Test that aware dates are converted to the target timezone."""
+        date = datetime(2020, 7, 1, 12, tzinfo=ZoneInfo("UTC"))
+        assert TimezoneService.get_historical_offset("America/New_York", date) == (-4.0, True)